@@ -260,10 +260,11 @@ public:
                               std::setw(15), "Current Best:\n");
                     }
                     print(std::setw(7), gen, std::setw(15), prob.get_fevals() - fevals0, std::setw(15),
-                          pop.champion_f()[0], std::setw(15), pop.get_f()[best_idx][0], '\n');
+                          pop.champion_f()[0], std::setw(15), pop.get_f_row(best_idx)[0], '\n');
                     ++count;
                     // Logs
-                    m_log.emplace_back(gen, prob.get_fevals() - fevals0, pop.champion_f()[0], pop.get_f()[best_idx][0]);
+                    m_log.emplace_back(gen, prob.get_fevals() - fevals0, pop.champion_f()[0],
+                                       pop.get_f_row(best_idx)[0]);
                 }
             }
         }
@@ -260,9 +260,9 @@ public:
         if ((newpop.size() != lam) || ((unsigned int)newpop[0].rows() != dim) || (m_memory == false)) {
             sigma = m_sigma0;
             mean.resize(_(dim));
-            auto idx_b = pop.best_idx();
+            const auto x_b = pop.get_x_row(pop.best_idx());
             for (decltype(dim) i = 0u; i < dim; ++i) {
-                mean(_(i)) = pop.get_x()[idx_b][i];
+                mean(_(i)) = x_b[i];
             }
             newpop = std::vector<Eigen::VectorXd>(lam, tmp);
             variation.resize(_(dim));
@@ -297,8 +297,8 @@ public:
         // ----------------------------------------------//
         // HERE WE START THE JUICE OF THE ALGORITHM      //
         // ----------------------------------------------//
-        auto best_x = pop.get_x()[pop.best_idx()];
-        auto best_f = pop.get_f()[pop.best_idx()];
+        vector_double best_x = pop.get_x_row(pop.best_idx());
+        vector_double best_f = pop.get_f_row(pop.best_idx());
 
         Eigen::SelfAdjointEigenSolver<Eigen::MatrixXd> es(_(dim));
         for (decltype(m_gen) gen = 1u; gen <= m_gen; ++gen) {
@@ -325,7 +325,7 @@ public:
                 // Exit condition on ftol
                 auto idx_b = pop.best_idx();
                 auto idx_w = pop.worst_idx();
-                double delta_f = std::abs(pop.get_f()[idx_b][0] - pop.get_f()[idx_w][0]);
+                double delta_f = std::abs(pop.get_f_row(idx_b)[0] - pop.get_f_row(idx_w)[0]);
                 if (delta_f < m_ftol) {
                     if (m_verbosity) {
                         std::cout << "Exit condition -- ftol < " << m_ftol << std::endl;
@@ -342,7 +342,7 @@ public:
                     // The population flattness in fitness
                     auto idx_b = pop.best_idx();
                     auto idx_w = pop.worst_idx();
-                    auto df = std::abs(pop.get_f()[idx_b][0] - pop.get_f()[idx_w][0]);
+                    auto df = std::abs(pop.get_f_row(idx_b)[0] - pop.get_f_row(idx_w)[0]);
                     // Every 50 lines print the column names
                     if (count % 50u == 1u) {
                         print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:", std::setw(15),
@@ -377,9 +377,9 @@ public:
                     dumb[j] = newpop[i](_(j));
                 }
                 pop.set_x(i, dumb);
-                if (pop.get_f()[i][0] <= best_f[0]) {
-                    best_f = pop.get_f()[i];
-                    best_x = pop.get_x()[i];
+                if (pop.get_f_row(i)[0] <= best_f[0]) {
+                    best_f = pop.get_f_row(i);
+                    best_x = pop.get_x_row(i);
                 }
             }
             counteval += lam;
@@ -387,12 +387,13 @@ public:
             std::vector<population::size_type> best_idx(lam);
             std::iota(best_idx.begin(), best_idx.end(), population::size_type(0));
             std::sort(best_idx.begin(), best_idx.end(), [&pop](population::size_type idx1, population::size_type idx2) {
-                return detail::less_than_f(pop.get_f()[idx1][0], pop.get_f()[idx2][0]);
+                return detail::less_than_f(pop.get_f_row(idx1)[0], pop.get_f_row(idx2)[0]);
             });
             best_idx.resize(mu); // not needed?
             for (decltype(mu) i = 0u; i < mu; ++i) {
+                const auto x_i = pop.get_x_row(best_idx[i]);
                 for (decltype(dim) j = 0u; j < dim; ++j) {
-                    elite[i](_(j)) = pop.get_x()[best_idx[i]][j];
+                    elite[i](_(j)) = x_i[j];
                 }
             }
             // 5 - Compute the new mean of the elite storing the old one
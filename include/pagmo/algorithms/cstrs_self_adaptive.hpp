@@ -139,7 +139,7 @@ public:
         // some decision vector
         m_fitness_map.clear();
         for (decltype(pop_size) i = 0u; i < pop_size; ++i) {
-            m_fitness_map[m_pop_ptr->get_x()[i]] = m_pop_ptr->get_f()[i];
+            m_fitness_map[m_pop_ptr->get_x_row(i)] = m_pop_ptr->get_f_row(i);
         }
 
         // Init some data member values
@@ -152,7 +152,7 @@ public:
         std::vector<double> infeasibility(pop_size, 0.);
         for (decltype(pop_size) i = 0u; i < pop_size; ++i) {
             // compute the infeasibility of the fitness
-            infeasibility[i] = compute_infeasibility(m_pop_ptr->get_f()[i]);
+            infeasibility[i] = compute_infeasibility(m_pop_ptr->get_f_row(i));
             if (infeasibility[i] > 0.) {
                 infeasible_idx.push_back(i);
             } else {
@@ -171,9 +171,9 @@ public:
             m_i_hat_down = 0.;
             // We init these as well even though they will not be used
             m_i_hat_round = 0.;
-            m_f_hat_down = m_pop_ptr->get_f()[0];
-            m_f_hat_up = m_pop_ptr->get_f()[0];
-            m_f_hat_round = m_pop_ptr->get_f()[0];
+            m_f_hat_down = m_pop_ptr->get_f_row(0);
+            m_f_hat_up = m_pop_ptr->get_f_row(0);
+            m_f_hat_round = m_pop_ptr->get_f_row(0);
             return;
         }
 
@@ -184,18 +184,18 @@ public:
             hat_down_idx = feasible_idx[0];
             for (decltype(feasible_idx.size()) i = 1u; i < feasible_idx.size(); ++i) {
                 auto current_idx = feasible_idx[i];
-                if (m_pop_ptr->get_f()[current_idx][0] < m_pop_ptr->get_f()[hat_down_idx][0]) {
+                if (m_pop_ptr->get_f_row(current_idx)[0] < m_pop_ptr->get_f_row(hat_down_idx)[0]) {
                     hat_down_idx = current_idx;
                 }
             }
-            auto f_hat_down = m_pop_ptr->get_f()[hat_down_idx];
+            auto f_hat_down = m_pop_ptr->get_f_row(hat_down_idx);
 
             // 4b - hat_up, its value depends if the population contains infeasible individual with objective
             // function better than f_hat_down
             bool pop_contains_infeasible_f_better_x_hat_down = false;
             for (decltype(infeasible_idx.size()) i = 0u; i < infeasible_idx.size(); ++i) {
                 auto current_idx = infeasible_idx[i];
-                if (m_pop_ptr->get_f()[current_idx][0] < f_hat_down[0]) {
+                if (m_pop_ptr->get_f_row(current_idx)[0] < f_hat_down[0]) {
                     pop_contains_infeasible_f_better_x_hat_down = true;
                     hat_up_idx = current_idx;
                     break;
@@ -205,10 +205,10 @@ public:
                 // gets the individual with maximum infeasibility and objfun lower than f_hat_down
                 for (decltype(infeasible_idx.size()) i = 0u; i < infeasible_idx.size(); ++i) {
                     auto current_idx = infeasible_idx[i];
-                    if (m_pop_ptr->get_f()[current_idx][0] < f_hat_down[0]
+                    if (m_pop_ptr->get_f_row(current_idx)[0] < f_hat_down[0]
                         && infeasibility[current_idx] >= infeasibility[hat_up_idx]) {
                         if (infeasibility[current_idx] == infeasibility[hat_up_idx]) {
-                            if (m_pop_ptr->get_f()[current_idx][0] < m_pop_ptr->get_f()[hat_up_idx][0]) {
+                            if (m_pop_ptr->get_f_row(current_idx)[0] < m_pop_ptr->get_f_row(hat_up_idx)[0]) {
                                 hat_up_idx = current_idx;
                             }
                         } else {
@@ -228,7 +228,7 @@ public:
                     auto current_idx = infeasible_idx[i];
                     if (infeasibility[current_idx] >= infeasibility[hat_up_idx]) {
                         if (infeasibility[current_idx] == infeasibility[hat_up_idx]) {
-                            if (m_pop_ptr->get_f()[hat_up_idx][0] < m_pop_ptr->get_f()[current_idx][0]) {
+                            if (m_pop_ptr->get_f_row(hat_up_idx)[0] < m_pop_ptr->get_f_row(current_idx)[0]) {
                                 hat_up_idx = current_idx;
                             }
                         } else {
@@ -246,7 +246,7 @@ public:
             for (decltype(pop_size) i = 1u; i < pop_size; ++i) {
                 if (infeasibility[i] <= infeasibility[hat_down_idx]) {
                     if (infeasibility[i] == infeasibility[hat_down_idx]) {
-                        if (m_pop_ptr->get_f()[i][0] < m_pop_ptr->get_f()[hat_down_idx][0]) {
+                        if (m_pop_ptr->get_f_row(i)[0] < m_pop_ptr->get_f_row(hat_down_idx)[0]) {
                             hat_down_idx = i;
                         }
                     } else {
@@ -259,7 +259,7 @@ public:
             for (decltype(pop_size) i = 1u; i < pop_size; ++i) {
                 if (infeasibility[i] >= infeasibility[hat_up_idx]) {
                     if (infeasibility[i] == infeasibility[hat_up_idx]) {
-                        if (m_pop_ptr->get_f()[i][0] > m_pop_ptr->get_f()[hat_up_idx][0]) {
+                        if (m_pop_ptr->get_f_row(i)[0] > m_pop_ptr->get_f_row(hat_up_idx)[0]) {
                             hat_up_idx = i;
                         }
                     } else {
@@ -275,15 +275,15 @@ public:
         // function value in the reference population
         hat_round_idx = 0u;
         for (decltype(pop_size) i = 1u; i < pop_size; ++i) {
-            if (m_pop_ptr->get_f()[i][0] > m_pop_ptr->get_f()[hat_round_idx][0]) {
+            if (m_pop_ptr->get_f_row(i)[0] > m_pop_ptr->get_f_row(hat_round_idx)[0]) {
                 hat_round_idx = i;
             }
         }
 
         // Stores the fitness values of the three special individuals
-        m_f_hat_round = m_pop_ptr->get_f()[hat_round_idx];
-        m_f_hat_down = m_pop_ptr->get_f()[hat_down_idx];
-        m_f_hat_up = m_pop_ptr->get_f()[hat_up_idx];
+        m_f_hat_round = m_pop_ptr->get_f_row(hat_round_idx);
+        m_f_hat_down = m_pop_ptr->get_f_row(hat_down_idx);
+        m_f_hat_up = m_pop_ptr->get_f_row(hat_up_idx);
 
         // Stores the solution infeasibility values of the three individuals
         m_i_hat_round = infeasibility[hat_round_idx];
@@ -311,7 +311,7 @@ public:
 
         for (decltype(pop_size) i = 0u; i < pop_size; ++i) {
             // compute the infeasibility of the fitness
-            infeasibility[i] = p.compute_infeasibility(p.m_pop_ptr->get_f()[i]);
+            infeasibility[i] = p.compute_infeasibility(p.m_pop_ptr->get_f_row(i));
         }
         os << "\nInfeasibilities: ";
         os << "\n\tBest (hat down): " << p.m_i_hat_down;
@@ -344,7 +344,7 @@ public:
         // We evaluate the scaling factor
         for (decltype(pop_size) i = 0u; i < pop_size; ++i) {
             // fitness of the i-th decision vector
-            auto fit = m_pop_ptr->get_f()[i];
+            auto fit = m_pop_ptr->get_f_row(i);
 
             // computes scaling with the right definition of the constraints
             for (decltype(nec) j = 0u; j < nec; ++j) {
@@ -579,7 +579,7 @@ public:
         population new_pop{udp_p};
         // The following lines do not cause fevals increments as the cache is hit.
         for (decltype(NP) i = 0u; i < NP; ++i) {
-            new_pop.push_back(pop.get_x()[i]);
+            new_pop.push_back(pop.get_x_row(i));
         }
         // Main iterations
         auto penalized_udp_ptr = new_pop.get_problem().extract<detail::penalized_udp>();
@@ -587,15 +587,15 @@ public:
             // We record the current best decision vector and fitness as we will
             // reinsert it at each iteration
             auto best_idx = pop.best_idx();
-            auto best_x = pop.get_x()[best_idx];
-            auto best_f = pop.get_f()[best_idx];
+            vector_double best_x = pop.get_x_row(best_idx);
+            vector_double best_f = pop.get_f_row(best_idx);
             auto worst_idx = pop.worst_idx();
             // As the population changes (evolves) we update all penalties and reset the cache
             // (the first iter this is not needed as upon construction this was already done and the pop
             // has not changed since)
             penalized_udp_ptr->update();
             for (decltype(new_pop.size()) i = 0u; i < new_pop.size(); ++i) {
-                new_pop.set_x(i, pop.get_x()[i]);
+                new_pop.set_x(i, pop.get_x_row(i));
             }
             // We log to screen
             if (m_verbosity > 0u) {
@@ -608,7 +608,7 @@ public:
                               std::setw(15), "N. Feasible:", '\n');
                     }
                     // 2 - Print
-                    auto cur_best_f = pop.get_f()[pop.best_idx()];
+                    auto cur_best_f = pop.get_f_row(pop.best_idx());
                     auto c1eq = detail::test_eq_constraints(cur_best_f.data() + 1, cur_best_f.data() + 1 + nec,
                                                             prob.get_c_tol().data());
                     auto c1ineq = detail::test_ineq_constraints(cur_best_f.data() + 1 + nec,
@@ -634,7 +634,7 @@ public:
             penalized_udp_ptr = new_pop.get_problem().extract<detail::penalized_udp>();
             // We update the original pop avoiding fevals thanks to the cache
             for (decltype(pop.size()) i = 0u; i < pop.size(); ++i) {
-                auto x = new_pop.get_x()[i];
+                auto x = new_pop.get_x_row(i);
                 auto it_f = penalized_udp_ptr->m_fitness_map.find(x);
                 assert(it_f
                        != penalized_udp_ptr->m_fitness_map.end()); // We are assasserting here the cache will be hit
@@ -667,8 +667,10 @@ public:
             if (gen % 40u == 0u) {
                 best_idx = pop.best_idx();
                 worst_idx = pop.worst_idx();
+                const auto x_worst = pop.get_x_row(worst_idx);
+                const auto x_best = pop.get_x_row(best_idx);
                 for (decltype(dim) i = 0u; i < dim; ++i) {
-                    dx += std::abs(pop.get_x()[worst_idx][i] - pop.get_x()[best_idx][i]);
+                    dx += std::abs(x_worst[i] - x_best[i]);
                 }
                 if (dx < m_xtol) {
                     if (m_verbosity > 0u) {
@@ -677,7 +679,7 @@ public:
                     return pop;
                 }
 
-                df = std::abs(pop.get_f()[worst_idx][0] - pop.get_f()[best_idx][0]);
+                df = std::abs(pop.get_f_row(worst_idx)[0] - pop.get_f_row(best_idx)[0]);
                 if (df < m_ftol) {
                     if (m_verbosity > 0u) {
                         std::cout << "Exit condition -- ftol < " << m_ftol << std::endl;
@@ -694,11 +696,13 @@ public:
                     worst_idx = pop.worst_idx();
                     dx = 0.;
                     // The population flattness in chromosome
+                    const auto x_worst = pop.get_x_row(worst_idx);
+                    const auto x_best = pop.get_x_row(best_idx);
                     for (decltype(dim) i = 0u; i < dim; ++i) {
-                        dx += std::abs(pop.get_x()[worst_idx][i] - pop.get_x()[best_idx][i]);
+                        dx += std::abs(x_worst[i] - x_best[i]);
                     }
                     // The population flattness in fitness
-                    df = std::abs(pop.get_f()[worst_idx][0] - pop.get_f()[best_idx][0]);
+                    df = std::abs(pop.get_f_row(worst_idx)[0] - pop.get_f_row(best_idx)[0]);
                     // Every 50 lines print the column names
                     if (count % 50u == 1u) {
                         print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:", std::setw(15),
@@ -706,11 +710,11 @@ public:
                               "Variant:", std::setw(15), "dx:", std::setw(15), std::setw(15), "df:", '\n');
                     }
                     print(std::setw(7), gen, std::setw(15), prob.get_fevals() - fevals0, std::setw(15),
-                          pop.get_f()[best_idx][0], std::setw(15), gbIterF, std::setw(15), gbIterCR, std::setw(15),
+                          pop.get_f_row(best_idx)[0], std::setw(15), gbIterF, std::setw(15), gbIterCR, std::setw(15),
                           gbIterVariant, std::setw(15), dx, std::setw(15), df, '\n');
                     ++count;
                     // Logs
-                    m_log.emplace_back(gen, prob.get_fevals() - fevals0, pop.get_f()[best_idx][0], gbIterF, gbIterCR,
+                    m_log.emplace_back(gen, prob.get_fevals() - fevals0, pop.get_f_row(best_idx)[0], gbIterF, gbIterCR,
                                        gbIterVariant, dx, df);
                 }
             }
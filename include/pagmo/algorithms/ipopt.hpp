@@ -337,17 +337,51 @@ struct ipopt_nlp final : Ipopt::TNLP {
         }
     }
 
+    // Store the decision vector x in m_dv. Ipopt sets the new_x flag to false if the last call
+    // to any of the eval_* functions used the same x value: in that case m_dv already contains x,
+    // and the cached fitness and gradient (if any) can be reused. Otherwise, the caches are invalidated.
+    void update_x(Index n, const Number *x, bool new_x)
+    {
+        if (new_x || !m_x_set) {
+            std::copy(x, x + n, m_dv.begin());
+            m_x_set = true;
+            m_fit_valid = false;
+            m_grad_valid = false;
+        }
+    }
+    // Fitness of the current m_dv, computed at most once per point and shared
+    // by eval_f() and eval_g().
+    const vector_double &cached_fitness()
+    {
+        if (m_fit_valid) {
+            ++m_fit_hits;
+        } else {
+            m_fit = m_prob.fitness(m_dv);
+            m_fit_valid = true;
+        }
+        return m_fit;
+    }
+    // Gradient of the current m_dv, computed at most once per point and shared
+    // by eval_grad_f() and eval_jac_g().
+    const vector_double &cached_gradient()
+    {
+        if (m_grad_valid) {
+            ++m_grad_hits;
+        } else {
+            m_grad = m_prob.gradient(m_dv);
+            m_grad_valid = true;
+        }
+        return m_grad;
+    }
+
     // Method to return the objective value.
     virtual bool eval_f(Index n, const Number *x, bool new_x, Number &obj_value) override final
     {
         try {
             assert(n == boost::numeric_cast<Index>(m_prob.get_nx()));
-            // NOTE: the new_x boolean flag will be false if the last call to any of the eval_* function
-            // used the same x value. Probably we can ignore this in favour of the upcoming caches work.
-            (void)new_x;
 
-            std::copy(x, x + n, m_dv.begin());
-            const auto fitness = m_prob.fitness(m_dv);
+            update_x(n, x, new_x);
+            const auto &fitness = cached_fitness();
             obj_value = fitness[0];
 
             // Update the log if requested.
@@ -393,11 +427,10 @@ struct ipopt_nlp final : Ipopt::TNLP {
     {
         try {
             assert(n == boost::numeric_cast<Index>(m_prob.get_nx()));
-            (void)new_x;
 
-            std::copy(x, x + n, m_dv.begin());
+            update_x(n, x, new_x);
             // Compute the full gradient (this includes the cosntraints as well).
-            const auto gradient = m_prob.gradient(m_dv);
+            const auto &gradient = cached_gradient();
 
             if (m_prob.has_gradient_sparsity()) {
                 // Sparse gradient case.
@@ -430,10 +463,9 @@ struct ipopt_nlp final : Ipopt::TNLP {
         try {
             assert(n == boost::numeric_cast<Index>(m_prob.get_nx()));
             assert(m == boost::numeric_cast<Index>(m_prob.get_nc()));
-            (void)new_x;
 
-            std::copy(x, x + n, m_dv.begin());
-            const auto fitness = m_prob.fitness(m_dv);
+            update_x(n, x, new_x);
+            const auto &fitness = cached_fitness();
 
             // Eq. constraints.
             std::copy(fitness.data() + 1, fitness.data() + 1 + m_prob.get_nec(), g);
@@ -458,11 +490,10 @@ struct ipopt_nlp final : Ipopt::TNLP {
             assert(n == boost::numeric_cast<Index>(m_prob.get_nx()));
             assert(m == boost::numeric_cast<Index>(m_prob.get_nc()));
             assert(nele_jac == boost::numeric_cast<Index>(m_jac_sp.size()));
-            (void)new_x;
 
             if (values) {
-                std::copy(x, x + n, m_dv.begin());
-                const auto gradient = m_prob.gradient(m_dv);
+                update_x(n, x, new_x);
+                const auto &gradient = cached_gradient();
                 // NOTE: here we need the gradients of the constraints only, so we need to discard the gradient of the
                 // objfun. If the gradient sparsity is user-provided, then the size of the objfun sparse gradient is
                 // m_obj_g_sp.size(), otherwise the gradient is dense and its size is nx.
@@ -492,7 +523,6 @@ struct ipopt_nlp final : Ipopt::TNLP {
             assert(n == boost::numeric_cast<Index>(m_prob.get_nx()));
             assert(m == boost::numeric_cast<Index>(m_prob.get_nc()));
             assert(nele_hess == boost::numeric_cast<Index>(m_lag_sp.size()));
-            (void)new_x;
             (void)new_lambda;
 
             if (!m_prob.has_hessians()) {
@@ -505,7 +535,7 @@ struct ipopt_nlp final : Ipopt::TNLP {
             }
 
             if (values) {
-                std::copy(x, x + n, m_dv.begin());
+                update_x(n, x, new_x);
                 const auto hessians = m_prob.hessians(m_dv);
                 if (m_prob.has_hessians_sparsity()) {
                     // Sparse case.
@@ -617,6 +647,15 @@ struct ipopt_nlp final : Ipopt::TNLP {
     const vector_double m_start;
     // Temporary dv used for fitness computation.
     vector_double m_dv;
+    // Cached fitness and gradient of m_dv, with their validity flags
+    // and the number of times they were reused.
+    vector_double m_fit;
+    vector_double m_grad;
+    bool m_x_set = false;
+    bool m_fit_valid = false;
+    bool m_grad_valid = false;
+    unsigned long long m_fit_hits = 0;
+    unsigned long long m_grad_hits = 0;
     // Dv of the solution.
     vector_double m_sol;
     // Final values of the constraints.
@@ -770,6 +809,10 @@ public:
      * set_replacement(population::size_type). The return status of the Ipopt optimisation run will be recorded (it can
      * be fetched with get_last_opt_result()).
      *
+     * The fitness and the gradient of the last decision vector evaluated are cached, so that the callbacks invoked by
+     * Ipopt for the same decision vector share a single fitness (and gradient) evaluation. The number of cache hits
+     * during the last optimisation is reported by get_extra_info().
+     *
      * @param pop the population to be optimised.
      *
      * @return the optimised population.
@@ -879,8 +922,10 @@ public:
             // Print to screen the result of the optimisation, if we are being verbose.
             std::cout << "\nOptimisation return status: " << detail::ipopt_data<>::results.at(m_last_opt_res) << '\n';
         }
-        // Replace the log.
+        // Replace the log and record the cache hits.
         m_log = std::move(inlp.m_log);
+        m_last_fit_hits = inlp.m_fit_hits;
+        m_last_grad_hits = inlp.m_grad_hits;
 
         // Handle any exception that might've been thrown.
         if (inlp.m_eptr) {
@@ -923,7 +968,9 @@ public:
     std::string get_extra_info() const
     {
         return "\tLast optimisation return code: " + detail::ipopt_data<>::results.at(m_last_opt_res)
-               + "\n\tVerbosity: " + std::to_string(m_verbosity) + "\n\tIndividual selection "
+               + "\n\tLast optimisation cache hits: fitness " + std::to_string(m_last_fit_hits) + ", gradient "
+               + std::to_string(m_last_grad_hits) + "\n\tVerbosity: " + std::to_string(m_verbosity)
+               + "\n\tIndividual selection "
                + (boost::any_cast<population::size_type>(&m_select)
                       ? "idx: " + std::to_string(boost::any_cast<population::size_type>(m_select))
                       : "policy: " + boost::any_cast<std::string>(m_select))
@@ -1006,7 +1053,7 @@ public:
     void save(Archive &ar) const
     {
         ar(cereal::base_class<not_population_based>(this), m_string_opts, m_integer_opts, m_numeric_opts,
-           m_last_opt_res, m_verbosity, m_log);
+           m_last_opt_res, m_verbosity, m_log, m_last_fit_hits, m_last_grad_hits);
     }
     /// Load from archive.
     /**
@@ -1022,7 +1069,7 @@ public:
     {
         try {
             ar(cereal::base_class<not_population_based>(this), m_string_opts, m_integer_opts, m_numeric_opts,
-               m_last_opt_res, m_verbosity, m_log);
+               m_last_opt_res, m_verbosity, m_log, m_last_fit_hits, m_last_grad_hits);
             // LCOV_EXCL_START
         } catch (...) {
             *this = ipopt{};
@@ -1174,6 +1221,9 @@ private:
     // Verbosity/log.
     unsigned m_verbosity = 0;
     mutable log_type m_log;
+    // Number of hits in the fitness and gradient caches during the last optimisation.
+    mutable unsigned long long m_last_fit_hits = 0;
+    mutable unsigned long long m_last_grad_hits = 0;
 };
 }
 
@@ -242,10 +242,10 @@ public:
             // 2 - We perturb the current population (NP funevals are made here)
             for (decltype(NP) j = 0u; j < NP; ++j) {
                 vector_double tmp_x(dim);
+                const auto x_j = pop.get_x_row(j);
                 for (decltype(dim) k = 0u; k < dim; ++k) {
-                    tmp_x[k] = uniform_real_from_range(
-                        std::max(pop.get_x()[j][k] - m_perturb[k] * (ub[k] - lb[k]), lb[k]),
-                        std::min(pop.get_x()[j][k] + m_perturb[k] * (ub[k] - lb[k]), ub[k]), m_e);
+                    tmp_x[k] = uniform_real_from_range(std::max(x_j[k] - m_perturb[k] * (ub[k] - lb[k]), lb[k]),
+                                                       std::min(x_j[k] + m_perturb[k] * (ub[k] - lb[k]), ub[k]), m_e);
                 }
                 pop.set_x(j, tmp_x); // fitness is evaluated here
             }
@@ -253,11 +253,12 @@ public:
             pop = m_algorithm.evolve(pop);
             i++;
             // 4 - We reset the counter if we have improved, otherwise we reset the population
-            if (compare_fc(pop.get_f()[pop.best_idx()], pop_old.get_f()[pop_old.best_idx()], nec, prob.get_c_tol())) {
+            if (compare_fc(pop.get_f_row(pop.best_idx()), pop_old.get_f_row(pop_old.best_idx()), nec,
+                           prob.get_c_tol())) {
                 i = 0u;
             } else {
                 for (decltype(NP) j = 0u; j < NP; ++j) {
-                    pop.set_xf(j, pop_old.get_x()[j], pop_old.get_f()[j]);
+                    pop.set_xf(j, pop_old.get_x_row(j), pop_old.get_f_row(j));
                 }
             }
             // 5 - We log to screen
@@ -269,7 +270,7 @@ public:
                           "Violated:", std::setw(15), "Viol. Norm:", std::setw(15), "Trial:", '\n');
                 }
                 // 2 - Print
-                auto cur_best_f = pop.get_f()[pop.best_idx()];
+                auto cur_best_f = pop.get_f_row(pop.best_idx());
                 auto c1eq = detail::test_eq_constraints(cur_best_f.data() + 1, cur_best_f.data() + 1 + nec,
                                                         prob.get_c_tol().data());
                 auto c1ineq = detail::test_ineq_constraints(
@@ -278,7 +279,7 @@ public:
                 auto l = c1eq.second + c1ineq.second;
                 print(std::setw(7), prob.get_fevals() - fevals0, std::setw(15), cur_best_f[0], std::setw(15), n,
                       std::setw(15), l, std::setw(15), i);
-                if (!prob.feasibility_f(pop.get_f()[pop.best_idx()])) {
+                if (!prob.feasibility_f(pop.get_f_row(pop.best_idx()))) {
                     std::cout << " i";
                 }
                 ++count;
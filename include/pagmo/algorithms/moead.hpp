@@ -37,6 +37,7 @@ see https://www.gnu.org/licenses/. */
 #include <tuple>
 
 #include <pagmo/algorithm.hpp> // needed for the cereal macro
+#include <pagmo/detail/fitness_dedup.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
@@ -113,7 +114,7 @@ public:
           unsigned int seed = pagmo::random_device::next())
         : m_gen(gen), m_weight_generation(weight_generation), m_decomposition(decomposition), m_neighbours(neighbours),
           m_CR(CR), m_F(F), m_eta_m(eta_m), m_realb(realb), m_limit(limit), m_preserve_diversity(preserve_diversity),
-          m_e(seed), m_seed(seed), m_verbosity(0u), m_log()
+          m_e(seed), m_seed(seed), m_verbosity(0u), m_log(), m_dedup(false), m_saved_fevals(0u)
     {
         // Sanity checks
         if (m_weight_generation != "random" && m_weight_generation != "grid"
@@ -208,6 +209,8 @@ public:
 
         // No throws, all valid: we clear the logs
         m_log.clear();
+        m_saved_fevals = 0u;
+        detail::fitness_dedup dedup(m_dedup);
 
         // Setting up necessary quantities------------------------------------------------------------------------------
         // Random distributions
@@ -216,8 +219,14 @@ public:
             0u, NP - 1u); // to generate a random index for the population
                           // Declaring the candidate chromosome
         vector_double candidate(dim);
-        // We compute, for each vector of weights, the k = m_neighbours neighbours
-        auto neigh_idxs = kNN(weights, m_neighbours);
+        // We compute, for each vector of weights, the k = m_neighbours neighbours. The neighbourhoods are cached,
+        // as the weights do not change across calls to evolve (unless they are generated at random, or the size
+        // of the population or the number of objectives change)
+        if (weights != m_cached_weights) {
+            m_cached_neigh_idxs = kNN(weights, m_neighbours);
+            m_cached_weights = weights;
+        }
+        const auto &neigh_idxs = m_cached_neigh_idxs;
         // We compute the initial ideal point (will be adapted along the course of the algorithm)
         vector_double ideal_point = ideal(pop.get_f());
         // We create the container that will represent a pseudo-random permutation of the population indexes 1..NP
@@ -233,11 +242,15 @@ public:
                     // We compute the average decomposed fitness (ADF)
                     auto adf = 0.;
                     for (decltype(pop.size()) i = 0u; i < pop.size(); ++i) {
-                        adf += decompose_objectives(pop.get_f()[i], weights[i], ideal_point, m_decomposition)[0];
+                        adf += decompose_objectives(pop.get_f_row(i), weights[i], ideal_point, m_decomposition)[0];
                     }
                     // Every 50 lines print the column names
                     if (count % 50u == 1u) {
-                        print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:", std::setw(15), "ADF:");
+                        print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:");
+                        if (dedup.is_active()) {
+                            print(std::setw(15), "Saved:");
+                        }
+                        print(std::setw(15), "ADF:");
                         for (decltype(ideal_point.size()) i = 0u; i < ideal_point.size(); ++i) {
                             if (i >= 5u) {
                                 print(std::setw(15), "... :");
@@ -247,7 +260,11 @@ public:
                         }
                         print('\n');
                     }
-                    print(std::setw(7), gen, std::setw(15), prob.get_fevals() - fevals0, std::setw(15), adf);
+                    print(std::setw(7), gen, std::setw(15), prob.get_fevals() - fevals0);
+                    if (dedup.is_active()) {
+                        print(std::setw(15), dedup.get_saved());
+                    }
+                    print(std::setw(15), adf);
                     for (decltype(ideal_point.size()) i = 0u; i < ideal_point.size(); ++i) {
                         if (i >= 5u) {
                             break;
@@ -260,8 +277,10 @@ public:
                     m_log.emplace_back(gen, prob.get_fevals() - fevals0, adf, ideal_point);
                 }
             }
-            // 1 - Shuffle the population indexes
+            // 1 - Shuffle the population indexes (and, if requested, index the current population to
+            // skip the evaluation of the duplicated candidates)
             std::shuffle(shuffle.begin(), shuffle.end(), m_e);
+            dedup.reset(pop);
             // 2 - Loop over the shuffled NP decomposed problems
             for (auto n : shuffle) {
                 // 3 - if the diversity preservation mechanism is active we select at random whether to consider the
@@ -277,26 +296,30 @@ public:
                 std::vector<population::size_type> parents_idx(2);
                 parents_idx = select_parents(n, neigh_idxs, whole_population);
                 // 5 - Crossover using the Differential Evolution operator (binomial crossover)
+                // NOTE: the decision vectors are read in place from the contiguous population storage.
+                const auto x_n = pop.get_x_data().data() + n * dim;
+                const auto x_p0 = pop.get_x_data().data() + parents_idx[0] * dim;
+                const auto x_p1 = pop.get_x_data().data() + parents_idx[1] * dim;
                 for (decltype(dim) kk = 0u; kk < dim; ++kk) {
                     if (drng(m_e) < m_CR) {
                         /*Selected Two Parents*/
-                        candidate[kk] = pop.get_x()[n][kk]
-                                        + m_F * (pop.get_x()[parents_idx[0]][kk] - pop.get_x()[parents_idx[1]][kk]);
+                        candidate[kk] = x_n[kk] + m_F * (x_p0[kk] - x_p1[kk]);
                         // Fix the bounds
                         if (candidate[kk] < lb[kk]) {
-                            candidate[kk] = lb[kk] + drng(m_e) * (pop.get_x()[n][kk] - lb[kk]);
+                            candidate[kk] = lb[kk] + drng(m_e) * (x_n[kk] - lb[kk]);
                         }
                         if (candidate[kk] > ub[kk]) {
-                            candidate[kk] = ub[kk] - drng(m_e) * (ub[kk] - pop.get_x()[n][kk]);
+                            candidate[kk] = ub[kk] - drng(m_e) * (ub[kk] - x_n[kk]);
                         }
                     } else {
-                        candidate[kk] = pop.get_x()[n][kk];
+                        candidate[kk] = x_n[kk];
                     }
                 }
                 // 6 - We apply a further mutation using polynomial mutation
                 polynomial_mutation(candidate, pop, 1.0 / static_cast<double>(dim));
                 // 7- We evaluate the fitness function.
-                auto new_f = prob.fitness(candidate);
+                auto new_f = dedup.fitness(prob, candidate);
+                m_saved_fevals = dedup.get_saved();
                 // 8 - We update the ideal point
                 for (decltype(prob.get_nf()) j = 0u; j < prob.get_nf(); ++j) {
                     ideal_point[j] = std::min(new_f[j], ideal_point[j]);
@@ -306,7 +329,7 @@ public:
                 // 9 - We insert the newly found solution into the population
                 decltype(NP) size, time = 0;
                 // First try on problem n
-                auto f1 = decompose_objectives(pop.get_f()[n], weights[n], ideal_point, m_decomposition);
+                auto f1 = decompose_objectives(pop.get_f_row(n), weights[n], ideal_point, m_decomposition);
                 auto f2 = decompose_objectives(new_f, weights[n], ideal_point, m_decomposition);
                 if (f2[0] < f1[0]) {
                     pop.set_xf(n, candidate, new_f);
@@ -328,7 +351,7 @@ public:
                     } else {
                         pick = neigh_idxs[n][shuffle2[k]];
                     }
-                    f1 = decompose_objectives(pop.get_f()[pick], weights[pick], ideal_point, m_decomposition);
+                    f1 = decompose_objectives(pop.get_f_row(pick), weights[pick], ideal_point, m_decomposition);
                     f2 = decompose_objectives(new_f, weights[pick], ideal_point, m_decomposition);
                     if (f2[0] < f1[0]) {
                         pop.set_xf(pick, candidate, new_f);
@@ -385,7 +408,8 @@ public:
      * Gen, is the generation number, Fevals the number of function evaluation used. ADF is the Average
      * Decomposed Fitness, that is the average across all decomposed problem of the single objective decomposed fitness
      * along the corresponding direction. The ideal point of the current population follows cropped to its 5th
-     * component.
+     * component. If the fitness deduplication is active (see moead::set_dedup()), a Saved column follows Fevals,
+     * reporting the number of fitness evaluations saved so far.
      *
      * @param level verbosity level
      */
@@ -409,6 +433,39 @@ public:
     {
         return m_gen;
     }
+    /// Sets the fitness deduplication
+    /**
+     * When the deduplication is active, the candidates which are exact copies of an individual of the
+     * population at the beginning of the generation, or of a candidate already evaluated in the same generation,
+     * are not evaluated: their fitness is copied over instead. The number of fitness evaluations saved during the
+     * last call to evolve() can be retrieved via moead::get_saved_fevals(), and it is shown in the Saved column
+     * of the screen output (see moead::set_verbosity()). The Fevals column counts only the evaluations actually
+     * performed.
+     *
+     * By default the deduplication is not active.
+     *
+     * @param flag \p true to activate the fitness deduplication, \p false to deactivate it
+     */
+    void set_dedup(bool flag)
+    {
+        m_dedup = flag;
+    }
+    /// Gets the fitness deduplication flag
+    /**
+     * @return \p true if the fitness deduplication is active, \p false otherwise
+     */
+    bool get_dedup() const
+    {
+        return m_dedup;
+    }
+    /// Number of saved fitness evaluations
+    /**
+     * @return the number of fitness evaluations saved by the deduplication during the last call to evolve()
+     */
+    unsigned long long get_saved_fevals() const
+    {
+        return m_saved_fevals;
+    }
     /// Algorithm name
     /**
      * One of the optional methods of any user-defined algorithm (UDA).
@@ -438,13 +495,15 @@ public:
         stream(ss, "\n\tChance for diversity preservation: ", m_realb);
         stream(ss, "\n\tSeed: ", m_seed);
         stream(ss, "\n\tVerbosity: ", m_verbosity);
+        stream(ss, "\n\tFitness deduplication: ", m_dedup);
         return ss.str();
     }
     /// Get log
     /**
      * A log containing relevant quantities monitoring the last call to evolve. Each element of the returned
      * <tt>std::vector</tt> is a moead::log_line_type containing: Gen, Fevals, ADR, ideal_point
-     * as described in moead::set_verbosity
+     * as described in moead::set_verbosity. The number of fitness evaluations saved by the deduplication is not
+     * part of the log, and it can be retrieved via moead::get_saved_fevals().
      * @return an <tt>std::vector</tt> of moead::log_line_type containing the logged values Gen, Fevals, ADR,
      * ideal_point
      */
@@ -464,7 +523,7 @@ public:
     void serialize(Archive &ar)
     {
         ar(m_gen, m_weight_generation, m_decomposition, m_neighbours, m_CR, m_F, m_eta_m, m_realb, m_limit,
-           m_preserve_diversity, m_e, m_seed, m_verbosity, m_log);
+           m_preserve_diversity, m_e, m_seed, m_verbosity, m_log, m_dedup, m_saved_fevals);
     }
 
 private:
@@ -551,6 +610,12 @@ private:
     unsigned int m_seed;
     unsigned int m_verbosity;
     mutable log_type m_log;
+    bool m_dedup;
+    mutable unsigned long long m_saved_fevals;
+    // The weights used in the last call to evolve and their neighbourhoods
+    // NOTE: these are not serialized, as they are just a cache.
+    mutable std::vector<vector_double> m_cached_weights;
+    mutable std::vector<std::vector<population::size_type>> m_cached_neigh_idxs;
 };
 
 } // namespace pagmo
@@ -363,6 +363,37 @@ struct nlopt_obj {
         }
     }
 
+    // Fitness of the decision vector currently stored in m_dv. NLopt invokes the objective function
+    // and the constraints separately, usually at the same decision vector: the fitness is thus cached,
+    // and it is re-computed only if m_dv differs from the last decision vector evaluated.
+    const vector_double &fitness()
+    {
+        if (m_fit_valid && m_fit_dv == m_dv) {
+            ++m_fit_hits;
+            return m_fit;
+        }
+        // NOTE: invalidate the cache first, in case the fitness computation throws.
+        m_fit_valid = false;
+        m_fit = m_prob.fitness(m_dv);
+        m_fit_dv = m_dv;
+        m_fit_valid = true;
+        return m_fit;
+    }
+
+    // Gradient of the decision vector currently stored in m_dv, cached like the fitness.
+    const vector_double &gradient()
+    {
+        if (m_grad_valid && m_grad_dv == m_dv) {
+            ++m_grad_hits;
+            return m_grad;
+        }
+        m_grad_valid = false;
+        m_grad = m_prob.gradient(m_dv);
+        m_grad_dv = m_dv;
+        m_grad_valid = true;
+        return m_grad;
+    }
+
     // Delete all other ctors/assignment ops.
     nlopt_obj(const nlopt_obj &) = delete;
     nlopt_obj(nlopt_obj &&) = delete;
@@ -378,6 +409,11 @@ struct nlopt_obj {
     unsigned m_verbosity;
     unsigned long m_objfun_counter = 0;
     log_type m_log;
+    // The last decision vectors whose fitness and gradient were computed,
+    // the cached values and the number of cache hits.
+    vector_double m_fit_dv, m_fit, m_grad_dv, m_grad;
+    bool m_fit_valid = false, m_grad_valid = false;
+    unsigned long long m_fit_hits = 0, m_grad_hits = 0;
     // This exception pointer will be null, unless
     // an error is raised during the computation of the objfun
     // or constraints. If not null, it will be re-thrown
@@ -423,11 +459,11 @@ inline double nlopt_objfun_wrapper(unsigned dim, const double *x, double *grad,
         std::copy(x, x + dim, dv.begin());
 
         // Compute fitness.
-        const auto fitness = p.fitness(dv);
+        const auto &fitness = nlo.fitness();
 
         // Compute gradient, if needed.
         if (grad) {
-            const auto gradient = p.gradient(dv);
+            const auto &gradient = nlo.gradient();
 
             if (p.has_gradient_sparsity()) {
                 // Sparse gradient case.
@@ -531,12 +567,12 @@ inline void nlopt_ineq_c_wrapper(unsigned m, double *result, unsigned dim, const
 
         // Compute fitness and write IC to the output.
         // NOTE: fitness is nobj + nec + nic.
-        const auto fitness = p.fitness(dv);
+        const auto &fitness = nlo.fitness();
         nlopt_obj::unchecked_copy(p.get_nic(), fitness.data() + 1 + p.get_nec(), result);
 
         if (grad) {
             // Handle gradient, if requested.
-            const auto gradient = p.gradient(dv);
+            const auto &gradient = nlo.gradient();
 
             if (p.has_gradient_sparsity()) {
                 // Sparse gradient.
@@ -618,12 +654,12 @@ inline void nlopt_eq_c_wrapper(unsigned m, double *result, unsigned dim, const d
 
         // Compute fitness and write EC to the output.
         // NOTE: fitness is nobj + nec + nic.
-        const auto fitness = p.fitness(dv);
+        const auto &fitness = nlo.fitness();
         nlopt_obj::unchecked_copy(p.get_nec(), fitness.data() + 1, result);
 
         if (grad) {
             // Handle gradient, if requested.
-            const auto gradient = p.gradient(dv);
+            const auto &gradient = nlo.gradient();
 
             if (p.has_gradient_sparsity()) {
                 // Sparse gradient case.
@@ -857,7 +893,8 @@ public:
           m_sc_stopval(other.m_sc_stopval), m_sc_ftol_rel(other.m_sc_ftol_rel), m_sc_ftol_abs(other.m_sc_ftol_abs),
           m_sc_xtol_rel(other.m_sc_xtol_rel), m_sc_xtol_abs(other.m_sc_xtol_abs), m_sc_maxeval(other.m_sc_maxeval),
           m_sc_maxtime(other.m_sc_maxtime), m_verbosity(other.m_verbosity), m_log(other.m_log),
-          m_loc_opt(other.m_loc_opt ? detail::make_unique<nlopt>(*other.m_loc_opt) : nullptr)
+          m_loc_opt(other.m_loc_opt ? detail::make_unique<nlopt>(*other.m_loc_opt) : nullptr),
+          m_last_fit_hits(other.m_last_fit_hits), m_last_grad_hits(other.m_last_grad_hits)
     {
     }
     /// Move constructor.
@@ -877,6 +914,11 @@ public:
      * is satisfied, and the return status of the NLopt solver will be recorded (it can be fetched with
      * get_last_opt_result()).
      *
+     * NLopt computes the objective function and the constraints via separate callbacks, which are usually
+     * invoked for the same decision vector. The fitness and the gradient of the last decision vector evaluated
+     * are thus cached, so that the fitness (and the gradient) of consecutive requests for the same decision vector
+     * are computed only once. The number of cache hits during the last optimisation is reported by get_extra_info().
+     *
      * @param pop the population to be optimised.
      *
      * @return the optimised population.
@@ -946,8 +988,10 @@ public:
             // Print to screen the result of the optimisation, if we are being verbose.
             std::cout << "\nOptimisation return status: " << detail::nlopt_res2string(m_last_opt_result) << '\n';
         }
-        // Replace the log.
+        // Replace the log and record the cache hits.
         m_log = std::move(no.m_log);
+        m_last_fit_hits = no.m_fit_hits;
+        m_last_grad_hits = no.m_grad_hits;
 
         // Handle any exception that might've been thrown.
         if (no.m_eptr) {
@@ -1011,6 +1055,8 @@ public:
         auto retval = "\tNLopt version: " + std::to_string(major) + "." + std::to_string(minor) + "."
                       + std::to_string(bugfix) + "\n\tSolver: '" + m_algo
                       + "'\n\tLast optimisation return code: " + detail::nlopt_res2string(m_last_opt_result)
+                      + "\n\tLast optimisation cache hits: fitness " + std::to_string(m_last_fit_hits) + ", gradient "
+                      + std::to_string(m_last_grad_hits)
                       + "\n\tVerbosity: " + std::to_string(m_verbosity) + "\n\tIndividual selection "
                       + (boost::any_cast<population::size_type>(&m_select)
                              ? "idx: " + std::to_string(boost::any_cast<population::size_type>(m_select))
@@ -1316,7 +1362,8 @@ public:
     void save(Archive &ar) const
     {
         ar(cereal::base_class<not_population_based>(this), m_algo, m_last_opt_result, m_sc_stopval, m_sc_ftol_rel,
-           m_sc_ftol_abs, m_sc_xtol_rel, m_sc_xtol_abs, m_sc_maxeval, m_sc_maxtime, m_verbosity, m_log, m_loc_opt);
+           m_sc_ftol_abs, m_sc_xtol_rel, m_sc_xtol_abs, m_sc_maxeval, m_sc_maxtime, m_verbosity, m_log, m_loc_opt,
+           m_last_fit_hits, m_last_grad_hits);
     }
     /// Load from archive.
     /**
@@ -1332,7 +1379,8 @@ public:
     {
         try {
             ar(cereal::base_class<not_population_based>(this), m_algo, m_last_opt_result, m_sc_stopval, m_sc_ftol_rel,
-               m_sc_ftol_abs, m_sc_xtol_rel, m_sc_xtol_abs, m_sc_maxeval, m_sc_maxtime, m_verbosity, m_log, m_loc_opt);
+               m_sc_ftol_abs, m_sc_xtol_rel, m_sc_xtol_abs, m_sc_maxeval, m_sc_maxtime, m_verbosity, m_log, m_loc_opt,
+               m_last_fit_hits, m_last_grad_hits);
         } catch (...) {
             *this = nlopt{};
             throw;
@@ -1355,6 +1403,9 @@ private:
     mutable log_type m_log;
     // Local/subsidiary optimizer.
     std::unique_ptr<nlopt> m_loc_opt;
+    // Number of hits in the fitness and gradient caches during the last optimisation.
+    mutable unsigned long long m_last_fit_hits = 0;
+    mutable unsigned long long m_last_grad_hits = 0;
 };
 }
 
@@ -274,17 +274,17 @@ protected:
         if (boost::any_cast<std::string>(&m_select)) {
             const auto &s_select = boost::any_cast<const std::string &>(m_select);
             if (s_select == "best") {
-                x = pop.get_x()[pop.best_idx()];
-                f = pop.get_f()[pop.best_idx()];
+                x = pop.get_x_row(pop.best_idx());
+                f = pop.get_f_row(pop.best_idx());
             } else if (s_select == "worst") {
-                x = pop.get_x()[pop.worst_idx()];
-                f = pop.get_f()[pop.worst_idx()];
+                x = pop.get_x_row(pop.worst_idx());
+                f = pop.get_f_row(pop.worst_idx());
             } else {
                 assert(s_select == "random");
                 std::uniform_int_distribution<population::size_type> dist(0, pop.size() - 1u);
                 const auto idx = dist(m_e);
-                x = pop.get_x()[idx];
-                f = pop.get_f()[idx];
+                x = pop.get_x_row(idx);
+                f = pop.get_f_row(idx);
             }
         } else {
             const auto idx = boost::any_cast<population::size_type>(m_select);
@@ -293,8 +293,8 @@ protected:
                                                        + ": the population has a size of only "
                                                        + std::to_string(pop.size()));
             }
-            x = pop.get_x()[idx];
-            f = pop.get_f()[idx];
+            x = pop.get_x_row(idx);
+            f = pop.get_f_row(idx);
         }
         return std::make_pair(std::move(x), std::move(f));
     }
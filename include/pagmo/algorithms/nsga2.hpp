@@ -37,12 +37,16 @@ see https://www.gnu.org/licenses/. */
 #include <tuple>
 
 #include <pagmo/algorithm.hpp> // needed for the cereal macro
+#include <pagmo/bfe.hpp>
+#include <pagmo/detail/fitness_dedup.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
 #include <pagmo/problem.hpp>
 #include <pagmo/problems/decompose.hpp>
 #include <pagmo/rng.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
 #include <pagmo/utils/multi_objective.hpp> // crowding_distance, etc..
 
 namespace pagmo
@@ -87,7 +91,7 @@ public:
     nsga2(unsigned gen = 1u, double cr = 0.95, double eta_c = 10., double m = 0.01, double eta_m = 50.,
           unsigned seed = pagmo::random_device::next())
         : m_gen(gen), m_cr(cr), m_eta_c(eta_c), m_m(m), m_eta_m(eta_m), m_e(seed), m_seed(seed), m_verbosity(0u),
-          m_log()
+          m_log(), m_bfe(), m_use_bfe(false), m_dedup(false), m_saved_fevals(0u)
     {
         if (cr >= 1. || cr < 0.) {
             pagmo_throw(std::invalid_argument, "The crossover probability must be in the [0,1[ range, while a value of "
@@ -126,6 +130,7 @@ public:
         const auto &prob = pop.get_problem(); // This is a const reference, so using set_seed for example will not be
                                               // allowed
         auto dim = prob.get_nx();             // This getter does not return a const reference but a copy
+        auto nf = prob.get_nf();
         auto NP = pop.size();
 
         auto fevals0 = prob.get_fevals(); // discount for the fevals already made
@@ -157,11 +162,14 @@ public:
 
         // No throws, all valid: we clear the logs
         m_log.clear();
+        m_saved_fevals = 0u;
+        detail::fitness_dedup dedup(m_dedup);
 
         // Declarations
         std::vector<vector_double::size_type> best_idx(NP), shuffle1(NP), shuffle2(NP);
         vector_double::size_type parent1_idx, parent2_idx;
         vector_double child1(dim), child2(dim);
+        vector_double dvs_off(NP * dim);
 
         std::iota(shuffle1.begin(), shuffle1.end(), 0u);
         std::iota(shuffle2.begin(), shuffle2.end(), 0u);
@@ -177,6 +185,9 @@ public:
                     // Every 50 lines print the column names
                     if (count % 50u == 1u) {
                         print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:");
+                        if (dedup.is_active()) {
+                            print(std::setw(15), "Saved:");
+                        }
                         for (decltype(ideal_point.size()) i = 0u; i < ideal_point.size(); ++i) {
                             if (i >= 5u) {
                                 print(std::setw(15), "... :");
@@ -187,6 +198,9 @@ public:
                         print('\n');
                     }
                     print(std::setw(7), gen, std::setw(15), prob.get_fevals() - fevals0);
+                    if (dedup.is_active()) {
+                        print(std::setw(15), dedup.get_saved());
+                    }
                     for (decltype(ideal_point.size()) i = 0u; i < ideal_point.size(); ++i) {
                         if (i >= 5u) {
                             break;
@@ -208,10 +222,10 @@ public:
             std::shuffle(shuffle2.begin(), shuffle2.end(), m_e);
 
             // 1 - We compute crowding distance and non dominated rank for the current population
-            auto fnds_res = fast_non_dominated_sorting(pop.get_f());
-            auto ndf = std::get<0>(fnds_res); // non dominated fronts [[0,3,2],[1,5,6],[4],...]
-            vector_double pop_cd(NP);         // crowding distances of the whole population
-            auto ndr = std::get<3>(fnds_res); // non domination rank [0,1,0,0,2,1,1, ... ]
+            auto nds_res = non_dominated_sorting(pop.get_f());
+            auto ndf = std::get<0>(nds_res); // non dominated fronts [[0,2,3],[1,5,6],[4],...]
+            vector_double pop_cd(NP);        // crowding distances of the whole population
+            auto ndr = std::get<1>(nds_res); // non domination rank [0,1,0,0,2,1,1, ... ]
             for (const auto &front_idxs : ndf) {
                 if (front_idxs.size() == 1u) { // handles the case where the front has collapsed to one point
                     pop_cd[front_idxs[0]] = std::numeric_limits<double>::infinity();
@@ -222,7 +236,7 @@ public:
                     } else {
                         std::vector<vector_double> front;
                         for (auto idx : front_idxs) {
-                            front.push_back(pop.get_f()[idx]);
+                            front.push_back(pop.get_f_row(idx));
                         }
                         auto cd = crowding_distance(front);
                         for (decltype(cd.size()) i = 0u; i < cd.size(); ++i) {
@@ -233,7 +247,8 @@ public:
             }
 
             // 3 - We then loop thorugh all individuals with increment 4 to select two pairs of parents that will
-            // each create 2 new offspring
+            // each create 2 new offspring. The offspring are stored contiguously in dvs_off, so that their
+            // fitnesses can then be computed in a single batch.
             for (decltype(NP) i = 0u; i < NP; i += 4) {
                 // We create two offsprings using the shuffled list 1
                 parent1_idx = tournament_selection(shuffle1[i], shuffle1[i + 1], ndr, pop_cd);
@@ -241,12 +256,8 @@ public:
                 crossover(child1, child2, parent1_idx, parent2_idx, pop);
                 mutate(child1, pop);
                 mutate(child2, pop);
-                // we use prob to evaluate the fitness so
-                // that its feval counter is correctly updated
-                auto f1 = prob.fitness(child1);
-                auto f2 = prob.fitness(child2);
-                popnew.push_back(child1, f1);
-                popnew.push_back(child2, f2);
+                std::copy(child1.begin(), child1.end(), dvs_off.data() + i * dim);
+                std::copy(child2.begin(), child2.end(), dvs_off.data() + (i + 1u) * dim);
 
                 // We repeat with the shuffled list 2
                 parent1_idx = tournament_selection(shuffle2[i], shuffle2[i + 1], ndr, pop_cd);
@@ -254,12 +265,22 @@ public:
                 crossover(child1, child2, parent1_idx, parent2_idx, pop);
                 mutate(child1, pop);
                 mutate(child2, pop);
-                // we use prob to evaluate the fitness so
-                // that its feval counter is correctly updated
-                f1 = prob.fitness(child1);
-                f2 = prob.fitness(child2);
-                popnew.push_back(child1, f1);
-                popnew.push_back(child2, f2);
+                std::copy(child1.begin(), child1.end(), dvs_off.data() + (i + 2u) * dim);
+                std::copy(child2.begin(), child2.end(), dvs_off.data() + (i + 3u) * dim);
+            }
+
+            // 4 - We evaluate the offspring. We use the problem in pop to evaluate the fitness so that its
+            // feval counter is correctly updated. If a batch fitness evaluator was set, we delegate the
+            // evaluation to it, otherwise we use the batch fitness function of the problem. If the deduplication
+            // is active, the offspring identical to a parent or to another offspring are not evaluated.
+            dedup.reset(pop);
+            const auto fvs_off = dedup.batch_fitness(dvs_off, dim, nf, [this, &pop, &prob](const vector_double &dvs) {
+                return m_use_bfe ? m_bfe(pop.get_problem(), dvs) : prob.batch_fitness(dvs);
+            });
+            m_saved_fevals = dedup.get_saved();
+            for (decltype(NP) i = 0u; i < NP; ++i) {
+                popnew.push_back(vector_double(dvs_off.data() + i * dim, dvs_off.data() + (i + 1u) * dim),
+                                 vector_double(fvs_off.data() + i * nf, fvs_off.data() + (i + 1u) * nf));
             } // popnew now contains 2NP individuals
 
             // This method returns the sorted N best individuals in the population according to the crowded comparison
@@ -267,7 +288,7 @@ public:
             best_idx = select_best_N_mo(popnew.get_f(), NP);
             // We insert into the population
             for (population::size_type i = 0; i < NP; ++i) {
-                pop.set_xf(i, popnew.get_x()[best_idx[i]], popnew.get_f()[best_idx[i]]);
+                pop.set_xf(i, popnew.get_x_row(best_idx[i]), popnew.get_f_row(best_idx[i]));
             }
         } // end of main NSGAII loop
         return pop;
@@ -311,7 +332,8 @@ public:
      *  10            468    0.000336743      0.0855247       0.432144
      * @endcode
      * Gen, is the generation number, Fevals the number of function evaluation used. The ideal point of the current
-     * population follows cropped to its 5th component.
+     * population follows cropped to its 5th component. If the fitness deduplication is active (see
+     * nsga2::set_dedup()), a Saved column follows Fevals, reporting the number of fitness evaluations saved so far.
      *
      * @param level verbosity level
      */
@@ -327,6 +349,63 @@ public:
     {
         return m_verbosity;
     }
+    /// Sets the batch fitness evaluator
+    /**
+     * Sets the batch fitness evaluator that will be used in evolve() to compute the fitnesses of the offspring
+     * generated in each generation. By default, no batch fitness evaluator is set and the offspring are
+     * evaluated via pagmo::problem::batch_fitness().
+     *
+     * @param b the batch fitness evaluator.
+     */
+    void set_bfe(const bfe &b)
+    {
+        m_bfe = b;
+        m_use_bfe = true;
+    }
+    /// Sets the fitness deduplication
+    /**
+     * When the deduplication is active, the offspring which are exact copies of an individual of the current
+     * population or of another offspring of the same generation are not evaluated: their fitness is copied
+     * over instead, and only the distinct new decision vectors are passed to pagmo::problem::batch_fitness() or to
+     * the batch fitness evaluator set via set_bfe(). The number of fitness evaluations saved during the last call to
+     * evolve() can be retrieved via nsga2::get_saved_fevals(), and it is shown in the Saved column of the screen
+     * output (see nsga2::set_verbosity()). The Fevals column counts only the evaluations actually performed.
+     *
+     * By default the deduplication is not active.
+     *
+     * @param flag \p true to activate the fitness deduplication, \p false to deactivate it
+     */
+    void set_dedup(bool flag)
+    {
+        m_dedup = flag;
+    }
+    /// Gets the fitness deduplication flag
+    /**
+     * @return \p true if the fitness deduplication is active, \p false otherwise
+     */
+    bool get_dedup() const
+    {
+        return m_dedup;
+    }
+    /// Number of saved fitness evaluations
+    /**
+     * @return the number of fitness evaluations saved by the deduplication during the last call to evolve()
+     */
+    unsigned long long get_saved_fevals() const
+    {
+        return m_saved_fevals;
+    }
+    /// Algorithm's thread safety level
+    /**
+     * The thread safety level of NSGA-II is pagmo::thread_safety::basic, unless a batch fitness evaluator
+     * was set via set_bfe(), in which case the thread safety level of the evaluator is returned.
+     *
+     * @return the thread safety level of the algorithm.
+     */
+    thread_safety get_thread_safety() const
+    {
+        return m_use_bfe ? m_bfe.get_thread_safety() : thread_safety::basic;
+    }
     /// Algorithm name
     /**
      * Returns the name of the algorithm.
@@ -353,13 +432,18 @@ public:
         stream(ss, "\n\tDistribution index for mutation: ", m_eta_m);
         stream(ss, "\n\tSeed: ", m_seed);
         stream(ss, "\n\tVerbosity: ", m_verbosity);
+        if (m_use_bfe) {
+            stream(ss, "\n\tBatch fitness evaluator: ", m_bfe.get_name());
+        }
+        stream(ss, "\n\tFitness deduplication: ", m_dedup);
         return ss.str();
     }
     /// Get log
     /**
      * A log containing relevant quantities monitoring the last call to evolve. Each element of the returned
      * <tt>std::vector</tt> is a nsga2::log_line_type containing: Gen, Fevals, ideal_point
-     * as described in nsga2::set_verbosity
+     * as described in nsga2::set_verbosity. The number of fitness evaluations saved by the deduplication is not
+     * part of the log, and it can be retrieved via nsga2::get_saved_fevals().
      * @return an <tt>std::vector</tt> of nsga2::log_line_type containing the logged values Gen, Fevals,
      * ideal_point
      */
@@ -378,7 +462,8 @@ public:
     template <typename Archive>
     void serialize(Archive &ar)
     {
-        ar(m_gen, m_cr, m_eta_c, m_m, m_eta_m, m_e, m_seed, m_verbosity, m_log);
+        ar(m_gen, m_cr, m_eta_c, m_m, m_eta_m, m_e, m_seed, m_verbosity, m_log, m_bfe, m_use_bfe, m_dedup,
+           m_saved_fevals);
     }
 
 private:
@@ -405,8 +490,8 @@ private:
         const auto &lb = bounds.first;
         const auto &ub = bounds.second;
         // Parents decision vectors
-        vector_double parent1 = pop.get_x()[parent1_idx];
-        vector_double parent2 = pop.get_x()[parent2_idx];
+        vector_double parent1 = pop.get_x_row(parent1_idx);
+        vector_double parent2 = pop.get_x_row(parent2_idx);
         // declarations
         double y1, y2, yl, yu, rand01, beta, alpha, betaq, c1, c2;
         vector_double::size_type site1, site2;
@@ -551,6 +636,10 @@ private:
     unsigned int m_seed;
     unsigned int m_verbosity;
     mutable log_type m_log;
+    bfe m_bfe;
+    bool m_use_bfe;
+    bool m_dedup;
+    mutable unsigned long long m_saved_fevals;
 };
 
 } // namespace pagmo
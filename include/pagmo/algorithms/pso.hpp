@@ -259,11 +259,11 @@ public:
 
         // Copy the particle positions and their fitness
         for (decltype(swarm_size) i = 0u; i < swarm_size; ++i) {
-            X[i] = pop.get_x()[i];
-            lbX[i] = pop.get_x()[i];
+            X[i] = pop.get_x_row(i);
+            lbX[i] = pop.get_x_row(i);
 
-            fit[i] = pop.get_f()[i];
-            lbfit[i] = pop.get_f()[i];
+            fit[i] = pop.get_f_row(i);
+            lbfit[i] = pop.get_f_row(i);
         }
 
         // Initialize the particle velocities if necessary
@@ -287,7 +287,7 @@ public:
             case 4:
                 initialize_topology__adaptive_random(neighb);
                 // need to track improvements in best found fitness, to know when to rewire
-                best_fit = pop.get_f()[pop.best_idx()];
+                best_fit = pop.get_f_row(pop.best_idx());
                 break;
             case 2:
             default:
@@ -703,8 +703,8 @@ private:
     {
         // The best position already visited by the swarm will be tracked in pso::evolve() as particles are evaluated.
         // Here we define the initial values of the variables that will do that tracking.
-        gbX = pop.get_x()[pop.best_idx()];
-        gbfit = pop.get_f()[pop.best_idx()];
+        gbX = pop.get_x_row(pop.best_idx());
+        gbfit = pop.get_f_row(pop.best_idx());
 
         /* The usage of a gbest swarm topology along with a FIPS (fully informed particle swarm) velocity update formula
          * is discouraged. However, because a user might still configure such a setup, we must ensure FIPS has access to
@@ -154,11 +154,11 @@ public:
                 pop.get_problem().set_seed(std::uniform_int_distribution<unsigned int>()(m_e));
                 // re-evaluate the whole population w.r.t. the new seed
                 for (decltype(pop.size()) j = 0u; j < pop.size(); ++j) {
-                    pop.set_xf(j, pop.get_x()[j], prob.fitness(pop.get_x()[j]));
+                    pop.set_xf(j, pop.get_x_row(j), prob.fitness(pop.get_x_row(j)));
                 }
             }
 
-            vector_double offspring = pop.get_x()[best_idx];
+            vector_double offspring = pop.get_x_row(best_idx);
             // 2 - Mutate the components (at least one) of the best
             vector_double::size_type mut = 0u;
             while (!mut) {
@@ -171,10 +171,10 @@ public:
             }
             // 3 - Insert the offspring into the population if better
             auto offspring_f = prob.fitness(offspring);
-            auto improvement = pop.get_f()[worst_idx][0] - offspring_f[0];
+            auto improvement = pop.get_f_row(worst_idx)[0] - offspring_f[0];
             if (improvement >= 0.) {
                 pop.set_xf(worst_idx, offspring, offspring_f);
-                if (pop.get_f()[best_idx][0] - offspring_f[0] >= 0.) {
+                if (pop.get_f_row(best_idx)[0] - offspring_f[0] >= 0.) {
                     best_idx = worst_idx;
                 }
                 worst_idx = pop.worst_idx();
@@ -187,10 +187,10 @@ public:
                               std::setw(15), "Improvement:", std::setw(15), "Mutations:", '\n');
                     }
                     print(std::setw(7), i, std::setw(15), prob.get_fevals() - fevals0, std::setw(15),
-                          pop.get_f()[best_idx][0], std::setw(15), improvement, std::setw(15), mut, '\n');
+                          pop.get_f_row(best_idx)[0], std::setw(15), improvement, std::setw(15), mut, '\n');
                     ++count;
                     // Logs
-                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f()[best_idx][0], improvement, mut);
+                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f_row(best_idx)[0], improvement, mut);
                 }
             }
             // 4 - Logs and prints (verbosity modes > 1: a line is added every m_verbosity generations)
@@ -203,10 +203,10 @@ public:
                               std::setw(15), "Improvement:", std::setw(15), "Mutations:", '\n');
                     }
                     print(std::setw(7), i, std::setw(15), prob.get_fevals() - fevals0, std::setw(15),
-                          pop.get_f()[best_idx][0], std::setw(15), improvement, std::setw(15), mut, '\n');
+                          pop.get_f_row(best_idx)[0], std::setw(15), improvement, std::setw(15), mut, '\n');
                     ++count;
                     // Logs
-                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f()[best_idx][0], improvement, mut);
+                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f_row(best_idx)[0], improvement, mut);
                 }
             }
         }
@@ -44,6 +44,7 @@ see https://www.gnu.org/licenses/. */
 
 #include <pagmo/algorithm.hpp>
 #include <pagmo/detail/custom_comparisons.hpp>
+#include <pagmo/detail/fitness_dedup.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
@@ -226,7 +227,7 @@ public:
         unsigned param_s = 2u, std::string crossover = "exponential", std::string mutation = "polynomial",
         std::string selection = "tournament", unsigned seed = pagmo::random_device::next())
         : m_gen(gen), m_cr(cr), m_eta_c(eta_c), m_m(m), m_param_m(param_m), m_param_s(param_s), m_e(seed), m_seed(seed),
-          m_verbosity(0u), m_log()
+          m_verbosity(0u), m_log(), m_dedup(false), m_saved_fevals(0u)
     {
         if (cr > 1. || cr < 0.) {
             pagmo_throw(std::invalid_argument, "The crossover probability must be in the [0,1] range, while a value of "
@@ -333,6 +334,9 @@ public:
 
         // No throws, all valid: we clear the logs
         m_log.clear();
+        m_saved_fevals = 0u;
+        // The fitness of duplicated decision vectors can be reused only if the problem is deterministic.
+        detail::fitness_dedup dedup(m_dedup && !prob.is_stochastic());
 
         double improvement; // stores the difference in fitness between parents and offsprings
         std::uniform_int_distribution<unsigned int> urng;
@@ -342,7 +346,7 @@ public:
                 pop.get_problem().set_seed(urng(m_e));
                 // re-evaluate the whole population w.r.t. the new seed
                 for (decltype(pop.size()) j = 0u; j < pop.size(); ++j) {
-                    pop.set_xf(j, pop.get_x()[j], prob.fitness(pop.get_x()[j]));
+                    pop.set_xf(j, pop.get_x_row(j), prob.fitness(pop.get_x_row(j)));
                 }
             }
             auto XNEW = pop.get_x();
@@ -350,44 +354,53 @@ public:
             // 2 - Selection.
             auto selected_idx = perform_selection(FNEW);
             for (decltype(NP) j = 0u; j < NP; ++j) {
-                XNEW[j] = pop.get_x()[selected_idx[j]];
+                XNEW[j] = pop.get_x_row(selected_idx[j]);
             }
             // 3 - Crossover
             perform_crossover(XNEW, prob.get_bounds(), dim_i);
             // 4 - Mutation
             perform_mutation(XNEW, prob.get_bounds(), dim_i);
-            // 5 - Evaluate the new population
+            // 5 - Evaluate the new population (skipping, if requested, the exact duplicates
+            // of the parents and of the offspring already evaluated)
+            dedup.reset(pop);
             for (decltype(NP) j = 0u; j < NP; ++j) {
-                FNEW[j] = prob.fitness(XNEW[j]);
+                FNEW[j] = dedup.fitness(prob, XNEW[j]);
             }
+            m_saved_fevals = dedup.get_saved();
             // 6 - Logs and prints
             if (m_verbosity > 0u) {
                 double bestf = std::numeric_limits<double>::max();
                 for (decltype(NP) j = 0u; j < NP; ++j) {
                     if (FNEW[j][0] < bestf) bestf = FNEW[j][0];
                 }
-                improvement = pop.get_f()[pop.best_idx()][0] - bestf;
+                improvement = pop.get_f_row(pop.best_idx())[0] - bestf;
                 // (verbosity modes = 1: a line is added at each improvement
                 // (verbosity modes > 1: a line is added every m_verbosity generations)
                 if (((i % m_verbosity == 1u) && (m_verbosity > 1u)) || ((improvement > 0) && (m_verbosity == 1u))) {
 
                     // Every 50 lines print the column names
                     if (count % 50u == 1u) {
-                        print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:", std::setw(15), "Best:",
-                              std::setw(15), "Improvement:", '\n');
+                        print("\n", std::setw(7), "Gen:", std::setw(15), "Fevals:");
+                        if (dedup.is_active()) {
+                            print(std::setw(15), "Saved:");
+                        }
+                        print(std::setw(15), "Best:", std::setw(15), "Improvement:", '\n');
+                    }
+                    print(std::setw(7), i, std::setw(15), prob.get_fevals() - fevals0);
+                    if (dedup.is_active()) {
+                        print(std::setw(15), dedup.get_saved());
                     }
-                    print(std::setw(7), i, std::setw(15), prob.get_fevals() - fevals0, std::setw(15),
-                          pop.get_f()[pop.best_idx()][0], std::setw(15), improvement, '\n');
+                    print(std::setw(15), pop.get_f_row(pop.best_idx())[0], std::setw(15), improvement, '\n');
                     ++count;
                     // Logs
-                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f()[pop.best_idx()][0], improvement);
+                    m_log.emplace_back(i, prob.get_fevals() - fevals0, pop.get_f_row(pop.best_idx())[0], improvement);
                 }
             }
             // 7 - And insert the best into pop
             // We add all the parents to the new population
             for (decltype(NP) j = 0u; j < NP; ++j) {
-                XNEW.push_back(pop.get_x()[j]);
-                FNEW.push_back(pop.get_f()[j]);
+                XNEW.push_back(pop.get_x_row(j));
+                FNEW.push_back(pop.get_f_row(j));
             }
             // sort the entire pool
             std::vector<vector_double::size_type> best_idxs(FNEW.size());
@@ -450,7 +463,9 @@ public:
     *   25            500        2354.07        22.6248
     * @endcode
     * Gen is the generation number, Fevals the number of fitness evaluations , Best is the best fitness found,
-    * Improvement is the improvement of the new population of offspring with respect to the parents.
+    * Improvement is the improvement of the new population of offspring with respect to the parents. If the fitness
+    * deduplication is active (see sga::set_dedup()), a Saved column follows Fevals, reporting the number of
+    * fitness evaluations saved so far.
     *
     * @param level verbosity level
     */
@@ -466,6 +481,42 @@ public:
     {
         return m_verbosity;
     }
+    /// Sets the fitness deduplication
+    /**
+     * When the deduplication is active, the offspring which are exact copies of a parent or of another
+     * offspring of the same generation are not evaluated: their fitness is copied over instead. This is
+     * useful, for instance, when the problem has an integer part and the population converges, as the
+     * crossover and mutation operators then often produce identical individuals. The number of fitness
+     * evaluations saved during the last call to evolve() can be retrieved via sga::get_saved_fevals(), and
+     * it is shown in the Saved column of the screen output (see sga::set_verbosity()). The Fevals column counts
+     * only the evaluations actually performed.
+     *
+     * The deduplication is never performed on stochastic problems, as their fitness changes with the seed.
+     *
+     * By default the deduplication is not active.
+     *
+     * @param flag \p true to activate the fitness deduplication, \p false to deactivate it
+     */
+    void set_dedup(bool flag)
+    {
+        m_dedup = flag;
+    }
+    /// Gets the fitness deduplication flag
+    /**
+     * @return \p true if the fitness deduplication is active, \p false otherwise
+     */
+    bool get_dedup() const
+    {
+        return m_dedup;
+    }
+    /// Number of saved fitness evaluations
+    /**
+     * @return the number of fitness evaluations saved by the deduplication during the last call to evolve()
+     */
+    unsigned long long get_saved_fevals() const
+    {
+        return m_saved_fevals;
+    }
     /// Algorithm name
     /**
     * @return a string containing the algorithm name
@@ -500,6 +551,7 @@ public:
         if (m_selection == selection::TOURNAMENT) stream(ss, "\n\t\tTournament size: ", m_param_s);
         stream(ss, "\n\tSeed: ", m_seed);
         stream(ss, "\n\tVerbosity: ", m_verbosity);
+        stream(ss, "\n\tFitness deduplication: ", m_dedup);
         return ss.str();
     }
 
@@ -507,7 +559,8 @@ public:
     /**
     * A log containing relevant quantities monitoring the last call to evolve. Each element of the returned
     * <tt>std::vector</tt> is a sga::log_line_type containing: Gen, Fevals, Current best, Best as
-    * described in sga::set_verbosity().
+    * described in sga::set_verbosity(). The number of fitness evaluations saved by the deduplication is not part
+    * of the log, and it can be retrieved via sga::get_saved_fevals().
     *
     * @return an <tt> std::vector</tt> of sga::log_line_type containing the logged values Gen, Fevals, Best
     * improvement
@@ -528,7 +581,7 @@ public:
     void serialize(Archive &ar)
     {
         ar(m_gen, m_cr, m_eta_c, m_m, m_param_m, m_param_s, m_mutation, m_selection, m_crossover, m_e, m_seed,
-           m_verbosity, m_log);
+           m_verbosity, m_log, m_dedup, m_saved_fevals);
     }
 
 private:
@@ -841,6 +894,8 @@ private:
     unsigned int m_seed;
     unsigned int m_verbosity;
     mutable log_type m_log;
+    bool m_dedup;
+    mutable unsigned long long m_saved_fevals;
 };
 
 } // namespace pagmo
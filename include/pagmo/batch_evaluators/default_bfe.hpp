@@ -0,0 +1,130 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_BATCH_EVALUATORS_DEFAULT_BFE_HPP
+#define PAGMO_BATCH_EVALUATORS_DEFAULT_BFE_HPP
+
+#include <functional>
+#include <stdexcept>
+#include <string>
+
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// NOTE: this structure holds an std::function that implements the logic for the selection of the
+// batch fitness evaluation strategy in default_bfe. The logic is decoupled so that we can override the default
+// logic with alternative implementations (e.g., use a process-based evaluator rather than the threaded one if the
+// problem does not provide thread safety).
+template <typename = void>
+struct default_bfe_impl {
+    using func_t = std::function<vector_double(problem &, const vector_double &)>;
+    static func_t s_func;
+};
+
+// C++ implementation of the default batch fitness evaluation strategy.
+inline vector_double default_bfe_cpp_impl(problem &p, const vector_double &dvs)
+{
+    if (p.has_batch_fitness()) {
+        // The problem provides a batch fitness member function, use it.
+        return member_bfe{}(p, dvs);
+    }
+    if (p.get_thread_safety() >= thread_safety::basic) {
+        // The problem is thread-safe, use the threaded evaluator.
+        return thread_bfe{}(p, dvs);
+    }
+    pagmo_throw(std::invalid_argument,
+                "Cannot execute fitness evaluations in batch mode for a problem of type '" + p.get_name()
+                    + "': the problem does not implement the batch_fitness() member function, and its thread safety "
+                      "level is not sufficient to run a thread-based batch fitness evaluation implementation");
+}
+
+// Static init.
+template <typename T>
+typename default_bfe_impl<T>::func_t default_bfe_impl<T>::s_func = default_bfe_cpp_impl;
+} // namespace detail
+
+/// Default batch fitness evaluator.
+/**
+ * This class is a user-defined batch fitness evaluator (UDBFE) that will select a batch fitness evaluation strategy
+ * depending on the properties of the input problem:
+ * - if the problem provides a batch fitness member function (as established by pagmo::problem::has_batch_fitness()),
+ *   the evaluation will be delegated to pagmo::member_bfe;
+ * - otherwise, if the problem provides at least the pagmo::thread_safety::basic thread safety guarantee, the
+ *   evaluation will be delegated to pagmo::thread_bfe;
+ * - otherwise, an error will be raised.
+ *
+ * This is the UDBFE used by the default constructor of pagmo::bfe.
+ */
+class default_bfe
+{
+public:
+    /// Call operator.
+    /**
+     * @param p the input problem.
+     * @param dvs the input decision vectors, stored contiguously.
+     *
+     * @return the fitness vectors corresponding to \p dvs, stored contiguously.
+     *
+     * @throws std::invalid_argument if \p p does not provide a batch fitness member function and its thread
+     * safety level is pagmo::thread_safety::none.
+     * @throws unspecified any exception thrown by the call operator of pagmo::member_bfe or pagmo::thread_bfe.
+     */
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        return detail::default_bfe_impl<>::s_func(p, dvs);
+    }
+    /// Name.
+    /**
+     * @return <tt>"Default batch fitness evaluator"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Default batch fitness evaluator";
+    }
+    /// Serialization support.
+    /**
+     * This class is stateless, no data will be saved to or loaded from the archive.
+     */
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+} // namespace pagmo
+
+#endif
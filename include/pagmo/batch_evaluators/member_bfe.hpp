@@ -0,0 +1,81 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_BATCH_EVALUATORS_MEMBER_BFE_HPP
+#define PAGMO_BATCH_EVALUATORS_MEMBER_BFE_HPP
+
+#include <string>
+
+#include <pagmo/problem.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Member function batch fitness evaluator.
+/**
+ * This class is a user-defined batch fitness evaluator (UDBFE) that will forward the evaluation of a batch of
+ * decision vectors to pagmo::problem::batch_fitness(). It is thus meant to be used with problems implementing
+ * a <tt>%batch_fitness()</tt> member function.
+ */
+class member_bfe
+{
+public:
+    /// Call operator.
+    /**
+     * @param p the input problem.
+     * @param dvs the input decision vectors, stored contiguously.
+     *
+     * @return the output of pagmo::problem::batch_fitness().
+     *
+     * @throws unspecified any exception thrown by pagmo::problem::batch_fitness().
+     */
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        return p.batch_fitness(dvs);
+    }
+    /// Name.
+    /**
+     * @return <tt>"Member function batch fitness evaluator"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Member function batch fitness evaluator";
+    }
+    /// Serialization support.
+    /**
+     * This class is stateless, no data will be saved to or loaded from the archive.
+     */
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+} // namespace pagmo
+
+#endif
@@ -0,0 +1,147 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_BATCH_EVALUATORS_THREAD_BFE_HPP
+#define PAGMO_BATCH_EVALUATORS_THREAD_BFE_HPP
+
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <pagmo/detail/bfe_impl.hpp>
+#include <pagmo/detail/parallel_for.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Threaded batch fitness evaluator.
+/**
+ * This class is a user-defined batch fitness evaluator (UDBFE) that will evaluate the decision vectors of a batch
+ * in parallel. The evaluations are run by the calling thread together with the workers of a persistent thread pool
+ * (distinct from the pool running the evolutions of the islands), so that repeated calls, e.g., once per generation
+ * of an algorithm, do not pay the cost of starting new threads. The decision vectors are handed out to the threads
+ * one at a time, so that the load is balanced even when the evaluation times are uneven. Each thread operates
+ * on its own copy of the input problem, thus this evaluator can be used only with problems providing at least
+ * the pagmo::thread_safety::basic thread safety guarantee. Problems providing the pagmo::thread_safety::constant
+ * guarantee are not copied: all the threads evaluate the input problem directly.
+ */
+class thread_bfe
+{
+public:
+    /// Call operator.
+    /**
+     * The call operator will evaluate the decision vectors in \p dvs in parallel, using a number of threads which
+     * is at most the value returned by <tt>std::thread::hardware_concurrency()</tt> (including the calling thread).
+     * After a successful evaluation, the fitness evaluation counter of \p p will be incremented by the number of
+     * decision vectors in \p dvs.
+     * If the thread safety level of \p p is pagmo::thread_safety::constant, \p p is evaluated concurrently
+     * without being copied, and its fitness evaluation counter is incremented also by the evaluations
+     * which completed before an error was raised.
+     *
+     * @param p the input problem.
+     * @param dvs the input decision vectors, stored contiguously.
+     *
+     * @return the fitness vectors corresponding to \p dvs, stored contiguously.
+     *
+     * @throws std::invalid_argument if the thread safety level of \p p is pagmo::thread_safety::none, or if
+     * the length of \p dvs is not a multiple of the dimension of \p p.
+     * @throws std::overflow_error if the size of the output vector would result in an overflow.
+     * @throws unspecified any exception thrown by:
+     * - the copy constructor of pagmo::problem,
+     * - pagmo::problem::fitness(),
+     * - threading primitives,
+     * - memory allocation errors in standard containers.
+     */
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        if (p.get_thread_safety() < thread_safety::basic) {
+            pagmo_throw(std::invalid_argument, "Cannot use a thread_bfe on the problem '" + p.get_name()
+                                                   + "', which does not provide the required level of thread safety");
+        }
+        const auto n_dvs = detail::bfe_check_input_dvs(p, dvs);
+        const auto nx = p.get_nx(), nf = p.get_nf();
+        vector_double retval(n_dvs * nf);
+        if (!n_dvs) {
+            return retval;
+        }
+
+        // Number of workers to use: we never use more workers than the number of decision vectors.
+        const auto n_workers = static_cast<unsigned>(std::min(
+            static_cast<vector_double::size_type>(detail::parallel_for_thread_pool().get_size()), n_dvs));
+
+        // If the problem can be evaluated concurrently, all the workers share p. Otherwise, each worker
+        // gets its own copy.
+        // NOTE: the copies of the problem are created serially here, because the basic thread safety level
+        // does not guarantee that concurrent copies of the same problem instance are safe.
+        const bool shared = p.get_thread_safety() >= thread_safety::constant;
+        std::vector<problem> probs(shared ? 0u : n_workers, p);
+        // Per-worker buffer for the decision vectors.
+        std::vector<vector_double> tmp_dvs(n_workers, vector_double(nx));
+
+        // Evaluate the decision vectors, handing them out to the workers one at a time.
+        auto eval = [&p, &dvs, &retval, &probs, &tmp_dvs, shared, nx, nf](unsigned w, vector_double::size_type i) {
+            const problem &prob = shared ? p : probs[w];
+            auto &tmp_dv = tmp_dvs[w];
+            std::copy(dvs.data() + i * nx, dvs.data() + (i + 1u) * nx, tmp_dv.data());
+            const auto tmp_f = prob.fitness(tmp_dv);
+            std::copy(tmp_f.begin(), tmp_f.end(), retval.data() + i * nf);
+        };
+        detail::parallel_for(n_dvs, n_workers, eval);
+
+        // Account for the evaluations in the original problem (if shared, p has already
+        // counted them).
+        if (!shared) {
+            p.increment_fevals(static_cast<unsigned long long>(n_dvs));
+        }
+        return retval;
+    }
+    /// Name.
+    /**
+     * @return <tt>"Multi-threaded batch fitness evaluator"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Multi-threaded batch fitness evaluator";
+    }
+    /// Serialization support.
+    /**
+     * This class is stateless, no data will be saved to or loaded from the archive.
+     */
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+} // namespace pagmo
+
+#endif
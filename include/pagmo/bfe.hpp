@@ -0,0 +1,581 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_BFE_HPP
+#define PAGMO_BFE_HPP
+
+#include <cassert>
+#include <iostream>
+#include <memory>
+#include <string>
+#include <type_traits>
+#include <typeinfo>
+#include <utility>
+
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/detail/bfe_impl.hpp>
+#include <pagmo/detail/make_unique.hpp>
+#include <pagmo/io.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+
+/// Macro for the registration of the serialization functionality for user-defined batch fitness evaluators.
+/**
+ * This macro should always be invoked after the declaration of a user-defined batch fitness evaluator: it will
+ * register the evaluator with pagmo's serialization machinery. The macro should be called in the root namespace
+ * and using the fully qualified name of the evaluator to be registered. For example:
+ * @code{.unparsed}
+ * namespace my_namespace
+ * {
+ *
+ * class my_bfe
+ * {
+ *    // ...
+ * };
+ *
+ * }
+ *
+ * PAGMO_REGISTER_BFE(my_namespace::my_bfe)
+ * @endcode
+ */
+#define PAGMO_REGISTER_BFE(b) CEREAL_REGISTER_TYPE_WITH_NAME(pagmo::detail::bfe_inner<b>, "udbfe " #b)
+
+namespace pagmo
+{
+
+/// Detect the call operator of a user-defined batch fitness evaluator.
+/**
+ * This type trait will be \p true if \p T provides a call operator with
+ * the following signature:
+ * @code{.unparsed}
+ * vector_double operator()(problem &, const vector_double &) const;
+ * @endcode
+ * The call operator is part of the interface for the definition of a batch fitness evaluator
+ * (see pagmo::bfe).
+ */
+template <typename T>
+class has_bfe_call_operator
+{
+    template <typename U>
+    using call_t
+        = decltype(std::declval<const U &>()(std::declval<problem &>(), std::declval<const vector_double &>()));
+    static const bool implementation_defined = std::is_same<vector_double, detected_t<call_t, T>>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool has_bfe_call_operator<T>::value;
+
+namespace detail
+{
+
+// Specialise this to true in order to disable all the UDBFE checks and mark a type
+// as a UDBFE regardless of the features provided by it.
+// NOTE: this is needed when implementing the machinery for Python batch evaluators.
+// NOTE: leave this as an implementation detail for now.
+template <typename>
+struct disable_udbfe_checks : std::false_type {};
+} // namespace detail
+
+/// Detect user-defined batch fitness evaluators (UDBFE).
+/**
+ * This type trait will be \p true if \p T is not cv/reference qualified, it is destructible, default, copy and move
+ * constructible, and if it satisfies the pagmo::has_bfe_call_operator type trait.
+ *
+ * Types satisfying this type trait can be used as user-defined batch fitness evaluators (UDBFE) in pagmo::bfe.
+ */
+template <typename T>
+class is_udbfe
+{
+    static const bool implementation_defined
+        = (std::is_same<T, uncvref_t<T>>::value && std::is_default_constructible<T>::value
+           && std::is_copy_constructible<T>::value && std::is_move_constructible<T>::value
+           && std::is_destructible<T>::value && has_bfe_call_operator<T>::value)
+          || detail::disable_udbfe_checks<T>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool is_udbfe<T>::value;
+
+namespace detail
+{
+
+struct bfe_inner_base {
+    virtual ~bfe_inner_base() {}
+    virtual std::unique_ptr<bfe_inner_base> clone() const = 0;
+    virtual vector_double operator()(problem &, const vector_double &) const = 0;
+    virtual std::string get_name() const = 0;
+    virtual std::string get_extra_info() const = 0;
+    virtual thread_safety get_thread_safety() const = 0;
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+
+template <typename T>
+struct bfe_inner final : bfe_inner_base {
+    // We just need the def ctor, delete everything else.
+    bfe_inner() = default;
+    bfe_inner(const bfe_inner &) = delete;
+    bfe_inner(bfe_inner &&) = delete;
+    bfe_inner &operator=(const bfe_inner &) = delete;
+    bfe_inner &operator=(bfe_inner &&) = delete;
+    // Constructors from T (copy and move variants).
+    explicit bfe_inner(const T &x) : m_value(x) {}
+    explicit bfe_inner(T &&x) : m_value(std::move(x)) {}
+    // The clone method, used in the copy constructor of bfe.
+    virtual std::unique_ptr<bfe_inner_base> clone() const override final
+    {
+        return make_unique<bfe_inner>(m_value);
+    }
+    // Mandatory methods.
+    virtual vector_double operator()(problem &p, const vector_double &dvs) const override final
+    {
+        return m_value(p, dvs);
+    }
+    // Optional methods.
+    virtual std::string get_name() const override final
+    {
+        return get_name_impl(m_value);
+    }
+    virtual std::string get_extra_info() const override final
+    {
+        return get_extra_info_impl(m_value);
+    }
+    virtual thread_safety get_thread_safety() const override final
+    {
+        return get_thread_safety_impl(m_value);
+    }
+    // Implementation of the optional methods.
+    template <typename U, enable_if_t<has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &value)
+    {
+        return value.get_name();
+    }
+    template <typename U, enable_if_t<!has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &)
+    {
+        return typeid(U).name();
+    }
+    template <typename U, enable_if_t<has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &value)
+    {
+        return value.get_extra_info();
+    }
+    template <typename U, enable_if_t<!has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &)
+    {
+        return "";
+    }
+    template <typename U, enable_if_t<has_get_thread_safety<U>::value, int> = 0>
+    static thread_safety get_thread_safety_impl(const U &value)
+    {
+        return value.get_thread_safety();
+    }
+    template <typename U, enable_if_t<!has_get_thread_safety<U>::value, int> = 0>
+    static thread_safety get_thread_safety_impl(const U &)
+    {
+        return thread_safety::basic;
+    }
+    // Serialization
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(cereal::base_class<bfe_inner_base>(this), m_value);
+    }
+    T m_value;
+};
+
+} // end of namespace detail
+
+/// Batch fitness evaluator.
+/**
+ * This class implements the evaluation of the fitnesses of a batch of decision vectors, represented as
+ * a single contiguous pagmo::vector_double. Algorithms can use this class in order to evaluate at once all the
+ * decision vectors generated in an iteration, possibly in parallel (e.g., via multiple threads or processes), or
+ * exploiting a vectorised fitness function provided by the problem.
+ *
+ * In order to define a batch fitness evaluator in pagmo, the user must first define a class (or a struct) whose
+ * methods describe the properties of the evaluator and implement its logic. In pagmo, we refer to such a class as
+ * a **user-defined batch fitness evaluator**, or UDBFE for short. Once defined and instantiated, a UDBFE can then be
+ * used to construct an instance of this class, pagmo::bfe, which provides a generic interface to batch fitness
+ * evaluators.
+ *
+ * Every UDBFE must implement at least the following method:
+ * @code{.unparsed}
+ * vector_double operator()(problem &, const vector_double &) const;
+ * @endcode
+ *
+ * The call operator takes as input a pagmo::problem and a batch of decision vectors stored contiguously (that is,
+ * the first \f$n_x\f$ components of the batch are the components of the first decision vector, and so on), and it
+ * is expected to return the corresponding fitness vectors, stored contiguously in the same order. The UDBFE is
+ * responsible for updating the fitness evaluation counter of the input problem (see
+ * pagmo::problem::increment_fevals()). In addition to providing the above method, a UDBFE must also be default,
+ * copy and move constructible.
+ *
+ * Additional optional methods can be implemented in a UDBFE:
+ * @code{.unparsed}
+ * std::string get_name() const;
+ * std::string get_extra_info() const;
+ * thread_safety get_thread_safety() const;
+ * @endcode
+ *
+ * See the documentation of the corresponding methods in this class for details on how the optional
+ * methods in the UDBFE are used by pagmo::bfe.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    A moved-from pagmo::bfe is destructible and assignable. Any other operation will result
+ *    in undefined behaviour.
+ *
+ * \endverbatim
+ */
+class bfe
+{
+    // Enable the generic ctor only if T is not a bfe (after removing
+    // const/reference qualifiers), and if T is a udbfe.
+    template <typename T>
+    using generic_ctor_enabler
+        = enable_if_t<!std::is_same<bfe, uncvref_t<T>>::value && is_udbfe<uncvref_t<T>>::value, int>;
+
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialize a pagmo::bfe containing a pagmo::default_bfe.
+     *
+     * @throws unspecified any exception thrown by the constructor from UDBFE.
+     */
+    bfe() : bfe(default_bfe{}) {}
+    /// Constructor from a user-defined batch fitness evaluator of type \p T
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is not enabled if, after the removal of cv and reference qualifiers,
+     *    ``T`` is of type :cpp:class:`pagmo::bfe` (that is, this constructor does not compete with the copy/move
+     *    constructors of :cpp:class:`pagmo::bfe`), or if ``T`` does not satisfy :cpp:class:`pagmo::is_udbfe`.
+     *
+     * \endverbatim
+     *
+     * This constructor will construct a pagmo::bfe from the UDBFE \p x of type \p T. The constructor will
+     * examine the properties of \p x and store them as data members of \p this.
+     *
+     * @param x the UDBFE.
+     *
+     * @throws unspecified any exception thrown by methods of the UDBFE invoked during construction or by memory
+     * errors in strings and standard containers.
+     */
+    template <typename T, generic_ctor_enabler<T> = 0>
+    explicit bfe(T &&x) : m_ptr(detail::make_unique<detail::bfe_inner<uncvref_t<T>>>(std::forward<T>(x)))
+    {
+        // We store at construction the value returned from the user implemented get_name
+        m_name = ptr()->get_name();
+        // Store the thread safety value.
+        m_thread_safety = ptr()->get_thread_safety();
+    }
+    /// Copy constructor
+    /**
+     * The copy constructor will deep copy the input bfe \p other.
+     *
+     * @param other the bfe to be copied.
+     *
+     * @throws unspecified any exception thrown by:
+     * - memory allocation errors in standard containers,
+     * - the copying of the internal UDBFE.
+     */
+    bfe(const bfe &other) : m_ptr(other.ptr()->clone()), m_name(other.m_name), m_thread_safety(other.m_thread_safety) {}
+    /// Move constructor
+    /**
+     * @param other the bfe from which \p this will be move-constructed.
+     */
+    bfe(bfe &&other) noexcept
+        : m_ptr(std::move(other.m_ptr)), m_name(std::move(other.m_name)),
+          m_thread_safety(std::move(other.m_thread_safety))
+    {
+    }
+    /// Move assignment operator
+    /**
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     */
+    bfe &operator=(bfe &&other) noexcept
+    {
+        if (this != &other) {
+            m_ptr = std::move(other.m_ptr);
+            m_name = std::move(other.m_name);
+            m_thread_safety = std::move(other.m_thread_safety);
+        }
+        return *this;
+    }
+    /// Copy assignment operator
+    /**
+     * Copy assignment is implemented as a copy constructor followed by a move assignment.
+     *
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     *
+     * @throws unspecified any exception thrown by the copy constructor.
+     */
+    bfe &operator=(const bfe &other)
+    {
+        // Copy ctor + move assignment.
+        return *this = bfe(other);
+    }
+
+    /// Extract a const pointer to the UDBFE.
+    /**
+     * This method will extract a const pointer to the internal instance of the UDBFE. If \p T is not the same type
+     * as the UDBFE used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime of
+     *    ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * @return a const pointer to the internal UDBFE, or \p nullptr
+     * if \p T does not correspond exactly to the original UDBFE type used
+     * in the constructor.
+     */
+    template <typename T>
+    const T *extract() const
+    {
+        auto p = dynamic_cast<const detail::bfe_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Extract a pointer to the UDBFE.
+    /**
+     * This method will extract a pointer to the internal instance of the UDBFE. If \p T is not the same type
+     * as the UDBFE used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime
+     *    of ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The ability to extract a mutable pointer is provided only in order to allow to call non-const
+     *    methods on the internal UDBFE instance. Assigning a new UDBFE via this pointer is undefined behaviour.
+     *
+     * \endverbatim
+     *
+     * @return a pointer to the internal UDBFE, or \p nullptr
+     * if \p T does not correspond exactly to the original UDBFE type used
+     * in the constructor.
+     */
+    template <typename T>
+    T *extract()
+    {
+        auto p = dynamic_cast<detail::bfe_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Checks the user-defined batch fitness evaluator type at run-time.
+    /**
+     * @return \p true if the user-defined batch fitness evaluator is \p T, \p false otherwise.
+     */
+    template <typename T>
+    bool is() const
+    {
+        return extract<T>() != nullptr;
+    }
+
+    /// Call operator.
+    /**
+     * The call operator will invoke the call operator of the UDBFE, after having checked that the length of
+     * \p dvs is a multiple of the dimension of \p p. The output of the UDBFE is then checked against the number of
+     * objectives and constraints of \p p.
+     *
+     * @param p the input problem.
+     * @param dvs the input decision vectors, stored contiguously.
+     *
+     * @return the fitness vectors corresponding to \p dvs, stored contiguously.
+     *
+     * @throws std::invalid_argument if either:
+     * - the length of \p dvs is not a multiple of the dimension of \p p, or
+     * - the length of the vector returned by the UDBFE is not the number of decision vectors in \p dvs
+     *   multiplied by the fitness dimension of \p p.
+     * @throws std::overflow_error if the size of the output vector would result in an overflow.
+     * @throws unspecified any exception thrown by the call operator of the UDBFE.
+     */
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        detail::bfe_check_input_dvs(p, dvs);
+        auto retval = ptr()->operator()(p, dvs);
+        detail::bfe_check_output_fvs(p, dvs, retval);
+        return retval;
+    }
+
+    /// Batch fitness evaluator's name.
+    /**
+     * If the UDBFE satisfies pagmo::has_name, then this method will return the output of its <tt>%get_name()</tt>
+     * method. Otherwise, an implementation-defined name based on the type of the UDBFE will be returned.
+     *
+     * @return the batch fitness evaluator's name.
+     *
+     * @throws unspecified any exception thrown by copying an \p std::string object.
+     */
+    std::string get_name() const
+    {
+        return m_name;
+    }
+
+    /// Batch fitness evaluator's extra info.
+    /**
+     * If the UDBFE satisfies pagmo::has_extra_info, then this method will return the output of its
+     * <tt>%get_extra_info()</tt> method. Otherwise, an empty string will be returned.
+     *
+     * @return extra info about the UDBFE.
+     *
+     * @throws unspecified any exception thrown by the <tt>%get_extra_info()</tt> method of the UDBFE.
+     */
+    std::string get_extra_info() const
+    {
+        return ptr()->get_extra_info();
+    }
+
+    /// Batch fitness evaluator's thread safety level.
+    /**
+     * If the UDBFE satisfies pagmo::has_get_thread_safety, then this method will return the output of its
+     * <tt>%get_thread_safety()</tt> method. Otherwise, thread_safety::basic will be returned.
+     * That is, pagmo assumes by default that is it safe to operate concurrently on distinct UDBFE instances.
+     *
+     * @return the thread safety level of the UDBFE.
+     */
+    thread_safety get_thread_safety() const
+    {
+        return m_thread_safety;
+    }
+
+    /// Streaming operator
+    /**
+     * This function will stream to \p os a human-readable representation of the input
+     * bfe \p b.
+     *
+     * @param os input <tt>std::ostream</tt>.
+     * @param b pagmo::bfe object to be streamed.
+     *
+     * @return a reference to \p os.
+     *
+     * @throws unspecified any exception thrown by querying various bfe properties and streaming them into \p os.
+     */
+    friend std::ostream &operator<<(std::ostream &os, const bfe &b)
+    {
+        os << "BFE name: " << b.get_name() << '\n';
+        stream(os, "\tThread safety: ", b.get_thread_safety(), '\n');
+        const auto extra_str = b.get_extra_info();
+        if (!extra_str.empty()) {
+            stream(os, "\nExtra info:\n", extra_str);
+        }
+        return os;
+    }
+
+    /// Save to archive.
+    /**
+     * This method will save \p this into the archive \p ar.
+     *
+     * @param ar target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of the UDBFE and of primitive types.
+     */
+    template <typename Archive>
+    void save(Archive &ar) const
+    {
+        ar(m_ptr, m_name, m_thread_safety);
+    }
+    /// Load from archive.
+    /**
+     * This method will load a pagmo::bfe from \p ar into \p this.
+     *
+     * @param ar source archive.
+     *
+     * @throws unspecified any exception thrown by the deserialization of the UDBFE and of primitive types.
+     */
+    template <typename Archive>
+    void load(Archive &ar)
+    {
+        bfe tmp;
+        ar(tmp.m_ptr, tmp.m_name, tmp.m_thread_safety);
+        *this = std::move(tmp);
+    }
+
+private:
+    // Two small helpers to make sure that whenever we require
+    // access to the pointer it actually points to something.
+    detail::bfe_inner_base const *ptr() const
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+    detail::bfe_inner_base *ptr()
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+
+private:
+    std::unique_ptr<detail::bfe_inner_base> m_ptr;
+    // Various properties determined at construction time
+    // from the UDBFE. These will be constant for the lifetime
+    // of bfe, but we cannot mark them as such because of serialization.
+    std::string m_name;
+    thread_safety m_thread_safety;
+};
+} // namespace pagmo
+
+PAGMO_REGISTER_BFE(pagmo::default_bfe)
+PAGMO_REGISTER_BFE(pagmo::member_bfe)
+PAGMO_REGISTER_BFE(pagmo::thread_bfe)
+
+#endif
@@ -0,0 +1,80 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_DETAIL_BFE_IMPL_HPP
+#define PAGMO_DETAIL_BFE_IMPL_HPP
+
+#include <limits>
+#include <stdexcept>
+#include <string>
+
+#include <pagmo/exceptions.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// Check the batch of decision vectors dvs which is about to be evaluated
+// with the problem p. Return the number of decision vectors in the batch.
+inline vector_double::size_type bfe_check_input_dvs(const problem &p, const vector_double &dvs)
+{
+    const auto nx = p.get_nx(), nf = p.get_nf();
+    if (dvs.size() % nx) {
+        pagmo_throw(std::invalid_argument, "Invalid argument for a batch fitness evaluation: the length of the vector "
+                                           "representing the decision vectors, "
+                                               + std::to_string(dvs.size())
+                                               + ", is not an exact multiple of the dimension of the problem, "
+                                               + std::to_string(nx));
+    }
+    const auto n_dvs = dvs.size() / nx;
+    if (n_dvs > std::numeric_limits<vector_double::size_type>::max() / nf) {
+        pagmo_throw(std::overflow_error, "The size of the batch of fitness vectors is too large");
+    }
+    return n_dvs;
+}
+
+// Check the batch of fitness vectors fvs resulting from the evaluation of the
+// decision vectors dvs with the problem p.
+inline void bfe_check_output_fvs(const problem &p, const vector_double &dvs, const vector_double &fvs)
+{
+    const auto n_dvs = dvs.size() / p.get_nx();
+    if (fvs.size() != n_dvs * p.get_nf()) {
+        pagmo_throw(std::invalid_argument,
+                    "An invalid result was produced by a batch fitness evaluation: the length of "
+                    "the vector representing the fitness vectors, "
+                        + std::to_string(fvs.size()) + ", should be " + std::to_string(n_dvs * p.get_nf()));
+    }
+}
+} // namespace detail
+} // namespace pagmo
+
+#endif
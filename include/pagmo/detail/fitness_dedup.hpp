@@ -0,0 +1,171 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_DETAIL_FITNESS_DEDUP_HPP
+#define PAGMO_DETAIL_FITNESS_DEDUP_HPP
+
+#include <algorithm>
+#include <cassert>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <pagmo/detail/custom_comparisons.hpp>
+#include <pagmo/population.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// Fitness deduplication layer used by the evolutionary algorithms.
+//
+// The decision vectors of the current population and the ones evaluated since the last reset are indexed,
+// together with their fitness, in a hash map. A decision vector which is an exact duplicate of an indexed one
+// is not evaluated again: its fitness is copied over and the evaluation is counted as saved. The map is meant to
+// be reset at each generation, so that its size stays proportional to the population size.
+//
+// When the object is not active all the calls are forwarded to the problem, so that the algorithms can
+// use it unconditionally. The deduplication is only valid for deterministic problems: it is up to the
+// algorithm to deactivate it for stochastic ones.
+class fitness_dedup
+{
+    using map_t = std::unordered_map<vector_double, vector_double, hash_vf<double>, equal_to_vf<double>>;
+
+public:
+    explicit fitness_dedup(bool active) : m_active(active), m_saved(0u) {}
+    bool is_active() const
+    {
+        return m_active;
+    }
+    // Number of evaluations saved so far.
+    unsigned long long get_saved() const
+    {
+        return m_saved;
+    }
+    // Forget the previous evaluations and index the individuals of pop.
+    void reset(const population &pop)
+    {
+        if (!m_active) {
+            return;
+        }
+        m_map.clear();
+        const auto &x = pop.get_x_data();
+        const auto &f = pop.get_f_data();
+        const auto nx = pop.get_problem().get_nx(), nf = pop.get_problem().get_nf();
+        for (decltype(pop.size()) i = 0u; i < pop.size(); ++i) {
+            m_map.emplace(vector_double(x.data() + i * nx, x.data() + (i + 1u) * nx),
+                          vector_double(f.data() + i * nf, f.data() + (i + 1u) * nf));
+        }
+    }
+    // Fitness of x, evaluated via prob only if x has not been seen before.
+    vector_double fitness(const problem &prob, const vector_double &x)
+    {
+        if (!m_active) {
+            return prob.fitness(x);
+        }
+        const auto it = m_map.find(x);
+        if (it != m_map.end()) {
+            ++m_saved;
+            return it->second;
+        }
+        auto f = prob.fitness(x);
+        m_map.emplace(x, f);
+        return f;
+    }
+    // Fitnesses of the decision vectors stored contiguously in dvs, in the batch format of
+    // pagmo::problem::batch_fitness(). Only the distinct decision vectors which have not been seen before
+    // are passed, in a single batch and in order of first appearance, to the evaluator eval.
+    template <typename F>
+    vector_double batch_fitness(const vector_double &dvs, vector_double::size_type dim, vector_double::size_type nf,
+                                F &&eval)
+    {
+        if (!m_active) {
+            return eval(dvs);
+        }
+        assert(dim > 0u && dvs.size() % dim == 0u);
+        const auto n_dvs = dvs.size() / dim;
+        // For each decision vector, the pointer to its already known fitness (if any) or the
+        // index of its first occurrence in the batch of the new decision vectors.
+        std::vector<const vector_double *> known(n_dvs, nullptr);
+        std::vector<vector_double::size_type> new_idx(n_dvs, 0u);
+        std::unordered_map<vector_double, vector_double::size_type, hash_vf<double>, equal_to_vf<double>> pending;
+        vector_double dvs_new;
+        vector_double x(dim);
+        for (decltype(dvs.size()) i = 0u; i < n_dvs; ++i) {
+            std::copy(dvs.data() + i * dim, dvs.data() + (i + 1u) * dim, x.begin());
+            const auto it = m_map.find(x);
+            if (it != m_map.end()) {
+                known[i] = &it->second;
+                continue;
+            }
+            const auto ret = pending.emplace(x, pending.size());
+            new_idx[i] = ret.first->second;
+            if (ret.second) {
+                dvs_new.insert(dvs_new.end(), x.begin(), x.end());
+            }
+        }
+        m_saved += n_dvs - pending.size();
+        if (pending.size() == n_dvs) {
+            // No duplicates: evaluate the original batch.
+            auto retval = eval(dvs);
+            for (decltype(dvs.size()) i = 0u; i < n_dvs; ++i) {
+                m_map.emplace(vector_double(dvs.data() + i * dim, dvs.data() + (i + 1u) * dim),
+                              vector_double(retval.data() + i * nf, retval.data() + (i + 1u) * nf));
+            }
+            return retval;
+        }
+        const auto fvs_new = pending.empty() ? vector_double{} : eval(dvs_new);
+        vector_double retval(n_dvs * nf);
+        for (decltype(dvs.size()) i = 0u; i < n_dvs; ++i) {
+            if (known[i]) {
+                std::copy(known[i]->begin(), known[i]->end(), retval.data() + i * nf);
+            } else {
+                std::copy(fvs_new.data() + new_idx[i] * nf, fvs_new.data() + (new_idx[i] + 1u) * nf,
+                          retval.data() + i * nf);
+            }
+        }
+        for (auto &p : pending) {
+            m_map.emplace(p.first,
+                          vector_double(fvs_new.data() + p.second * nf, fvs_new.data() + (p.second + 1u) * nf));
+        }
+        return retval;
+    }
+
+private:
+    bool m_active;
+    unsigned long long m_saved;
+    map_t m_map;
+};
+} // namespace detail
+} // namespace pagmo
+
+#endif
@@ -0,0 +1,175 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_DETAIL_HV_MC_SAMPLER_HPP
+#define PAGMO_DETAIL_HV_MC_SAMPLER_HPP
+
+#include <algorithm>
+#include <limits>
+#include <random>
+#include <vector>
+
+#include <pagmo/detail/parallel_for.hpp>
+#include <pagmo/rng.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// Batched Monte Carlo sampling engine for the approximated hypervolume algorithms.
+//
+// The points are stored in chunks of fixed size, dimension-major within each chunk, so that a sample point
+// is tested for dominance against a whole chunk with tight, branch-free loops of constant length. The samples
+// are drawn in blocks, each block using its own random engine seeded from the pair (seed, block index): the blocks
+// can thus be processed by several threads, and the results depend only on the seed, not on the number of threads.
+class hv_mc_sampler
+{
+public:
+    using size_type = vector_double::size_type;
+    // Number of samples in a block.
+    static size_type block_size()
+    {
+        return 512u;
+    }
+    hv_mc_sampler() = default;
+    // Store the points of 'points' at the indices 'idx'.
+    hv_mc_sampler(const std::vector<vector_double> &points, const std::vector<size_type> &idx)
+        : m_size(idx.size()), m_dim(points.empty() ? 0u : points[0].size()),
+          m_n_chunks((m_size + chunk_size - 1u) / chunk_size),
+          // NOTE: the padding points at infinity never dominate a (finite) sample point.
+          m_coords(m_n_chunks * m_dim * chunk_size, std::numeric_limits<double>::infinity())
+    {
+        for (size_type j = 0u; j < m_size; ++j) {
+            for (size_type d = 0u; d < m_dim; ++d) {
+                m_coords[((j / chunk_size) * m_dim + d) * chunk_size + j % chunk_size] = points[idx[j]][d];
+            }
+        }
+    }
+    // Store all the points.
+    explicit hv_mc_sampler(const std::vector<vector_double> &points)
+        : hv_mc_sampler(points, all_indices(points.size()))
+    {
+    }
+    size_type size() const
+    {
+        return m_size;
+    }
+    // Number of stored points weakly dominating x.
+    size_type n_dominating(const double *x) const
+    {
+        double retval = 0.;
+        for (size_type k = 0u; k < m_n_chunks; ++k) {
+            retval += chunk_count(x, k);
+        }
+        return static_cast<size_type>(retval);
+    }
+    // Whether any of the stored points weakly dominates x. The number of points a point-by-point
+    // test would have checked before giving an answer (i.e., up to and including the first dominating
+    // point, in storage order) is added to n_checked.
+    bool is_dominated(const double *x, size_type &n_checked) const
+    {
+        double mask[chunk_size];
+        for (size_type k = 0u; k < m_n_chunks; ++k) {
+            chunk_mask(x, k, mask);
+            const auto it = std::find_if(mask, mask + chunk_size, [](double m) { return m != 0.; });
+            if (it != mask + chunk_size) {
+                n_checked += static_cast<size_type>(it - mask) + 1u;
+                return true;
+            }
+            n_checked += std::min(size_type(chunk_size), m_size - k * chunk_size);
+        }
+        return false;
+    }
+    // Compute f(b, e) for the blocks b in [first_block, last_block), where e is the random engine of
+    // the block, using up to n_threads threads (zero meaning the size of parallel_for_thread_pool()).
+    // The results are returned in block order.
+    // NOTE: f must be safe to call concurrently.
+    template <typename R, typename F>
+    static std::vector<R> run_blocks(unsigned seed, size_type first_block, size_type last_block, unsigned n_threads,
+                                     const F &f)
+    {
+        const auto n_blocks = last_block - first_block;
+        std::vector<R> retval(n_blocks);
+        // The blocks are handed out to the workers one at a time.
+        auto run_block = [&retval, &f, seed, first_block](unsigned, size_type i) {
+            const auto b = first_block + i;
+            std::seed_seq sseq{seed, static_cast<unsigned>(b), static_cast<unsigned>(b >> 16 >> 16)};
+            random_engine_type e(sseq);
+            retval[i] = f(b, e);
+        };
+        parallel_for(n_blocks, n_threads, run_block);
+        return retval;
+    }
+
+private:
+    enum : size_type { chunk_size = 64u };
+    static std::vector<size_type> all_indices(size_type n)
+    {
+        std::vector<size_type> retval(n);
+        for (size_type i = 0u; i < n; ++i) {
+            retval[i] = i;
+        }
+        return retval;
+    }
+    // Set mask[j] to 1 if the j-th point of the k-th chunk weakly dominates x, to 0 otherwise.
+    // NOTE: the mask is made of doubles so that the inner loop operates on operands of the same width,
+    // which lets the compiler vectorise it.
+    void chunk_mask(const double *x, size_type k, double *mask) const
+    {
+        std::fill(mask, mask + chunk_size, 1.);
+        const double *c = m_coords.data() + k * m_dim * chunk_size;
+        for (size_type d = 0u; d < m_dim; ++d, c += chunk_size) {
+            const double xd = x[d];
+            for (size_type j = 0u; j < chunk_size; ++j) {
+                mask[j] = c[j] <= xd ? mask[j] : 0.;
+            }
+        }
+    }
+    // Number of points of the k-th chunk weakly dominating x.
+    double chunk_count(const double *x, size_type k) const
+    {
+        double mask[chunk_size];
+        chunk_mask(x, k, mask);
+        double retval = 0.;
+        for (size_type j = 0u; j < chunk_size; ++j) {
+            retval += mask[j];
+        }
+        return retval;
+    }
+    size_type m_size = 0u;
+    size_type m_dim = 0u;
+    size_type m_n_chunks = 0u;
+    vector_double m_coords;
+};
+} // namespace detail
+} // namespace pagmo
+
+#endif
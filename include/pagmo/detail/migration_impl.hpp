@@ -0,0 +1,199 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_DETAIL_MIGRATION_IMPL_HPP
+#define PAGMO_DETAIL_MIGRATION_IMPL_HPP
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <vector>
+
+#include <pagmo/detail/custom_comparisons.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+#include <pagmo/utils/constrained.hpp>
+#include <pagmo/utils/multi_objective.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// Check that the group of individuals inds is consistent (i.e., the IDs, decision vectors and fitness
+// vectors have all the same length) and that its decision/fitness vectors have dimensions nx and nf.
+// Return the number of individuals in the group. The string descr is used to describe inds in the
+// error messages.
+inline std::vector<vector_double>::size_type check_individuals_group(const individuals_group_t &inds,
+                                                                     vector_double::size_type nx,
+                                                                     vector_double::size_type nf,
+                                                                     const std::string &descr)
+{
+    const auto &IDs = std::get<0>(inds);
+    const auto &xs = std::get<1>(inds);
+    const auto &fs = std::get<2>(inds);
+    if (xs.size() != IDs.size() || fs.size() != IDs.size()) {
+        pagmo_throw(std::invalid_argument, "Inconsistent " + descr + ": the number of IDs ("
+                                               + std::to_string(IDs.size()) + "), decision vectors ("
+                                               + std::to_string(xs.size()) + ") and fitness vectors ("
+                                               + std::to_string(fs.size()) + ") must all be equal");
+    }
+    for (decltype(xs.size()) i = 0; i < xs.size(); ++i) {
+        if (xs[i].size() != nx) {
+            pagmo_throw(std::invalid_argument, "Invalid " + descr + ": the decision vector at index "
+                                                   + std::to_string(i) + " has a dimension of "
+                                                   + std::to_string(xs[i].size()) + ", but a dimension of "
+                                                   + std::to_string(nx) + " was expected");
+        }
+        if (fs[i].size() != nf) {
+            pagmo_throw(std::invalid_argument, "Invalid " + descr + ": the fitness vector at index "
+                                                   + std::to_string(i) + " has a dimension of "
+                                                   + std::to_string(fs[i].size()) + ", but a dimension of "
+                                                   + std::to_string(nf) + " was expected");
+        }
+    }
+    return IDs.size();
+}
+
+// Check the problem properties passed to the selection/replacement methods of the migration policies.
+// Return the fitness dimension.
+inline vector_double::size_type
+migration_check_problem_properties(vector_double::size_type nx, vector_double::size_type nix,
+                                   vector_double::size_type nobj, vector_double::size_type nec,
+                                   vector_double::size_type nic, const vector_double &tol)
+{
+    if (!nx) {
+        pagmo_throw(std::invalid_argument, "The problem dimension passed to a migration policy cannot be zero");
+    }
+    if (nix > nx) {
+        pagmo_throw(std::invalid_argument, "The integer dimension (" + std::to_string(nix)
+                                               + ") passed to a migration policy cannot be larger than the "
+                                                 "problem dimension ("
+                                               + std::to_string(nx) + ")");
+    }
+    if (!nobj) {
+        pagmo_throw(std::invalid_argument, "The number of objectives passed to a migration policy cannot be zero");
+    }
+    if (nec > std::numeric_limits<vector_double::size_type>::max() - nic
+        || nobj > std::numeric_limits<vector_double::size_type>::max() - nec - nic) {
+        pagmo_throw(std::overflow_error, "The fitness dimension passed to a migration policy is too large");
+    }
+    if (tol.size() != nec + nic) {
+        pagmo_throw(std::invalid_argument, "The vector of constraint tolerances passed to a migration policy has a "
+                                           "size of "
+                                               + std::to_string(tol.size()) + ", but a size of "
+                                               + std::to_string(nec + nic) + " was expected");
+    }
+    return nobj + nec + nic;
+}
+
+// Check the fractional migration rate of a policy, which must be in the [0, 1] range.
+inline void check_fractional_migration_rate(double rate)
+{
+    if (!std::isfinite(rate) || rate < 0. || rate > 1.) {
+        pagmo_throw(std::invalid_argument, "A fractional migration rate must be in the [0, 1] range, but a value of "
+                                               + std::to_string(rate) + " was provided instead");
+    }
+}
+
+// Check the absolute migration rate of a policy, which must be non-negative.
+template <typename T, enable_if_t<std::is_unsigned<T>::value, int> = 0>
+inline void check_absolute_migration_rate(T)
+{
+}
+
+template <typename T, enable_if_t<std::is_signed<T>::value, int> = 0>
+inline void check_absolute_migration_rate(T rate)
+{
+    if (rate < T(0)) {
+        pagmo_throw(std::invalid_argument, "An absolute migration rate must be non-negative, but a value of "
+                                               + std::to_string(rate) + " was provided instead");
+    }
+}
+
+// Compute the number of individuals involved in a migration from a group of n individuals,
+// given the migration rate (absolute or fractional) of a policy.
+inline std::vector<vector_double>::size_type migration_count(double rate, bool fractional,
+                                                             std::vector<vector_double>::size_type n)
+{
+    if (fractional) {
+        return static_cast<std::vector<vector_double>::size_type>(rate * static_cast<double>(n));
+    }
+    return rate >= static_cast<double>(n) ? n : static_cast<std::vector<vector_double>::size_type>(rate);
+}
+
+// Return the indices of the best n individuals in the input fitness vectors, according to the
+// problem properties nobj, nec, nic and tol. In the single-objective case, the indices are returned
+// from the best to the worst individual.
+inline std::vector<vector_double::size_type>
+select_best_n_individuals(const std::vector<vector_double> &fs, std::vector<vector_double>::size_type n,
+                          vector_double::size_type nobj, vector_double::size_type nec, vector_double::size_type nic,
+                          const vector_double &tol)
+{
+    if (!n || fs.empty()) {
+        return {};
+    }
+    if (nobj == 1u && nec == 0u && nic == 0u) {
+        // Unconstrained single-objective: a partial sort on the objective is enough.
+        std::vector<vector_double::size_type> retval(fs.size());
+        std::iota(retval.begin(), retval.end(), vector_double::size_type(0));
+        n = std::min(n, fs.size());
+        std::partial_sort(retval.begin(), retval.begin() + static_cast<std::ptrdiff_t>(n), retval.end(),
+                          [&fs](vector_double::size_type idx1, vector_double::size_type idx2) {
+                              return detail::less_than_f(fs[idx1][0], fs[idx2][0])
+                                     || (!detail::less_than_f(fs[idx2][0], fs[idx1][0]) && idx1 < idx2);
+                          });
+        retval.resize(n);
+        return retval;
+    }
+    if (nobj == 1u) {
+        // Constrained single-objective.
+        auto retval = sort_population_con(fs, nec, tol);
+        retval.resize(std::min(n, retval.size()));
+        return retval;
+    }
+    if (nec == 0u && nic == 0u) {
+        // Unconstrained multi-objective.
+        return select_best_N_mo(fs, n);
+    }
+    pagmo_throw(std::invalid_argument,
+                "The selection of the best individuals is not supported for constrained multi-objective problems");
+}
+} // namespace detail
+} // namespace pagmo
+
+#endif
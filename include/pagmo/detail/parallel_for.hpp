@@ -0,0 +1,167 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_DETAIL_PARALLEL_FOR_HPP
+#define PAGMO_DETAIL_PARALLEL_FOR_HPP
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstddef>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+
+#include <pagmo/detail/task_queue.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// The thread pool running the parallel loops of pagmo (e.g., in thread_bfe and in the hypervolume algorithms).
+// It is distinct from island_thread_pool(), so that the parallel loops and the island evolutions (which may
+// themselves run parallel loops) do not compete for the same workers. By default, its size is the number of cores.
+// NOTE: the pool is never destroyed, as idle workers may still be waiting for jobs at program exit.
+inline thread_pool &parallel_for_thread_pool()
+{
+    static auto ptr = []() {
+        const auto hc = std::thread::hardware_concurrency();
+        return new thread_pool(hc ? hc : 1u);
+    }();
+    return *ptr;
+}
+
+// Shared state of a parallel_for() invocation. It is owned jointly by the caller and by the jobs submitted
+// to the pool, as the jobs may start after the caller has returned (in which case they find no work left).
+struct parallel_for_state {
+    explicit parallel_for_state(std::size_t n) : m_next(0), m_stop(false), m_n(n) {}
+    std::atomic<std::size_t> m_next;
+    std::atomic<bool> m_stop;
+    const std::size_t m_n;
+    std::mutex m_mutex;
+    std::condition_variable m_cond;
+    // Number of jobs which may still invoke the loop body.
+    unsigned m_active = 0;
+    std::exception_ptr m_error;
+};
+
+// Execute the iterations of the loop assigned to the worker w. The iteration indices are handed
+// out one at a time, so that the workers finishing early pick up the remaining work.
+template <typename F>
+inline void parallel_for_worker(parallel_for_state &s, unsigned w, const F &f)
+{
+    std::exception_ptr err;
+    try {
+        while (!s.m_stop.load(std::memory_order_relaxed)) {
+            const auto i = s.m_next.fetch_add(1u, std::memory_order_relaxed);
+            if (i >= s.m_n) {
+                break;
+            }
+            f(w, i);
+        }
+    } catch (...) {
+        err = std::current_exception();
+        s.m_stop.store(true, std::memory_order_relaxed);
+    }
+    std::unique_lock<std::mutex> lock(s.m_mutex);
+    if (err && !s.m_error) {
+        s.m_error = err;
+    }
+}
+
+// Run f(w, i) for all i in [0, n), using up to n_workers workers (zero meaning the size of
+// parallel_for_thread_pool()): the calling thread plus the workers of parallel_for_thread_pool().
+// w in [0, n_workers) identifies the worker running the iteration: the iterations with the same w are run
+// sequentially, thus w can be used to index per-worker state. The function returns when all the iterations
+// have completed. If any iteration throws, the iterations not yet started are skipped, and the first
+// exception is re-thrown.
+// NOTE: f must be safe to call concurrently with different values of w.
+template <typename F>
+inline void parallel_for(std::size_t n, unsigned n_workers, const F &f)
+{
+    auto &pool = parallel_for_thread_pool();
+    const auto n_w
+        = static_cast<unsigned>(std::min(static_cast<std::size_t>(n_workers ? n_workers : pool.get_size()), n));
+    if (n_w <= 1u) {
+        for (std::size_t i = 0; i < n; ++i) {
+            f(0u, i);
+        }
+        return;
+    }
+    auto state = std::make_shared<parallel_for_state>(n);
+    // NOTE: the jobs hold a pointer to f, which is valid only until this function returns. A job
+    // invokes f only after registering itself as active, which is possible only while iterations are
+    // left, and the function waits for all the active jobs before returning.
+    const F *fp = &f;
+    auto job = [state, fp](unsigned w) {
+        {
+            std::unique_lock<std::mutex> lock(state->m_mutex);
+            if (state->m_next.load() >= state->m_n || state->m_stop.load()) {
+                return;
+            }
+            ++state->m_active;
+        }
+        parallel_for_worker(*state, w, *fp);
+        std::unique_lock<std::mutex> lock(state->m_mutex);
+        --state->m_active;
+        state->m_cond.notify_all();
+    };
+    try {
+        for (unsigned w = 1; w < n_w; ++w) {
+            pool.submit([job, w]() { job(w); });
+        }
+        // LCOV_EXCL_START
+    } catch (...) {
+        // If we fail to submit a job, make sure the submitted ones do not start new iterations,
+        // and wait for them before re-throwing.
+        state->m_stop.store(true);
+        std::unique_lock<std::mutex> lock(state->m_mutex);
+        while (state->m_active) {
+            state->m_cond.wait(lock);
+        }
+        throw;
+        // LCOV_EXCL_STOP
+    }
+    // The calling thread is the worker 0.
+    parallel_for_worker(*state, 0u, f);
+    // NOTE: at this point no iterations are left, thus no more jobs can become active.
+    std::unique_lock<std::mutex> lock(state->m_mutex);
+    while (state->m_active) {
+        state->m_cond.wait(lock);
+    }
+    if (state->m_error) {
+        std::rethrow_exception(state->m_error);
+    }
+}
+} // namespace detail
+} // namespace pagmo
+
+#endif
@@ -29,7 +29,9 @@ see https://www.gnu.org/licenses/. */
 #ifndef PAGMO_TASK_QUEUE_HPP
 #define PAGMO_TASK_QUEUE_HPP
 
+#include <condition_variable>
 #include <cstdlib>
+#include <deque>
 #include <functional>
 #include <future>
 #include <memory>
@@ -47,44 +49,183 @@ namespace pagmo
 namespace detail
 {
 
-struct task_queue {
-    task_queue() : m_stop(false)
+// A pool of worker threads executing jobs in FIFO order. The number of jobs running
+// concurrently is capped at the size of the pool. Worker threads are spawned lazily,
+// and surplus workers exit when the pool shrinks.
+// NOTE: the workers are detached, thus an instance of this class must outlive all its workers.
+// This is why the only instance in use is the one returned by island_thread_pool(),
+// which is never destroyed.
+class thread_pool
+{
+public:
+    explicit thread_pool(unsigned size) : m_size(size)
     {
-        m_thread = std::thread([this]() {
-            try {
-                while (true) {
-                    std::unique_lock<std::mutex> lock(this->m_mutex);
-                    while (!this->m_stop && this->m_tasks.empty()) {
-                        // Need to wait for something to happen only if the task
-                        // list is empty and we are not stopping.
-                        // NOTE: wait will be noexcept in C++14.
-                        this->m_cond.wait(lock);
-                    }
-                    if (this->m_stop && this->m_tasks.empty()) {
-                        // If the stop flag was set, and we do not have more tasks,
-                        // just exit.
-                        break;
+        if (!m_size) {
+            pagmo_throw(std::invalid_argument, "the size of a thread pool must be nonzero");
+        }
+    }
+    thread_pool(const thread_pool &) = delete;
+    thread_pool(thread_pool &&) = delete;
+    thread_pool &operator=(const thread_pool &) = delete;
+    thread_pool &operator=(thread_pool &&) = delete;
+    unsigned get_size()
+    {
+        std::unique_lock<std::mutex> lock(m_mutex);
+        return m_size;
+    }
+    void set_size(unsigned size)
+    {
+        if (!size) {
+            pagmo_throw(std::invalid_argument, "the size of a thread pool must be nonzero");
+        }
+        {
+            std::unique_lock<std::mutex> lock(m_mutex);
+            m_size = size;
+            spawn_workers(0);
+        }
+        // Wake up the idle workers, so that they can pick up pending jobs
+        // (if the pool grew) or exit (if the pool shrank).
+        m_cond.notify_all();
+    }
+    // Submit a job for execution. The job must not throw.
+    // NOTE: if this function throws, the job will not have been submitted.
+    void submit(std::function<void()> &&job)
+    {
+        {
+            std::unique_lock<std::mutex> lock(m_mutex);
+            spawn_workers(1);
+            m_jobs.push_back(std::move(job));
+        }
+        m_cond.notify_one();
+    }
+    // A job which is about to block waiting for the completion of other jobs must be
+    // wrapped by these two functions. While a worker is blocked, the cap on the number of running
+    // jobs is raised by one, so that the pool cannot deadlock. These functions do nothing if not
+    // invoked from a worker thread of this pool.
+    void begin_blocking()
+    {
+        if (!is_worker()) {
+            return;
+        }
+        {
+            std::unique_lock<std::mutex> lock(m_mutex);
+            ++m_blocked;
+            spawn_workers(0);
+        }
+        m_cond.notify_one();
+    }
+    void end_blocking()
+    {
+        if (!is_worker()) {
+            return;
+        }
+        std::unique_lock<std::mutex> lock(m_mutex);
+        --m_blocked;
+    }
+
+private:
+    // The pool owning the current thread (null if the current thread is not a worker thread).
+    static const thread_pool *&owner_pool()
+    {
+        static thread_local const thread_pool *ptr = nullptr;
+        return ptr;
+    }
+    // Check whether the current thread is a worker thread of this pool.
+    bool is_worker() const
+    {
+        return owner_pool() == this;
+    }
+    // The maximum number of jobs which can be running at the same time.
+    unsigned max_running() const
+    {
+        return m_size + m_blocked;
+    }
+    // Spawn enough workers to pick up the pending jobs (plus n jobs about to be submitted), within the
+    // limits of max_running(). This must be called with the mutex locked.
+    void spawn_workers(unsigned n)
+    {
+        while (m_jobs.size() + n > m_nthreads - m_running && m_nthreads < max_running()) {
+            std::thread(&thread_pool::worker_loop, this).detach();
+            ++m_nthreads;
+        }
+    }
+    void worker_loop()
+    {
+        try {
+            owner_pool() = this;
+            std::unique_lock<std::mutex> lock(m_mutex);
+            while (true) {
+                while (m_jobs.empty() || m_running >= max_running()) {
+                    if (m_nthreads > max_running()) {
+                        // The pool shrank, this worker is not needed any more.
+                        --m_nthreads;
+                        return;
                     }
-                    // NOTE: move constructor of std::function could throw, unfortunately.
-                    std::function<void()> task(std::move(this->m_tasks.front()));
-                    this->m_tasks.pop();
-                    lock.unlock();
-                    task();
+                    // NOTE: wait will be noexcept in C++14.
+                    m_cond.wait(lock);
                 }
-                // LCOV_EXCL_START
-            } catch (...) {
-                // The errors we could get here are:
-                // - threading primitives,
-                // - move-construction of std::function,
-                // - queue popping (I guess unlikely, as the destructor of std::function
-                //   is noexcept).
-                // In any case, not much that can be done to recover from this, better to abort.
-                // NOTE: logging candidate.
-                std::abort();
-                // LCOV_EXCL_STOP
+                // NOTE: move constructor of std::function could throw, unfortunately.
+                std::function<void()> job(std::move(m_jobs.front()));
+                m_jobs.pop_front();
+                ++m_running;
+                lock.unlock();
+                job();
+                lock.lock();
+                --m_running;
             }
-        });
+            // LCOV_EXCL_START
+        } catch (...) {
+            // The errors we could get here are from threading primitives and the move-construction
+            // of std::function. Not much that can be done to recover from this, better to abort.
+            // NOTE: logging candidate.
+            std::abort();
+            // LCOV_EXCL_STOP
+        }
     }
+    // Data members.
+    std::mutex m_mutex;
+    std::condition_variable m_cond;
+    std::deque<std::function<void()>> m_jobs;
+    unsigned m_size;
+    // Number of workers blocked waiting for other jobs.
+    unsigned m_blocked = 0;
+    // Number of worker threads alive.
+    unsigned m_nthreads = 0;
+    // Number of workers currently running a job.
+    unsigned m_running = 0;
+};
+
+// The thread pool shared by all the task queues. By default, its size is the number of cores.
+// NOTE: the pool is never destroyed, as idle workers may still be waiting for jobs at program exit.
+inline thread_pool &island_thread_pool()
+{
+    static auto ptr = []() {
+        const auto hc = std::thread::hardware_concurrency();
+        return new thread_pool(hc ? hc : 1u);
+    }();
+    return *ptr;
+}
+
+// RAII wrapper for the blocking sections of a thread pool (see thread_pool::begin_blocking()).
+struct thread_pool_blocking_guard {
+    explicit thread_pool_blocking_guard(thread_pool &pool) : m_pool(pool)
+    {
+        m_pool.begin_blocking();
+    }
+    ~thread_pool_blocking_guard()
+    {
+        m_pool.end_blocking();
+    }
+    thread_pool_blocking_guard(const thread_pool_blocking_guard &) = delete;
+    thread_pool_blocking_guard &operator=(const thread_pool_blocking_guard &) = delete;
+    thread_pool &m_pool;
+};
+
+// A queue executing its tasks one at a time, in FIFO order. The tasks are run by
+// the workers of island_thread_pool(): rather than owning a thread, the queue
+// submits to the pool a job consuming one task whenever it has tasks pending.
+struct task_queue {
+    task_queue() : m_stop(false), m_running(false) {}
     ~task_queue()
     {
         // NOTE: logging candidate (catch any exception,
@@ -107,41 +248,85 @@ struct task_queue {
         // - std::function (in m_tasks) gives the uniform type interface via type erasure.
         auto task = std::make_shared<p_task_type>(std::forward<F>(f));
         std::future<void> res = task->get_future();
-        {
-            std::unique_lock<std::mutex> lock(m_mutex);
-            if (m_stop) {
-                // Enqueueing is not allowed if the queue is stopped.
-                pagmo_throw(std::runtime_error, "cannot enqueue task while the task queue is stopping");
+        std::unique_lock<std::mutex> lock(m_mutex);
+        if (m_stop) {
+            // Enqueueing is not allowed if the queue is stopped.
+            pagmo_throw(std::runtime_error, "cannot enqueue task while the task queue is stopping");
+        }
+        m_tasks.push([task]() { (*task)(); });
+        if (!m_running) {
+            // No job of this queue is in the pool, submit one.
+            try {
+                island_thread_pool().submit([this]() { this->run_next(); });
+                // LCOV_EXCL_START
+            } catch (...) {
+                // Undo the push before re-throwing.
+                // NOTE: std::queue::pop() calls pop_front()/pop_back() on the underlying container,
+                // which never throw.
+                m_tasks.pop();
+                throw;
+                // LCOV_EXCL_STOP
             }
-            m_tasks.push([task]() { (*task)(); });
+            m_running = true;
         }
-        // NOTE: notify_one is noexcept.
-        m_cond.notify_one();
         return res;
     }
     // NOTE: we call this only from dtor, it is here in order to be able to test it.
     // So the exception handling in dtor will suffice, keep it in mind if things change.
     void stop()
     {
-        {
+        std::unique_lock<std::mutex> lock(m_mutex);
+        m_stop = true;
+        if (!m_running) {
+            return;
+        }
+        // Wait for the remaining tasks to be consumed. If we are in a worker of the pool,
+        // let the pool know we are blocking.
+        thread_pool_blocking_guard bg(island_thread_pool());
+        while (m_running) {
+            m_cond.wait(lock);
+        }
+    }
+    // Consume the first task in the queue, and submit a new job to the pool if more tasks are pending.
+    // NOTE: this runs in a worker thread of the pool. The tasks never throw (the exceptions are
+    // stored in the futures).
+    void run_next()
+    {
+        try {
             std::unique_lock<std::mutex> lock(m_mutex);
-            if (m_stop) {
-                // Already stopped.
-                return;
+            // NOTE: move constructor of std::function could throw, unfortunately.
+            std::function<void()> task(std::move(m_tasks.front()));
+            m_tasks.pop();
+            lock.unlock();
+            task();
+            lock.lock();
+            if (m_tasks.empty()) {
+                m_running = false;
+                // NOTE: notify while holding the lock, as the queue may be destroyed
+                // as soon as stop() sees m_running == false.
+                m_cond.notify_all();
+            } else {
+                // Go to the back of the pool's line, so that the queues sharing the pool
+                // take turns.
+                island_thread_pool().submit([this]() { this->run_next(); });
             }
-            m_stop = true;
+            // LCOV_EXCL_START
+        } catch (...) {
+            // The errors we could get here are from threading primitives, the move-construction
+            // of std::function and the submission of the next job. Not much that can be done
+            // to recover from this, better to abort.
+            // NOTE: logging candidate.
+            std::abort();
+            // LCOV_EXCL_STOP
         }
-        // Notify the thread that queue has been stopped, wait for it
-        // to consume the remaining tasks and exit.
-        m_cond.notify_one();
-        m_thread.join();
     }
     // Data members.
     bool m_stop;
+    // Flag signalling that a job of this queue has been submitted to the pool.
+    bool m_running;
     std::condition_variable m_cond;
     std::mutex m_mutex;
     std::queue<std::function<void()>> m_tasks;
-    std::thread m_thread;
 };
 }
 }
@@ -0,0 +1,67 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_DETAIL_TOPOLOGY_IMPL_HPP
+#define PAGMO_DETAIL_TOPOLOGY_IMPL_HPP
+
+#include <cmath>
+#include <cstddef>
+#include <stdexcept>
+#include <string>
+
+#include <pagmo/exceptions.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// Check that w is a valid weight for an edge in a topology, i.e., a finite value in the [0, 1] range.
+inline void topology_check_edge_weight(double w)
+{
+    if (!std::isfinite(w) || w < 0. || w > 1.) {
+        pagmo_throw(std::invalid_argument, "The weight of an edge in a topology must be in the [0., 1.] range, but a "
+                                           "value of "
+                                               + std::to_string(w) + " was provided instead");
+    }
+}
+
+// Check that i is a valid index for a vertex in a topology with n vertices.
+inline void topology_check_vertex_index(std::size_t i, std::size_t n)
+{
+    if (i >= n) {
+        pagmo_throw(std::invalid_argument, "Invalid vertex index " + std::to_string(i)
+                                               + " for a topology with " + std::to_string(n) + " vertices");
+    }
+}
+} // namespace detail
+} // namespace pagmo
+
+#endif
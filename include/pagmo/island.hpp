@@ -57,10 +57,14 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
+#include <pagmo/r_policy.hpp>
 #include <pagmo/rng.hpp>
+#include <pagmo/s_policy.hpp>
 #include <pagmo/serialization.hpp>
 #include <pagmo/threading.hpp>
+#include <pagmo/topology.hpp>
 #include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
 
 /// Macro for the registration of the serialization functionality for user-defined islands.
 /**
@@ -273,10 +277,45 @@ inline bool future_running(const std::future<void> &f)
 }
 }
 
+/// Get the size of the island thread pool.
+/**
+ * The evolutions of all the pagmo::island objects are run by a shared pool of threads, and the number
+ * of evolutions running concurrently is capped at the size of the pool. Each island still runs
+ * its own evolutions one at a time, in the order in which they were enqueued. By default, the size of the pool
+ * is the number of cores returned by <tt>std::thread::hardware_concurrency()</tt> (or 1 if the
+ * number of cores cannot be determined).
+ *
+ * @return the size of the island thread pool.
+ *
+ * @throws unspecified any exception thrown by threading primitives.
+ */
+inline unsigned get_island_pool_size()
+{
+    return detail::island_thread_pool().get_size();
+}
+
+/// Set the size of the island thread pool.
+/**
+ * This function will set the maximum number of island evolutions that can run concurrently
+ * (see pagmo::get_island_pool_size()). Raising the size of the pool can be useful with UDIs whose
+ * evolutions do not occupy a local core (e.g., if the evolutions are offloaded to other processes or machines).
+ * The new size affects also the evolutions which are already enqueued.
+ *
+ * @param n the new size of the island thread pool.
+ *
+ * @throws std::invalid_argument if \p n is zero.
+ * @throws unspecified any exception thrown by threading primitives.
+ */
+inline void set_island_pool_size(unsigned n)
+{
+    detail::island_thread_pool().set_size(n);
+}
+
 /// Thread island.
 /**
  * This class is a user-defined island (UDI) that will run evolutions directly inside
- * the separate thread of execution within pagmo::island.
+ * the thread of execution within pagmo::island (that is, in one of the threads
+ * of the island thread pool, see pagmo::set_island_pool_size()).
  */
 class thread_island
 {
@@ -319,6 +358,19 @@ struct wait_raii {
 template <typename T>
 std::function<boost::any()> wait_raii<T>::getter = []() { return boost::any{}; };
 
+// NOTE: this construct is used to create a RAII-style object around the migration steps performed
+// by an island belonging to an archipelago. Migration copies and destroys populations outside
+// the island's UDI: in Python, these operations must be performed while holding the GIL if the
+// problem is implemented in Python. Normally this object's constructor and destructor will not do anything,
+// but in Python we need to override this getter so that it returns a RAII object that acquires the GIL.
+template <typename = void>
+struct migration_raii {
+    static std::function<boost::any()> getter;
+};
+
+template <typename T>
+std::function<boost::any()> migration_raii<T>::getter = []() { return boost::any{}; };
+
 // NOTE: this structure holds an std::function that implements the logic for the selection of the UDI
 // type in the constructor of island_data. The logic is decoupled so that we can override the default logic with
 // alternative implementations (e.g., use a process-based island rather than the default thread island if prob, algo,
@@ -397,6 +449,9 @@ struct island_data {
     // This will be explicitly set only during archipelago::push_back().
     // In all other situations, it will be null.
     archipelago *archi_ptr = nullptr;
+    // The index of the island in the archipelago (meaningful only
+    // if archi_ptr is not null).
+    std::size_t archi_idx = 0;
     task_queue queue;
 };
 }
@@ -489,9 +544,10 @@ inline std::ostream &operator<<(std::ostream &os, evolve_status es)
  * the UDI will use the input island algorithm's algorithm::evolve() method to evolve the input island's
  * pagmo::population and, once the evolution is finished, will replace the population of the input island with the
  * evolved population. Since internally the pagmo::island class uses a separate thread of execution to provide
- * asynchronous behaviour, a UDI needs to guarantee a certain degree of thread-safety: it must be possible to interact
- * with the UDI while evolution is ongoing (e.g., it must be possible to copy the UDI while evolution is undergoing, or
- * call the <tt>%get_name()</tt>, <tt>%get_extra_info()</tt> methods, etc.), otherwise the behaviour will be undefined.
+ * asynchronous behaviour (a thread from a pool shared by all islands, see pagmo::set_island_pool_size()), a UDI needs
+ * to guarantee a certain degree of thread-safety: it must be possible to interact with the UDI while evolution is
+ * ongoing (e.g., it must be possible to copy the UDI while evolution is undergoing, or call the <tt>%get_name()</tt>,
+ * <tt>%get_extra_info()</tt> methods, etc.), otherwise the behaviour will be undefined.
  *
  * In addition to the mandatory <tt>run_evolve()</tt> method, a UDI may implement the following optional methods:
  * @code{.unparsed}
@@ -771,12 +827,14 @@ public:
      * island's pagmo::algorithm. The evolution happens asynchronously:
      * a call to island::evolve() will create an evolution task that will be pushed
      * to a queue, and then return immediately.
-     * The tasks in the queue are consumed
-     * by a separate thread of execution managed by the pagmo::island object.
+     * The tasks in the queue are consumed, one at a time,
+     * by a thread pool shared by all the pagmo::island objects (see pagmo::set_island_pool_size()).
      * Each task will invoke the <tt>run_evolve()</tt>
      * method of the UDI \p n times consecutively to perform the actual evolution.
      * The island's population will be updated at the end of each <tt>run_evolve()</tt>
-     * invocation. Exceptions raised inside the
+     * invocation. If the island belongs to a pagmo::archipelago, each <tt>run_evolve()</tt> invocation
+     * is preceded by the immigration of individuals from the connected islands and followed by the
+     * emigration of the island's selected individuals (see pagmo::archipelago). Exceptions raised inside the
      * tasks are stored within the island object, and can be re-raised by calling wait_check().
      *
      * It is possible to call this method multiple times to enqueue multiple evolution tasks, which
@@ -792,30 +850,7 @@ public:
      * - memory allocation errors,
      * - the public interface of \p std::future.
      */
-    void evolve(unsigned n = 1)
-    {
-        // First add an empty future, so that if an exception is thrown
-        // we will not have modified m_futures, nor we will have a future
-        // in flight which we cannot wait upon.
-        m_ptr->futures.emplace_back();
-        try {
-            // Move assign a new future provided by the enqueue() method.
-            // NOTE: enqueue either returns a valid future, or throws without
-            // having enqueued any task.
-            m_ptr->futures.back() = m_ptr->queue.enqueue([this, n]() {
-                for (auto i = 0u; i < n; ++i) {
-                    this->m_ptr->isl_ptr->run_evolve(*this);
-                }
-            });
-            // LCOV_EXCL_START
-        } catch (...) {
-            // We end up here only if enqueue threw. In such a case, we need to cleanup
-            // the empty future we added above before re-throwing and exiting.
-            m_ptr->futures.pop_back();
-            throw;
-            // LCOV_EXCL_STOP
-        }
-    }
+    void evolve(unsigned n = 1);
     /// Block until evolution ends and re-raise the first stored exception.
     /**
      * This method will block until all the evolution tasks enqueued via island::evolve() have been completed.
@@ -833,6 +868,9 @@ public:
     {
         auto iwr = detail::wait_raii<>::getter();
         (void)iwr;
+        // NOTE: if we are inside the island thread pool (e.g., an island being waited
+        // upon during the evolution of another island), let the pool know we are blocking.
+        detail::thread_pool_blocking_guard bg(detail::island_thread_pool());
         for (auto it = m_ptr->futures.begin(); it != m_ptr->futures.end(); ++it) {
             assert(it->valid());
             try {
@@ -869,6 +907,7 @@ public:
         // will still re-throw the first exception, and status() will still return idle_error.
         auto iwr = detail::wait_raii<>::getter();
         (void)iwr;
+        detail::thread_pool_blocking_guard bg(detail::island_thread_pool());
         const auto it_f = m_ptr->futures.end();
         auto it_first_exc = it_f;
         for (auto it = m_ptr->futures.begin(); it != it_f; ++it) {
@@ -975,7 +1014,9 @@ public:
     {
         auto new_algo_ptr = std::make_shared<algorithm>(std::move(algo));
         std::lock_guard<std::mutex> lock(m_ptr->algo_mutex);
-        m_ptr->algo = new_algo_ptr;
+        // NOTE: after the swap, new_algo_ptr holds the old algorithm, which will thus be destroyed
+        // after the mutex has been released (see set_population()).
+        m_ptr->algo.swap(new_algo_ptr);
     }
     /// Get the population.
     /**
@@ -1006,7 +1047,11 @@ public:
     {
         auto new_pop_ptr = std::make_shared<population>(std::move(pop));
         std::lock_guard<std::mutex> lock(m_ptr->pop_mutex);
-        m_ptr->pop = new_pop_ptr;
+        // NOTE: after the swap, new_pop_ptr holds the old population, which will thus be destroyed
+        // after the mutex has been released. In this way, the destruction of the old population
+        // (which might need to acquire other locks, e.g., the GIL in pygmo) never happens while
+        // holding the mutex.
+        m_ptr->pop.swap(new_pop_ptr);
     }
     /// Get the thread safety of the island's members.
     /**
@@ -1163,6 +1208,44 @@ inline void thread_island::run_evolve(island &isl) const
     isl.set_population(isl.get_algorithm().evolve(isl.get_population()));
 }
 
+namespace detail
+{
+
+// The buffer of emigrants of an island in an archipelago.
+struct migrant_buffer {
+    // Protects inds and version.
+    std::mutex mutex;
+    // The individuals selected for emigration after the last evolution of the island.
+    individuals_group_t inds;
+    // This is incremented every time inds is overwritten.
+    unsigned long long version = 0;
+    // The versions of the buffers of the other islands at the time of the last
+    // immigration into this island. This is accessed only by the evolution tasks of the island,
+    // which are executed serially, thus it needs no protection.
+    std::vector<unsigned long long> seen;
+};
+
+// The default topology and migration policies of pagmo::archipelago. They can be shared by all the
+// archipelagos because a shared topology is never modified in place, and the policies are immutable.
+inline std::shared_ptr<topology> default_archi_topology()
+{
+    static const auto retval = std::make_shared<topology>();
+    return retval;
+}
+
+inline std::shared_ptr<const s_policy> default_archi_s_policy()
+{
+    static const auto retval = std::make_shared<const s_policy>();
+    return retval;
+}
+
+inline std::shared_ptr<const r_policy> default_archi_r_policy()
+{
+    static const auto retval = std::make_shared<const r_policy>();
+    return retval;
+}
+} // namespace detail
+
 /// Archipelago.
 /**
  * \image html archi_no_text.png
@@ -1175,9 +1258,24 @@ inline void thread_island::run_evolve(island &isl) const
  * state of the archipelago and access its island members. The user can explicitly wait for pending evolutions
  * to conclude by calling the wait() and wait_check() methods. The status of
  * ongoing evolutions in the archipelago can be queried via status().
+ *
+ * The islands of an archipelago can exchange individuals (i.e., *migrate*) during their evolutions. The migration
+ * routes are established by a pagmo::topology, in which the <tt>i</tt>-th vertex corresponds to the <tt>i</tt>-th
+ * island of the archipelago. After each evolution of an island (see island::evolve()), some of its individuals are
+ * selected via a pagmo::s_policy and stored in the island's *migrant buffer*, replacing the previous content of the
+ * buffer. Before each evolution of an island, the buffers of the islands connected to it in the topology are
+ * queried for new emigrants (each connection being used with a probability equal to its weight), and the collected
+ * migrants are inserted in the island's population via a pagmo::r_policy. The migrant buffers are protected by
+ * per-island locks, which are held only for the time needed to read from or write to a buffer: the evolutions of
+ * the islands never wait for each other.
+ *
+ * The default topology is pagmo::unconnected, which disables migration.
  */
 class archipelago
 {
+    // NOTE: the islands' evolution tasks call the migration methods.
+    friend class island;
+
     using container_t = std::vector<std::unique_ptr<island>>;
     using size_type_implementation = container_t::size_type;
     using iterator_implementation = boost::indirect_iterator<container_t::iterator>;
@@ -1191,6 +1289,14 @@ class archipelago
         } catch (...) {
         }
     }
+    // Point the islands to this, and set their indices.
+    void set_archi_ptrs()
+    {
+        for (decltype(m_islands.size()) i = 0; i < m_islands.size(); ++i) {
+            m_islands[i]->m_ptr->archi_ptr = this;
+            m_islands[i]->m_ptr->archi_idx = i;
+        }
+    }
 
 public:
     /// The size type of the archipelago.
@@ -1226,18 +1332,32 @@ public:
     }
     /// Copy constructor.
     /**
-     * The islands of \p other will be copied into \p this via archipelago::push_back().
+     * The islands, the topology, the migration policies and the content of the migrant buffers
+     * of \p other will be copied into \p this.
      *
      * @param other the archipelago that will be copied.
      *
-     * @throws unspecified any exception thrown by archipelago::push_back().
+     * @throws unspecified any exception thrown by the copy constructor of pagmo::island, or
+     * by memory errors in standard containers.
      */
     archipelago(const archipelago &other)
     {
         for (const auto &iptr : other.m_islands) {
             // This will end up copying the island members,
             // and assign the archi pointer as well.
-            push_back(*iptr);
+            push_back_impl(detail::make_unique<island>(*iptr), false);
+        }
+        // NOTE: the topology is never modified in place while shared, and the
+        // migration policies are immutable: we can just share them with other.
+        {
+            std::lock_guard<std::mutex> lock(other.m_migr_mutex);
+            m_topology = other.m_topology;
+            m_s_policy = other.m_s_policy;
+            m_r_policy = other.m_r_policy;
+        }
+        auto db = other.get_migrants_db();
+        for (decltype(db.size()) i = 0; i < db.size(); ++i) {
+            m_migrants[i]->inds = std::move(db[i]);
         }
     }
     /// Move constructor.
@@ -1254,12 +1374,15 @@ public:
         // island evolutions are interacting with their hosting archi 'other'.
         // We cannot just move in the vector of islands.
         other.wait_check_ignore();
-        // Move in the islands.
+        // Move in the islands and the migrant buffers.
         m_islands = std::move(other.m_islands);
+        m_migrants = std::move(other.m_migrants);
+        // NOTE: other is left with the default topology and policies.
+        m_topology.swap(other.m_topology);
+        m_s_policy.swap(other.m_s_policy);
+        m_r_policy.swap(other.m_r_policy);
         // Re-direct the archi pointers to point to this.
-        for (const auto &iptr : m_islands) {
-            iptr->m_ptr->archi_ptr = this;
-        }
+        set_archi_ptrs();
     }
 
 private:
@@ -1371,12 +1494,14 @@ public:
             // This mirrors the island's behaviour.
             wait_check_ignore();
             other.wait_check_ignore();
-            // Move in the islands.
+            // Move in the islands and the migrant buffers.
             m_islands = std::move(other.m_islands);
+            m_migrants = std::move(other.m_migrants);
+            m_topology.swap(other.m_topology);
+            m_s_policy.swap(other.m_s_policy);
+            m_r_policy.swap(other.m_r_policy);
             // Re-direct the archi pointers to point to this.
-            for (const auto &iptr : m_islands) {
-                iptr->m_ptr->archi_ptr = this;
-            }
+            set_archi_ptrs();
         }
         return *this;
     }
@@ -1472,19 +1597,132 @@ public:
      *
      * This method will construct an island from the supplied arguments and add it to the archipelago.
      * Islands are added at the end of the archipelago (that is, the new island will have an index
-     * equal to the value of size() before the call to this method).
+     * equal to the value of size() before the call to this method). A new vertex will also be added
+     * to the archipelago's topology via topology::push_back().
      *
      * @param args the arguments that will be used for the construction of the island.
      *
-     * @throws unspecified any exception thrown by memory allocation errors or by the invoked constructor
-     * of pagmo::island.
+     * @throws unspecified any exception thrown by memory allocation errors, by the invoked constructor
+     * of pagmo::island, or by topology::push_back().
      */
     template <typename... Args, push_back_enabler<Args...> = 0>
     void push_back(Args &&... args)
     {
-        m_islands.emplace_back(detail::make_unique<island>(std::forward<Args>(args)...));
-        // NOTE: this is noexcept.
-        m_islands.back()->m_ptr->archi_ptr = this;
+        push_back_impl(detail::make_unique<island>(std::forward<Args>(args)...), true);
+    }
+    /// Get the topology.
+    /**
+     * It is safe to call this method while the archipelago is evolving.
+     *
+     * @return a copy of the archipelago's topology.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by the copy constructor of
+     * pagmo::topology.
+     */
+    topology get_topology() const
+    {
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        return *m_topology;
+    }
+    /// Set the topology.
+    /**
+     * It is safe to call this method while the archipelago is evolving: the new topology will be used
+     * by the migrations that start after the invocation of this method. The topology is expected to contain
+     * a number of vertices equal to the number of islands in the archipelago.
+     *
+     * @param t the new topology.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by memory allocation errors.
+     */
+    void set_topology(topology t)
+    {
+        auto new_topo = std::make_shared<topology>(std::move(t));
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        m_topology.swap(new_topo);
+    }
+    /// Get the selection policy.
+    /**
+     * It is safe to call this method while the archipelago is evolving.
+     *
+     * @return a copy of the archipelago's selection policy.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by the copy constructor of
+     * pagmo::s_policy.
+     */
+    s_policy get_s_policy() const
+    {
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        return *m_s_policy;
+    }
+    /// Set the selection policy.
+    /**
+     * It is safe to call this method while the archipelago is evolving: the new policy will be used
+     * by the migrations that start after the invocation of this method.
+     *
+     * @param s the new selection policy.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by memory allocation errors.
+     */
+    void set_s_policy(s_policy s)
+    {
+        std::shared_ptr<const s_policy> new_s_pol = std::make_shared<const s_policy>(std::move(s));
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        m_s_policy.swap(new_s_pol);
+    }
+    /// Get the replacement policy.
+    /**
+     * It is safe to call this method while the archipelago is evolving.
+     *
+     * @return a copy of the archipelago's replacement policy.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by the copy constructor of
+     * pagmo::r_policy.
+     */
+    r_policy get_r_policy() const
+    {
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        return *m_r_policy;
+    }
+    /// Set the replacement policy.
+    /**
+     * It is safe to call this method while the archipelago is evolving: the new policy will be used
+     * by the migrations that start after the invocation of this method.
+     *
+     * @param r the new replacement policy.
+     *
+     * @throws unspecified any exception thrown by threading primitives or by memory allocation errors.
+     */
+    void set_r_policy(r_policy r)
+    {
+        std::shared_ptr<const r_policy> new_r_pol = std::make_shared<const r_policy>(std::move(r));
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        m_r_policy.swap(new_r_pol);
+    }
+    /// Get the content of the migrant buffers.
+    /**
+     * It is safe to call this method while the archipelago is evolving.
+     *
+     * @return a vector containing, for each island, the individuals currently stored in its migrant buffer
+     * (that is, the emigrants selected after the last evolution of the island).
+     *
+     * @throws unspecified any exception thrown by threading primitives or by memory allocation errors.
+     */
+    std::vector<individuals_group_t> get_migrants_db() const
+    {
+        std::vector<detail::migrant_buffer *> buffers;
+        {
+            std::lock_guard<std::mutex> lock(m_migr_mutex);
+            for (const auto &ptr : m_migrants) {
+                buffers.push_back(ptr.get());
+            }
+        }
+        std::vector<individuals_group_t> retval;
+        retval.reserve(buffers.size());
+        for (auto ptr : buffers) {
+            std::lock_guard<std::mutex> lock(ptr->mutex);
+            retval.push_back(ptr->inds);
+        }
+        return retval;
     }
     /// Evolve archipelago.
     /**
@@ -1683,11 +1921,15 @@ public:
      *
      * @throws unspecified any exception thrown by:
      * - the streaming of primitive types,
-     * - island::get_algorithm(), island::get_population().
+     * - island::get_algorithm(), island::get_population(),
+     * - get_topology(), get_s_policy(), get_r_policy().
      */
     friend std::ostream &operator<<(std::ostream &os, const archipelago &archi)
     {
         stream(os, "Number of islands: ", archi.size(), "\n");
+        stream(os, "Topology: ", archi.get_topology().get_name(), "\n");
+        stream(os, "Selection policy: ", archi.get_s_policy().get_name(), "\n");
+        stream(os, "Replacement policy: ", archi.get_r_policy().get_name(), "\n");
         stream(os, "Status: ", archi.status(), "\n\n");
         stream(os, "Islands summaries:\n\n");
         detail::table t({"#", "Type", "Algo", "Prob", "Size", "Status"}, "\t");
@@ -1731,16 +1973,18 @@ public:
     }
     /// Save to archive.
     /**
-     * This method will save to \p ar the islands of the archipelago.
+     * This method will save to \p ar the islands, the topology, the migration policies and the content
+     * of the migrant buffers of the archipelago.
      *
      * @param ar the output archive.
      *
-     * @throws unspecified any exception thrown by the serialization of pagmo::island.
+     * @throws unspecified any exception thrown by the serialization of pagmo::island, pagmo::topology,
+     * pagmo::s_policy, pagmo::r_policy or of the migrants.
      */
     template <typename Archive>
     void save(Archive &ar) const
     {
-        ar(m_islands);
+        ar(m_islands, get_topology(), get_s_policy(), get_r_policy(), get_migrants_db());
     }
     /// Load from archive.
     /**
@@ -1749,19 +1993,227 @@ public:
      *
      * @param ar the input archive.
      *
-     * @throws unspecified any exception thrown by the deserialization of pagmo::island.
+     * @throws std::invalid_argument if the number of migrant buffers in \p ar differs from the number of islands.
+     * @throws unspecified any exception thrown by the deserialization of pagmo::island, pagmo::topology,
+     * pagmo::s_policy, pagmo::r_policy or of the migrants.
      */
     template <typename Archive>
     void load(Archive &ar)
     {
         archipelago tmp;
+        topology t;
+        s_policy s;
+        r_policy r;
+        std::vector<individuals_group_t> db;
         ar(tmp.m_islands);
+        tmp.set_archi_ptrs();
+        ar(t, s, r, db);
+        if (db.size() != tmp.m_islands.size()) {
+            pagmo_throw(std::invalid_argument, "Cannot load an archipelago with " + std::to_string(tmp.m_islands.size())
+                                                   + " islands and " + std::to_string(db.size())
+                                                   + " migrant buffers");
+        }
+        for (auto &inds : db) {
+            tmp.m_migrants.emplace_back(detail::make_unique<detail::migrant_buffer>());
+            tmp.m_migrants.back()->inds = std::move(inds);
+        }
+        tmp.set_topology(std::move(t));
+        tmp.set_s_policy(std::move(s));
+        tmp.set_r_policy(std::move(r));
         *this = std::move(tmp);
     }
 
+private:
+    // Add a new island to the archipelago. If add_vertex is true, a new vertex
+    // will be added to the topology as well.
+    void push_back_impl(std::unique_ptr<island> &&new_isl, bool add_vertex)
+    {
+        auto new_buf = detail::make_unique<detail::migrant_buffer>();
+        std::lock_guard<std::mutex> lock(m_migr_mutex);
+        if (add_vertex) {
+            // NOTE: the topology can be modified in place only if it is not shared with
+            // evolving islands or other archipelagos, otherwise we need to make a copy.
+            if (m_topology.use_count() > 1) {
+                m_topology = std::make_shared<topology>(*m_topology);
+            }
+            m_topology->push_back();
+        }
+        m_islands.push_back(std::move(new_isl));
+        try {
+            m_migrants.push_back(std::move(new_buf));
+            // LCOV_EXCL_START
+        } catch (...) {
+            m_islands.pop_back();
+            throw;
+            // LCOV_EXCL_STOP
+        }
+        // NOTE: this is noexcept.
+        m_islands.back()->m_ptr->archi_ptr = this;
+        m_islands.back()->m_ptr->archi_idx = m_islands.size() - 1u;
+    }
+    // Snapshot the population of the island isl.
+    static std::shared_ptr<population> get_pop_ptr(const island &isl)
+    {
+        std::lock_guard<std::mutex> lock(isl.m_ptr->pop_mutex);
+        return isl.m_ptr->pop;
+    }
+    // Migrate into the island isl the new emigrants of the islands connected to it in the topology.
+    void immigrate(island &isl)
+    {
+        const auto i = isl.m_ptr->archi_idx;
+        std::shared_ptr<const topology> topo;
+        std::shared_ptr<const r_policy> r_pol;
+        detail::migrant_buffer *dest;
+        {
+            std::lock_guard<std::mutex> lock(m_migr_mutex);
+            topo = m_topology;
+            r_pol = m_r_policy;
+            dest = m_migrants[i].get();
+        }
+        const auto conns = topo->get_connections(i);
+        if (conns.first.empty()) {
+            return;
+        }
+        // Select the connections that will be used in this migration, according to their weights.
+        std::vector<std::pair<size_type, detail::migrant_buffer *>> sources;
+        {
+            std::lock_guard<std::mutex> lock(m_migr_mutex);
+            std::uniform_real_distribution<double> rdist;
+            for (decltype(conns.first.size()) k = 0; k < conns.first.size(); ++k) {
+                const auto j = conns.first[k];
+                if (j >= m_migrants.size()) {
+                    pagmo_throw(std::invalid_argument, "The topology '" + topo->get_name()
+                                                           + "' connects the island at index " + std::to_string(i)
+                                                           + " to the island at index " + std::to_string(j)
+                                                           + ", but the archipelago contains only "
+                                                           + std::to_string(m_migrants.size()) + " islands");
+                }
+                const auto w = conns.second[k];
+                if (j != i && (w == 1. || (w > 0. && rdist(m_migr_e) < w))) {
+                    sources.emplace_back(j, m_migrants[j].get());
+                }
+            }
+        }
+        // Collect the emigrants that were stored in the buffers after the last migration into isl.
+        individuals_group_t mig;
+        for (const auto &src : sources) {
+            if (dest->seen.size() <= src.first) {
+                dest->seen.resize(src.first + 1u, 0u);
+            }
+            std::lock_guard<std::mutex> lock(src.second->mutex);
+            if (src.second->version == dest->seen[src.first]) {
+                continue;
+            }
+            dest->seen[src.first] = src.second->version;
+            const auto &inds = src.second->inds;
+            std::get<0>(mig).insert(std::get<0>(mig).end(), std::get<0>(inds).begin(), std::get<0>(inds).end());
+            std::get<1>(mig).insert(std::get<1>(mig).end(), std::get<1>(inds).begin(), std::get<1>(inds).end());
+            std::get<2>(mig).insert(std::get<2>(mig).end(), std::get<2>(inds).begin(), std::get<2>(inds).end());
+        }
+        if (std::get<0>(mig).empty()) {
+            return;
+        }
+        // NOTE: the RAII object must be destroyed after all the populations below.
+        boost::any mr;
+        const auto pop_ptr = get_pop_ptr(isl);
+        const auto &prob = pop_ptr->get_problem();
+        if (prob.get_thread_safety() == thread_safety::none) {
+            mr = detail::migration_raii<>::getter();
+        }
+        const individuals_group_t inds(pop_ptr->get_ID(), pop_ptr->get_x(), pop_ptr->get_f());
+        const auto new_inds = r_pol->replace(inds, prob.get_nx(), prob.get_nix(), prob.get_nobj(), prob.get_nec(),
+                                             prob.get_nic(), prob.get_c_tol(), mig);
+        // Overwrite the individuals which were replaced.
+        std::shared_ptr<population> new_pop;
+        for (population::size_type k = 0; k < pop_ptr->size(); ++k) {
+            if (std::get<0>(new_inds)[k] != std::get<0>(inds)[k] || std::get<1>(new_inds)[k] != std::get<1>(inds)[k]
+                || std::get<2>(new_inds)[k] != std::get<2>(inds)[k]) {
+                if (!new_pop) {
+                    new_pop = std::make_shared<population>(*pop_ptr);
+                }
+                new_pop->set_xf(k, std::get<1>(new_inds)[k], std::get<2>(new_inds)[k]);
+            }
+        }
+        if (new_pop) {
+            std::lock_guard<std::mutex> lock(isl.m_ptr->pop_mutex);
+            // NOTE: if the population was replaced in the meantime (e.g., via
+            // island::set_population()), the immigrants are discarded.
+            if (isl.m_ptr->pop == pop_ptr) {
+                isl.m_ptr->pop = std::move(new_pop);
+            }
+        }
+    }
+    // Select the emigrants of the island isl and store them in its migrant buffer.
+    void emigrate(island &isl)
+    {
+        std::shared_ptr<const s_policy> s_pol;
+        detail::migrant_buffer *buf;
+        {
+            std::lock_guard<std::mutex> lock(m_migr_mutex);
+            s_pol = m_s_policy;
+            buf = m_migrants[isl.m_ptr->archi_idx].get();
+        }
+        // NOTE: the RAII object must be destroyed after the population snapshot.
+        boost::any mr;
+        const auto pop_ptr = get_pop_ptr(isl);
+        const auto &prob = pop_ptr->get_problem();
+        if (prob.get_thread_safety() == thread_safety::none) {
+            mr = detail::migration_raii<>::getter();
+        }
+        auto emigrants = s_pol->select(individuals_group_t(pop_ptr->get_ID(), pop_ptr->get_x(), pop_ptr->get_f()),
+                                       prob.get_nx(), prob.get_nix(), prob.get_nobj(), prob.get_nec(),
+                                       prob.get_nic(), prob.get_c_tol());
+        std::lock_guard<std::mutex> lock(buf->mutex);
+        buf->inds = std::move(emigrants);
+        ++buf->version;
+    }
+
 private:
     container_t m_islands;
+    // NOTE: the topology and the migration policies are stored as shared pointers which are
+    // replaced (rather than modified) by the setters. This allows the evolving islands to use them
+    // without holding any lock. The mutex protects the pointers, the insertion of new migrant
+    // buffers and the random engine used for probabilistic migration.
+    mutable std::mutex m_migr_mutex;
+    std::shared_ptr<topology> m_topology = detail::default_archi_topology();
+    std::shared_ptr<const s_policy> m_s_policy = detail::default_archi_s_policy();
+    std::shared_ptr<const r_policy> m_r_policy = detail::default_archi_r_policy();
+    std::vector<std::unique_ptr<detail::migrant_buffer>> m_migrants;
+    detail::random_engine_type m_migr_e{static_cast<detail::random_engine_type::result_type>(random_device::next())};
 };
+inline void island::evolve(unsigned n)
+{
+    // First add an empty future, so that if an exception is thrown
+    // we will not have modified m_futures, nor we will have a future
+    // in flight which we cannot wait upon.
+    m_ptr->futures.emplace_back();
+    try {
+        // Move assign a new future provided by the enqueue() method.
+        // NOTE: enqueue either returns a valid future, or throws without
+        // having enqueued any task.
+        m_ptr->futures.back() = m_ptr->queue.enqueue([this, n]() {
+            for (auto i = 0u; i < n; ++i) {
+                // NOTE: archi_ptr is modified only while the island is not evolving
+                // (see the archipelago's move semantics), thus it is safe to read it here.
+                const auto archi_ptr = this->m_ptr->archi_ptr;
+                if (archi_ptr) {
+                    archi_ptr->immigrate(*this);
+                }
+                this->m_ptr->isl_ptr->run_evolve(*this);
+                if (archi_ptr) {
+                    archi_ptr->emigrate(*this);
+                }
+            }
+        });
+        // LCOV_EXCL_START
+    } catch (...) {
+        // We end up here only if enqueue threw. In such a case, we need to cleanup
+        // the empty future we added above before re-throwing and exiting.
+        m_ptr->futures.pop_back();
+        throw;
+        // LCOV_EXCL_STOP
+    }
+}
 }
 
 PAGMO_REGISTER_ISLAND(pagmo::thread_island)
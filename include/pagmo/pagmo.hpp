@@ -55,6 +55,10 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/algorithms/sga.hpp>
 #include <pagmo/algorithms/simulated_annealing.hpp>
 #include <pagmo/archipelago.hpp>
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/island.hpp>
@@ -71,15 +75,26 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/problems/griewank.hpp>
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
 #include <pagmo/problems/inventory.hpp>
+#include <pagmo/problems/memoize.hpp>
 #include <pagmo/problems/rastrigin.hpp>
 #include <pagmo/problems/rosenbrock.hpp>
 #include <pagmo/problems/schwefel.hpp>
 #include <pagmo/problems/translate.hpp>
 #include <pagmo/problems/unconstrain.hpp>
 #include <pagmo/problems/zdt.hpp>
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/r_policy.hpp>
 #include <pagmo/rng.hpp>
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/s_policy.hpp>
 #include <pagmo/serialization.hpp>
 #include <pagmo/threading.hpp>
+#include <pagmo/topologies/free_form.hpp>
+#include <pagmo/topologies/fully_connected.hpp>
+#include <pagmo/topologies/random_k_regular.hpp>
+#include <pagmo/topologies/ring.hpp>
+#include <pagmo/topologies/unconnected.hpp>
+#include <pagmo/topology.hpp>
 #include <pagmo/type_traits.hpp>
 #include <pagmo/types.hpp>
 #include <pagmo/utils/constrained.hpp>
@@ -90,8 +105,11 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/utils/hv_algos/hv_bf_fpras.hpp>
 #include <pagmo/utils/hv_algos/hv_hv2d.hpp>
 #include <pagmo/utils/hv_algos/hv_hv3d.hpp>
+#include <pagmo/utils/hv_algos/hv_hv4d.hpp>
 #include <pagmo/utils/hv_algos/hv_hvwfg.hpp>
+#include <pagmo/utils/hv_archive.hpp>
 #include <pagmo/utils/hypervolume.hpp>
 #include <pagmo/utils/multi_objective.hpp>
+#include <pagmo/utils/shared_buffer.hpp>
 
 #endif
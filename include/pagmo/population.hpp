@@ -32,14 +32,18 @@ see https://www.gnu.org/licenses/. */
 #include <algorithm>
 #include <cassert>
 #include <cmath>
+#include <cstddef>
 #include <iostream>
 #include <iterator>
 #include <limits>
 #include <numeric>
 #include <random>
 #include <stdexcept>
+#include <string>
 #include <vector>
 
+#include <pagmo/bfe.hpp>
+#include <pagmo/exceptions.hpp>
 #include <pagmo/problem.hpp>
 #include <pagmo/rng.hpp>
 #include <pagmo/type_traits.hpp>
@@ -62,6 +66,13 @@ namespace pagmo
  * and thus including objectives, equality constraints and inequality
  * constraints if present.
  *
+ * The decision vectors and the fitness vectors of the individuals are stored contiguously in row-major order
+ * (i.e., the decision vectors are stored one after the other in a single vector of size \f$ n_x \times N\f$, where
+ * \f$ N\f$ is the population size, and similarly for the fitness vectors). This layout requires a constant number
+ * of memory allocations regardless of the population size, and it allows to scan the population efficiently.
+ * The contiguous storage can be accessed via population::get_x_data() and population::get_f_data(), while
+ * population::get_x_row() and population::get_f_row() return copies of the vectors of a single individual.
+ *
  * A special mechanism is implemented to track the best individual that has ever
  * been part of the population. Such an individual is called *champion* and its
  * decision vector and fitness vector are automatically kept updated. The *champion* is
@@ -89,6 +100,159 @@ class population
 public:
     /// The size type of the population.
     typedef std::vector<vector_double>::size_type size_type;
+    /// Read-only view on a decision or fitness vector.
+    /**
+     * This class is a non-owning view on the decision or fitness vector of an individual, as returned by
+     * population::get_x_row() and population::get_f_row(). It points directly into the contiguous storage of the
+     * population, and it is thus invalidated by any operation modifying the population (or destroying it).
+     * A view converts implicitly to pagmo::vector_double, so that it can be passed to functions expecting
+     * a vector (with the cost of a copy).
+     */
+    class row_view
+    {
+    public:
+        /// Value type.
+        typedef double value_type;
+        /// Iterator type.
+        typedef const double *const_iterator;
+        /// Constructor.
+        /**
+         * @param ptr a pointer to the first element of the view.
+         * @param size the number of elements in the view.
+         */
+        row_view(const double *ptr, vector_double::size_type size) : m_ptr(ptr), m_size(size) {}
+        /// Pointer to the data.
+        /**
+         * @return a pointer to the first element of the view.
+         */
+        const double *data() const
+        {
+            return m_ptr;
+        }
+        /// Size.
+        /**
+         * @return the number of elements in the view.
+         */
+        vector_double::size_type size() const
+        {
+            return m_size;
+        }
+        /// Check if the view is empty.
+        /**
+         * @return \p true if the view contains no elements, \p false otherwise.
+         */
+        bool empty() const
+        {
+            return m_size == 0u;
+        }
+        /// Begin iterator.
+        /**
+         * @return a pointer to the first element of the view.
+         */
+        const_iterator begin() const
+        {
+            return m_ptr;
+        }
+        /// End iterator.
+        /**
+         * @return a pointer one past the last element of the view.
+         */
+        const_iterator end() const
+        {
+            return m_ptr + m_size;
+        }
+        /// Element access.
+        /**
+         * @param i the index of the element (it must be smaller than size()).
+         *
+         * @return a const reference to the \f$ i\f$-th element of the view.
+         */
+        const double &operator[](vector_double::size_type i) const
+        {
+            assert(i < m_size);
+            return m_ptr[i];
+        }
+        /// Conversion to pagmo::vector_double.
+        /**
+         * @return a copy of the elements of the view.
+         *
+         * @throws unspecified any exception thrown by memory errors in standard containers.
+         */
+        operator vector_double() const
+        {
+            return vector_double(begin(), end());
+        }
+        /// Equality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have the same elements, \p false otherwise.
+         */
+        friend bool operator==(const row_view &a, const row_view &b)
+        {
+            return a.m_size == b.m_size && std::equal(a.begin(), a.end(), b.begin());
+        }
+        /// Equality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have the same elements, \p false otherwise.
+         */
+        friend bool operator==(const row_view &a, const vector_double &b)
+        {
+            return a == row_view(b.data(), b.size());
+        }
+        /// Equality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have the same elements, \p false otherwise.
+         */
+        friend bool operator==(const vector_double &a, const row_view &b)
+        {
+            return b == a;
+        }
+        /// Inequality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have different elements, \p false otherwise.
+         */
+        friend bool operator!=(const row_view &a, const row_view &b)
+        {
+            return !(a == b);
+        }
+        /// Inequality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have different elements, \p false otherwise.
+         */
+        friend bool operator!=(const row_view &a, const vector_double &b)
+        {
+            return !(a == b);
+        }
+        /// Inequality operator.
+        /**
+         * @param a first operand.
+         * @param b second operand.
+         *
+         * @return \p true if \p a and \p b have different elements, \p false otherwise.
+         */
+        friend bool operator!=(const vector_double &a, const row_view &b)
+        {
+            return !(a == b);
+        }
+
+    private:
+        const double *m_ptr;
+        vector_double::size_type m_size;
+    };
     /// Default constructor
     /**
      * Constructs an empty population with a pagmo::null_problem.
@@ -132,6 +296,53 @@ public:
         }
     }
 
+    /// Constructor from a problem and a batch fitness evaluator.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if, after the removal of cv/reference qualifiers,
+     *    ``T`` is not :cpp:class:`pagmo::population`, and if :cpp:class:`pagmo::problem` is constructible from ``T``.
+     *
+     * \endverbatim
+     *
+     * This constructor is equivalent to the constructor from a problem, but the fitnesses of the \p pop_size
+     * random individuals are computed in a single batch by the batch fitness evaluator \p b (e.g., in parallel
+     * via pagmo::thread_bfe). The random decision vectors and the IDs of the individuals are generated before
+     * the evaluation exactly as in the constructor from a problem, so that, for the same \p seed, the two
+     * constructors produce the same population.
+     *
+     * @param x the problem the population refers to.
+     * @param b the batch fitness evaluator that will be used to compute the fitnesses of the individuals.
+     * @param pop_size population size (i.e. number of individuals therein).
+     * @param seed seed of the random number generator used, for example, to
+     * create new random individuals within the bounds.
+     *
+     * @throws std::overflow_error if the size of the population storage would overflow.
+     * @throws unspecified any exception thrown by random_decision_vector(), by the call operator of pagmo::bfe,
+     * or by the invoked constructor of pagmo::problem.
+     */
+    template <typename T, generic_ctor_enabler<T> = 0>
+    explicit population(T &&x, const bfe &b, size_type pop_size = 0u, unsigned seed = pagmo::random_device::next())
+        : m_prob(std::forward<T>(x)), m_e(seed), m_seed(seed)
+    {
+        if (!pop_size) {
+            return;
+        }
+        vector_double dvs;
+        std::vector<unsigned long long> ids;
+        grow_storage(ids, pop_size);
+        for (size_type i = 0u; i < pop_size; ++i) {
+            const auto x_rnd = random_decision_vector();
+            grow_storage(dvs, x_rnd.size());
+            dvs.insert(dvs.end(), x_rnd.begin(), x_rnd.end());
+            // NOTE: the ID is drawn right after the decision vector, as in push_back().
+            ids.push_back(std::uniform_int_distribution<unsigned long long>()(m_e));
+        }
+        const auto fvs = b(m_prob, dvs);
+        append_batch(dvs, fvs, ids);
+    }
+
     /// Defaulted copy constructor.
     population(const population &) = default;
 
@@ -191,8 +402,8 @@ public:
      */
     ~population()
     {
-        assert(m_ID.size() == m_x.size());
-        assert(m_ID.size() == m_f.size());
+        assert(m_ID.size() * m_prob.get_nx() == m_x.size());
+        assert(m_ID.size() * m_prob.get_nf() == m_f.size());
     }
 
     /// Adds one decision vector (chromosome) to the population.
@@ -245,20 +456,62 @@ public:
 
         // Prepare quantities to be appended to the internal vectors.
         const auto new_id = std::uniform_int_distribution<unsigned long long>()(m_e);
-        auto x_copy(x);
-        auto f_copy(f);
-        // Reserve space in the vectors.
-        // NOTE: in face of overflow here, reserve(0) will be called, which is fine.
-        // The first push_back below will then fail, with no modifications to the class taking place.
-        m_ID.reserve(m_ID.size() + 1u);
-        m_x.reserve(m_x.size() + 1u);
-        m_f.reserve(m_f.size() + 1u);
+        // Reserve space in the vectors, growing geometrically in order to obtain
+        // amortised constant time insertions.
+        // NOTE: in face of overflow here, the reserve() calls will throw, with no modifications
+        // to the class taking place.
+        grow_storage(m_ID, 1u);
+        grow_storage(m_x, x.size());
+        grow_storage(m_f, f.size());
 
         // update champion either throws before modfying anything, or completes successfully. The rest is noexcept.
         update_champion(x, f);
         m_ID.push_back(new_id);
-        m_x.push_back(std::move(x_copy));
-        m_f.push_back(std::move(f_copy));
+        m_x.insert(m_x.end(), x.begin(), x.end());
+        m_f.insert(m_f.end(), f.begin(), f.end());
+    }
+
+    /// Adds many decision vectors to the population.
+    /**
+     * Appends the decision vectors stored contiguously in \p dvs (i.e., in the format used by
+     * problem::batch_fitness()) to the population, evaluating their fitnesses in a single batch via
+     * problem::batch_fitness() and creating new unique identifiers for the newly born individuals. The outcome
+     * is the same as calling push_back() on each decision vector in order.
+     *
+     * In case of exceptions, the population will not be altered.
+     *
+     * @param dvs the decision vectors to be added to the population, stored contiguously.
+     *
+     * @throws std::invalid_argument if the size of \p dvs is not a multiple of the problem's dimension.
+     * @throws std::overflow_error if the size of the population storage would overflow.
+     * @throws unspecified any exception thrown by memory errors in standard containers or by
+     * problem::batch_fitness().
+     */
+    void batch_push_back(const vector_double &dvs)
+    {
+        check_batch_dvs(dvs);
+        push_back_evaluated(dvs, m_prob.batch_fitness(dvs));
+    }
+
+    /// Adds many decision vectors to the population using a batch fitness evaluator.
+    /**
+     * Equivalent to batch_push_back(const vector_double &), but the fitnesses of the decision vectors are
+     * computed by the batch fitness evaluator \p b (e.g., in parallel via pagmo::thread_bfe).
+     *
+     * In case of exceptions, the population will not be altered.
+     *
+     * @param dvs the decision vectors to be added to the population, stored contiguously.
+     * @param b the batch fitness evaluator that will be used to compute the fitnesses of \p dvs.
+     *
+     * @throws std::invalid_argument if the size of \p dvs is not a multiple of the problem's dimension.
+     * @throws std::overflow_error if the size of the population storage would overflow.
+     * @throws unspecified any exception thrown by memory errors in standard containers or by the call operator
+     * of pagmo::bfe.
+     */
+    void batch_push_back(const vector_double &dvs, const bfe &b)
+    {
+        check_batch_dvs(dvs);
+        push_back_evaluated(dvs, b(m_prob, dvs));
     }
 
     /// Creates a random decision vector
@@ -319,13 +572,13 @@ public:
                         "The best individual can only be extracted in single objective problems");
         }
         if (m_prob.get_nc() > 0u) { // TODO: should we also code a min_element_population_con?
-            return sort_population_con(m_f, m_prob.get_nec(), tol)[0];
+            return sort_population_con(get_f(), m_prob.get_nec(), tol)[0];
         }
         // Sort for single objective, unconstrained optimization
         std::vector<size_type> indexes(size());
         std::iota(indexes.begin(), indexes.end(), size_type(0u));
         return *std::min_element(indexes.begin(), indexes.end(),
-                                 [this](size_type idx1, size_type idx2) { return m_f[idx1] < m_f[idx2]; });
+                                 [this](size_type idx1, size_type idx2) { return f_row_less(idx1, idx2); });
     }
 
     /// Index of the best individual (accounting for a scalar tolerance)
@@ -368,13 +621,13 @@ public:
                         "The worst element of a population can only be extracted in single objective problems");
         }
         if (m_prob.get_nc() > 0u) { // TODO: should we also code a min_element_population_con?
-            return sort_population_con(m_f, m_prob.get_nec(), tol).back();
+            return sort_population_con(get_f(), m_prob.get_nec(), tol).back();
         }
         // Sort for single objective, unconstrained optimization
         std::vector<size_type> indexes(size());
         std::iota(indexes.begin(), indexes.end(), size_type(0u));
         return *std::max_element(indexes.begin(), indexes.end(),
-                                 [this](size_type idx1, size_type idx2) { return m_f[idx1] < m_f[idx2]; });
+                                 [this](size_type idx1, size_type idx2) { return f_row_less(idx1, idx2); });
     }
 
     /// Index of the worst individual (accounting for a scalar tolerance)
@@ -443,8 +696,8 @@ public:
      */
     size_type size() const
     {
-        assert(m_f.size() == m_ID.size());
-        assert(m_x.size() == m_ID.size());
+        assert(m_f.size() == m_ID.size() * m_prob.get_nf());
+        assert(m_x.size() == m_ID.size() * m_prob.get_nx());
         return m_ID.size();
     }
 
@@ -487,18 +740,11 @@ public:
                                                    + std::to_string(m_prob.get_nx()));
         }
 
-        // Reserve space for the incoming vectors. If any of this throws,
-        // the data in m_x[i]/m_f[i] will not be modified.
-        m_x[i].reserve(x.size());
-        m_f[i].reserve(f.size());
-
+        // update champion either throws before modfying anything, or completes successfully. The rest is noexcept,
+        // as the storage for the i-th individual already exists.
         update_champion(x, f);
-        // Use resize + std::copy: since we reserved enough space above, none of this
-        // can throw.
-        m_x[i].resize(x.size());
-        m_f[i].resize(f.size());
-        std::copy(x.begin(), x.end(), m_x[i].begin());
-        std::copy(f.begin(), f.end(), m_f[i].begin());
+        std::copy(x.begin(), x.end(), m_x.begin() + static_cast<std::ptrdiff_t>(i * x.size()));
+        std::copy(f.begin(), f.end(), m_f.begin() + static_cast<std::ptrdiff_t>(i * f.size()));
     }
 
     /// Sets the \f$i\f$-th individual's chromosome
@@ -551,24 +797,100 @@ public:
         return m_prob;
     }
 
-    /// Const getter for the fitness vectors.
+    /// Getter for the fitness vectors.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The fitness vectors are stored contiguously inside the population, and this method
+     *    will thus build and return a copy of them (with a cost proportional to the size of the population).
+     *    Code accessing the fitness vectors repeatedly should rather use
+     *    :cpp:func:`pagmo::population::get_f_data()` or :cpp:func:`pagmo::population::get_f_row()`.
+     *
+     * \endverbatim
+     *
+     * @return a vector containing the fitness vectors of the individuals.
+     *
+     * @throws unspecified any exception thrown by memory errors in standard containers.
+     */
+    std::vector<vector_double> get_f() const
+    {
+        return unflatten(m_f, m_prob.get_nf());
+    }
+
+    /// Getter for the decision vectors.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The decision vectors are stored contiguously inside the population, and this method
+     *    will thus build and return a copy of them (with a cost proportional to the size of the population).
+     *    Code accessing the decision vectors repeatedly should rather use
+     *    :cpp:func:`pagmo::population::get_x_data()` or :cpp:func:`pagmo::population::get_x_row()`.
+     *
+     * \endverbatim
+     *
+     * @return a vector containing the decision vectors of the individuals.
+     *
+     * @throws unspecified any exception thrown by memory errors in standard containers.
+     */
+    std::vector<vector_double> get_x() const
+    {
+        return unflatten(m_x, m_prob.get_nx());
+    }
+
+    /// Const getter for the contiguous storage of the fitness vectors.
     /**
-     * @return a const reference to the vector of fitness vectors.
+     * The fitness vectors are stored one after the other, so that the \f$ j\f$-th component
+     * of the fitness vector of the \f$ i\f$-th individual is located at index \f$ i n_f + j\f$.
+     *
+     * @return a const reference to the contiguous storage of the fitness vectors.
      */
-    const std::vector<vector_double> &get_f() const
+    const vector_double &get_f_data() const
     {
         return m_f;
     }
 
-    /// Const getter for the decision vectors.
+    /// Const getter for the contiguous storage of the decision vectors.
     /**
-     * @return a const reference to the vector of decision vectors.
+     * The decision vectors are stored one after the other, so that the \f$ j\f$-th component
+     * of the decision vector of the \f$ i\f$-th individual is located at index \f$ i n_x + j\f$.
+     *
+     * @return a const reference to the contiguous storage of the decision vectors.
      */
-    const std::vector<vector_double> &get_x() const
+    const vector_double &get_x_data() const
     {
         return m_x;
     }
 
+    /// Get the fitness vector of an individual.
+    /**
+     * @param i the index of the individual.
+     *
+     * @return a read-only view on the fitness vector of the \f$ i\f$-th individual, valid until the population
+     * is next modified.
+     *
+     * @throws std::invalid_argument if \p i is not smaller than the population size.
+     */
+    row_view get_f_row(size_type i) const
+    {
+        return get_row(m_f, i, m_prob.get_nf());
+    }
+
+    /// Get the decision vector of an individual.
+    /**
+     * @param i the index of the individual.
+     *
+     * @return a read-only view on the decision vector of the \f$ i\f$-th individual, valid until the population
+     * is next modified.
+     *
+     * @throws std::invalid_argument if \p i is not smaller than the population size.
+     */
+    row_view get_x_row(size_type i) const
+    {
+        return get_row(m_x, i, m_prob.get_nx());
+    }
+
     /// Const getter for the individual IDs.
     /**
      * @return a const reference to the vector of individual IDs.
@@ -602,8 +924,8 @@ public:
         for (size_type i = 0u; i < p.size(); ++i) {
             stream(os, "#", i, ":\n");
             stream(os, "\tID:\t\t\t", p.m_ID[i], '\n');
-            stream(os, "\tDecision vector:\t", p.m_x[i], '\n');
-            stream(os, "\tFitness vector:\t\t", p.m_f[i], '\n');
+            stream(os, "\tDecision vector:\t", vector_double(p.get_x_row(i)), '\n');
+            stream(os, "\tFitness vector:\t\t", vector_double(p.get_f_row(i)), '\n');
         }
         if (p.get_problem().get_nobj() == 1u) {
             stream(os, "\nChampion decision vector: ", p.champion_x(), '\n');
@@ -640,10 +962,107 @@ public:
     {
         population tmp;
         ar(tmp.m_prob, tmp.m_ID, tmp.m_x, tmp.m_f, tmp.m_champion_x, tmp.m_champion_f, tmp.m_e, tmp.m_seed);
+        if (tmp.m_x.size() != tmp.m_ID.size() * tmp.m_prob.get_nx()
+            || tmp.m_f.size() != tmp.m_ID.size() * tmp.m_prob.get_nf()) {
+            pagmo_throw(std::invalid_argument, "Inconsistent population data detected during deserialization");
+        }
         *this = std::move(tmp);
     }
 
 private:
+    // Check that the size of the contiguous decision vectors dvs is compatible with the problem.
+    void check_batch_dvs(const vector_double &dvs) const
+    {
+        if (dvs.size() % m_prob.get_nx()) {
+            pagmo_throw(std::invalid_argument, "Trying to add a batch of decision vectors of total size: "
+                                                   + std::to_string(dvs.size())
+                                                   + ", which is not a multiple of the problem's dimension: "
+                                                   + std::to_string(m_prob.get_nx()));
+        }
+    }
+    // Draw the IDs of the evaluated decision vectors dvs, and append them to the population.
+    void push_back_evaluated(const vector_double &dvs, const vector_double &fvs)
+    {
+        const auto n = dvs.size() / m_prob.get_nx();
+        std::vector<unsigned long long> ids;
+        ids.reserve(n);
+        for (size_type i = 0u; i < n; ++i) {
+            ids.push_back(std::uniform_int_distribution<unsigned long long>()(m_e));
+        }
+        append_batch(dvs, fvs, ids);
+    }
+    // Append the individuals with decision vectors dvs, fitness vectors fvs and IDs ids (all
+    // stored contiguously). Either throws before modifying anything, or completes successfully.
+    void append_batch(const vector_double &dvs, const vector_double &fvs, const std::vector<unsigned long long> &ids)
+    {
+        const auto nx = m_prob.get_nx(), nf = m_prob.get_nf();
+        assert(dvs.size() == ids.size() * nx && fvs.size() == ids.size() * nf);
+        if (ids.empty()) {
+            return;
+        }
+        grow_storage(m_ID, ids.size());
+        grow_storage(m_x, dvs.size());
+        grow_storage(m_f, fvs.size());
+        // Only the best new individual can replace the champion: we locate it, using the same
+        // criterion as update_champion(), and offer it as the only candidate.
+        size_type best = 0u;
+        if (m_prob.get_nobj() == 1u) {
+            for (size_type i = 1u; i < ids.size(); ++i) {
+                const auto f_i = fvs.data() + i * nf, f_best = fvs.data() + best * nf;
+                if (m_prob.get_nc() == 0u
+                        ? *f_i < *f_best
+                        : compare_fc(vector_double(f_i, f_i + nf), vector_double(f_best, f_best + nf),
+                                     m_prob.get_nec(), m_prob.get_c_tol())) {
+                    best = i;
+                }
+            }
+        }
+        update_champion(vector_double(dvs.data() + best * nx, dvs.data() + (best + 1u) * nx),
+                        vector_double(fvs.data() + best * nf, fvs.data() + (best + 1u) * nf));
+        m_ID.insert(m_ID.end(), ids.begin(), ids.end());
+        m_x.insert(m_x.end(), dvs.begin(), dvs.end());
+        m_f.insert(m_f.end(), fvs.begin(), fvs.end());
+    }
+    // Reserve space for n more elements in v, growing the capacity geometrically.
+    template <typename T>
+    static void grow_storage(std::vector<T> &v, typename std::vector<T>::size_type n)
+    {
+        if (n > std::numeric_limits<typename std::vector<T>::size_type>::max() - v.size()) {
+            pagmo_throw(std::overflow_error, "Overflow in the size of the population storage");
+        }
+        const auto new_size = v.size() + n;
+        if (new_size > v.capacity()) {
+            v.reserve(std::max(new_size, v.capacity() + v.capacity() / 2u));
+        }
+    }
+    // View on the i-th row of the contiguous storage v, with rows of size n.
+    row_view get_row(const vector_double &v, size_type i, vector_double::size_type n) const
+    {
+        if (i >= size()) {
+            pagmo_throw(std::invalid_argument, "Trying to access individual at position: " + std::to_string(i)
+                                                   + ", while population has size: " + std::to_string(size()));
+        }
+        return row_view(v.data() + i * n, n);
+    }
+    // Convert the contiguous storage v, with rows of size n, into a vector of rows.
+    static std::vector<vector_double> unflatten(const vector_double &v, vector_double::size_type n)
+    {
+        assert(n && v.size() % n == 0u);
+        std::vector<vector_double> retval;
+        retval.reserve(v.size() / n);
+        for (auto it = v.begin(); it != v.end(); it += static_cast<std::ptrdiff_t>(n)) {
+            retval.emplace_back(it, it + static_cast<std::ptrdiff_t>(n));
+        }
+        return retval;
+    }
+    // Lexicographical comparison between the fitness vectors of the individuals at indices idx1 and idx2.
+    bool f_row_less(size_type idx1, size_type idx2) const
+    {
+        const auto nf = static_cast<std::ptrdiff_t>(m_prob.get_nf());
+        const auto it1 = m_f.begin() + static_cast<std::ptrdiff_t>(idx1) * nf,
+                   it2 = m_f.begin() + static_cast<std::ptrdiff_t>(idx2) * nf;
+        return std::lexicographical_compare(it1, it1 + nf, it2, it2 + nf);
+    }
     // Short routine to update the champion. Does nothing if the problem is MO
     void update_champion(vector_double x, vector_double f)
     {
@@ -671,10 +1090,10 @@ private:
     problem m_prob;
     // ID of the various decision vectors
     std::vector<unsigned long long> m_ID;
-    // Decision vectors.
-    std::vector<vector_double> m_x;
-    // Fitness vectors.
-    std::vector<vector_double> m_f;
+    // Decision vectors, stored contiguously in row-major order.
+    vector_double m_x;
+    // Fitness vectors, stored contiguously in row-major order.
+    vector_double m_f;
     // The Champion chromosome
     vector_double m_champion_x;
     // The Champion fitness
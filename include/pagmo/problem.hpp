@@ -30,6 +30,7 @@ see https://www.gnu.org/licenses/. */
 #define PAGMO_PROBLEM_HPP
 
 #include <algorithm>
+#include <atomic>
 #include <boost/numeric/conversion/cast.hpp>
 #include <cassert>
 #include <cmath>
@@ -203,6 +204,56 @@ public:
 template <typename T>
 const bool has_fitness<T>::value;
 
+/// Detect \p batch_fitness() method.
+/**
+ * This type trait will be \p true if \p T provides a method with
+ * the following signature:
+ * @code{.unparsed}
+ * vector_double batch_fitness(const vector_double &) const;
+ * @endcode
+ * The \p batch_fitness() method is part of the interface for the definition of a problem
+ * (see pagmo::problem).
+ */
+template <typename T>
+class has_batch_fitness
+{
+    template <typename U>
+    using batch_fitness_t = decltype(std::declval<const U &>().batch_fitness(std::declval<const vector_double &>()));
+    static const bool implementation_defined = std::is_same<vector_double, detected_t<batch_fitness_t, T>>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool has_batch_fitness<T>::value;
+
+/// Detect \p has_batch_fitness() method.
+/**
+ * This type trait will be \p true if \p T provides a method with
+ * the following signature:
+ * @code{.unparsed}
+ * bool has_batch_fitness() const;
+ * @endcode
+ * The \p has_batch_fitness() method is part of the interface for the definition of a problem
+ * (see pagmo::problem).
+ */
+template <typename T>
+class override_has_batch_fitness
+{
+    template <typename U>
+    using has_batch_fitness_t = decltype(std::declval<const U &>().has_batch_fitness());
+    static const bool implementation_defined = std::is_same<bool, detected_t<has_batch_fitness_t, T>>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool override_has_batch_fitness<T>::value;
+
 /// Detect \p get_nobj() method.
 /**
  * This type trait will be \p true if \p T provides a method with
@@ -664,6 +715,8 @@ struct prob_inner_base {
     }
     virtual std::unique_ptr<prob_inner_base> clone() const = 0;
     virtual vector_double fitness(const vector_double &) const = 0;
+    virtual vector_double batch_fitness(const vector_double &) const = 0;
+    virtual bool has_batch_fitness() const = 0;
     virtual vector_double gradient(const vector_double &) const = 0;
     virtual bool has_gradient() const = 0;
     virtual sparsity_pattern gradient_sparsity() const = 0;
@@ -722,6 +775,14 @@ struct prob_inner final : prob_inner_base {
     {
         return get_nobj_impl(m_value);
     }
+    virtual vector_double batch_fitness(const vector_double &dvs) const override final
+    {
+        return batch_fitness_impl(m_value, dvs);
+    }
+    virtual bool has_batch_fitness() const override final
+    {
+        return has_batch_fitness_impl(m_value);
+    }
     virtual vector_double gradient(const vector_double &dv) const override final
     {
         return gradient_impl(m_value, dv);
@@ -797,6 +858,37 @@ struct prob_inner final : prob_inner_base {
     {
         return 1u;
     }
+    template <typename U, enable_if_t<pagmo::has_batch_fitness<U>::value, int> = 0>
+    static vector_double batch_fitness_impl(const U &value, const vector_double &dvs)
+    {
+        return value.batch_fitness(dvs);
+    }
+    template <typename U, enable_if_t<!pagmo::has_batch_fitness<U>::value, int> = 0>
+    [[noreturn]] static vector_double batch_fitness_impl(const U &, const vector_double &) // LCOV_EXCL_LINE
+    {
+        // NOTE: we should never end up here. batch_fitness() is called only if m_has_batch_fitness
+        // in the problem is set to true, and m_has_batch_fitness is unconditionally false if the UDP
+        // does not implement batch_fitness() (see implementation of the three overloads below).
+        assert(false); // LCOV_EXCL_LINE
+        throw;
+    }
+    template <typename U,
+              enable_if_t<pagmo::has_batch_fitness<U>::value && pagmo::override_has_batch_fitness<U>::value, int> = 0>
+    static bool has_batch_fitness_impl(const U &p)
+    {
+        return p.has_batch_fitness();
+    }
+    template <typename U,
+              enable_if_t<pagmo::has_batch_fitness<U>::value && !pagmo::override_has_batch_fitness<U>::value, int> = 0>
+    static bool has_batch_fitness_impl(const U &)
+    {
+        return true;
+    }
+    template <typename U, enable_if_t<!pagmo::has_batch_fitness<U>::value, int> = 0>
+    static bool has_batch_fitness_impl(const U &)
+    {
+        return false;
+    }
     template <typename U, enable_if_t<pagmo::has_gradient<U>::value, int> = 0>
     static vector_double gradient_impl(const U &value, const vector_double &dv)
     {
@@ -1067,6 +1159,8 @@ struct prob_inner final : prob_inner_base {
  * vector_double::size_type get_nec() const;
  * vector_double::size_type get_nic() const;
  * vector_double::size_type get_nix() const;
+ * vector_double batch_fitness(const vector_double &) const;
+ * bool has_batch_fitness() const;
  * bool has_gradient() const;
  * vector_double gradient(const vector_double &) const;
  * bool has_gradient_sparsity() const;
@@ -1178,8 +1272,9 @@ public:
         if (m_nic > std::numeric_limits<decltype(m_nic)>::max() / 3u) {
             pagmo_throw(std::invalid_argument, "The number of inequality constraints is too large");
         }
-        // 4 - Presence of gradient and its sparsity.
+        // 4 - Presence of batch fitness, gradient and its sparsity.
         // NOTE: all these m_has_* attributes refer to the presence of the features in the UDP.
+        m_has_batch_fitness = ptr()->has_batch_fitness();
         m_has_gradient = ptr()->has_gradient();
         m_has_gradient_sparsity = ptr()->has_gradient_sparsity();
         // 5 - Presence of Hessians and their sparsity.
@@ -1243,13 +1338,14 @@ public:
      * - the copying of the internal UDP.
      */
     problem(const problem &other)
-        : m_ptr(other.ptr()->clone()), m_fevals(other.m_fevals), m_gevals(other.m_gevals), m_hevals(other.m_hevals),
+        : m_ptr(other.ptr()->clone()), m_fevals(other.get_fevals()), m_gevals(other.get_gevals()),
+          m_hevals(other.get_hevals()),
           m_lb(other.m_lb), m_ub(other.m_ub), m_nobj(other.m_nobj), m_nec(other.m_nec), m_nic(other.m_nic),
-          m_nix(other.m_nix), m_c_tol(other.m_c_tol), m_has_gradient(other.m_has_gradient),
-          m_has_gradient_sparsity(other.m_has_gradient_sparsity), m_has_hessians(other.m_has_hessians),
-          m_has_hessians_sparsity(other.m_has_hessians_sparsity), m_has_set_seed(other.m_has_set_seed),
-          m_name(other.m_name), m_gs_dim(other.m_gs_dim), m_hs_dim(other.m_hs_dim),
-          m_thread_safety(other.m_thread_safety)
+          m_nix(other.m_nix), m_c_tol(other.m_c_tol), m_has_batch_fitness(other.m_has_batch_fitness),
+          m_has_gradient(other.m_has_gradient), m_has_gradient_sparsity(other.m_has_gradient_sparsity),
+          m_has_hessians(other.m_has_hessians), m_has_hessians_sparsity(other.m_has_hessians_sparsity),
+          m_has_set_seed(other.m_has_set_seed), m_name(other.m_name), m_gs_dim(other.m_gs_dim),
+          m_hs_dim(other.m_hs_dim), m_thread_safety(other.m_thread_safety)
     {
     }
 
@@ -1258,13 +1354,15 @@ public:
      * @param other the problem from which \p this will be move-constructed.
      */
     problem(problem &&other) noexcept
-        : m_ptr(std::move(other.m_ptr)), m_fevals(other.m_fevals), m_gevals(other.m_gevals), m_hevals(other.m_hevals),
+        : m_ptr(std::move(other.m_ptr)), m_fevals(other.get_fevals()), m_gevals(other.get_gevals()),
+          m_hevals(other.get_hevals()),
           m_lb(std::move(other.m_lb)), m_ub(std::move(other.m_ub)), m_nobj(other.m_nobj), m_nec(other.m_nec),
           m_nic(other.m_nic), m_nix(other.m_nix), m_c_tol(std::move(other.m_c_tol)),
-          m_has_gradient(other.m_has_gradient), m_has_gradient_sparsity(other.m_has_gradient_sparsity),
-          m_has_hessians(other.m_has_hessians), m_has_hessians_sparsity(other.m_has_hessians_sparsity),
-          m_has_set_seed(other.m_has_set_seed), m_name(std::move(other.m_name)), m_gs_dim(other.m_gs_dim),
-          m_hs_dim(other.m_hs_dim), m_thread_safety(std::move(other.m_thread_safety))
+          m_has_batch_fitness(other.m_has_batch_fitness), m_has_gradient(other.m_has_gradient),
+          m_has_gradient_sparsity(other.m_has_gradient_sparsity), m_has_hessians(other.m_has_hessians),
+          m_has_hessians_sparsity(other.m_has_hessians_sparsity), m_has_set_seed(other.m_has_set_seed),
+          m_name(std::move(other.m_name)), m_gs_dim(other.m_gs_dim), m_hs_dim(other.m_hs_dim),
+          m_thread_safety(std::move(other.m_thread_safety))
     {
     }
 
@@ -1278,9 +1376,9 @@ public:
     {
         if (this != &other) {
             m_ptr = std::move(other.m_ptr);
-            m_fevals = other.m_fevals;
-            m_gevals = other.m_gevals;
-            m_hevals = other.m_hevals;
+            m_fevals.store(other.get_fevals(), std::memory_order_relaxed);
+            m_gevals.store(other.get_gevals(), std::memory_order_relaxed);
+            m_hevals.store(other.get_hevals(), std::memory_order_relaxed);
             m_lb = std::move(other.m_lb);
             m_ub = std::move(other.m_ub);
             m_nobj = other.m_nobj;
@@ -1288,6 +1386,7 @@ public:
             m_nic = other.m_nic;
             m_nix = other.m_nix;
             m_c_tol = std::move(other.m_c_tol);
+            m_has_batch_fitness = other.m_has_batch_fitness;
             m_has_gradient = other.m_has_gradient;
             m_has_gradient_sparsity = other.m_has_gradient_sparsity;
             m_has_hessians = other.m_has_hessians;
@@ -1413,10 +1512,106 @@ public:
         // 3 - checks the fitness vector
         check_fitness_vector(retval);
         // 4 - increments fitness evaluation counter
-        ++m_fevals;
+        m_fevals.fetch_add(1u, std::memory_order_relaxed);
         return retval;
     }
 
+    /// Batch fitness.
+    /**
+     * This method will compute the fitness of a batch of decision vectors in a single call. The decision vectors
+     * are expected to be stored contiguously in \p dvs (that is, \p dvs contains the \f$n_x\f$ components of
+     * the first decision vector, followed by the \f$n_x\f$ components of the second decision vector, and so on).
+     * The return value will contain, in the same order, the \f$n_f\f$-dimensional fitness vectors corresponding to
+     * the input decision vectors.
+     *
+     * If problem::has_batch_fitness() returns \p true, \p dvs will be forwarded to the <tt>%batch_fitness()</tt>
+     * method of the UDP, which can thus compute the fitness of the whole batch at once (e.g., exploiting
+     * vectorisation or parallelism). Otherwise, the <tt>%fitness()</tt> method of the UDP will be invoked on each
+     * decision vector in turn, and the results will be written directly into the output vector.
+     *
+     * In both cases, the input batch is checked only once against the problem dimension, and the output is written
+     * into a single contiguous vector. A successful call of this method will increase the internal fitness evaluation
+     * counter (see problem::get_fevals()) by the number of decision vectors in \p dvs.
+     *
+     * @param dvs the decision vectors, stored contiguously.
+     *
+     * @return the fitness vectors of \p dvs, stored contiguously.
+     *
+     * @throws std::invalid_argument if either
+     * - the length of \p dvs is not a multiple of the value returned by get_nx(), or
+     * - the length of the returned fitness vector is not \f$n_f\f$ times the number of decision vectors
+     *   in \p dvs.
+     * @throws std::overflow_error if the size of the output vector would result in an overflow.
+     * @throws unspecified any exception thrown by the <tt>%batch_fitness()</tt> or <tt>%fitness()</tt> methods
+     * of the UDP.
+     */
+    vector_double batch_fitness(const vector_double &dvs) const
+    {
+        // 1 - checks the decision vectors
+        const auto nx = get_nx(), nf = get_nf();
+        if (dvs.size() % nx) {
+            pagmo_throw(std::invalid_argument,
+                        "Length of the batch of decision vectors is " + std::to_string(dvs.size())
+                            + ", which is not a multiple of the problem dimension " + std::to_string(nx));
+        }
+        const auto n_dvs = dvs.size() / nx;
+        if (n_dvs > std::numeric_limits<vector_double::size_type>::max() / nf) {
+            pagmo_throw(std::overflow_error, "The size of the batch of fitness vectors is too large");
+        }
+        // 2 - computes the fitnesses
+        vector_double retval;
+        if (m_has_batch_fitness) {
+            retval = ptr()->batch_fitness(dvs);
+        } else {
+            // Fallback: evaluate one decision vector at a time, reusing a single
+            // temporary for the input.
+            retval.resize(n_dvs * nf);
+            vector_double tmp_dv(nx);
+            for (decltype(dvs.size()) i = 0u; i < n_dvs; ++i) {
+                std::copy(dvs.data() + i * nx, dvs.data() + (i + 1u) * nx, tmp_dv.data());
+                const auto tmp_f = ptr()->fitness(tmp_dv);
+                check_fitness_vector(tmp_f);
+                std::copy(tmp_f.begin(), tmp_f.end(), retval.data() + i * nf);
+            }
+        }
+        // 3 - checks the fitness vectors
+        if (retval.size() != n_dvs * nf) {
+            pagmo_throw(std::invalid_argument, "Length of the batch of fitness vectors is "
+                                                   + std::to_string(retval.size()) + ", should be "
+                                                   + std::to_string(n_dvs * nf));
+        }
+        // 4 - increments fitness evaluation counter
+        m_fevals.fetch_add(static_cast<unsigned long long>(n_dvs), std::memory_order_relaxed);
+        return retval;
+    }
+
+    /// Check if the UDP provides a batch fitness function.
+    /**
+     * This method will return \p true if the UDP provides a <tt>%batch_fitness()</tt> method, \p false otherwise.
+     *
+     * The availability of the batch fitness function is determined as follows:
+     * - if the UDP does not satisfy pagmo::has_batch_fitness, then this method will always return \p false;
+     * - if the UDP satisfies pagmo::has_batch_fitness but it does not satisfy pagmo::override_has_batch_fitness,
+     *   then this method will always return \p true;
+     * - if the UDP satisfies both pagmo::has_batch_fitness and pagmo::override_has_batch_fitness,
+     *   then this method will return the output of the <tt>%has_batch_fitness()</tt> method of the UDP.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    Regardless of what this method returns, :cpp:func:`problem::batch_fitness()` can always be called: if the
+     *    UDP does not provide a batch fitness function, the decision vectors will be evaluated one by one via the
+     *    UDP's ``fitness()`` method.
+     *
+     * \endverbatim
+     *
+     * @return a flag signalling the availability of the batch fitness function in the UDP.
+     */
+    bool has_batch_fitness() const
+    {
+        return m_has_batch_fitness;
+    }
+
     /// Gradient.
     /**
      * This method will compute the gradient of the input decision vector \p dv by invoking
@@ -1454,7 +1649,7 @@ public:
         // 3 - checks the gradient vector
         check_gradient_vector(retval);
         // 4 - increments gradient evaluation counter
-        ++m_gevals;
+        m_gevals.fetch_add(1u, std::memory_order_relaxed);
         return retval;
     }
 
@@ -1582,7 +1777,7 @@ public:
         // 3 - checks the hessians
         check_hessians_vector(retval);
         // 4 - increments hessians evaluation counter
-        ++m_hevals;
+        m_hevals.fetch_add(1u, std::memory_order_relaxed);
         return retval;
     }
 
@@ -1829,14 +2024,29 @@ public:
     /// Number of fitness evaluations.
     /**
      * Each time a call to problem::fitness() successfully completes, an internal counter is increased by one.
-     * The counter is initialised to zero upon problem construction and it is never reset. Copy and move operations
-     * copy the counter as well.
+     * Each time a call to problem::batch_fitness() successfully completes, the counter is increased by the number
+     * of decision vectors in the batch. The counter is initialised to zero upon problem construction and it is never
+     * reset. Copy and move operations copy the counter as well. The counter is updated atomically, thus
+     * concurrent evaluations of the same problem (see pagmo::thread_safety::constant) are accounted for correctly.
      *
-     * @return the number of times problem::fitness() was successfully called.
+     * @return the number of fitness evaluations performed via problem::fitness() and problem::batch_fitness().
      */
     unsigned long long get_fevals() const
     {
-        return m_fevals;
+        return m_fevals.load(std::memory_order_relaxed);
+    }
+
+    /// Increment the number of fitness evaluations.
+    /**
+     * This method will increase the internal counter of fitness evaluations by \p n. It is meant to be used
+     * by components which compute fitnesses on copies of \p this (e.g., the batch fitness evaluators), so that
+     * the evaluations can be accounted for in the original problem.
+     *
+     * @param n the amount by which the fitness evaluation counter will be increased.
+     */
+    void increment_fevals(unsigned long long n)
+    {
+        m_fevals.fetch_add(n, std::memory_order_relaxed);
     }
 
     /// Number of gradient evaluations.
@@ -1849,7 +2059,7 @@ public:
      */
     unsigned long long get_gevals() const
     {
-        return m_gevals;
+        return m_gevals.load(std::memory_order_relaxed);
     }
 
     /// Number of hessians evaluations.
@@ -1862,7 +2072,7 @@ public:
      */
     unsigned long long get_hevals() const
     {
-        return m_hevals;
+        return m_hevals.load(std::memory_order_relaxed);
     }
 
     /// Set the seed for the stochastic variables.
@@ -1992,6 +2202,11 @@ public:
      * <tt>%get_thread_safety()</tt> method. Otherwise, thread_safety::basic will be returned.
      * That is, pagmo assumes by default that is it safe to operate concurrently on distinct UDP instances.
      *
+     * UDPs whose const methods can be invoked concurrently on the same instance can declare the
+     * pagmo::thread_safety::constant level. In such case, the const methods of the problem (e.g., problem::fitness())
+     * can be called concurrently as well, and parallel evaluation schemes (such as pagmo::thread_bfe) can share
+     * a single problem among threads rather than copying it.
+     *
      * @return the thread safety level of the UDP.
      */
     thread_safety get_thread_safety() const
@@ -2030,7 +2245,8 @@ public:
         stream(os, p.get_bounds().first, '\n');
         os << "\tUpper bounds: ";
         stream(os, p.get_bounds().second, '\n');
-        stream(os, "\n\tHas gradient: ", p.has_gradient(), '\n');
+        stream(os, "\n\tHas batch fitness evaluation: ", p.has_batch_fitness(), '\n');
+        stream(os, "\tHas gradient: ", p.has_gradient(), '\n');
         stream(os, "\tUser implemented gradient sparsity: ", p.m_has_gradient_sparsity, '\n');
         if (p.has_gradient()) {
             stream(os, "\tExpected gradients: ", p.m_gs_dim, '\n');
@@ -2067,9 +2283,9 @@ public:
     template <typename Archive>
     void save(Archive &ar) const
     {
-        ar(m_ptr, m_fevals, m_gevals, m_hevals, m_lb, m_ub, m_nobj, m_nec, m_nic, m_nix, m_c_tol, m_has_gradient,
-           m_has_gradient_sparsity, m_has_hessians, m_has_hessians_sparsity, m_has_set_seed, m_name, m_gs_dim, m_hs_dim,
-           m_thread_safety);
+        ar(m_ptr, get_fevals(), get_gevals(), get_hevals(), m_lb, m_ub, m_nobj, m_nec, m_nic, m_nix, m_c_tol,
+           m_has_batch_fitness, m_has_gradient, m_has_gradient_sparsity, m_has_hessians, m_has_hessians_sparsity,
+           m_has_set_seed, m_name, m_gs_dim, m_hs_dim, m_thread_safety);
     }
 
     /// Load from archive.
@@ -2085,10 +2301,14 @@ public:
     {
         // Deserialize in a separate object and move it in later, for exception safety.
         problem tmp_prob;
-        ar(tmp_prob.m_ptr, tmp_prob.m_fevals, tmp_prob.m_gevals, tmp_prob.m_hevals, tmp_prob.m_lb, tmp_prob.m_ub,
-           tmp_prob.m_nobj, tmp_prob.m_nec, tmp_prob.m_nic, tmp_prob.m_nix, tmp_prob.m_c_tol, tmp_prob.m_has_gradient,
+        unsigned long long fevals, gevals, hevals;
+        ar(tmp_prob.m_ptr, fevals, gevals, hevals, tmp_prob.m_lb, tmp_prob.m_ub, tmp_prob.m_nobj, tmp_prob.m_nec,
+           tmp_prob.m_nic, tmp_prob.m_nix, tmp_prob.m_c_tol, tmp_prob.m_has_batch_fitness, tmp_prob.m_has_gradient,
            tmp_prob.m_has_gradient_sparsity, tmp_prob.m_has_hessians, tmp_prob.m_has_hessians_sparsity,
            tmp_prob.m_has_set_seed, tmp_prob.m_name, tmp_prob.m_gs_dim, tmp_prob.m_hs_dim, tmp_prob.m_thread_safety);
+        tmp_prob.m_fevals.store(fevals, std::memory_order_relaxed);
+        tmp_prob.m_gevals.store(gevals, std::memory_order_relaxed);
+        tmp_prob.m_hevals.store(hevals, std::memory_order_relaxed);
         *this = std::move(tmp_prob);
     }
 
@@ -2228,12 +2448,13 @@ private:
 private:
     // Pointer to the inner base problem
     std::unique_ptr<detail::prob_inner_base> m_ptr;
-    // Counter for calls to the fitness
-    mutable unsigned long long m_fevals;
-    // Counter for calls to the gradient
-    mutable unsigned long long m_gevals;
-    // Counter for calls to the hessians
-    mutable unsigned long long m_hevals;
+    // Counters for calls to the fitness, gradient and hessians. They are atomic
+    // so that the const methods can be invoked concurrently on the same problem.
+    // NOTE: relaxed ordering is enough, as the counters do not synchronise
+    // any other memory access.
+    mutable std::atomic<unsigned long long> m_fevals;
+    mutable std::atomic<unsigned long long> m_gevals;
+    mutable std::atomic<unsigned long long> m_hevals;
     // Various problem properties determined at construction time
     // from the concrete problem. These will be constant for the lifetime
     // of problem, but we cannot mark them as such because of serialization.
@@ -2244,6 +2465,7 @@ private:
     vector_double::size_type m_nic;
     vector_double::size_type m_nix;
     vector_double m_c_tol;
+    bool m_has_batch_fitness;
     bool m_has_gradient;
     bool m_has_gradient_sparsity;
     bool m_has_hessians;
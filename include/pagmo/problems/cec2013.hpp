@@ -30,6 +30,8 @@ see https://www.gnu.org/licenses/. */
 #define PAGMO_PROBLEM_CEC2013_HPP
 
 #include <cassert>
+#include <map>
+#include <mutex>
 #include <stdexcept>
 #include <string>
 #include <utility>
@@ -40,6 +42,7 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/exceptions.hpp>
 #include <pagmo/problem.hpp> // needed for cereal registration macro
 #include <pagmo/types.hpp>
+#include <pagmo/utils/shared_buffer.hpp>
 
 #define E 2.7182818284590452353602874713526625
 
@@ -84,7 +87,7 @@ public:
      * [2,5,10,20,30,40,50,60,70,80,90,100]
      */
     cec2013(unsigned int prob_id = 1u, unsigned int dim = 2u)
-        : m_prob_id(prob_id), m_rotation_matrix(), m_origin_shift(), m_y(dim), m_z(dim)
+        : m_prob_id(prob_id), m_y(dim), m_z(dim)
     {
         if (!(dim == 2u || dim == 5u || dim == 10u || dim == 20u || dim == 30u || dim == 40u || dim == 50u || dim == 60u
               || dim == 70u || dim == 80u || dim == 90u || dim == 100u)) {
@@ -97,10 +100,8 @@ public:
                         "Error: CEC2013 Test functions are only defined for prob_id in [1, 28], a prob_id of "
                             + std::to_string(prob_id) + " was detected.");
         }
-        m_origin_shift = detail::cec2013_data::shift_data;
-        auto it = detail::cec2013_data::MD.find(dim);
-        assert(it != detail::cec2013_data::MD.end());
-        m_rotation_matrix = it->second;
+        m_origin_shift = get_shift_data();
+        m_rotation_matrix = get_rotation_data(dim);
     }
     /// Fitness computation
     /**
@@ -116,115 +117,115 @@ public:
         vector_double f(1);
         switch (m_prob_id) {
             case 1:
-                sphere_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                sphere_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += -1400.0;
                 break;
             case 2:
-                ellips_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                ellips_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -1300.0;
                 break;
             case 3:
-                bent_cigar_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                bent_cigar_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -1200.0;
                 break;
             case 4:
-                discus_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                discus_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -1100.0;
                 break;
             case 5:
-                dif_powers_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                dif_powers_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += -1000.0;
                 break;
             case 6:
-                rosenbrock_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                rosenbrock_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -900.0;
                 break;
             case 7:
-                schaffer_F7_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                schaffer_F7_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -800.0;
                 break;
             case 8:
-                ackley_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                ackley_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -700.0;
                 break;
             case 9:
-                weierstrass_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                weierstrass_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -600.0;
                 break;
             case 10:
-                griewank_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                griewank_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -500.0;
                 break;
             case 11:
-                rastrigin_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                rastrigin_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += -400.0;
                 break;
             case 12:
-                rastrigin_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                rastrigin_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -300.0;
                 break;
             case 13:
-                step_rastrigin_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                step_rastrigin_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += -200.0;
                 break;
             case 14:
-                schwefel_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                schwefel_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += -100.0;
                 break;
             case 15:
-                schwefel_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                schwefel_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 100.0;
                 break;
             case 16:
-                katsuura_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                katsuura_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 200.0;
                 break;
             case 17:
-                bi_rastrigin_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                bi_rastrigin_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += 300.0;
                 break;
             case 18:
-                bi_rastrigin_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                bi_rastrigin_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 400.0;
                 break;
             case 19:
-                grie_rosen_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                grie_rosen_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 500.0;
                 break;
             case 20:
-                escaffer6_func(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                escaffer6_func(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 600.0;
                 break;
             case 21:
-                cf01(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf01(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 700.0;
                 break;
             case 22:
-                cf02(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 0);
+                cf02(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 0);
                 f[0] += 800.0;
                 break;
             case 23:
-                cf03(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf03(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 900.0;
                 break;
             case 24:
-                cf04(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf04(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 1000.0;
                 break;
             case 25:
-                cf05(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf05(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 1100.0;
                 break;
             case 26:
-                cf06(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf06(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 1200.0;
                 break;
             case 27:
-                cf07(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf07(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 1300.0;
                 break;
             case 28:
-                cf08(&x[0], &f[0], nx, &m_origin_shift[0], &m_rotation_matrix[0], 1);
+                cf08(&x[0], &f[0], nx, m_origin_shift->data(), m_rotation_matrix->data(), 1);
                 f[0] += 1400.0;
                 break;
         }
@@ -344,7 +345,8 @@ public:
     }
     /// Object serialization
     /**
-     * This method will save/load \p this into the archive \p ar.
+     * This method will save/load \p this into the archive \p ar. Upon loading, the shift and rotation data
+     * are shared with the live instances having the same data (see pagmo::shared_buffer).
      *
      * @param ar target archive.
      *
@@ -357,6 +359,27 @@ public:
     }
 
 private:
+    // The shift and rotation data are created from the static tables on first use, and then shared
+    // by all the instances.
+    static shared_buffer<vector_double> get_shift_data()
+    {
+        static const shared_buffer<vector_double> retval(detail::cec2013_data::shift_data);
+        return retval;
+    }
+    static shared_buffer<vector_double> get_rotation_data(unsigned dim)
+    {
+        static std::mutex mutex;
+        static std::map<unsigned, shared_buffer<vector_double>> data;
+        std::lock_guard<std::mutex> lock(mutex);
+        auto it = data.find(dim);
+        if (it == data.end()) {
+            auto md_it = detail::cec2013_data::MD.find(dim);
+            assert(md_it != detail::cec2013_data::MD.end());
+            it = data.emplace(dim, shared_buffer<vector_double>(md_it->second)).first;
+        }
+        return it->second;
+    }
+
     // For the coverage analysis we do not cover the code below as its derived from a third party source
     // LCOV_EXCL_START
     void sphere_func(const double *x, double *f, const unsigned int nx, const double *Os, const double *Mr,
@@ -1167,8 +1190,10 @@ private:
     // problem id
     unsigned int m_prob_id;
     // problem data
-    std::vector<double> m_rotation_matrix;
-    std::vector<double> m_origin_shift;
+    // NOTE: the shift and rotation data are immutable and identical for all the instances
+    // with the same dimension, thus they are shared rather than copied.
+    shared_buffer<vector_double> m_rotation_matrix;
+    shared_buffer<vector_double> m_origin_shift;
 
     // pre-allocated stuff for speed
     mutable std::vector<double> m_y;
@@ -345,12 +345,16 @@ public:
     /// Problem's thread safety level.
     /**
      * The thread safety of a meta-problem is defined by the thread safety of the inner pagmo::problem.
+     * If the reference point is adapted during the fitness evaluations, the level is capped to
+     * pagmo::thread_safety::basic.
      *
-     * @return the thread safety level of the inner pagmo::problem.
+     * @return the thread safety level of the inner pagmo::problem, capped to pagmo::thread_safety::basic
+     * if the reference point is adapted.
      */
     thread_safety get_thread_safety() const
     {
-        return m_problem.get_thread_safety();
+        return m_adapt_ideal ? std::min(m_problem.get_thread_safety(), thread_safety::basic)
+                             : m_problem.get_thread_safety();
     }
 
     /// Getter for the inner problem.
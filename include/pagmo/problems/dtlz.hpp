@@ -199,7 +199,7 @@ public:
     {
         double c = 0.0;
         for (decltype(pop.size()) i = 0u; i < pop.size(); ++i) {
-            c += p_distance(pop.get_x()[i]);
+            c += p_distance(pop.get_x_row(i));
         }
 
         return c / static_cast<double>(pop.size());
@@ -0,0 +1,690 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_PROBLEM_MEMOIZE_HPP
+#define PAGMO_PROBLEM_MEMOIZE_HPP
+
+#include <algorithm>
+#include <cassert>
+#include <cstddef>
+#include <iterator>
+#include <list>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <pagmo/detail/custom_comparisons.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+namespace detail
+{
+
+// A bounded LRU cache mapping decision vectors to vectors of doubles (e.g., fitness
+// or gradient vectors). The entries are kept in a list ordered from the most recently used
+// to the least recently used, and a hash map (using the floating-point aware hashing and comparison
+// functors from custom_comparisons.hpp) indexes the list.
+class vf_lru_cache
+{
+    using list_t = std::list<std::pair<vector_double, vector_double>>;
+    using map_t = std::unordered_map<vector_double, list_t::iterator, hash_vf<double>, equal_to_vf<double>>;
+
+public:
+    explicit vf_lru_cache(std::size_t capacity) : m_capacity(capacity) {}
+    // NOTE: the map stores iterators into the list, thus the copy operations need
+    // to rebuild the map. The move operations are fine, as moving an std::list
+    // does not invalidate its iterators.
+    vf_lru_cache(const vf_lru_cache &other) : m_capacity(other.m_capacity), m_list(other.m_list)
+    {
+        rebuild_map();
+    }
+    vf_lru_cache(vf_lru_cache &&) = default;
+    vf_lru_cache &operator=(const vf_lru_cache &other)
+    {
+        if (this != &other) {
+            *this = vf_lru_cache(other);
+        }
+        return *this;
+    }
+    vf_lru_cache &operator=(vf_lru_cache &&) = default;
+    // Look up x. On a hit, x is marked as the most recently used entry and a pointer to the
+    // cached value is returned. On a miss, nullptr is returned.
+    const vector_double *find(const vector_double &x)
+    {
+        const auto it = m_map.find(x);
+        if (it == m_map.end()) {
+            return nullptr;
+        }
+        m_list.splice(m_list.begin(), m_list, it->second);
+        return &it->second->second;
+    }
+    // Insert the pair (x, v) as the most recently used entry, evicting the least recently used
+    // entry if the cache is full. x must not be in the cache already.
+    void insert(const vector_double &x, const vector_double &v)
+    {
+        assert(m_map.find(x) == m_map.end());
+        if (m_list.size() == m_capacity) {
+            // Recycle the storage of the least recently used entry.
+            m_map.erase(m_list.back().first);
+            m_list.splice(m_list.begin(), m_list, std::prev(m_list.end()));
+            m_list.front().first = x;
+            m_list.front().second = v;
+        } else {
+            m_list.emplace_front(x, v);
+        }
+        m_map.emplace(x, m_list.begin());
+    }
+    void clear()
+    {
+        m_map.clear();
+        m_list.clear();
+    }
+    std::size_t size() const
+    {
+        return m_list.size();
+    }
+    std::size_t capacity() const
+    {
+        return m_capacity;
+    }
+    template <typename Archive>
+    void save(Archive &ar) const
+    {
+        // The entries are stored from the most recently used to the least recently used.
+        std::vector<vector_double> keys, values;
+        for (const auto &p : m_list) {
+            keys.push_back(p.first);
+            values.push_back(p.second);
+        }
+        ar(m_capacity, keys, values);
+    }
+    template <typename Archive>
+    void load(Archive &ar)
+    {
+        std::size_t capacity;
+        std::vector<vector_double> keys, values;
+        ar(capacity, keys, values);
+        if (keys.size() != values.size() || keys.size() > capacity) {
+            pagmo_throw(std::invalid_argument, "Inconsistent LRU cache data detected during deserialization");
+        }
+        list_t new_list;
+        for (decltype(keys.size()) i = 0; i < keys.size(); ++i) {
+            new_list.emplace_back(std::move(keys[i]), std::move(values[i]));
+        }
+        m_capacity = capacity;
+        m_list = std::move(new_list);
+        rebuild_map();
+    }
+
+private:
+    void rebuild_map()
+    {
+        m_map.clear();
+        for (auto it = m_list.begin(); it != m_list.end(); ++it) {
+            m_map.emplace(it->first, it);
+        }
+    }
+    std::size_t m_capacity;
+    list_t m_list;
+    map_t m_map;
+};
+} // namespace detail
+
+/// The memoize meta-problem.
+/**
+ * This meta-problem wraps an input problem and memoizes the results of its fitness function (and, optionally,
+ * of its gradient) in a bounded least-recently-used (LRU) cache keyed on the decision vector. When the fitness of
+ * a decision vector which is already in the cache is requested, the cached value is returned and the inner problem
+ * is not invoked. When the cache is full, the least recently used entry is discarded to make room for a new one.
+ *
+ * This meta-problem is useful for expensive problems which are repeatedly evaluated on the same decision
+ * vectors (e.g., integer and mixed-integer problems, where the search space is discrete).
+ *
+ * The number of cache hits and misses is recorded, and it can be retrieved via memoize::get_hits(),
+ * memoize::get_misses() (and the corresponding methods for the gradient), or via memoize::get_extra_info().
+ * Note that the fitness evaluation counter of the inner problem will record only the cache misses.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    The cache is stored inside the :cpp:class:`~pagmo::memoize` object, and it is thus copied together
+ *    with it. Distinct copies of a :cpp:class:`~pagmo::memoize` object hence have independent caches.
+ *    As a consequence, :cpp:class:`~pagmo::memoize` provides the same thread safety guarantee as the inner
+ *    problem.
+ *
+ * .. warning::
+ *
+ *    The inner problem is assumed to be deterministic, or to change its behaviour only when its seed
+ *    is changed via :cpp:func:`memoize::set_seed()` (which clears the cache).
+ *
+ * \endverbatim
+ */
+class memoize
+{
+    // Enabler for the ctor from UDP or problem. In this case we also allow construction from type problem.
+    // NOTE: we need to exclude memoize itself, otherwise the generic ctor would hijack the copy ctor
+    // when copying from a non-const memoize.
+    template <typename T>
+    using ctor_enabler
+        = enable_if_t<std::is_constructible<problem, T &&>::value && !std::is_same<uncvref_t<T>, memoize>::value, int>;
+
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialize a pagmo::null_problem memoized with a cache capacity of 1000
+     * entries.
+     */
+    memoize() : memoize(null_problem{}) {}
+
+    /// Constructor from problem and cache capacity.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if ``T`` can be used to construct a :cpp:class:`pagmo::problem`.
+     *
+     * \endverbatim
+     *
+     * Wraps a user-defined problem so that the results of its fitness function (and, if \p cache_gradient is
+     * \p true, of its gradient) will be memoized in LRU caches containing at most \p capacity entries each.
+     *
+     * @param p a pagmo::problem or a user-defined problem (UDP).
+     * @param capacity the maximum number of entries in the cache.
+     * @param cache_gradient if \p true, the gradient will be memoized as well.
+     *
+     * @throws std::invalid_argument if \p capacity is zero.
+     * @throws unspecified any exception thrown by the pagmo::problem constructor.
+     */
+    template <typename T, ctor_enabler<T> = 0>
+    explicit memoize(T &&p, std::size_t capacity = 1000u, bool cache_gradient = false)
+        : m_problem(std::forward<T>(p)), m_f_cache(capacity), m_g_cache(capacity), m_cache_gradient(cache_gradient)
+    {
+        if (!capacity) {
+            pagmo_throw(std::invalid_argument, "The capacity of the cache of a memoize meta-problem cannot be zero");
+        }
+    }
+
+    /// Fitness.
+    /**
+     * If \p x is in the fitness cache, the cached fitness will be returned. Otherwise, the fitness computation
+     * is forwarded to the inner problem, and the result is stored in the cache.
+     *
+     * @param x the decision vector.
+     *
+     * @return the fitness of \p x.
+     *
+     * @throws unspecified any exception thrown by memory errors in standard containers,
+     * or by problem::fitness().
+     */
+    vector_double fitness(const vector_double &x) const
+    {
+        if (const auto f = m_f_cache.find(x)) {
+            ++m_f_hits;
+            return *f;
+        }
+        auto retval = m_problem.fitness(x);
+        ++m_f_misses;
+        m_f_cache.insert(x, retval);
+        return retval;
+    }
+
+    /// Batch fitness.
+    /**
+     * The decision vectors in \p dvs which are not in the fitness cache are evaluated in a single call to
+     * problem::batch_fitness() of the inner problem, and the results are stored in the cache.
+     *
+     * @param dvs the decision vectors, stored contiguously.
+     *
+     * @return the fitness vectors of \p dvs, stored contiguously.
+     *
+     * @throws unspecified any exception thrown by memory errors in standard containers,
+     * or by problem::batch_fitness().
+     */
+    vector_double batch_fitness(const vector_double &dvs) const
+    {
+        // NOTE: the dimension of dvs has already been checked by problem::batch_fitness().
+        const auto nx = m_problem.get_nx(), nf = m_problem.get_nf();
+        assert(dvs.size() % nx == 0u);
+        const auto n_dvs = dvs.size() / nx;
+        vector_double retval(n_dvs * nf), x(nx), missed_dvs;
+        // Indices (in dvs) of the decision vectors which are not in the cache.
+        std::vector<decltype(dvs.size())> missed_idx;
+        for (decltype(dvs.size()) i = 0; i < n_dvs; ++i) {
+            std::copy(dvs.data() + i * nx, dvs.data() + (i + 1u) * nx, x.data());
+            if (const auto f = m_f_cache.find(x)) {
+                std::copy(f->begin(), f->end(), retval.data() + i * nf);
+            } else {
+                missed_dvs.insert(missed_dvs.end(), x.begin(), x.end());
+                missed_idx.push_back(i);
+            }
+        }
+        if (!missed_idx.empty()) {
+            const auto missed_fvs = m_problem.batch_fitness(missed_dvs);
+            vector_double f(nf);
+            for (decltype(missed_idx.size()) j = 0; j < missed_idx.size(); ++j) {
+                std::copy(missed_dvs.data() + j * nx, missed_dvs.data() + (j + 1u) * nx, x.data());
+                std::copy(missed_fvs.data() + j * nf, missed_fvs.data() + (j + 1u) * nf, f.data());
+                std::copy(f.begin(), f.end(), retval.data() + missed_idx[j] * nf);
+                // NOTE: the same decision vector could appear multiple times in dvs.
+                if (!m_f_cache.find(x)) {
+                    m_f_cache.insert(x, f);
+                }
+            }
+        }
+        m_f_hits += n_dvs - missed_idx.size();
+        m_f_misses += missed_idx.size();
+        return retval;
+    }
+
+    /// Check if the inner problem provides a batch fitness function.
+    /**
+     * @return the output of problem::has_batch_fitness() for the inner problem.
+     */
+    bool has_batch_fitness() const
+    {
+        return m_problem.has_batch_fitness();
+    }
+
+    /// Box-bounds.
+    /**
+     * @return the box-bounds of the inner problem.
+     *
+     * @throws unspecified any exception thrown by problem::get_bounds().
+     */
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return m_problem.get_bounds();
+    }
+
+    /// Number of objectives.
+    /**
+     * @return the number of objectives of the inner problem.
+     */
+    vector_double::size_type get_nobj() const
+    {
+        return m_problem.get_nobj();
+    }
+
+    /// Equality constraint dimension.
+    /**
+     * @return the number of equality constraints of the inner problem.
+     */
+    vector_double::size_type get_nec() const
+    {
+        return m_problem.get_nec();
+    }
+
+    /// Inequality constraint dimension.
+    /**
+     * @return the number of inequality constraints of the inner problem.
+     */
+    vector_double::size_type get_nic() const
+    {
+        return m_problem.get_nic();
+    }
+
+    /// Integer dimension.
+    /**
+     * @return the integer dimension of the inner problem.
+     */
+    vector_double::size_type get_nix() const
+    {
+        return m_problem.get_nix();
+    }
+
+    /// Checks if the inner problem has gradients.
+    /**
+     * The <tt>has_gradient()</tt> computation is forwarded to the inner problem.
+     *
+     * @return a flag signalling the availability of the gradient in the inner problem.
+     */
+    bool has_gradient() const
+    {
+        return m_problem.has_gradient();
+    }
+
+    /// Gradients.
+    /**
+     * If gradient memoization was requested upon construction and \p x is in the gradient cache,
+     * the cached gradient will be returned. Otherwise, the gradient computation is forwarded to the inner problem
+     * (and, if gradient memoization is active, the result is stored in the gradient cache).
+     *
+     * @param x the decision vector.
+     *
+     * @return the gradient of the fitness function.
+     *
+     * @throws unspecified any exception thrown by memory errors in standard containers,
+     * or by <tt>problem::gradient()</tt>.
+     */
+    vector_double gradient(const vector_double &x) const
+    {
+        if (!m_cache_gradient) {
+            return m_problem.gradient(x);
+        }
+        if (const auto g = m_g_cache.find(x)) {
+            ++m_g_hits;
+            return *g;
+        }
+        auto retval = m_problem.gradient(x);
+        ++m_g_misses;
+        m_g_cache.insert(x, retval);
+        return retval;
+    }
+
+    /// Checks if the inner problem has gradient sparisty implemented.
+    /**
+     * The <tt>has_gradient_sparsity()</tt> computation is forwarded to the inner problem.
+     *
+     * @return a flag signalling the availability of the gradient sparisty in the inner problem.
+     */
+    bool has_gradient_sparsity() const
+    {
+        return m_problem.has_gradient_sparsity();
+    }
+
+    /// Gradient sparsity.
+    /**
+     * The <tt>gradient_sparsity</tt> computation is forwarded to the inner problem.
+     *
+     * @return the gradient sparsity of the inner problem.
+     */
+    sparsity_pattern gradient_sparsity() const
+    {
+        return m_problem.gradient_sparsity();
+    }
+
+    /// Checks if the inner problem has hessians.
+    /**
+     * The <tt>has_hessians()</tt> computation is forwarded to the inner problem.
+     *
+     * @return a flag signalling the availability of the hessians in the inner problem.
+     */
+    bool has_hessians() const
+    {
+        return m_problem.has_hessians();
+    }
+
+    /// Hessians.
+    /**
+     * The <tt>hessians()</tt> computation is forwarded to the inner problem (hessians are not memoized).
+     *
+     * @param x the decision vector.
+     *
+     * @return the hessians of the fitness function computed at \p x.
+     *
+     * @throws unspecified any exception thrown by problem::hessians().
+     */
+    std::vector<vector_double> hessians(const vector_double &x) const
+    {
+        return m_problem.hessians(x);
+    }
+
+    /// Checks if the inner problem has hessians sparisty implemented.
+    /**
+     * The <tt>has_hessians_sparsity()</tt> computation is forwarded to the inner problem.
+     *
+     * @return a flag signalling the availability of the hessians sparisty in the inner problem.
+     */
+    bool has_hessians_sparsity() const
+    {
+        return m_problem.has_hessians_sparsity();
+    }
+
+    /// Hessians sparsity.
+    /**
+     * The <tt>hessians_sparsity()</tt> computation is forwarded to the inner problem.
+     *
+     * @return the hessians sparsity of the inner problem.
+     */
+    std::vector<sparsity_pattern> hessians_sparsity() const
+    {
+        return m_problem.hessians_sparsity();
+    }
+
+    /// Calls <tt>has_set_seed()</tt> of the inner problem.
+    /**
+     * Calls the method <tt>has_set_seed()</tt> of the inner problem.
+     *
+     * @return a flag signalling wether the inner problem is stochastic.
+     */
+    bool has_set_seed() const
+    {
+        return m_problem.has_set_seed();
+    }
+
+    /// Calls <tt>set_seed()</tt> of the inner problem.
+    /**
+     * Calls the method <tt>set_seed()</tt> of the inner problem and then clears the caches, as the cached values
+     * might not be valid any more.
+     *
+     * @param seed seed to be set.
+     *
+     * @throws unspecified any exception thrown by the method <tt>set_seed()</tt> of the inner problem.
+     */
+    void set_seed(unsigned seed)
+    {
+        m_problem.set_seed(seed);
+        clear_cache();
+    }
+
+    /// Problem name
+    /**
+     * This method will add <tt>[memoized]</tt> to the name provided by the inner problem.
+     *
+     * @return a string containing the problem name.
+     *
+     * @throws unspecified any exception thrown by <tt>problem::get_name()</tt> or memory errors in standard classes.
+     */
+    std::string get_name() const
+    {
+        return m_problem.get_name() + " [memoized]";
+    }
+
+    /// Extra info
+    /**
+     * This method will append a description of the cache status (capacity, number of entries, hits and misses)
+     * to the extra info provided by the inner problem.
+     *
+     * @return a string containing extra info on the problem.
+     *
+     * @throws unspecified any exception thrown by problem::get_extra_info(), the public interface of
+     * \p std::ostringstream or memory errors in standard classes.
+     */
+    std::string get_extra_info() const
+    {
+        std::ostringstream oss;
+        oss << m_problem.get_extra_info();
+        oss << "\n\tCache capacity: " << m_f_cache.capacity();
+        oss << "\n\tFitness cache size: " << m_f_cache.size();
+        oss << "\n\tFitness cache hits: " << m_f_hits;
+        oss << "\n\tFitness cache misses: " << m_f_misses;
+        if (m_cache_gradient) {
+            oss << "\n\tGradient cache size: " << m_g_cache.size();
+            oss << "\n\tGradient cache hits: " << m_g_hits;
+            oss << "\n\tGradient cache misses: " << m_g_misses;
+        }
+        return oss.str();
+    }
+
+    /// Problem's thread safety level.
+    /**
+     * The thread safety of a meta-problem is defined by the thread safety of the inner pagmo::problem.
+     * Because the caches are updated by the const methods, the level is capped to pagmo::thread_safety::basic.
+     *
+     * @return the thread safety level of the inner pagmo::problem, capped to pagmo::thread_safety::basic.
+     */
+    thread_safety get_thread_safety() const
+    {
+        return std::min(m_problem.get_thread_safety(), thread_safety::basic);
+    }
+
+    /// Get the capacity of the cache.
+    /**
+     * @return the maximum number of entries in the fitness (and gradient) cache.
+     */
+    std::size_t get_capacity() const
+    {
+        return m_f_cache.capacity();
+    }
+
+    /// Check if the gradient is memoized.
+    /**
+     * @return \p true if the gradient of the inner problem is memoized, \p false otherwise.
+     */
+    bool get_cache_gradient() const
+    {
+        return m_cache_gradient;
+    }
+
+    /// Number of fitness cache hits.
+    /**
+     * @return the number of fitness evaluations which were served from the cache.
+     */
+    unsigned long long get_hits() const
+    {
+        return m_f_hits;
+    }
+
+    /// Number of fitness cache misses.
+    /**
+     * @return the number of fitness evaluations which were forwarded to the inner problem.
+     */
+    unsigned long long get_misses() const
+    {
+        return m_f_misses;
+    }
+
+    /// Number of gradient cache hits.
+    /**
+     * @return the number of gradient evaluations which were served from the cache.
+     */
+    unsigned long long get_gradient_hits() const
+    {
+        return m_g_hits;
+    }
+
+    /// Number of gradient cache misses.
+    /**
+     * @return the number of gradient evaluations which were forwarded to the inner problem while
+     * gradient memoization was active.
+     */
+    unsigned long long get_gradient_misses() const
+    {
+        return m_g_misses;
+    }
+
+    /// Clear the caches.
+    /**
+     * This method will remove all the entries from the fitness and gradient caches. The hit/miss
+     * counters are not reset.
+     */
+    void clear_cache()
+    {
+        m_f_cache.clear();
+        m_g_cache.clear();
+    }
+
+    /// Getter for the inner problem.
+    /**
+     * Returns a const reference to the inner pagmo::problem.
+     *
+     * @return a const reference to the inner pagmo::problem.
+     */
+    const problem &get_inner_problem() const
+    {
+        return m_problem;
+    }
+
+    /// Getter for the inner problem.
+    /**
+     * Returns a reference to the inner pagmo::problem.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The ability to extract a non const reference is provided only in order to allow to call
+     *    non-const methods on the internal :cpp:class:`pagmo::problem` instance. Assigning a new
+     *    :cpp:class:`pagmo::problem` via this reference is undefined behaviour. Note also that
+     *    the caches are not cleared when the inner problem is modified via this reference.
+     *
+     * \endverbatim
+     *
+     * @return a reference to the inner pagmo::problem.
+     */
+    problem &get_inner_problem()
+    {
+        return m_problem;
+    }
+
+    /// Object serialization
+    /**
+     * This method will save/load \p this into/from the archive \p ar. The content of the caches is
+     * serialized as well.
+     *
+     * @param ar target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of the inner problem and of primitive types.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_problem, m_f_cache, m_g_cache, m_cache_gradient, m_f_hits, m_f_misses, m_g_hits, m_g_misses);
+    }
+
+private:
+    /// Inner problem
+    problem m_problem;
+    // NOTE: the caches and the counters are mutable as they are updated
+    // from the const fitness() and gradient() methods.
+    /// Fitness cache
+    mutable detail::vf_lru_cache m_f_cache;
+    /// Gradient cache
+    mutable detail::vf_lru_cache m_g_cache;
+    /// Gradient memoization flag
+    bool m_cache_gradient;
+    /// Counters
+    mutable unsigned long long m_f_hits = 0u;
+    mutable unsigned long long m_f_misses = 0u;
+    mutable unsigned long long m_g_hits = 0u;
+    mutable unsigned long long m_g_misses = 0u;
+};
+} // namespace pagmo
+
+PAGMO_REGISTER_PROBLEM(pagmo::memoize)
+
+#endif
@@ -0,0 +1,219 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_R_POLICIES_FAIR_REPLACE_HPP
+#define PAGMO_R_POLICIES_FAIR_REPLACE_HPP
+
+#include <algorithm>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <vector>
+
+#include <pagmo/detail/migration_impl.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Fair replacement policy.
+/**
+ * This user-defined replacement policy (UDRP) will first select the best migrants, up to a maximum number
+ * determined by the migration rate. The migration rate can be either absolute (i.e., a fixed number of
+ * individuals) or fractional (i.e., a fraction of the size of the input group of individuals). The selected
+ * migrants then compete with the input individuals: the worst individuals of the input group are replaced
+ * by the selected migrants which are better than them. Individuals which are not replaced retain their
+ * position in the group, and the replaced positions are filled, in order, by the incoming migrants.
+ *
+ * The best individuals are determined as follows:
+ * - in unconstrained single-objective problems, the individuals with the lowest objective value are selected,
+ * - in constrained single-objective problems, the individuals are ranked according to
+ *   pagmo::sort_population_con(),
+ * - in unconstrained multi-objective problems, the individuals are selected via pagmo::select_best_N_mo().
+ *
+ * Constrained multi-objective problems are not supported.
+ */
+class fair_replace
+{
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialise a policy with an absolute migration rate of 1.
+     */
+    fair_replace() : fair_replace(1) {}
+    /// Constructor from an absolute migration rate.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if ``T`` is an integral type.
+     *
+     * \endverbatim
+     *
+     * @param rate the maximum number of migrants to be inserted.
+     *
+     * @throws std::invalid_argument if \p rate is negative.
+     */
+    template <typename T, enable_if_t<std::is_integral<T>::value, int> = 0>
+    explicit fair_replace(T rate) : m_rate(static_cast<double>(rate)), m_fractional(false)
+    {
+        detail::check_absolute_migration_rate(rate);
+    }
+    /// Constructor from a fractional migration rate.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if ``T`` is a floating-point type.
+     *
+     * \endverbatim
+     *
+     * @param rate the maximum number of migrants to be inserted, as a fraction of the size of the input group.
+     *
+     * @throws std::invalid_argument if \p rate is not in the \f$ [0.,1.] \f$ range.
+     */
+    template <typename T, enable_if_t<std::is_floating_point<T>::value, int> = 0>
+    explicit fair_replace(T rate) : m_rate(static_cast<double>(rate)), m_fractional(true)
+    {
+        detail::check_fractional_migration_rate(m_rate);
+    }
+    /// Replace individuals.
+    /**
+     * @param inds the input group of individuals.
+     * @param nobj the number of objectives of the problem.
+     * @param nec the number of equality constraints of the problem.
+     * @param nic the number of inequality constraints of the problem.
+     * @param tol the vector of constraint tolerances of the problem.
+     * @param mig the group of migrants.
+     *
+     * @return the group resulting from the replacement of the worst individuals in \p inds with
+     * the best migrants in \p mig.
+     *
+     * @throws std::invalid_argument if the problem is constrained and multi-objective.
+     * @throws unspecified any exception thrown by pagmo::sort_population_con(), pagmo::select_best_N_mo()
+     * or by memory allocation errors in standard containers.
+     */
+    individuals_group_t replace(const individuals_group_t &inds, vector_double::size_type,
+                                vector_double::size_type, vector_double::size_type nobj,
+                                vector_double::size_type nec, vector_double::size_type nic, const vector_double &tol,
+                                const individuals_group_t &mig) const
+    {
+        const auto n_inds = std::get<0>(inds).size();
+        const auto n = detail::migration_count(m_rate, m_fractional, n_inds);
+        if (!n || std::get<0>(mig).empty()) {
+            return inds;
+        }
+        // Select the best migrants.
+        const auto mig_idx = detail::select_best_n_individuals(std::get<2>(mig), n, nobj, nec, nic, tol);
+        // Let them compete with the input individuals: the best n_inds individuals
+        // of the merged group will be kept.
+        auto merged_f = std::get<2>(inds);
+        for (auto i : mig_idx) {
+            merged_f.push_back(std::get<2>(mig)[i]);
+        }
+        const auto keep = detail::select_best_n_individuals(merged_f, n_inds, nobj, nec, nic, tol);
+        // Mark the input individuals which survived, and collect the incoming migrants.
+        std::vector<char> kept(n_inds, 0);
+        std::vector<vector_double::size_type> incoming;
+        for (auto i : keep) {
+            if (i < n_inds) {
+                kept[i] = 1;
+            } else {
+                incoming.push_back(mig_idx[i - n_inds]);
+            }
+        }
+        std::sort(incoming.begin(), incoming.end());
+        // Fill the positions of the replaced individuals with the incoming migrants.
+        auto retval = inds;
+        decltype(incoming.size()) j = 0;
+        for (decltype(kept.size()) i = 0; i < kept.size() && j < incoming.size(); ++i) {
+            if (!kept[i]) {
+                std::get<0>(retval)[i] = std::get<0>(mig)[incoming[j]];
+                std::get<1>(retval)[i] = std::get<1>(mig)[incoming[j]];
+                std::get<2>(retval)[i] = std::get<2>(mig)[incoming[j]];
+                ++j;
+            }
+        }
+        return retval;
+    }
+    /// Get the migration rate.
+    /**
+     * @return the migration rate (either absolute or fractional, see is_fractional()).
+     */
+    double get_rate() const
+    {
+        return m_rate;
+    }
+    /// Check if the migration rate is fractional.
+    /**
+     * @return \p true if the migration rate is fractional, \p false if it is absolute.
+     */
+    bool is_fractional() const
+    {
+        return m_fractional;
+    }
+    /// Name.
+    /**
+     * @return <tt>"Fair replace"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Fair replace";
+    }
+    /// Extra info.
+    /**
+     * @return a human-readable string containing the migration rate.
+     */
+    std::string get_extra_info() const
+    {
+        return m_fractional ? "\tFractional migration rate: " + std::to_string(m_rate) + "\n"
+                            : "\tAbsolute migration rate: " + std::to_string(static_cast<unsigned long long>(m_rate))
+                                  + "\n";
+    }
+    /// Serialization support.
+    /**
+     * @param ar the target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of primitive types.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_rate, m_fractional);
+    }
+
+private:
+    double m_rate;
+    bool m_fractional;
+};
+} // namespace pagmo
+
+#endif
@@ -0,0 +1,561 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_R_POLICY_HPP
+#define PAGMO_R_POLICY_HPP
+
+#include <cassert>
+#include <iostream>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <typeinfo>
+#include <utility>
+
+#include <pagmo/detail/make_unique.hpp>
+#include <pagmo/detail/migration_impl.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/io.hpp>
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+
+/// Macro for the registration of the serialization functionality for user-defined replacement policies.
+/**
+ * This macro should always be invoked after the declaration of a user-defined replacement policy: it will register
+ * the policy with pagmo's serialization machinery. The macro should be called in the root namespace
+ * and using the fully qualified name of the policy to be registered. For example:
+ * @code{.unparsed}
+ * namespace my_namespace
+ * {
+ *
+ * class my_r_policy
+ * {
+ *    // ...
+ * };
+ *
+ * }
+ *
+ * PAGMO_REGISTER_R_POLICY(my_namespace::my_r_policy)
+ * @endcode
+ */
+#define PAGMO_REGISTER_R_POLICY(r) CEREAL_REGISTER_TYPE_WITH_NAME(pagmo::detail::r_pol_inner<r>, "udrp " #r)
+
+namespace pagmo
+{
+
+/// Detect the <tt>replace()</tt> method of a user-defined replacement policy.
+/**
+ * This type trait will be \p true if \p T provides a method with the following signature:
+ * @code{.unparsed}
+ * individuals_group_t replace(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+ *                             vector_double::size_type, vector_double::size_type, vector_double::size_type,
+ *                             const vector_double &, const individuals_group_t &) const;
+ * @endcode
+ * The <tt>replace()</tt> method is part of the interface for the definition of a replacement policy
+ * (see pagmo::r_policy).
+ */
+template <typename T>
+class has_replace
+{
+    template <typename U>
+    using replace_t = decltype(std::declval<const U &>().replace(
+        std::declval<const individuals_group_t &>(), std::declval<vector_double::size_type>(),
+        std::declval<vector_double::size_type>(), std::declval<vector_double::size_type>(),
+        std::declval<vector_double::size_type>(), std::declval<vector_double::size_type>(),
+        std::declval<const vector_double &>(), std::declval<const individuals_group_t &>()));
+    static const bool implementation_defined = std::is_same<individuals_group_t, detected_t<replace_t, T>>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool has_replace<T>::value;
+
+/// Detect user-defined replacement policies (UDRP).
+/**
+ * This type trait will be \p true if \p T is not cv/reference qualified, it is destructible, default, copy and move
+ * constructible, and if it satisfies the pagmo::has_replace type trait.
+ *
+ * Types satisfying this type trait can be used as user-defined replacement policies (UDRP) in pagmo::r_policy.
+ */
+template <typename T>
+class is_udrp
+{
+    static const bool implementation_defined
+        = std::is_same<T, uncvref_t<T>>::value && std::is_default_constructible<T>::value
+          && std::is_copy_constructible<T>::value && std::is_move_constructible<T>::value
+          && std::is_destructible<T>::value && has_replace<T>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool is_udrp<T>::value;
+
+namespace detail
+{
+
+struct r_pol_inner_base {
+    virtual ~r_pol_inner_base() {}
+    virtual std::unique_ptr<r_pol_inner_base> clone() const = 0;
+    virtual individuals_group_t replace(const individuals_group_t &, vector_double::size_type,
+                                        vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                        vector_double::size_type, const vector_double &,
+                                        const individuals_group_t &) const = 0;
+    virtual std::string get_name() const = 0;
+    virtual std::string get_extra_info() const = 0;
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+
+template <typename T>
+struct r_pol_inner final : r_pol_inner_base {
+    // We just need the def ctor, delete everything else.
+    r_pol_inner() = default;
+    r_pol_inner(const r_pol_inner &) = delete;
+    r_pol_inner(r_pol_inner &&) = delete;
+    r_pol_inner &operator=(const r_pol_inner &) = delete;
+    r_pol_inner &operator=(r_pol_inner &&) = delete;
+    // Constructors from T (copy and move variants).
+    explicit r_pol_inner(const T &x) : m_value(x) {}
+    explicit r_pol_inner(T &&x) : m_value(std::move(x)) {}
+    // The clone method, used in the copy constructor of r_policy.
+    virtual std::unique_ptr<r_pol_inner_base> clone() const override final
+    {
+        return make_unique<r_pol_inner>(m_value);
+    }
+    // Mandatory methods.
+    virtual individuals_group_t replace(const individuals_group_t &inds, vector_double::size_type nx,
+                                        vector_double::size_type nix, vector_double::size_type nobj,
+                                        vector_double::size_type nec, vector_double::size_type nic,
+                                        const vector_double &tol, const individuals_group_t &mig) const override final
+    {
+        return m_value.replace(inds, nx, nix, nobj, nec, nic, tol, mig);
+    }
+    // Optional methods.
+    virtual std::string get_name() const override final
+    {
+        return get_name_impl(m_value);
+    }
+    virtual std::string get_extra_info() const override final
+    {
+        return get_extra_info_impl(m_value);
+    }
+    // Implementation of the optional methods.
+    template <typename U, enable_if_t<has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &value)
+    {
+        return value.get_name();
+    }
+    template <typename U, enable_if_t<!has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &)
+    {
+        return typeid(U).name();
+    }
+    template <typename U, enable_if_t<has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &value)
+    {
+        return value.get_extra_info();
+    }
+    template <typename U, enable_if_t<!has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &)
+    {
+        return "";
+    }
+    // Serialization
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(cereal::base_class<r_pol_inner_base>(this), m_value);
+    }
+    T m_value;
+};
+
+} // end of namespace detail
+
+/// Replacement policy.
+/**
+ * A replacement policy is used in pagmo::archipelago to decide, before each evolution of an island, how the
+ * individuals migrating into the island from other islands (the immigrants) replace the individuals
+ * in the island's population.
+ *
+ * Following the same schema adopted for pagmo::problem, pagmo::algorithm, etc., pagmo::r_policy exposes a generic
+ * interface to *user-defined replacement policies* (or UDRP for short). Once defined and instantiated, a UDRP
+ * can then be used to construct an instance of this class, pagmo::r_policy, which provides a generic interface to
+ * replacement policies for use by pagmo::archipelago.
+ *
+ * Every UDRP must implement at least the following method:
+ * @code{.unparsed}
+ * individuals_group_t replace(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+ *                             vector_double::size_type, vector_double::size_type, vector_double::size_type,
+ *                             const vector_double &, const individuals_group_t &) const;
+ * @endcode
+ *
+ * The <tt>%replace()</tt> method takes as input a group of individuals (typically the individuals of an island's
+ * population), the properties of the problem the individuals refer to (in order, the problem dimension, the
+ * integer dimension, the number of objectives, the number of equality and inequality constraints, and the
+ * constraint tolerances) and a group of migrants, and it is expected to return a group of individuals of the same
+ * size as the input group, resulting from the replacement of some of the input individuals with some of the
+ * migrants. pagmo::archipelago will then overwrite the \f$i\f$-th individual of the island's population with the
+ * \f$i\f$-th individual of the returned group (if they differ).
+ *
+ * In addition to providing the above method, a UDRP must also be default, copy and move constructible.
+ * Note that the <tt>%replace()</tt> method may be invoked concurrently from multiple threads on the same
+ * UDRP instance (i.e., it must be safe to call it concurrently with itself).
+ *
+ * Additional optional methods can be implemented in a UDRP:
+ * @code{.unparsed}
+ * std::string get_name() const;
+ * std::string get_extra_info() const;
+ * @endcode
+ *
+ * See the documentation of the corresponding methods in this class for details on how the optional
+ * methods in the UDRP are used by pagmo::r_policy.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    A moved-from pagmo::r_policy is destructible and assignable. Any other operation will result
+ *    in undefined behaviour.
+ *
+ * \endverbatim
+ */
+class r_policy
+{
+    // Enable the generic ctor only if T is not an r_policy (after removing
+    // const/reference qualifiers), and if T is a udrp.
+    template <typename T>
+    using generic_ctor_enabler
+        = enable_if_t<!std::is_same<r_policy, uncvref_t<T>>::value && is_udrp<uncvref_t<T>>::value, int>;
+
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialize a pagmo::r_policy containing a pagmo::fair_replace
+     * with default parameters.
+     *
+     * @throws unspecified any exception thrown by the constructor from UDRP.
+     */
+    r_policy() : r_policy(fair_replace{}) {}
+    /// Constructor from a user-defined replacement policy of type \p T
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is not enabled if, after the removal of cv and reference qualifiers,
+     *    ``T`` is of type :cpp:class:`pagmo::r_policy` (that is, this constructor does not compete with the copy/move
+     *    constructors of :cpp:class:`pagmo::r_policy`), or if ``T`` does not satisfy :cpp:class:`pagmo::is_udrp`.
+     *
+     * \endverbatim
+     *
+     * This constructor will construct a pagmo::r_policy from the UDRP \p x of type \p T.
+     *
+     * @param x the UDRP.
+     *
+     * @throws unspecified any exception thrown by methods of the UDRP invoked during construction or by memory
+     * errors in strings and standard containers.
+     */
+    template <typename T, generic_ctor_enabler<T> = 0>
+    explicit r_policy(T &&x) : m_ptr(detail::make_unique<detail::r_pol_inner<uncvref_t<T>>>(std::forward<T>(x)))
+    {
+        // We store at construction the value returned from the user implemented get_name
+        m_name = ptr()->get_name();
+    }
+    /// Copy constructor
+    /**
+     * The copy constructor will deep copy the input r_policy \p other.
+     *
+     * @param other the r_policy to be copied.
+     *
+     * @throws unspecified any exception thrown by:
+     * - memory allocation errors in standard containers,
+     * - the copying of the internal UDRP.
+     */
+    r_policy(const r_policy &other) : m_ptr(other.ptr()->clone()), m_name(other.m_name) {}
+    /// Move constructor
+    /**
+     * @param other the r_policy from which \p this will be move-constructed.
+     */
+    r_policy(r_policy &&other) noexcept : m_ptr(std::move(other.m_ptr)), m_name(std::move(other.m_name)) {}
+    /// Move assignment operator
+    /**
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     */
+    r_policy &operator=(r_policy &&other) noexcept
+    {
+        if (this != &other) {
+            m_ptr = std::move(other.m_ptr);
+            m_name = std::move(other.m_name);
+        }
+        return *this;
+    }
+    /// Copy assignment operator
+    /**
+     * Copy assignment is implemented as a copy constructor followed by a move assignment.
+     *
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     *
+     * @throws unspecified any exception thrown by the copy constructor.
+     */
+    r_policy &operator=(const r_policy &other)
+    {
+        // Copy ctor + move assignment.
+        return *this = r_policy(other);
+    }
+
+    /// Extract a const pointer to the UDRP.
+    /**
+     * This method will extract a const pointer to the internal instance of the UDRP. If \p T is not the same type
+     * as the UDRP used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime of
+     *    ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * @return a const pointer to the internal UDRP, or \p nullptr
+     * if \p T does not correspond exactly to the original UDRP type used
+     * in the constructor.
+     */
+    template <typename T>
+    const T *extract() const
+    {
+        auto p = dynamic_cast<const detail::r_pol_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Extract a pointer to the UDRP.
+    /**
+     * This method will extract a pointer to the internal instance of the UDRP. If \p T is not the same type
+     * as the UDRP used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime
+     *    of ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The ability to extract a mutable pointer is provided only in order to allow to call non-const
+     *    methods on the internal UDRP instance. Assigning a new UDRP via this pointer is undefined behaviour.
+     *
+     * \endverbatim
+     *
+     * @return a pointer to the internal UDRP, or \p nullptr
+     * if \p T does not correspond exactly to the original UDRP type used
+     * in the constructor.
+     */
+    template <typename T>
+    T *extract()
+    {
+        auto p = dynamic_cast<detail::r_pol_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Checks the user-defined replacement policy type at run-time.
+    /**
+     * @return \p true if the user-defined replacement policy is \p T, \p false otherwise.
+     */
+    template <typename T>
+    bool is() const
+    {
+        return extract<T>() != nullptr;
+    }
+
+    /// Replace individuals.
+    /**
+     * This method will invoke the <tt>%replace()</tt> method of the UDRP in order to replace some of the
+     * individuals in \p inds with some of the individuals in \p mig. The input arguments and the return
+     * value of the UDRP are checked for consistency.
+     *
+     * @param inds the input group of individuals.
+     * @param nx the dimension of the problem.
+     * @param nix the integer dimension of the problem.
+     * @param nobj the number of objectives of the problem.
+     * @param nec the number of equality constraints of the problem.
+     * @param nic the number of inequality constraints of the problem.
+     * @param tol the vector of constraint tolerances of the problem.
+     * @param mig the group of migrants.
+     *
+     * @return the group of individuals resulting from the replacement.
+     *
+     * @throws std::invalid_argument if either:
+     * - the problem properties are invalid (e.g., \p nx or \p nobj are zero, \p nix is larger than \p nx, or the
+     *   size of \p tol is not <tt>nec + nic</tt>),
+     * - \p inds, \p mig or the return value of the UDRP are inconsistent (e.g., the number of IDs, decision vectors
+     *   and fitness vectors differ) or their dimensions do not match the problem properties,
+     * - the UDRP returned a number of individuals different from the number of individuals in \p inds.
+     * @throws std::overflow_error if the fitness dimension results in an overflow.
+     * @throws unspecified any exception thrown by the <tt>%replace()</tt> method of the UDRP.
+     */
+    individuals_group_t replace(const individuals_group_t &inds, vector_double::size_type nx,
+                                vector_double::size_type nix, vector_double::size_type nobj,
+                                vector_double::size_type nec, vector_double::size_type nic, const vector_double &tol,
+                                const individuals_group_t &mig) const
+    {
+        const auto nf = detail::migration_check_problem_properties(nx, nix, nobj, nec, nic, tol);
+        const auto n_inds = detail::check_individuals_group(inds, nx, nf, "input group of individuals");
+        detail::check_individuals_group(mig, nx, nf, "group of migrants");
+        auto retval = ptr()->replace(inds, nx, nix, nobj, nec, nic, tol, mig);
+        const auto n_rep = detail::check_individuals_group(
+            retval, nx, nf, "group of individuals returned by the replacement policy '" + get_name() + "'");
+        if (n_rep != n_inds) {
+            pagmo_throw(std::invalid_argument, "The replacement policy '" + get_name() + "' returned "
+                                                   + std::to_string(n_rep) + " individuals, but "
+                                                   + std::to_string(n_inds) + " individuals were expected");
+        }
+        return retval;
+    }
+
+    /// Replacement policy's name.
+    /**
+     * If the UDRP satisfies pagmo::has_name, then this method will return the output of its <tt>%get_name()</tt>
+     * method. Otherwise, an implementation-defined name based on the type of the UDRP will be returned.
+     *
+     * @return the replacement policy's name.
+     *
+     * @throws unspecified any exception thrown by copying an \p std::string object.
+     */
+    std::string get_name() const
+    {
+        return m_name;
+    }
+
+    /// Replacement policy's extra info.
+    /**
+     * If the UDRP satisfies pagmo::has_extra_info, then this method will return the output of its
+     * <tt>%get_extra_info()</tt> method. Otherwise, an empty string will be returned.
+     *
+     * @return extra info about the UDRP.
+     *
+     * @throws unspecified any exception thrown by the <tt>%get_extra_info()</tt> method of the UDRP.
+     */
+    std::string get_extra_info() const
+    {
+        return ptr()->get_extra_info();
+    }
+
+    /// Streaming operator
+    /**
+     * This function will stream to \p os a human-readable representation of the input
+     * r_policy \p r.
+     *
+     * @param os input <tt>std::ostream</tt>.
+     * @param r pagmo::r_policy object to be streamed.
+     *
+     * @return a reference to \p os.
+     *
+     * @throws unspecified any exception thrown by querying various policy properties and streaming them into \p os.
+     */
+    friend std::ostream &operator<<(std::ostream &os, const r_policy &r)
+    {
+        os << "Replacement policy name: " << r.get_name() << '\n';
+        const auto extra_str = r.get_extra_info();
+        if (!extra_str.empty()) {
+            stream(os, "\nExtra info:\n", extra_str);
+        }
+        return os;
+    }
+
+    /// Save to archive.
+    /**
+     * This method will save \p this into the archive \p ar.
+     *
+     * @param ar target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of the UDRP and of primitive types.
+     */
+    template <typename Archive>
+    void save(Archive &ar) const
+    {
+        ar(m_ptr, m_name);
+    }
+    /// Load from archive.
+    /**
+     * This method will load a pagmo::r_policy from \p ar into \p this.
+     *
+     * @param ar source archive.
+     *
+     * @throws unspecified any exception thrown by the deserialization of the UDRP and of primitive types.
+     */
+    template <typename Archive>
+    void load(Archive &ar)
+    {
+        r_policy tmp;
+        ar(tmp.m_ptr, tmp.m_name);
+        *this = std::move(tmp);
+    }
+
+private:
+    // Two small helpers to make sure that whenever we require
+    // access to the pointer it actually points to something.
+    detail::r_pol_inner_base const *ptr() const
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+    detail::r_pol_inner_base *ptr()
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+
+private:
+    std::unique_ptr<detail::r_pol_inner_base> m_ptr;
+    // The name of the UDRP, determined at construction time. It will be constant
+    // for the lifetime of r_policy, but we cannot mark it as such because of serialization.
+    std::string m_name;
+};
+} // namespace pagmo
+
+PAGMO_REGISTER_R_POLICY(pagmo::fair_replace)
+
+#endif
@@ -0,0 +1,184 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_S_POLICIES_SELECT_BEST_HPP
+#define PAGMO_S_POLICIES_SELECT_BEST_HPP
+
+#include <string>
+#include <tuple>
+#include <type_traits>
+
+#include <pagmo/detail/migration_impl.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Select best migration policy.
+/**
+ * This user-defined selection policy (UDSP) will select the *best* individuals of a group. The number of
+ * individuals to be selected is determined by the migration rate, which can be either absolute (i.e., a fixed
+ * number of individuals) or fractional (i.e., a fraction of the size of the group).
+ *
+ * The best individuals are determined as follows:
+ * - in unconstrained single-objective problems, the individuals with the lowest objective value are selected,
+ * - in constrained single-objective problems, the individuals are ranked according to
+ *   pagmo::sort_population_con(),
+ * - in unconstrained multi-objective problems, the individuals are selected via pagmo::select_best_N_mo().
+ *
+ * Constrained multi-objective problems are not supported.
+ */
+class select_best
+{
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialise a policy with an absolute migration rate of 1.
+     */
+    select_best() : select_best(1) {}
+    /// Constructor from an absolute migration rate.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if ``T`` is an integral type.
+     *
+     * \endverbatim
+     *
+     * @param rate the number of individuals to be selected.
+     *
+     * @throws std::invalid_argument if \p rate is negative.
+     */
+    template <typename T, enable_if_t<std::is_integral<T>::value, int> = 0>
+    explicit select_best(T rate) : m_rate(static_cast<double>(rate)), m_fractional(false)
+    {
+        detail::check_absolute_migration_rate(rate);
+    }
+    /// Constructor from a fractional migration rate.
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is enabled only if ``T`` is a floating-point type.
+     *
+     * \endverbatim
+     *
+     * @param rate the fraction of individuals to be selected.
+     *
+     * @throws std::invalid_argument if \p rate is not in the \f$ [0.,1.] \f$ range.
+     */
+    template <typename T, enable_if_t<std::is_floating_point<T>::value, int> = 0>
+    explicit select_best(T rate) : m_rate(static_cast<double>(rate)), m_fractional(true)
+    {
+        detail::check_fractional_migration_rate(m_rate);
+    }
+    /// Select individuals.
+    /**
+     * @param inds the input group of individuals.
+     * @param nobj the number of objectives of the problem.
+     * @param nec the number of equality constraints of the problem.
+     * @param nic the number of inequality constraints of the problem.
+     * @param tol the vector of constraint tolerances of the problem.
+     *
+     * @return the best individuals in \p inds, according to the migration rate.
+     *
+     * @throws std::invalid_argument if the problem is constrained and multi-objective.
+     * @throws unspecified any exception thrown by pagmo::sort_population_con(), pagmo::select_best_N_mo()
+     * or by memory allocation errors in standard containers.
+     */
+    individuals_group_t select(const individuals_group_t &inds, vector_double::size_type,
+                               vector_double::size_type, vector_double::size_type nobj,
+                               vector_double::size_type nec, vector_double::size_type nic,
+                               const vector_double &tol) const
+    {
+        const auto n = detail::migration_count(m_rate, m_fractional, std::get<0>(inds).size());
+        const auto idx = detail::select_best_n_individuals(std::get<2>(inds), n, nobj, nec, nic, tol);
+        individuals_group_t retval;
+        for (auto i : idx) {
+            std::get<0>(retval).push_back(std::get<0>(inds)[i]);
+            std::get<1>(retval).push_back(std::get<1>(inds)[i]);
+            std::get<2>(retval).push_back(std::get<2>(inds)[i]);
+        }
+        return retval;
+    }
+    /// Get the migration rate.
+    /**
+     * @return the migration rate (either absolute or fractional, see is_fractional()).
+     */
+    double get_rate() const
+    {
+        return m_rate;
+    }
+    /// Check if the migration rate is fractional.
+    /**
+     * @return \p true if the migration rate is fractional, \p false if it is absolute.
+     */
+    bool is_fractional() const
+    {
+        return m_fractional;
+    }
+    /// Name.
+    /**
+     * @return <tt>"Select best"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Select best";
+    }
+    /// Extra info.
+    /**
+     * @return a human-readable string containing the migration rate.
+     */
+    std::string get_extra_info() const
+    {
+        return m_fractional ? "\tFractional migration rate: " + std::to_string(m_rate) + "\n"
+                            : "\tAbsolute migration rate: " + std::to_string(static_cast<unsigned long long>(m_rate))
+                                  + "\n";
+    }
+    /// Serialization support.
+    /**
+     * @param ar the target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of primitive types.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_rate, m_fractional);
+    }
+
+private:
+    double m_rate;
+    bool m_fractional;
+};
+} // namespace pagmo
+
+#endif
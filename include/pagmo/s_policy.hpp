@@ -0,0 +1,553 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_S_POLICY_HPP
+#define PAGMO_S_POLICY_HPP
+
+#include <cassert>
+#include <iostream>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <typeinfo>
+#include <utility>
+
+#include <pagmo/detail/make_unique.hpp>
+#include <pagmo/detail/migration_impl.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/io.hpp>
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/type_traits.hpp>
+#include <pagmo/types.hpp>
+
+/// Macro for the registration of the serialization functionality for user-defined selection policies.
+/**
+ * This macro should always be invoked after the declaration of a user-defined selection policy: it will register
+ * the policy with pagmo's serialization machinery. The macro should be called in the root namespace
+ * and using the fully qualified name of the policy to be registered. For example:
+ * @code{.unparsed}
+ * namespace my_namespace
+ * {
+ *
+ * class my_s_policy
+ * {
+ *    // ...
+ * };
+ *
+ * }
+ *
+ * PAGMO_REGISTER_S_POLICY(my_namespace::my_s_policy)
+ * @endcode
+ */
+#define PAGMO_REGISTER_S_POLICY(s) CEREAL_REGISTER_TYPE_WITH_NAME(pagmo::detail::s_pol_inner<s>, "udsp " #s)
+
+namespace pagmo
+{
+
+/// Detect the <tt>select()</tt> method of a user-defined selection policy.
+/**
+ * This type trait will be \p true if \p T provides a method with the following signature:
+ * @code{.unparsed}
+ * individuals_group_t select(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+ *                            vector_double::size_type, vector_double::size_type, vector_double::size_type,
+ *                            const vector_double &) const;
+ * @endcode
+ * The <tt>select()</tt> method is part of the interface for the definition of a selection policy
+ * (see pagmo::s_policy).
+ */
+template <typename T>
+class has_select
+{
+    template <typename U>
+    using select_t = decltype(std::declval<const U &>().select(
+        std::declval<const individuals_group_t &>(), std::declval<vector_double::size_type>(),
+        std::declval<vector_double::size_type>(), std::declval<vector_double::size_type>(),
+        std::declval<vector_double::size_type>(), std::declval<vector_double::size_type>(),
+        std::declval<const vector_double &>()));
+    static const bool implementation_defined = std::is_same<individuals_group_t, detected_t<select_t, T>>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool has_select<T>::value;
+
+/// Detect user-defined selection policies (UDSP).
+/**
+ * This type trait will be \p true if \p T is not cv/reference qualified, it is destructible, default, copy and move
+ * constructible, and if it satisfies the pagmo::has_select type trait.
+ *
+ * Types satisfying this type trait can be used as user-defined selection policies (UDSP) in pagmo::s_policy.
+ */
+template <typename T>
+class is_udsp
+{
+    static const bool implementation_defined
+        = std::is_same<T, uncvref_t<T>>::value && std::is_default_constructible<T>::value
+          && std::is_copy_constructible<T>::value && std::is_move_constructible<T>::value
+          && std::is_destructible<T>::value && has_select<T>::value;
+
+public:
+    /// Value of the type trait.
+    static const bool value = implementation_defined;
+};
+
+template <typename T>
+const bool is_udsp<T>::value;
+
+namespace detail
+{
+
+struct s_pol_inner_base {
+    virtual ~s_pol_inner_base() {}
+    virtual std::unique_ptr<s_pol_inner_base> clone() const = 0;
+    virtual individuals_group_t select(const individuals_group_t &, vector_double::size_type,
+                                       vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                       vector_double::size_type, const vector_double &) const = 0;
+    virtual std::string get_name() const = 0;
+    virtual std::string get_extra_info() const = 0;
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+
+template <typename T>
+struct s_pol_inner final : s_pol_inner_base {
+    // We just need the def ctor, delete everything else.
+    s_pol_inner() = default;
+    s_pol_inner(const s_pol_inner &) = delete;
+    s_pol_inner(s_pol_inner &&) = delete;
+    s_pol_inner &operator=(const s_pol_inner &) = delete;
+    s_pol_inner &operator=(s_pol_inner &&) = delete;
+    // Constructors from T (copy and move variants).
+    explicit s_pol_inner(const T &x) : m_value(x) {}
+    explicit s_pol_inner(T &&x) : m_value(std::move(x)) {}
+    // The clone method, used in the copy constructor of s_policy.
+    virtual std::unique_ptr<s_pol_inner_base> clone() const override final
+    {
+        return make_unique<s_pol_inner>(m_value);
+    }
+    // Mandatory methods.
+    virtual individuals_group_t select(const individuals_group_t &inds, vector_double::size_type nx,
+                                       vector_double::size_type nix, vector_double::size_type nobj,
+                                       vector_double::size_type nec, vector_double::size_type nic,
+                                       const vector_double &tol) const override final
+    {
+        return m_value.select(inds, nx, nix, nobj, nec, nic, tol);
+    }
+    // Optional methods.
+    virtual std::string get_name() const override final
+    {
+        return get_name_impl(m_value);
+    }
+    virtual std::string get_extra_info() const override final
+    {
+        return get_extra_info_impl(m_value);
+    }
+    // Implementation of the optional methods.
+    template <typename U, enable_if_t<has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &value)
+    {
+        return value.get_name();
+    }
+    template <typename U, enable_if_t<!has_name<U>::value, int> = 0>
+    static std::string get_name_impl(const U &)
+    {
+        return typeid(U).name();
+    }
+    template <typename U, enable_if_t<has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &value)
+    {
+        return value.get_extra_info();
+    }
+    template <typename U, enable_if_t<!has_extra_info<U>::value, int> = 0>
+    static std::string get_extra_info_impl(const U &)
+    {
+        return "";
+    }
+    // Serialization
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(cereal::base_class<s_pol_inner_base>(this), m_value);
+    }
+    T m_value;
+};
+
+} // end of namespace detail
+
+/// Selection policy.
+/**
+ * A selection policy is used in pagmo::archipelago to select, after each evolution of an island, the individuals
+ * of the island's population that will be offered as emigrants to the other islands.
+ *
+ * Following the same schema adopted for pagmo::problem, pagmo::algorithm, etc., pagmo::s_policy exposes a generic
+ * interface to *user-defined selection policies* (or UDSP for short). Once defined and instantiated, a UDSP
+ * can then be used to construct an instance of this class, pagmo::s_policy, which provides a generic interface to
+ * selection policies for use by pagmo::archipelago.
+ *
+ * Every UDSP must implement at least the following method:
+ * @code{.unparsed}
+ * individuals_group_t select(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+ *                            vector_double::size_type, vector_double::size_type, vector_double::size_type,
+ *                            const vector_double &) const;
+ * @endcode
+ *
+ * The <tt>%select()</tt> method takes as input a group of individuals (typically the individuals of an island's
+ * population), the properties of the problem the individuals refer to (in order, the problem dimension, the
+ * integer dimension, the number of objectives, the number of equality and inequality constraints, and the
+ * constraint tolerances), and it is expected to return a subset of the input individuals (the emigrants).
+ *
+ * In addition to providing the above method, a UDSP must also be default, copy and move constructible.
+ * Note that the <tt>%select()</tt> method may be invoked concurrently from multiple threads on the same
+ * UDSP instance (i.e., it must be safe to call it concurrently with itself).
+ *
+ * Additional optional methods can be implemented in a UDSP:
+ * @code{.unparsed}
+ * std::string get_name() const;
+ * std::string get_extra_info() const;
+ * @endcode
+ *
+ * See the documentation of the corresponding methods in this class for details on how the optional
+ * methods in the UDSP are used by pagmo::s_policy.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    A moved-from pagmo::s_policy is destructible and assignable. Any other operation will result
+ *    in undefined behaviour.
+ *
+ * \endverbatim
+ */
+class s_policy
+{
+    // Enable the generic ctor only if T is not an s_policy (after removing
+    // const/reference qualifiers), and if T is a udsp.
+    template <typename T>
+    using generic_ctor_enabler
+        = enable_if_t<!std::is_same<s_policy, uncvref_t<T>>::value && is_udsp<uncvref_t<T>>::value, int>;
+
+public:
+    /// Default constructor.
+    /**
+     * The default constructor will initialize a pagmo::s_policy containing a pagmo::select_best
+     * with default parameters.
+     *
+     * @throws unspecified any exception thrown by the constructor from UDSP.
+     */
+    s_policy() : s_policy(select_best{}) {}
+    /// Constructor from a user-defined selection policy of type \p T
+    /**
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    This constructor is not enabled if, after the removal of cv and reference qualifiers,
+     *    ``T`` is of type :cpp:class:`pagmo::s_policy` (that is, this constructor does not compete with the copy/move
+     *    constructors of :cpp:class:`pagmo::s_policy`), or if ``T`` does not satisfy :cpp:class:`pagmo::is_udsp`.
+     *
+     * \endverbatim
+     *
+     * This constructor will construct a pagmo::s_policy from the UDSP \p x of type \p T.
+     *
+     * @param x the UDSP.
+     *
+     * @throws unspecified any exception thrown by methods of the UDSP invoked during construction or by memory
+     * errors in strings and standard containers.
+     */
+    template <typename T, generic_ctor_enabler<T> = 0>
+    explicit s_policy(T &&x) : m_ptr(detail::make_unique<detail::s_pol_inner<uncvref_t<T>>>(std::forward<T>(x)))
+    {
+        // We store at construction the value returned from the user implemented get_name
+        m_name = ptr()->get_name();
+    }
+    /// Copy constructor
+    /**
+     * The copy constructor will deep copy the input s_policy \p other.
+     *
+     * @param other the s_policy to be copied.
+     *
+     * @throws unspecified any exception thrown by:
+     * - memory allocation errors in standard containers,
+     * - the copying of the internal UDSP.
+     */
+    s_policy(const s_policy &other) : m_ptr(other.ptr()->clone()), m_name(other.m_name) {}
+    /// Move constructor
+    /**
+     * @param other the s_policy from which \p this will be move-constructed.
+     */
+    s_policy(s_policy &&other) noexcept : m_ptr(std::move(other.m_ptr)), m_name(std::move(other.m_name)) {}
+    /// Move assignment operator
+    /**
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     */
+    s_policy &operator=(s_policy &&other) noexcept
+    {
+        if (this != &other) {
+            m_ptr = std::move(other.m_ptr);
+            m_name = std::move(other.m_name);
+        }
+        return *this;
+    }
+    /// Copy assignment operator
+    /**
+     * Copy assignment is implemented as a copy constructor followed by a move assignment.
+     *
+     * @param other the assignment target.
+     *
+     * @return a reference to \p this.
+     *
+     * @throws unspecified any exception thrown by the copy constructor.
+     */
+    s_policy &operator=(const s_policy &other)
+    {
+        // Copy ctor + move assignment.
+        return *this = s_policy(other);
+    }
+
+    /// Extract a const pointer to the UDSP.
+    /**
+     * This method will extract a const pointer to the internal instance of the UDSP. If \p T is not the same type
+     * as the UDSP used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime of
+     *    ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * @return a const pointer to the internal UDSP, or \p nullptr
+     * if \p T does not correspond exactly to the original UDSP type used
+     * in the constructor.
+     */
+    template <typename T>
+    const T *extract() const
+    {
+        auto p = dynamic_cast<const detail::s_pol_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Extract a pointer to the UDSP.
+    /**
+     * This method will extract a pointer to the internal instance of the UDSP. If \p T is not the same type
+     * as the UDSP used during construction (after removal of cv and reference qualifiers), this method will
+     * return \p nullptr.
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The returned value is a raw non-owning pointer: the lifetime of the pointee is tied to the lifetime
+     *    of ``this`` and ``delete`` must never be called on the pointer.
+     *
+     * \endverbatim
+     *
+     * \verbatim embed:rst:leading-asterisk
+     * .. note::
+     *
+     *    The ability to extract a mutable pointer is provided only in order to allow to call non-const
+     *    methods on the internal UDSP instance. Assigning a new UDSP via this pointer is undefined behaviour.
+     *
+     * \endverbatim
+     *
+     * @return a pointer to the internal UDSP, or \p nullptr
+     * if \p T does not correspond exactly to the original UDSP type used
+     * in the constructor.
+     */
+    template <typename T>
+    T *extract()
+    {
+        auto p = dynamic_cast<detail::s_pol_inner<T> *>(ptr());
+        return p == nullptr ? nullptr : &(p->m_value);
+    }
+
+    /// Checks the user-defined selection policy type at run-time.
+    /**
+     * @return \p true if the user-defined selection policy is \p T, \p false otherwise.
+     */
+    template <typename T>
+    bool is() const
+    {
+        return extract<T>() != nullptr;
+    }
+
+    /// Select individuals.
+    /**
+     * This method will invoke the <tt>%select()</tt> method of the UDSP in order to select a subset of the
+     * individuals in \p inds. The input arguments and the return value of the UDSP are checked for consistency.
+     *
+     * @param inds the input group of individuals.
+     * @param nx the dimension of the problem.
+     * @param nix the integer dimension of the problem.
+     * @param nobj the number of objectives of the problem.
+     * @param nec the number of equality constraints of the problem.
+     * @param nic the number of inequality constraints of the problem.
+     * @param tol the vector of constraint tolerances of the problem.
+     *
+     * @return the group of selected individuals.
+     *
+     * @throws std::invalid_argument if either:
+     * - the problem properties are invalid (e.g., \p nx or \p nobj are zero, \p nix is larger than \p nx, or the
+     *   size of \p tol is not <tt>nec + nic</tt>),
+     * - \p inds or the return value of the UDSP are inconsistent (e.g., the number of IDs, decision vectors and
+     *   fitness vectors differ) or their dimensions do not match the problem properties,
+     * - the UDSP returned more individuals than those in \p inds.
+     * @throws std::overflow_error if the fitness dimension results in an overflow.
+     * @throws unspecified any exception thrown by the <tt>%select()</tt> method of the UDSP.
+     */
+    individuals_group_t select(const individuals_group_t &inds, vector_double::size_type nx,
+                               vector_double::size_type nix, vector_double::size_type nobj,
+                               vector_double::size_type nec, vector_double::size_type nic,
+                               const vector_double &tol) const
+    {
+        const auto nf = detail::migration_check_problem_properties(nx, nix, nobj, nec, nic, tol);
+        const auto n_inds = detail::check_individuals_group(inds, nx, nf, "input group of individuals");
+        auto retval = ptr()->select(inds, nx, nix, nobj, nec, nic, tol);
+        const auto n_sel = detail::check_individuals_group(
+            retval, nx, nf, "group of individuals returned by the selection policy '" + get_name() + "'");
+        if (n_sel > n_inds) {
+            pagmo_throw(std::invalid_argument, "The selection policy '" + get_name() + "' selected "
+                                                   + std::to_string(n_sel) + " individuals out of a group of only "
+                                                   + std::to_string(n_inds) + " individuals");
+        }
+        return retval;
+    }
+
+    /// Selection policy's name.
+    /**
+     * If the UDSP satisfies pagmo::has_name, then this method will return the output of its <tt>%get_name()</tt>
+     * method. Otherwise, an implementation-defined name based on the type of the UDSP will be returned.
+     *
+     * @return the selection policy's name.
+     *
+     * @throws unspecified any exception thrown by copying an \p std::string object.
+     */
+    std::string get_name() const
+    {
+        return m_name;
+    }
+
+    /// Selection policy's extra info.
+    /**
+     * If the UDSP satisfies pagmo::has_extra_info, then this method will return the output of its
+     * <tt>%get_extra_info()</tt> method. Otherwise, an empty string will be returned.
+     *
+     * @return extra info about the UDSP.
+     *
+     * @throws unspecified any exception thrown by the <tt>%get_extra_info()</tt> method of the UDSP.
+     */
+    std::string get_extra_info() const
+    {
+        return ptr()->get_extra_info();
+    }
+
+    /// Streaming operator
+    /**
+     * This function will stream to \p os a human-readable representation of the input
+     * s_policy \p s.
+     *
+     * @param os input <tt>std::ostream</tt>.
+     * @param s pagmo::s_policy object to be streamed.
+     *
+     * @return a reference to \p os.
+     *
+     * @throws unspecified any exception thrown by querying various policy properties and streaming them into \p os.
+     */
+    friend std::ostream &operator<<(std::ostream &os, const s_policy &s)
+    {
+        os << "Selection policy name: " << s.get_name() << '\n';
+        const auto extra_str = s.get_extra_info();
+        if (!extra_str.empty()) {
+            stream(os, "\nExtra info:\n", extra_str);
+        }
+        return os;
+    }
+
+    /// Save to archive.
+    /**
+     * This method will save \p this into the archive \p ar.
+     *
+     * @param ar target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of the UDSP and of primitive types.
+     */
+    template <typename Archive>
+    void save(Archive &ar) const
+    {
+        ar(m_ptr, m_name);
+    }
+    /// Load from archive.
+    /**
+     * This method will load a pagmo::s_policy from \p ar into \p this.
+     *
+     * @param ar source archive.
+     *
+     * @throws unspecified any exception thrown by the deserialization of the UDSP and of primitive types.
+     */
+    template <typename Archive>
+    void load(Archive &ar)
+    {
+        s_policy tmp;
+        ar(tmp.m_ptr, tmp.m_name);
+        *this = std::move(tmp);
+    }
+
+private:
+    // Two small helpers to make sure that whenever we require
+    // access to the pointer it actually points to something.
+    detail::s_pol_inner_base const *ptr() const
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+    detail::s_pol_inner_base *ptr()
+    {
+        assert(m_ptr.get() != nullptr);
+        return m_ptr.get();
+    }
+
+private:
+    std::unique_ptr<detail::s_pol_inner_base> m_ptr;
+    // The name of the UDSP, determined at construction time. It will be constant
+    // for the lifetime of s_policy, but we cannot mark it as such because of serialization.
+    std::string m_name;
+};
+} // namespace pagmo
+
+PAGMO_REGISTER_S_POLICY(pagmo::select_best)
+
+#endif
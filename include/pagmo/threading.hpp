@@ -40,8 +40,10 @@ namespace pagmo
  * the thread safety of problems, algorithms, etc.
  */
 enum class thread_safety {
-    none, ///< No thread safety: any concurrent operation on distinct instances is unsafe
-    basic ///< Basic thread safety: any concurrent operation on distinct instances is safe
+    none,    ///< No thread safety: any concurrent operation on distinct instances is unsafe
+    basic,   ///< Basic thread safety: any concurrent operation on distinct instances is safe
+    constant ///< Constant thread safety: basic thread safety, and concurrent const operations on the same instance
+             ///< are safe
 };
 
 #if !defined(PAGMO_DOXYGEN_INVOKED)
@@ -56,6 +58,9 @@ inline std::ostream &operator<<(std::ostream &os, thread_safety ts)
         case thread_safety::basic:
             os << "basic";
             break;
+        case thread_safety::constant:
+            os << "constant";
+            break;
     }
     return os;
 }
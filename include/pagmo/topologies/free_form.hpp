@@ -0,0 +1,171 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_TOPOLOGIES_FREE_FORM_HPP
+#define PAGMO_TOPOLOGIES_FREE_FORM_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <iterator>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <pagmo/detail/topology_impl.hpp>
+#include <pagmo/exceptions.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Free-form topology.
+/**
+ * This user-defined topology (UDT) represents a generic weighted directed graph, whose edges are set
+ * explicitly by the user via add_edge(). New vertices added via push_back() are not connected to any
+ * other vertex.
+ */
+class free_form
+{
+public:
+    /// Constructor.
+    /**
+     * The constructor will create a free-form topology with \p n unconnected vertices.
+     *
+     * @param n the number of vertices.
+     *
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    explicit free_form(std::size_t n = 0) : m_in(n) {}
+    /// Get the list of connections.
+    /**
+     * @param i the index of a vertex.
+     *
+     * @return a pair of vectors containing the indices of the vertices connected to \p i and the
+     * corresponding weights.
+     *
+     * @throws std::invalid_argument if \p i is not smaller than the number of vertices.
+     */
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t i) const
+    {
+        detail::topology_check_vertex_index(i, m_in.size());
+        return m_in[i];
+    }
+    /// Add a new vertex.
+    /**
+     * The new vertex will not be connected to any other vertex.
+     *
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    void push_back()
+    {
+        m_in.emplace_back();
+    }
+    /// Add an edge.
+    /**
+     * This method will add an edge from the vertex \p i to the vertex \p j (that is, individuals will be
+     * able to migrate from \p i to \p j). If the edge already exists, its weight will be set to \p w.
+     *
+     * @param i the source vertex.
+     * @param j the destination vertex.
+     * @param w the weight of the edge.
+     *
+     * @throws std::invalid_argument if either:
+     * - \p i or \p j are not smaller than the number of vertices,
+     * - \p i and \p j are equal,
+     * - \p w is not in the \f$ [0.,1.] \f$ range.
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    void add_edge(std::size_t i, std::size_t j, double w = 1.)
+    {
+        detail::topology_check_vertex_index(i, m_in.size());
+        detail::topology_check_vertex_index(j, m_in.size());
+        detail::topology_check_edge_weight(w);
+        if (i == j) {
+            pagmo_throw(std::invalid_argument, "Cannot add an edge from the vertex " + std::to_string(i)
+                                                   + " to itself in a free-form topology");
+        }
+        auto &in = m_in[j];
+        const auto it = std::find(in.first.begin(), in.first.end(), i);
+        if (it == in.first.end()) {
+            in.first.push_back(i);
+            in.second.push_back(w);
+        } else {
+            in.second[static_cast<decltype(in.second.size())>(std::distance(in.first.begin(), it))] = w;
+        }
+    }
+    /// Get the number of vertices.
+    /**
+     * @return the number of vertices in the topology.
+     */
+    std::size_t num_vertices() const
+    {
+        return m_in.size();
+    }
+    /// Name.
+    /**
+     * @return <tt>"Free form"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Free form";
+    }
+    /// Extra info.
+    /**
+     * @return a human-readable string containing the number of vertices and the number of edges.
+     */
+    std::string get_extra_info() const
+    {
+        std::size_t n_edges = 0;
+        for (const auto &in : m_in) {
+            n_edges += in.first.size();
+        }
+        return "\tNumber of vertices: " + std::to_string(m_in.size()) + "\n\tNumber of edges: "
+               + std::to_string(n_edges) + "\n";
+    }
+    /// Serialization support.
+    /**
+     * @param ar the target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of standard containers.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_in);
+    }
+
+private:
+    // The incoming connections of each vertex, and their weights.
+    std::vector<std::pair<std::vector<std::size_t>, vector_double>> m_in;
+};
+} // namespace pagmo
+
+#endif
@@ -0,0 +1,146 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_TOPOLOGIES_FULLY_CONNECTED_HPP
+#define PAGMO_TOPOLOGIES_FULLY_CONNECTED_HPP
+
+#include <cstddef>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <pagmo/detail/topology_impl.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Fully connected topology.
+/**
+ * This user-defined topology (UDT) represents a complete graph: each vertex is connected to all the
+ * other vertices. All the edges share the same weight, which is set upon construction.
+ */
+class fully_connected
+{
+public:
+    /// Constructor.
+    /**
+     * The constructor will create a fully connected topology with \p n vertices, in which all the edges have a
+     * weight of \p w.
+     *
+     * @param n the number of vertices.
+     * @param w the weight of the edges.
+     *
+     * @throws std::invalid_argument if \p w is not in the \f$ [0.,1.] \f$ range.
+     */
+    explicit fully_connected(std::size_t n = 0, double w = 1.) : m_n(n), m_weight(w)
+    {
+        detail::topology_check_edge_weight(w);
+    }
+    /// Get the list of connections.
+    /**
+     * @param i the index of a vertex.
+     *
+     * @return a pair of vectors containing the indices of all the vertices different from \p i,
+     * and the corresponding weights.
+     *
+     * @throws std::invalid_argument if \p i is not smaller than the number of vertices.
+     */
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t i) const
+    {
+        detail::topology_check_vertex_index(i, m_n);
+        std::pair<std::vector<std::size_t>, vector_double> retval;
+        retval.first.reserve(m_n - 1u);
+        for (std::size_t j = 0; j < m_n; ++j) {
+            if (j != i) {
+                retval.first.push_back(j);
+            }
+        }
+        retval.second.resize(retval.first.size(), m_weight);
+        return retval;
+    }
+    /// Add a new vertex.
+    /**
+     * The new vertex is connected to all the existing vertices.
+     */
+    void push_back()
+    {
+        ++m_n;
+    }
+    /// Get the number of vertices.
+    /**
+     * @return the number of vertices in the topology.
+     */
+    std::size_t num_vertices() const
+    {
+        return m_n;
+    }
+    /// Get the weight of the edges.
+    /**
+     * @return the weight of the edges in the topology.
+     */
+    double get_weight() const
+    {
+        return m_weight;
+    }
+    /// Name.
+    /**
+     * @return <tt>"Fully connected"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Fully connected";
+    }
+    /// Extra info.
+    /**
+     * @return a human-readable string containing the number of vertices and the weight of the edges.
+     */
+    std::string get_extra_info() const
+    {
+        return "\tNumber of vertices: " + std::to_string(m_n) + "\n\tWeight: " + std::to_string(m_weight) + "\n";
+    }
+    /// Serialization support.
+    /**
+     * @param ar the target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of primitive types.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_n, m_weight);
+    }
+
+private:
+    std::size_t m_n;
+    double m_weight;
+};
+} // namespace pagmo
+
+#endif
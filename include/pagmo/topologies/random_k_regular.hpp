@@ -0,0 +1,182 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_TOPOLOGIES_RANDOM_K_REGULAR_HPP
+#define PAGMO_TOPOLOGIES_RANDOM_K_REGULAR_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <numeric>
+#include <random>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <pagmo/detail/topology_impl.hpp>
+#include <pagmo/rng.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Random k-regular topology.
+/**
+ * This user-defined topology (UDT) represents a random directed graph in which each vertex receives
+ * connections from exactly \f$ \min\left(k, n - 1\right) \f$ other vertices, \f$ n \f$ being the number
+ * of vertices in the graph. All the edges share the same weight, which is set upon construction.
+ *
+ * The graph is grown incrementally: when a new vertex is added via push_back(), it receives connections
+ * from \f$ \min\left(k, n\right) \f$ randomly-chosen existing vertices, and it is connected to all the
+ * existing vertices which have fewer than \f$ k \f$ incoming connections. The graph is thus fully determined
+ * by the seed used upon construction and by the number of vertices.
+ */
+class random_k_regular
+{
+public:
+    /// Constructor.
+    /**
+     * The constructor will create a random k-regular topology with \p n vertices.
+     *
+     * @param k the number of incoming connections of each vertex.
+     * @param n the number of vertices.
+     * @param w the weight of the edges.
+     * @param seed the seed used to initialise the random number generator.
+     *
+     * @throws std::invalid_argument if \p w is not in the \f$ [0.,1.] \f$ range.
+     * @throws unspecified any exception thrown by push_back().
+     */
+    explicit random_k_regular(unsigned k = 1u, std::size_t n = 0, double w = 1.,
+                              unsigned seed = pagmo::random_device::next())
+        : m_k(k), m_weight(w), m_e(seed), m_seed(seed)
+    {
+        detail::topology_check_edge_weight(w);
+        for (std::size_t i = 0; i < n; ++i) {
+            push_back();
+        }
+    }
+    /// Get the list of connections.
+    /**
+     * @param i the index of a vertex.
+     *
+     * @return a pair of vectors containing the indices of the vertices connected to \p i and the
+     * corresponding weights.
+     *
+     * @throws std::invalid_argument if \p i is not smaller than the number of vertices.
+     */
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t i) const
+    {
+        detail::topology_check_vertex_index(i, m_in.size());
+        return std::make_pair(m_in[i], vector_double(m_in[i].size(), m_weight));
+    }
+    /// Add a new vertex.
+    /**
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    void push_back()
+    {
+        const auto n = m_in.size();
+        // Pick the sources of the new vertex among the existing vertices.
+        std::vector<std::size_t> sources(n);
+        std::iota(sources.begin(), sources.end(), std::size_t(0));
+        std::shuffle(sources.begin(), sources.end(), m_e);
+        sources.resize(std::min(static_cast<std::size_t>(m_k), n));
+        std::sort(sources.begin(), sources.end());
+        // Connect the new vertex to the existing vertices which have not reached k connections yet.
+        for (auto &in : m_in) {
+            if (in.size() < m_k) {
+                in.push_back(n);
+            }
+        }
+        m_in.push_back(std::move(sources));
+    }
+    /// Get the number of vertices.
+    /**
+     * @return the number of vertices in the topology.
+     */
+    std::size_t num_vertices() const
+    {
+        return m_in.size();
+    }
+    /// Get the weight of the edges.
+    /**
+     * @return the weight of the edges in the topology.
+     */
+    double get_weight() const
+    {
+        return m_weight;
+    }
+    /// Get the seed.
+    /**
+     * @return the seed used upon construction.
+     */
+    unsigned get_seed() const
+    {
+        return m_seed;
+    }
+    /// Name.
+    /**
+     * @return <tt>"Random k-regular"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Random k-regular";
+    }
+    /// Extra info.
+    /**
+     * @return a human-readable string containing the parameters of the topology.
+     */
+    std::string get_extra_info() const
+    {
+        return "\tk: " + std::to_string(m_k) + "\n\tNumber of vertices: " + std::to_string(m_in.size())
+               + "\n\tWeight: " + std::to_string(m_weight) + "\n\tSeed: " + std::to_string(m_seed) + "\n";
+    }
+    /// Serialization support.
+    /**
+     * @param ar the target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of primitive types or standard containers.
+     */
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_k, m_weight, m_e, m_seed, m_in);
+    }
+
+private:
+    unsigned m_k;
+    double m_weight;
+    detail::random_engine_type m_e;
+    unsigned m_seed;
+    // The incoming connections of each vertex.
+    std::vector<std::vector<std::size_t>> m_in;
+};
+} // namespace pagmo
+
+#endif
@@ -0,0 +1,88 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_TOPOLOGIES_UNCONNECTED_HPP
+#define PAGMO_TOPOLOGIES_UNCONNECTED_HPP
+
+#include <cstddef>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <pagmo/types.hpp>
+
+namespace pagmo
+{
+
+/// Unconnected topology.
+/**
+ * This user-defined topology (UDT) represents an unconnected graph: no migration will take place
+ * between the islands of a pagmo::archipelago adopting this topology. This is the default topology
+ * in pagmo.
+ */
+class unconnected
+{
+public:
+    /// Get the list of connections.
+    /**
+     * In an unconnected topology there are no connections for any vertex.
+     *
+     * @return a pair of empty vectors.
+     */
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t) const
+    {
+        return {};
+    }
+    /// Add a new vertex.
+    /**
+     * This method is a no-op.
+     */
+    void push_back()
+    {
+    }
+    /// Name.
+    /**
+     * @return <tt>"Unconnected"</tt>.
+     */
+    std::string get_name() const
+    {
+        return "Unconnected";
+    }
+    /// Serialization support.
+    /**
+     * This class is stateless, no data will be saved to or loaded from the archive.
+     */
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+} // namespace pagmo
+
+#endif
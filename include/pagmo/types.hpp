@@ -29,6 +29,7 @@ see https://www.gnu.org/licenses/. */
 #ifndef PAGMO_TYPES_HPP
 #define PAGMO_TYPES_HPP
 
+#include <tuple>
 #include <utility>
 #include <vector>
 
@@ -40,6 +41,13 @@ namespace pagmo
 typedef std::vector<double> vector_double;
 /// Alias for an <tt>std::vector</tt> of <tt>std::pair</tt>s of the size type of pagmo::vector_double.
 typedef std::vector<std::pair<vector_double::size_type, vector_double::size_type>> sparsity_pattern;
+/// Group of individuals.
+/**
+ * This is an <tt>std::tuple</tt> of three vectors containing, respectively, the IDs, the decision vectors
+ * and the fitness vectors of a group of individuals (e.g., the migrants exchanged between islands).
+ */
+typedef std::tuple<std::vector<unsigned long long>, std::vector<vector_double>, std::vector<vector_double>>
+    individuals_group_t;
 
 } // namespaces
 
@@ -35,12 +35,15 @@ see https://www.gnu.org/licenses/. */
  * This header contains utilities useful in general for PaGMO purposes
  */
 
+#include <algorithm>
 #include <cmath>
+#include <cstddef>
 #include <limits>
 #include <numeric>
 #include <stdexcept>
 #include <string>
 #include <utility>
+#include <vector>
 
 #include <pagmo/detail/custom_comparisons.hpp>
 #include <pagmo/exceptions.hpp>
@@ -229,11 +232,153 @@ inline double binomial_coefficient(vector_double::size_type n, vector_double::si
     }
 }
 
+namespace detail
+{
+
+// Ordering of the (squared distance, index) pairs in the k-NN searches: by distance first
+// (NaN distances being greater than any other distance) and by index second, so that ties are broken
+// deterministically.
+inline bool knn_less(const std::pair<double, vector_double::size_type> &a,
+                     const std::pair<double, vector_double::size_type> &b)
+{
+    if (less_than_f(a.first, b.first)) {
+        return true;
+    }
+    if (less_than_f(b.first, a.first)) {
+        return false;
+    }
+    return a.second < b.second;
+}
+
+// Squared euclidean distance between two points of equal dimension.
+inline double squared_distance(const vector_double &a, const vector_double &b)
+{
+    double retval = 0.;
+    for (decltype(a.size()) l = 0u; l < a.size(); ++l) {
+        retval += (a[l] - b[l]) * (a[l] - b[l]);
+    }
+    return retval;
+}
+
+// A k-d tree over a set of finite points of equal dimension, used to accelerate the k-NN searches.
+// The tree is implicit: the indices of the points are permuted so that, in each range [lo, hi) of the
+// tree, the point at the middle index splits the others along the dimension of largest spread, the points
+// before it being not greater and the ones after it not smaller along that dimension.
+class kd_tree
+{
+public:
+    using size_type = vector_double::size_type;
+    explicit kd_tree(const std::vector<vector_double> &points)
+        : m_points(points), m_idx(points.size()), m_split(points.size())
+    {
+        std::iota(m_idx.begin(), m_idx.end(), size_type(0u));
+        build(0u, m_idx.size());
+    }
+    // The indices of the k nearest neighbours of the point at index i (excluding i itself), sorted by distance.
+    std::vector<size_type> query(size_type i, size_type k) const
+    {
+        std::vector<std::pair<double, size_type>> heap;
+        if (k) {
+            heap.reserve(k);
+            search(0u, m_idx.size(), i, k, heap);
+        }
+        std::sort_heap(heap.begin(), heap.end(), knn_less);
+        std::vector<size_type> retval(heap.size());
+        std::transform(heap.begin(), heap.end(), retval.begin(),
+                       [](const std::pair<double, size_type> &p) { return p.second; });
+        return retval;
+    }
+
+private:
+    enum : size_type { leaf_size = 8u };
+    void build(size_type lo, size_type hi)
+    {
+        if (hi - lo <= leaf_size) {
+            return;
+        }
+        // Find the dimension of largest spread.
+        const auto M = m_points[m_idx[lo]].size();
+        size_type d = 0u;
+        double spread = -1.;
+        for (size_type l = 0u; l < M; ++l) {
+            const auto mm = std::minmax_element(
+                m_idx.begin() + static_cast<std::ptrdiff_t>(lo), m_idx.begin() + static_cast<std::ptrdiff_t>(hi),
+                [this, l](size_type a, size_type b) { return m_points[a][l] < m_points[b][l]; });
+            const auto cur = m_points[*mm.second][l] - m_points[*mm.first][l];
+            if (cur > spread) {
+                spread = cur;
+                d = l;
+            }
+        }
+        const auto mid = lo + (hi - lo) / 2u;
+        std::nth_element(m_idx.begin() + static_cast<std::ptrdiff_t>(lo),
+                         m_idx.begin() + static_cast<std::ptrdiff_t>(mid),
+                         m_idx.begin() + static_cast<std::ptrdiff_t>(hi),
+                         [this, d](size_type a, size_type b) { return m_points[a][d] < m_points[b][d]; });
+        m_split[mid] = d;
+        build(lo, mid);
+        build(mid + 1u, hi);
+    }
+    // Offer the point at index j as a neighbour of the point at index i. The candidates
+    // are kept in a max-heap of size at most k.
+    void consider(size_type j, size_type i, size_type k, std::vector<std::pair<double, size_type>> &heap) const
+    {
+        if (j == i) {
+            return;
+        }
+        const std::pair<double, size_type> c(squared_distance(m_points[i], m_points[j]), j);
+        if (heap.size() < k) {
+            heap.push_back(c);
+            std::push_heap(heap.begin(), heap.end(), knn_less);
+        } else if (knn_less(c, heap.front())) {
+            std::pop_heap(heap.begin(), heap.end(), knn_less);
+            heap.back() = c;
+            std::push_heap(heap.begin(), heap.end(), knn_less);
+        }
+    }
+    void search(size_type lo, size_type hi, size_type i, size_type k,
+                std::vector<std::pair<double, size_type>> &heap) const
+    {
+        if (hi - lo <= leaf_size) {
+            for (auto j = lo; j < hi; ++j) {
+                consider(m_idx[j], i, k, heap);
+            }
+            return;
+        }
+        const auto mid = lo + (hi - lo) / 2u;
+        const auto pivot = m_idx[mid];
+        const auto d = m_split[mid];
+        consider(pivot, i, k, heap);
+        const double diff = m_points[i][d] - m_points[pivot][d];
+        // Visit first the side of the point, then the other side, unless all its points
+        // are farther than the current k-th neighbour.
+        if (diff < 0.) {
+            search(lo, mid, i, k, heap);
+            if (heap.size() < k || diff * diff <= heap.front().first) {
+                search(mid + 1u, hi, i, k, heap);
+            }
+        } else {
+            search(mid + 1u, hi, i, k, heap);
+            if (heap.size() < k || diff * diff <= heap.front().first) {
+                search(lo, mid, i, k, heap);
+            }
+        }
+    }
+    const std::vector<vector_double> &m_points;
+    std::vector<size_type> m_idx;
+    std::vector<size_type> m_split;
+};
+} // namespace detail
+
 /// K-Nearest Neighbours
 /**
  * Computes the indexes of the k nearest neighbours (euclidean distance) to each of the input points.
- * The algorithm complexity (naive implementation) is \f$ O(MN^2)\f$ where \f$N\f$ is the number of
- * points and \f$M\f$ their dimensionality
+ * Neighbours at the same distance are sorted by index.
+ *
+ * The neighbours are searched with a k-d tree built over the points, so that the algorithm complexity is
+ * \f$ O(MN\log N)\f$ for the construction of the tree, plus roughly \f$ O(N(M + k)\log N)\f$ for the searches
+ * in low dimensions, where \f$N\f$ is the number of points and \f$M\f$ their dimensionality. For small sets of
+ * points, or if some of the coordinates are not finite, a naive \f$ O(MN^2)\f$ search is performed instead.
  *
  * Example:
  * @code{.unparsed}
@@ -249,7 +394,6 @@ inline double binomial_coefficient(vector_double::size_type n, vector_double::si
 inline std::vector<std::vector<vector_double::size_type>> kNN(const std::vector<vector_double> &points,
                                                               std::vector<vector_double>::size_type k)
 {
-    std::vector<std::vector<vector_double::size_type>> neigh_idxs;
     auto N = points.size();
     if (N == 0u) {
         return {};
@@ -258,32 +402,33 @@ inline std::vector<std::vector<vector_double::size_type>> kNN(const std::vector<
     if (!std::all_of(points.begin(), points.end(), [M](const vector_double &p) { return p.size() == M; })) {
         pagmo_throw(std::invalid_argument, "All points must have the same dimensionality for k-NN to be invoked");
     }
+    // The number of neighbours of each point.
+    const auto n_neigh = std::min(k, N - 1u);
+    std::vector<std::vector<vector_double::size_type>> neigh_idxs(N);
+    if (N > 32u && std::all_of(points.begin(), points.end(), [](const vector_double &p) {
+            return std::all_of(p.begin(), p.end(), [](double x) { return std::isfinite(x); });
+        })) {
+        const detail::kd_tree tree(points);
+        for (decltype(N) i = 0u; i < N; ++i) {
+            neigh_idxs[i] = tree.query(i, n_neigh);
+        }
+        return neigh_idxs;
+    }
     // loop through the points
+    std::vector<std::pair<double, vector_double::size_type>> distances;
     for (decltype(N) i = 0u; i < N; ++i) {
-        // We compute all the distances to all other points including the self
-        vector_double distances;
+        // We compute all the (squared) distances to all other points
+        distances.clear();
         for (decltype(N) j = 0u; j < N; ++j) {
-            double dist = 0.;
-            for (decltype(M) l = 0u; l < M; ++l) {
-                dist += (points[i][l] - points[j][l]) * (points[i][l] - points[j][l]);
+            if (j != i) {
+                distances.emplace_back(detail::squared_distance(points[i], points[j]), j);
             }
-            distances.push_back(std::sqrt(dist));
         }
-        // We sort the indexes with respect to the distance
-        std::vector<vector_double::size_type> idxs(N);
-        std::iota(idxs.begin(), idxs.end(), vector_double::size_type(0u));
-        std::sort(idxs.begin(), idxs.end(), [&distances](vector_double::size_type idx1, vector_double::size_type idx2) {
-            return detail::less_than_f(distances[idx1], distances[idx2]);
-        });
-        // We remove the first element containg the self-distance (0)
-        idxs.erase(std::remove(idxs.begin(), idxs.end(), i), idxs.end());
-        neigh_idxs.push_back(idxs);
-    }
-    // We trim to k the lists if needed
-    if (k < N - 1u) {
-        for (decltype(neigh_idxs.size()) i = 0u; i < neigh_idxs.size(); ++i) {
-            neigh_idxs[i].erase(neigh_idxs[i].begin() + static_cast<int>(k),
-                                neigh_idxs[i].end()); // TODO: remove the static_cast
+        // We sort the first k indexes with respect to the distance
+        std::partial_sort(distances.begin(), distances.begin() + static_cast<std::ptrdiff_t>(n_neigh),
+                          distances.end(), detail::knn_less);
+        for (decltype(N) j = 0u; j < n_neigh; ++j) {
+            neigh_idxs[i].push_back(distances[j].second);
         }
     }
     return neigh_idxs;
@@ -29,12 +29,16 @@ see https://www.gnu.org/licenses/. */
 #ifndef PAGMO_UTIL_bf_approx_H
 #define PAGMO_UTIL_bf_approx_H
 
+#include <algorithm>
 #include <cmath>
 #include <iostream>
+#include <random>
 #include <stdexcept>
 #include <string>
+#include <utility>
 #include <vector>
 
+#include <pagmo/detail/hv_mc_sampler.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
@@ -51,6 +55,7 @@ namespace pagmo
  * of the least contributor to the hypervolume.
  * Default values for the parameters of the algorithm were obtained from the shark implementation of the
  * algorithm (http://image.diku.dk/shark/doxygen_pages/html/_least_contributor_approximator_8hpp_source.html)
+ * The samples are drawn in blocks, which can be spread over multiple threads (see bf_approx::set_n_threads()).
  *
  * @see "Approximating the least hypervolume contributor: NP-hard in general, but fast in practice", Karl Bringmann,
  * Tobias Friedrich.
@@ -134,6 +139,28 @@ public:
                                           gc_erase_condition, gc_end_condition);
     }
 
+    /// Set the number of threads
+    /**
+     * The samples of each round are distributed among the threads in blocks, each using its own stream of
+     * pseudo-random numbers derived from the seed: the results do not depend on the number of threads.
+     *
+     * @param n_threads the number of threads used for the sampling. If zero, the value returned by
+     * <tt>std::thread::hardware_concurrency()</tt> will be used.
+     */
+    void set_n_threads(unsigned int n_threads)
+    {
+        m_n_threads = n_threads;
+    }
+
+    /// Get the number of threads
+    /**
+     * @return the number of threads used for the sampling (1 by default).
+     */
+    unsigned int get_n_threads() const
+    {
+        return m_n_threads;
+    }
+
     /// Verify before compute method
     /**
     * Verifies whether given algorithm suits the requested data.
@@ -298,11 +325,22 @@ private:
         double tmp = m_box_volume[idx] / delta;
         double required_no_samples = 0.5 * ((1. + m_gamma) * std::log(round) + log_factor) * tmp * tmp;
 
-        while (static_cast<double>(m_no_samples[idx]) < required_no_samples) {
-            ++m_no_samples[idx];
-            if (sample_successful(points, idx)) {
-                ++m_no_succ_samples[idx];
+        if (static_cast<double>(m_no_samples[idx]) < required_no_samples) {
+            // Draw the missing samples in blocks, possibly in parallel.
+            using size_type = vector_double::size_type;
+            const auto n_samples = static_cast<size_type>(
+                std::ceil(required_no_samples - static_cast<double>(m_no_samples[idx])));
+            const auto bs = detail::hv_mc_sampler::block_size();
+            const auto blocks = detail::hv_mc_sampler::run_blocks<std::pair<size_type, size_type>>(
+                static_cast<unsigned>(m_e()), 0u, (n_samples + bs - 1u) / bs, m_n_threads,
+                [&](size_type b, detail::random_engine_type &e) {
+                    return sample_block(points, idx, std::min(bs, n_samples - b * bs), e);
+                });
+            for (const auto &p : blocks) {
+                m_no_succ_samples[idx] += p.first;
+                m_no_ops[idx] += p.second;
             }
+            m_no_samples[idx] += n_samples;
         }
 
         m_approx_volume[idx]
@@ -310,40 +348,29 @@ private:
         m_point_delta[idx] = compute_point_delta(round, idx, log_factor) * m_box_volume[idx];
     }
 
-    /// samples the bounding box and returns true if it fell into the exclusive hypervolume
-    bool sample_successful(const std::vector<vector_double> &points, vector_double::size_type idx) const
+    /// samples the bounding box n times and returns the number of samples that fell into the exclusive hypervolume,
+    /// together with the number of elementary operations performed
+    std::pair<vector_double::size_type, vector_double::size_type>
+    sample_block(const std::vector<vector_double> &points, vector_double::size_type idx, vector_double::size_type n,
+                 detail::random_engine_type &e) const
     {
         const vector_double &lb = points[idx];
         const vector_double &ub = m_boxes[idx];
         vector_double rnd_p(lb.size(), 0.0);
 
-        for (decltype(lb.size()) i = 0u; i < lb.size(); ++i) {
-            auto V_dist = std::uniform_real_distribution<double>(lb[i], ub[i]);
-            rnd_p[i] = V_dist(m_e);
-        }
-
-        for (decltype(m_box_points[idx].size()) i = 0u; i < m_box_points[idx].size(); ++i) {
-
-            // box_p is a point overlapping the bounding box volume
-            const vector_double &box_p = points[m_box_points[idx][i]];
-
-            // assume that box_p DOMINATES the random point and try to prove it otherwise below
-            bool dominates = true;
-
-            // increase the number of operations by the dimension size
-            m_no_ops[idx] += box_p.size() + 1;
-            for (decltype(box_p.size()) d_idx = 0u; d_idx < box_p.size(); ++d_idx) {
-                if (rnd_p[d_idx] < box_p[d_idx]) { // box_p does not dominate rnd_p
-                    dominates = false;
-                    break;
-                }
+        vector_double::size_type n_succ = 0u, n_checked = 0u;
+        for (decltype(n) k = 0u; k < n; ++k) {
+            for (decltype(lb.size()) i = 0u; i < lb.size(); ++i) {
+                auto V_dist = std::uniform_real_distribution<double>(lb[i], ub[i]);
+                rnd_p[i] = V_dist(e);
             }
-            // if the box_p dominated the rnd_p return the sample as false
-            if (dominates) {
-                return false;
+            // the sample is successful if none of the points overlapping the bounding box dominates it
+            if (!m_box_samplers[idx].is_dominated(rnd_p.data(), n_checked)) {
+                ++n_succ;
             }
         }
-        return true;
+        // each dominance check costs the dimension size plus one operations
+        return std::make_pair(n_succ, n_checked * (lb.size() + 1u));
     }
 
     enum extreme_contrib_type { LEAST = 1, GREATEST = 2 };
@@ -388,6 +415,7 @@ private:
         m_point_delta = vector_double(points.size(), 0.0);
         m_boxes = std::vector<vector_double>(points.size());
         m_box_points = std::vector<std::vector<vector_double::size_type>>(points.size());
+        m_box_samplers = std::vector<detail::hv_mc_sampler>(points.size());
 
         // precomputed log factor for the point delta computation
         const double log_factor
@@ -441,6 +469,7 @@ private:
                     }
                 }
             }
+            m_box_samplers[idx] = detail::hv_mc_sampler(points, m_box_points[idx]);
         }
 
         // decrease the initial maximum volume by a constant factor
@@ -554,6 +583,9 @@ private:
 
     mutable detail::random_engine_type m_e;
 
+    // number of threads used for the sampling
+    unsigned int m_n_threads = 1u;
+
     /**
      * 'least_contributor' method variables section
      *
@@ -588,6 +620,9 @@ private:
     // during monte carlo sampling it suffices to check only these points when deciding whether the sampling was
     // "successful"
     mutable std::vector<std::vector<vector_double::size_type>> m_box_points;
+
+    // points overlapping the bounding box of each point, stored for the batched dominance checks
+    mutable std::vector<detail::hv_mc_sampler> m_box_samplers;
     /**
      * End of 'least_contributor' method variables section
      */
@@ -29,12 +29,17 @@ see https://www.gnu.org/licenses/. */
 #ifndef PAGMO_UTIL_bf_fpras_H
 #define PAGMO_UTIL_bf_fpras_H
 
+#include <algorithm>
 #include <cmath>
 #include <iostream>
+#include <iterator>
+#include <random>
 #include <stdexcept>
 #include <string>
 #include <vector>
 
+#include <pagmo/detail/hv_mc_sampler.hpp>
+#include <pagmo/detail/parallel_for.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
@@ -49,6 +54,7 @@ namespace pagmo
 /**
  * This class contains the implementation of the Bringmann-Friedrich approximation scheme (FPRAS),
  * reduced to a special case of approximating the hypervolume indicator.
+ * The samples are drawn in blocks, which can be spread over multiple threads (see bf_fpras::set_n_threads()).
  * @see "Approximating the volume of unions and intersections of high-dimensional geometric objects", Karl Bringmann,
  * Tobias Friedrich.
  *
@@ -112,53 +118,103 @@ public:
         // Partial sums of consecutive boxes
         vector_double sums(n, 0.0);
 
-        // points iterator
-        std::vector<vector_double>::iterator it_p;
-
-        // volume iterator - used for finding the contributor using std::lower_bound
-        vector_double::iterator it_sums;
-
-        unsigned int i = 0u;
-
         // Total sum of every box
         double V = 0.0;
-        for (it_p = points.begin(); it_p != points.end(); ++it_p) {
-            V = (sums[i++] = V + hv_algorithm::volume_between(*it_p, r_point));
+        for (decltype(n) i = 0u; i < n; ++i) {
+            V = (sums[i] = V + hv_algorithm::volume_between(points[i], r_point));
         }
 
-        double M = 0.;     // Round counter
-        double M_sum = 0.; // Total number of samples over every round so far
-
-        vector_double rnd_point(dim, 0.0); // Container for the random point
-        auto unireal_dist = std::uniform_real_distribution<double>(0.0, 1.0);
-
-        while (true) {
-            // Get the random volume in-between [0, V] range, in order to choose the box with probability sums[i] / V
-
+        // In each round, a random point is sampled in the union of the boxes, and points are then drawn uniformly
+        // from the set until one dominating the random point is found. The number of draws of a round follows a
+        // geometric distribution whose parameter is the fraction of the points dominating the random point: after
+        // a few unsuccessful draws (as many as the cost of a scan of the whole set), rather than carrying on with
+        // the draws one by one, we count the dominating points and sample the remaining number of draws directly.
+        const detail::hv_mc_sampler sampler(points);
+        const auto max_draws = std::max(decltype(n)(1u), n * dim / 16u);
+        auto sample_block = [&](vector_double::size_type, detail::random_engine_type &e) {
+            std::vector<unsigned long long> retval(detail::hv_mc_sampler::block_size());
+            vector_double rnd_point(dim, 0.0); // Container for the random point
+            auto unireal_dist = std::uniform_real_distribution<double>(0.0, 1.0);
             auto V_dist = std::uniform_real_distribution<double>(0.0, V);
-            auto r = V_dist(m_e);
-
-            // Find the contributor using binary search
-            it_sums = std::lower_bound(sums.begin(), sums.end(), r);
-            i = static_cast<unsigned int>(std::distance(sums.begin(), it_sums));
+            auto idx_dist = std::uniform_int_distribution<decltype(n)>(0u, n - 1u);
+            for (auto &n_draws : retval) {
+                // Get the random volume in-between [0, V] range, in order to choose the box with probability
+                // sums[i] / V. Find the contributor using binary search.
+                const auto i = static_cast<decltype(n)>(
+                    std::distance(sums.begin(), std::lower_bound(sums.begin(), sums.end(), V_dist(e))));
+
+                // Sample a point inside the 'box' (r_point, points[i])
+                for (decltype(dim) d_idx = 0u; d_idx < dim; ++d_idx) {
+                    rnd_point[d_idx] = (points[i][d_idx] + unireal_dist(e) * (r_point[d_idx] - points[i][d_idx]));
+                }
 
-            // Sample a point inside the 'box' (r_point, points[i])
-            for (decltype(dim) d_idx = 0u; d_idx < dim; ++d_idx) {
-                rnd_point[d_idx] = (points[i][d_idx] + unireal_dist(m_e) * (r_point[d_idx] - points[i][d_idx]));
+                for (n_draws = 1u; n_draws <= max_draws; ++n_draws) {
+                    const auto &p = points[idx_dist(e)];
+                    decltype(dim) d_idx = 0u;
+                    while (d_idx < dim && p[d_idx] <= rnd_point[d_idx]) {
+                        ++d_idx;
+                    }
+                    if (d_idx == dim) {
+                        break;
+                    }
+                }
+                if (n_draws > max_draws) {
+                    // NOTE: the number of dominating points is at least one, as points[i] dominates the random point.
+                    const auto n_dom = sampler.n_dominating(rnd_point.data());
+                    if (n_dom < n) {
+                        n_draws += std::geometric_distribution<unsigned long long>(static_cast<double>(n_dom)
+                                                                                   / static_cast<double>(n))(e);
+                    }
+                }
             }
+            return retval;
+        };
 
-            unsigned int j = 0u;
-            do {
-                if (M_sum >= T) {
-                    return (T * V) / (static_cast<double>(n) * M);
+        double M = 0.;     // Round counter
+        double M_sum = 0.; // Total number of draws over every round so far
+
+        // The blocks of rounds are computed in parallel and consumed in order, until the
+        // total number of draws reaches T.
+        const auto seed = static_cast<unsigned>(m_e());
+        const vector_double::size_type n_par
+            = m_n_threads ? m_n_threads : detail::parallel_for_thread_pool().get_size();
+        for (vector_double::size_type first_block = 0u;; first_block += n_par) {
+            const auto blocks = detail::hv_mc_sampler::run_blocks<std::vector<unsigned long long>>(
+                seed, first_block, first_block + n_par, m_n_threads, sample_block);
+            for (const auto &block : blocks) {
+                for (auto n_draws : block) {
+                    if (M_sum + static_cast<double>(n_draws) > T) {
+                        return (T * V) / (static_cast<double>(n) * M);
+                    }
+                    M_sum += static_cast<double>(n_draws);
+                    ++M;
                 }
-                j = static_cast<unsigned int>(static_cast<double>(n) * unireal_dist(m_e));
-                ++M_sum;
-            } while (!(hv_algorithm::dom_cmp(rnd_point, points[j], 0) == hv_algorithm::DOM_CMP_B_DOMINATES_A));
-            ++M;
+            }
         }
     }
 
+    /// Set the number of threads
+    /**
+     * The sampling is distributed among the threads in blocks, each using its own stream of pseudo-random numbers
+     * derived from the seed: the result of bf_fpras::compute() does not depend on the number of threads.
+     *
+     * @param n_threads the number of threads used by bf_fpras::compute(). If zero, the value returned by
+     * <tt>std::thread::hardware_concurrency()</tt> will be used.
+     */
+    void set_n_threads(unsigned int n_threads)
+    {
+        m_n_threads = n_threads;
+    }
+
+    /// Get the number of threads
+    /**
+     * @return the number of threads used by bf_fpras::compute() (1 by default).
+     */
+    unsigned int get_n_threads() const
+    {
+        return m_n_threads;
+    }
+
     /// Exclusive method
     /**
     * This algorithm does not support this method.
@@ -226,6 +282,8 @@ private:
     const double m_delta;
 
     mutable detail::random_engine_type m_e;
+    // number of threads
+    unsigned int m_n_threads = 1u;
 };
 }
 
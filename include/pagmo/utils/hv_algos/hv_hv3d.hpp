@@ -40,6 +40,7 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/population.hpp>
 #include <pagmo/types.hpp>
 #include <pagmo/utils/hv_algos/hv_algorithm.hpp>
+#include <pagmo/utils/hv_algos/hv_hv4d.hpp>
 #include <pagmo/utils/hv_algos/hv_hvwfg.hpp>
 #include <pagmo/utils/hypervolume.hpp>
 
@@ -407,6 +408,8 @@ inline std::shared_ptr<hv_algorithm> hypervolume::get_best_compute(const vector_
         return hv2d().clone();
     } else if (fdim == 3u) {
         return hv3d().clone();
+    } else if (fdim == 4u) {
+        return hv4d().clone();
     } else {
         return hvwfg().clone();
     }
@@ -0,0 +1,228 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_UTIL_HV4D_H
+#define PAGMO_UTIL_HV4D_H
+
+#include <algorithm>
+#include <array>
+#include <iterator>
+#include <map>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <pagmo/exceptions.hpp>
+#include <pagmo/types.hpp>
+#include <pagmo/utils/hv_algos/hv_algorithm.hpp>
+
+namespace pagmo
+{
+
+/// hv4d hypervolume algorithm class
+/**
+ * This class contains the implementation of a dimension-sweep algorithm for the exact computation of the hypervolume
+ * in 4 dimensions.
+ *
+ * The points are swept in ascending order along the fourth dimension: the hypervolume is the sum, over the sweep, of
+ * the 3-dimensional hypervolume of the points swept so far, times the length of the slab up to the next point. The
+ * 3-dimensional hypervolume is updated incrementally, by adding the exclusive contribution of each new point
+ * (computed by sweeping along the third dimension with a 2-dimensional staircase limited to the region dominated
+ * by the new point) and discarding the points it dominates. Computational complexity: \f$ O(n^2\log n)\f$.
+ *
+ * @see "A Fast Dimension-Sweep Algorithm for the Hypervolume Indicator in Four Dimensions", Andreia P. Guerreiro,
+ * Carlos M. Fonseca, Michael T. M. Emmerich. CCCG 2012.
+ */
+class hv4d : public hv_algorithm
+{
+    using point3d = std::array<double, 3>;
+
+public:
+    /// Compute hypervolume
+    /**
+     * @param points vector of points containing the 4-dimensional points for which we compute the hypervolume
+     * @param r_point reference point for the points
+     *
+     * @return hypervolume.
+     */
+    double compute(std::vector<vector_double> &points, const vector_double &r_point) const
+    {
+        if (points.empty()) {
+            return 0.;
+        }
+        // Sort the points in ascending order along the fourth dimension.
+        std::vector<const vector_double *> sorted;
+        sorted.reserve(points.size());
+        for (const auto &p : points) {
+            sorted.push_back(&p);
+        }
+        std::sort(sorted.begin(), sorted.end(),
+                  [](const vector_double *a, const vector_double *b) { return (*a)[3] < (*b)[3]; });
+
+        // The non-dominated 3-dimensional projections of the points swept so far,
+        // in ascending order along the third dimension, and their hypervolume.
+        std::vector<point3d> front;
+        front.reserve(points.size());
+        double hv3 = 0.;
+        double V = 0.;
+        for (decltype(sorted.size()) i = 0u; i < sorted.size(); ++i) {
+            const auto &q = *sorted[i];
+            const point3d p{{q[0], q[1], q[2]}};
+            // NOTE: a point weakly dominated by the front does not change its hypervolume.
+            if (std::none_of(front.begin(), front.end(), [&p](const point3d &s) {
+                    return s[0] <= p[0] && s[1] <= p[1] && s[2] <= p[2];
+                })) {
+                hv3 += exclusive3d(p, front, r_point);
+                // Remove the points dominated by p, and insert p keeping the front sorted.
+                front.erase(std::remove_if(front.begin(), front.end(),
+                                           [&p](const point3d &s) {
+                                               return p[0] <= s[0] && p[1] <= s[1] && p[2] <= s[2];
+                                           }),
+                            front.end());
+                front.insert(std::upper_bound(front.begin(), front.end(), p,
+                                              [](const point3d &a, const point3d &b) { return a[2] < b[2]; }),
+                             p);
+            }
+            const double next = (i + 1u == sorted.size()) ? r_point[3] : (*sorted[i + 1u])[3];
+            V += hv3 * (next - q[3]);
+        }
+        return V;
+    }
+
+    /// Verify before compute
+    /**
+     * Verifies whether given algorithm suits the requested data.
+     *
+     * @param points vector of points containing the 4-dimensional points for which we compute the hypervolume
+     * @param r_point reference point for the vector of points
+     *
+     * @throws value_error when trying to compute the hypervolume for the dimension other than 4 or non-maximal
+     * reference point
+     */
+    void verify_before_compute(const std::vector<vector_double> &points, const vector_double &r_point) const
+    {
+        if (r_point.size() != 4u) {
+            pagmo_throw(std::invalid_argument, "Algorithm hv4d works only for 4-dimensional cases");
+        }
+
+        hv_algorithm::assert_minimisation(points, r_point);
+    }
+
+    /// Clone method.
+    /**
+     * @return a pointer to a new object cloning this
+     */
+    std::shared_ptr<hv_algorithm> clone() const
+    {
+        return std::shared_ptr<hv_algorithm>(new hv4d(*this));
+    }
+
+    /// Algorithm name
+    /**
+     * @return The name of this particular algorithm
+     */
+    std::string get_name() const
+    {
+        return "hv4d algorithm";
+    }
+
+private:
+    // A 2-dimensional staircase of mutually non-dominated points, sorted in ascending order along the
+    // first dimension, together with the area they dominate up to the reference point (rx, ry).
+    class staircase
+    {
+    public:
+        staircase(double rx, double ry) : m_rx(rx), m_ry(ry) {}
+        double area() const
+        {
+            return m_area;
+        }
+        void insert(double x, double y)
+        {
+            auto first = m_points.upper_bound(x);
+            if (first != m_points.begin() && std::prev(first)->second <= y) {
+                // Weakly dominated.
+                return;
+            }
+            // The points dominated by (x, y) are contiguous.
+            first = m_points.lower_bound(x);
+            auto last = first;
+            while (last != m_points.end() && last->second >= y) {
+                ++last;
+            }
+            const auto pred = first == m_points.begin() ? m_points.end() : std::prev(first);
+            double delta = pred == m_points.end() ? 0. : -term(pred);
+            for (auto it = first; it != last; ++it) {
+                delta -= term(it);
+            }
+            m_points.erase(first, last);
+            const auto it = m_points.emplace(x, y).first;
+            delta += term(it) + (pred == m_points.end() ? 0. : term(pred));
+            m_area += delta;
+        }
+
+    private:
+        double term(std::map<double, double>::const_iterator it) const
+        {
+            const auto x = it->first, y = it->second;
+            return ((++it == m_points.end() ? m_rx : it->first) - x) * (m_ry - y);
+        }
+        std::map<double, double> m_points;
+        double m_rx, m_ry;
+        double m_area = 0.;
+    };
+
+    // Exclusive contribution of p with respect to the 3-dimensional front (sorted along the third dimension, not
+    // weakly dominating p): the volume of the box between p and the reference point which is not dominated by
+    // the front. It is computed by sweeping the front along the third dimension, starting from p, and maintaining
+    // the staircase of the points limited to the box.
+    static double exclusive3d(const point3d &p, const std::vector<point3d> &front, const vector_double &r_point)
+    {
+        const double box2d = (r_point[0] - p[0]) * (r_point[1] - p[1]);
+        staircase stair(r_point[0], r_point[1]);
+        double retval = 0., z = p[2];
+        for (const auto &s : front) {
+            if (s[2] > z) {
+                retval += (box2d - stair.area()) * (s[2] - z);
+                z = s[2];
+            }
+            const double x = std::max(s[0], p[0]), y = std::max(s[1], p[1]);
+            if (x == p[0] && y == p[1]) {
+                // s dominates the projection of p: the rest of the box is covered.
+                return retval;
+            }
+            stair.insert(x, y);
+        }
+        return retval + (box2d - stair.area()) * (r_point[2] - z);
+    }
+};
+} // namespace pagmo
+
+#endif
@@ -29,12 +29,14 @@ see https://www.gnu.org/licenses/. */
 #ifndef PAGMO_UTIL_hvwfg_H
 #define PAGMO_UTIL_hvwfg_H
 
+#include <algorithm>
 #include <cmath>
 #include <iostream>
 #include <stdexcept>
 #include <string>
 #include <vector>
 
+#include <pagmo/detail/parallel_for.hpp>
 #include <pagmo/exceptions.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/population.hpp>
@@ -53,6 +55,9 @@ namespace pagmo
  * Computation, IEEE Transactions on 16.1 (2012): 86-95."
  * @see "Lyndon While and Lucas Bradstreet. Applying the WFG Algorithm To Calculate Incremental Hypervolumes. 2012 IEEE
  * Congress on Evolutionary Computation. CEC 2012, pages 489-496. IEEE, June 2012."
+ *
+ * The exclusive contributions of the points (and thus the least and greatest contributors) can be computed
+ * in parallel by multiple threads, see hvwfg::contributions().
  */
 class hvwfg : public hv_algorithm
 {
@@ -60,8 +65,11 @@ public:
     /// Constructor
     /**
      * @param stop_dimension The stop dimension
+     * @param n_threads The number of threads used in the computation of the exclusive contributions. If zero,
+     * the value returned by <tt>std::thread::hardware_concurrency()</tt> will be used.
      */
-    hvwfg(unsigned int stop_dimension = 2u) : hv_algorithm(), m_current_slice(0), m_stop_dimension(stop_dimension)
+    hvwfg(unsigned int stop_dimension = 2u, unsigned int n_threads = 1u)
+        : hv_algorithm(), m_current_slice(0), m_stop_dimension(stop_dimension), m_n_threads(n_threads)
     {
         if (stop_dimension < 2u) {
             pagmo_throw(std::invalid_argument, "Stop dimension for WFG must be greater than or equal to 2");
@@ -97,6 +105,10 @@ public:
     * This simplifies the sub problems for each exclusive computation right away, which makes the whole algorithm much
     * faster, and in many cases only slower than regular WFG algorithm by a constant factor.
     *
+    * The exclusive contributions are independent of each other: if the number of threads set on construction
+    * is greater than one, they are distributed among the threads, each operating on its own copy of the
+    * algorithm's state. The results do not depend on the number of threads.
+    *
     * @see "Lyndon While and Lucas Bradstreet. Applying the WFG Algorithm To Calculate Incremental Hypervolumes. 2012
     * IEEE Congress on Evolutionary Computation. CEC 2012, pages 489-496. IEEE, June 2012."
     *
@@ -104,35 +116,67 @@ public:
     * @param r_point reference point for the points
     *
     * @return the single contributions
+    *
+    * @throws unspecified any exception thrown by threading primitives.
     */
     std::vector<double> contributions(std::vector<vector_double> &points, const vector_double &r_point) const
     {
-        std::vector<double> c;
-        c.reserve(points.size());
-
-        // Allocate the same members as for 'compute' method
-        allocate_wfg_members(points, r_point);
-
-        // Prepare the memory for first front
-        double **fr = new double *[m_max_points];
-        for (unsigned int i = 0; i < m_max_points; ++i) {
-            fr[i] = new double[m_current_slice];
+        std::vector<double> c(points.size());
+
+        // Number of workers to use: we never use more workers than the number of points.
+        const auto n_workers = static_cast<unsigned int>(
+            std::min(static_cast<decltype(points.size())>(
+                         m_n_threads ? m_n_threads : detail::parallel_for_thread_pool().get_size()),
+                     points.size()));
+        if (n_workers <= 1u) {
+            begin_contributions(points, r_point);
+            for (decltype(points.size()) p_idx = 0u; p_idx < points.size(); ++p_idx) {
+                c[p_idx] = contribution(static_cast<unsigned int>(p_idx));
+            }
+            free_wfg_members();
+            return c;
         }
-        m_frames[m_n_frames] = fr;
-        m_frames_size[m_n_frames] = 0;
-        ++m_n_frames;
 
-        for (unsigned int p_idx = 0u; p_idx < m_max_points; ++p_idx) {
-            limitset(0, p_idx, 1);
-            c.push_back(exclusive_hv(p_idx, 1));
+        // The WFG members are mutable state, hence each worker needs its own copy of the algorithm.
+        // The state of a worker is set up when it computes its first contribution.
+        std::vector<hvwfg> algos(n_workers, hvwfg(m_stop_dimension, 1u));
+        std::vector<char> ready(n_workers, 0);
+        auto free_algos = [&algos, &ready]() {
+            for (decltype(algos.size()) i = 0u; i < algos.size(); ++i) {
+                if (ready[i]) {
+                    algos[i].free_wfg_members();
+                }
+            }
+        };
+        // The points are handed out to the workers one at a time, so that the work is spread evenly
+        // even if the costs of the contributions differ.
+        auto contrib = [&points, &r_point, &c, &algos, &ready](unsigned w, vector_double::size_type p_idx) {
+            if (!ready[w]) {
+                algos[w].begin_contributions(points, r_point);
+                ready[w] = 1;
+            }
+            c[p_idx] = algos[w].contribution(static_cast<unsigned int>(p_idx));
+        };
+        try {
+            detail::parallel_for(points.size(), n_workers, contrib);
+        } catch (...) {
+            free_algos();
+            throw;
         }
-
-        // Free the contributions and the remaining WFG members
-        free_wfg_members();
+        free_algos();
 
         return c;
     }
 
+    /// Get the number of threads
+    /**
+     * @return the number of threads used in the computation of the exclusive contributions, as set on construction.
+     */
+    unsigned int get_n_threads() const
+    {
+        return m_n_threads;
+    }
+
     /// Verify before compute method
     /**
     * Verifies whether given algorithm suits the requested data.
@@ -166,6 +210,32 @@ public:
     }
 
 private:
+    /// Set up the members for the computation of the exclusive contributions (see contribution()).
+    void begin_contributions(std::vector<vector_double> &points, const vector_double &r_point) const
+    {
+        // Allocate the same members as for 'compute' method
+        allocate_wfg_members(points, r_point);
+
+        // Prepare the memory for first front
+        double **fr = new double *[m_max_points];
+        for (unsigned int i = 0; i < m_max_points; ++i) {
+            fr[i] = new double[m_current_slice];
+        }
+        m_frames[m_n_frames] = fr;
+        m_frames_size[m_n_frames] = 0;
+        ++m_n_frames;
+    }
+
+    /// Compute the exclusive contribution of the point at index p_idx. The members must have been set up
+    /// by begin_contributions(), and they must be freed afterwards via free_wfg_members().
+    double contribution(unsigned int p_idx) const
+    {
+        // NOTE: the first frame (i.e., the original set of points) is never altered below, thus
+        // each contribution does not depend on the ones computed before.
+        limitset(0, p_idx, 1);
+        return exclusive_hv(p_idx, 1);
+    }
+
     /// Limit the set of points to point at p_idx
     void limitset(unsigned int begin_idx, unsigned int p_idx, unsigned int rec_level) const
     {
@@ -412,6 +482,9 @@ private:
 
     // Dimension at which WFG stops the slicing
     const unsigned int m_stop_dimension;
+
+    // Number of threads used in the computation of the contributions
+    const unsigned int m_n_threads;
 };
 }
 #endif
@@ -0,0 +1,444 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#ifndef PAGMO_UTIL_HV_ARCHIVE_H
+#define PAGMO_UTIL_HV_ARCHIVE_H
+
+#include <algorithm>
+#include <cmath>
+#include <iterator>
+#include <map>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <pagmo/exceptions.hpp>
+#include <pagmo/types.hpp>
+#include <pagmo/utils/hv_algos/hv_algorithm.hpp>
+#include <pagmo/utils/hv_algos/hv_hv3d.hpp>
+
+namespace pagmo
+{
+
+/// Incremental hypervolume archive
+/**
+ * This class maintains a set of mutually non-dominated points in two or three dimensions, together with the
+ * hypervolume they dominate with respect to a fixed reference point and the exclusive contribution of each point.
+ * Rather than recomputing everything from scratch as pagmo::hypervolume does, the hypervolume and the
+ * contributions are updated incrementally as points are inserted into and removed from the archive. This makes the
+ * class suitable, e.g., for steady-state selection schemes (where the least contributor is repeatedly removed) or
+ * for tracking the hypervolume of a front across the generations of an evolution.
+ *
+ * A point is accepted into the archive only if it is not weakly dominated by any point already in the archive, and
+ * its insertion evicts all the archived points it dominates.
+ *
+ * In two dimensions the archive is kept sorted along the first objective, and an insertion or a removal affects
+ * only the neighbours of the point: the hypervolume and the contributions are updated in \f$ O(\log N)\f$
+ * (plus \f$ O(\log N)\f$ for each evicted point), and the least contributor is available in constant time.
+ *
+ * In three dimensions the hypervolume is updated by computing the exclusive contribution of the inserted (or
+ * removed) point only, with the sweep of pagmo::hv3d, in \f$ O(N\log N)\f$. The contributions of all the points are
+ * computed on demand via pagmo::hv3d::contributions(), and cached until the archive is next modified.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    As the hypervolume is updated incrementally, it may accumulate floating-point rounding errors
+ *    over long sequences of insertions and removals.
+ *
+ * \endverbatim
+ */
+class hv_archive
+{
+    // Data associated to each point of the 2D front: second objective and exclusive contribution.
+    struct point2d {
+        double y;
+        double contrib;
+    };
+    using front2d_t = std::map<double, point2d>;
+
+public:
+    /// Constructor from reference point.
+    /**
+     * Constructs an empty archive.
+     *
+     * @param r_point the reference point.
+     *
+     * @throws std::invalid_argument if the dimension of \p r_point is not 2 or 3, or if \p r_point contains NaNs.
+     */
+    explicit hv_archive(const vector_double &r_point) : m_r_point(r_point)
+    {
+        if (m_r_point.size() != 2u && m_r_point.size() != 3u) {
+            pagmo_throw(std::invalid_argument, "The hypervolume archive supports only 2 or 3 dimensions, but a "
+                                                   "reference point of dimension "
+                                                   + std::to_string(m_r_point.size()) + " was provided");
+        }
+        if (std::any_of(m_r_point.begin(), m_r_point.end(), [](double x) { return std::isnan(x); })) {
+            pagmo_throw(std::invalid_argument, "The reference point of a hypervolume archive cannot contain NaNs");
+        }
+    }
+
+    /// Insert a point.
+    /**
+     * The point \p p is inserted into the archive if it is not weakly dominated by any point already in the archive.
+     * All the points of the archive dominated by \p p are removed from the archive.
+     *
+     * @param p the point to be inserted.
+     *
+     * @return \p true if \p p was inserted, \p false if \p p was rejected because weakly dominated by an archived
+     * point.
+     *
+     * @throws std::invalid_argument if the dimension of \p p differs from the dimension of the reference point,
+     * or if \p p contains NaNs or is not dominated by the reference point.
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    bool insert(const vector_double &p)
+    {
+        check_point(p);
+        return m_r_point.size() == 2u ? insert2d(p) : insert3d(p);
+    }
+
+    /// Remove a point.
+    /**
+     * @param p the point to be removed.
+     *
+     * @return \p true if \p p was found in the archive and removed, \p false otherwise.
+     *
+     * @throws std::invalid_argument if the dimension of \p p differs from the dimension of the reference point,
+     * or if \p p contains NaNs or is not dominated by the reference point.
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    bool erase(const vector_double &p)
+    {
+        check_point(p);
+        return m_r_point.size() == 2u ? erase2d(p) : erase3d(p);
+    }
+
+    /// Get the hypervolume.
+    /**
+     * @return the hypervolume dominated by the points of the archive with respect to the reference point.
+     */
+    double get_hv() const
+    {
+        return m_hv;
+    }
+
+    /// Get the reference point.
+    /**
+     * @return the reference point.
+     */
+    const vector_double &get_r_point() const
+    {
+        return m_r_point;
+    }
+
+    /// Get the number of points.
+    /**
+     * @return the number of points in the archive.
+     */
+    vector_double::size_type size() const
+    {
+        return m_r_point.size() == 2u ? static_cast<vector_double::size_type>(m_front2d.size()) : m_points3d.size();
+    }
+
+    /// Get the points.
+    /**
+     * In two dimensions, the points are sorted in ascending order with respect to the first objective. In three
+     * dimensions, they are returned in insertion order.
+     *
+     * @return the points of the archive.
+     *
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    std::vector<vector_double> get_points() const
+    {
+        if (m_r_point.size() == 3u) {
+            return m_points3d;
+        }
+        std::vector<vector_double> retval;
+        retval.reserve(m_front2d.size());
+        for (const auto &p : m_front2d) {
+            retval.push_back(vector_double{p.first, p.second.y});
+        }
+        return retval;
+    }
+
+    /// Get the exclusive contributions.
+    /**
+     * @return the exclusive contributions to the hypervolume of the points of the archive, in the same order
+     * as get_points().
+     *
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    std::vector<double> contributions() const
+    {
+        if (m_r_point.size() == 3u) {
+            return contributions3d();
+        }
+        std::vector<double> retval;
+        retval.reserve(m_front2d.size());
+        for (const auto &p : m_front2d) {
+            retval.push_back(p.second.contrib);
+        }
+        return retval;
+    }
+
+    /// Get the exclusive contribution of a point.
+    /**
+     * @param p a point of the archive.
+     *
+     * @return the exclusive contribution of \p p to the hypervolume.
+     *
+     * @throws std::invalid_argument if \p p is not in the archive.
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    double exclusive(const vector_double &p) const
+    {
+        check_point(p);
+        if (m_r_point.size() == 2u) {
+            const auto it = m_front2d.find(p[0]);
+            if (it != m_front2d.end() && it->second.y == p[1]) {
+                return it->second.contrib;
+            }
+        } else {
+            const auto it = std::find(m_points3d.begin(), m_points3d.end(), p);
+            if (it != m_points3d.end()) {
+                return contributions3d()[static_cast<vector_double::size_type>(it - m_points3d.begin())];
+            }
+        }
+        pagmo_throw(std::invalid_argument, "Cannot compute the exclusive contribution of a point which is not in "
+                                           "the hypervolume archive");
+    }
+
+    /// Get the least contributor.
+    /**
+     * If several points share the least contribution, the first one in the order of get_points() is returned.
+     *
+     * @return the point of the archive contributing the least to the hypervolume.
+     *
+     * @throws std::invalid_argument if the archive is empty.
+     * @throws unspecified any exception thrown by memory allocation errors in standard containers.
+     */
+    vector_double least_contributor() const
+    {
+        if (!size()) {
+            pagmo_throw(std::invalid_argument, "Cannot find the least contributor of an empty hypervolume archive");
+        }
+        if (m_r_point.size() == 2u) {
+            const auto x = m_contribs2d.begin()->second;
+            return vector_double{x, m_front2d.find(x)->second.y};
+        }
+        const auto &c = contributions3d();
+        return m_points3d[static_cast<vector_double::size_type>(std::min_element(c.begin(), c.end()) - c.begin())];
+    }
+
+private:
+    void check_point(const vector_double &p) const
+    {
+        if (p.size() != m_r_point.size()) {
+            pagmo_throw(std::invalid_argument, "The dimension of the point (" + std::to_string(p.size())
+                                                   + ") differs from the dimension of the reference point of the "
+                                                     "hypervolume archive ("
+                                                   + std::to_string(m_r_point.size()) + ")");
+        }
+        for (decltype(p.size()) i = 0u; i < p.size(); ++i) {
+            if (std::isnan(p[i])) {
+                pagmo_throw(std::invalid_argument, "A point in a hypervolume archive cannot contain NaNs");
+            }
+            if (p[i] > m_r_point[i]) {
+                pagmo_throw(std::invalid_argument, "A point in a hypervolume archive must be dominated by the "
+                                                   "reference point");
+            }
+        }
+    }
+
+    // 2D implementation. The front is sorted in ascending order with respect to the first objective
+    // (and thus in descending order with respect to the second), and the hypervolume is the sum
+    // of the terms (x_next - x) * (r_y - y), where x_next is the first objective of the next point
+    // (or the first coordinate of the reference point for the last point).
+    double next_x(front2d_t::const_iterator it) const
+    {
+        return ++it == m_front2d.end() ? m_r_point[0] : it->first;
+    }
+    double prev_y(front2d_t::const_iterator it) const
+    {
+        return it == m_front2d.begin() ? m_r_point[1] : std::prev(it)->second.y;
+    }
+    double term2d(front2d_t::const_iterator it) const
+    {
+        return (next_x(it) - it->first) * (m_r_point[1] - it->second.y);
+    }
+    // Recompute the exclusive contribution of the point at it, which depends only on its neighbours.
+    void update_contrib2d(front2d_t::iterator it)
+    {
+        m_contribs2d.erase(std::make_pair(it->second.contrib, it->first));
+        it->second.contrib = (next_x(it) - it->first) * (prev_y(it) - it->second.y);
+        m_contribs2d.emplace(it->second.contrib, it->first);
+    }
+    bool insert2d(const vector_double &p)
+    {
+        const auto x = p[0], y = p[1];
+        // The last point whose first objective is not greater than x is the only candidate
+        // for weakly dominating p.
+        auto first = m_front2d.upper_bound(x);
+        if (first != m_front2d.begin() && std::prev(first)->second.y <= y) {
+            return false;
+        }
+        // The points dominated by p are contiguous, starting from the first point
+        // whose first objective is not less than x.
+        first = m_front2d.lower_bound(x);
+        auto last = first;
+        while (last != m_front2d.end() && last->second.y >= y) {
+            ++last;
+        }
+        // Predecessor of p, if any.
+        const auto pred = first == m_front2d.begin() ? m_front2d.end() : std::prev(first);
+        // Remove the terms of the predecessor and of the evicted points from the hypervolume.
+        double delta = pred == m_front2d.end() ? 0. : -term2d(pred);
+        for (auto it = first; it != last; ++it) {
+            delta -= term2d(it);
+            m_contribs2d.erase(std::make_pair(it->second.contrib, it->first));
+        }
+        m_front2d.erase(first, last);
+        // Insert p, with a provisional contribution which is fixed by update_contrib2d() below.
+        const auto it = m_front2d.emplace(x, point2d{y, 0.}).first;
+        m_contribs2d.emplace(0., x);
+        delta += term2d(it) + (pred == m_front2d.end() ? 0. : term2d(pred));
+        m_hv += delta;
+        // Update the contributions of p and of its neighbours.
+        update_contrib2d(it);
+        if (pred != m_front2d.end()) {
+            update_contrib2d(pred);
+        }
+        const auto succ = std::next(it);
+        if (succ != m_front2d.end()) {
+            update_contrib2d(succ);
+        }
+        return true;
+    }
+    bool erase2d(const vector_double &p)
+    {
+        const auto it = m_front2d.find(p[0]);
+        if (it == m_front2d.end() || it->second.y != p[1]) {
+            return false;
+        }
+        const auto pred = it == m_front2d.begin() ? m_front2d.end() : std::prev(it);
+        double delta = -term2d(it) - (pred == m_front2d.end() ? 0. : term2d(pred));
+        m_contribs2d.erase(std::make_pair(it->second.contrib, it->first));
+        const auto succ = m_front2d.erase(it);
+        if (pred != m_front2d.end()) {
+            delta += term2d(pred);
+            update_contrib2d(pred);
+        }
+        if (succ != m_front2d.end()) {
+            update_contrib2d(succ);
+        }
+        m_hv += delta;
+        return true;
+    }
+
+    // 3D implementation.
+    // Exclusive contribution of p with respect to the points in m_points3d (which must not contain p): the volume
+    // of the box between p and the reference point, minus the hypervolume of the points limited to that box.
+    double exclusive3d(const vector_double &p) const
+    {
+        std::vector<vector_double> limited;
+        limited.reserve(m_points3d.size());
+        for (const auto &q : m_points3d) {
+            limited.push_back(vector_double{std::max(p[0], q[0]), std::max(p[1], q[1]), std::max(p[2], q[2])});
+        }
+        const auto box = hv_algorithm::volume_between(p, m_r_point);
+        return limited.empty() ? box : box - hv3d().compute(limited, m_r_point);
+    }
+    const std::vector<double> &contributions3d() const
+    {
+        if (!m_contribs3d_valid) {
+            if (m_points3d.size() < 2u) {
+                m_contribs3d.clear();
+                for (const auto &p : m_points3d) {
+                    m_contribs3d.push_back(hv_algorithm::volume_between(p, m_r_point));
+                }
+            } else {
+                std::vector<vector_double> points_cpy(m_points3d);
+                m_contribs3d = hv3d().contributions(points_cpy, m_r_point);
+            }
+            m_contribs3d_valid = true;
+        }
+        return m_contribs3d;
+    }
+    bool insert3d(const vector_double &p)
+    {
+        auto weakly_dominates = [](const vector_double &a, const vector_double &b) {
+            return a[0] <= b[0] && a[1] <= b[1] && a[2] <= b[2];
+        };
+        if (std::any_of(m_points3d.begin(), m_points3d.end(),
+                        [&p, &weakly_dominates](const vector_double &q) { return weakly_dominates(q, p); })) {
+            return false;
+        }
+        // NOTE: the points dominated by p lie in the box between p and the reference point,
+        // hence the hypervolume grows by the exclusive contribution of p with respect to the
+        // current points, evicted ones included.
+        m_hv += exclusive3d(p);
+        m_points3d.erase(std::remove_if(m_points3d.begin(), m_points3d.end(),
+                                        [&p, &weakly_dominates](const vector_double &q) {
+                                            return weakly_dominates(p, q);
+                                        }),
+                         m_points3d.end());
+        m_points3d.push_back(p);
+        m_contribs3d_valid = false;
+        return true;
+    }
+    bool erase3d(const vector_double &p)
+    {
+        const auto it = std::find(m_points3d.begin(), m_points3d.end(), p);
+        if (it == m_points3d.end()) {
+            return false;
+        }
+        m_points3d.erase(it);
+        m_hv -= exclusive3d(p);
+        m_contribs3d_valid = false;
+        return true;
+    }
+
+    // Data members.
+    vector_double m_r_point;
+    double m_hv = 0.;
+    // 2D front (first objective -> second objective and contribution), and the
+    // contributions paired with the first objective of the points, sorted.
+    front2d_t m_front2d;
+    std::set<std::pair<double, double>> m_contribs2d;
+    // 3D points, and the cache of their contributions.
+    std::vector<vector_double> m_points3d;
+    mutable std::vector<double> m_contribs3d;
+    mutable bool m_contribs3d_valid = true;
+};
+} // namespace pagmo
+
+#endif
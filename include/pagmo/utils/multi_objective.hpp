@@ -198,6 +198,9 @@ using fnds_return_type
  * for multi-objective optimization: NSGA-II." Parallel problem solving from nature PPSN VI. Springer Berlin Heidelberg,
  * 2000.
  *
+ * If the domination list and the domination count are not needed, pagmo::non_dominated_sorting() computes
+ * the non dominated fronts and ranks much more efficiently.
+ *
  * @param points An std::vector containing the objectives of different individuals. Example
  * {{1,2,3},{-2,3,7},{-1,-2,-3},{0,0,0}}
  *
@@ -272,6 +275,108 @@ inline fnds_return_type fast_non_dominated_sorting(const std::vector<vector_doub
                            std::move(non_dom_rank));
 }
 
+/// Return type for the non_dominated_sorting algorithm
+using nds_return_type
+    = std::tuple<std::vector<std::vector<vector_double::size_type>>, std::vector<vector_double::size_type>>;
+
+/// Non dominated sorting
+/**
+ * An implementation of the efficient non dominated sorting algorithm with binary search strategy (ENS-BS).
+ * The points are first sorted lexicographically, so that a point can only be dominated by the points preceding it,
+ * and each point is then assigned, via a binary search over the fronts built so far, to the first front
+ * containing no point dominating it. The point is compared only with (some of) the members of the fronts visited
+ * by the binary search. Complexity is \f$ O(MN\log N)\f$ in the best case and \f$ O(MN^2)\f$ in the worst case,
+ * where \f$M\f$ is the number of objectives and \f$N\f$ is the number of individuals, but in practice it is
+ * considerably faster than pagmo::fast_non_dominated_sorting on large populations. It also uses \f$ O(N)\f$ memory,
+ * as the domination list and the domination count are not computed: callers needing those must use
+ * pagmo::fast_non_dominated_sorting instead.
+ *
+ * See: Zhang, Xingyi, et al. "An efficient approach to nondominated sorting for evolutionary multiobjective
+ * optimization." IEEE Transactions on Evolutionary Computation 19.2 (2015): 201-213.
+ *
+ * @param points An std::vector containing the objectives of different individuals. Example
+ * {{1,2,3},{-2,3,7},{-1,-2,-3},{0,0,0}}
+ *
+ * @return an std::tuple containing:
+ *  - the non dominated fronts, an <tt>std::vector<std::vector<vector_double::size_type>></tt>
+ * containing the non dominated fronts, the indexes in each front being sorted in ascending order. Example
+ * {{1,2},{3},{0}}
+ *  - the non domination rank, an <tt>std::vector<vector_double::size_type></tt> containing the index of the non
+ * dominated front to which the individual at position \f$i\f$ belongs. Example {2,0,0,1}
+ *
+ * @throws std::invalid_argument If the size of \p points is not at least 2, or if the points do not all have the
+ * same dimension
+ */
+inline nds_return_type non_dominated_sorting(const std::vector<vector_double> &points)
+{
+    auto N = points.size();
+    // We make sure to have two points at least (one could also be allowed)
+    if (N < 2u) {
+        pagmo_throw(std::invalid_argument, "At least two points are needed for non_dominated_sorting: "
+                                               + std::to_string(N) + " detected.");
+    }
+    // We make sure all points contain M objectives
+    auto M = points[0].size();
+    if (!std::all_of(points.begin(), points.end(), [M](const vector_double &item) { return item.size() == M; })) {
+        pagmo_throw(std::invalid_argument, "Input contains vector of objectives with heterogeneous dimensionalities");
+    }
+    // Sort the indexes lexicographically with respect to the objectives. After the sort, each point
+    // can only be dominated by points preceding it. NaNs are placed last, to ensure a strict weak ordering
+    // (points containing NaNs cannot dominate nor be dominated anyway).
+    std::vector<vector_double::size_type> indexes(N);
+    std::iota(indexes.begin(), indexes.end(), vector_double::size_type(0u));
+    std::sort(indexes.begin(), indexes.end(),
+              [&points, M](vector_double::size_type idx1, vector_double::size_type idx2) {
+                  for (decltype(M) k = 0u; k < M; ++k) {
+                      if (detail::less_than_f(points[idx1][k], points[idx2][k])) {
+                          return true;
+                      }
+                      if (detail::greater_than_f(points[idx1][k], points[idx2][k])) {
+                          return false;
+                      }
+                  }
+                  return idx1 < idx2;
+              });
+    std::vector<std::vector<vector_double::size_type>> non_dom_fronts;
+    std::vector<vector_double::size_type> non_dom_rank(N);
+    // Returns true if any of the points already in the front dominates points[idx]. The front is scanned
+    // backwards, as the points added last are the closest to points[idx] in the lexicographic order.
+    auto dominated_by_front = [&points, &non_dom_fronts](decltype(non_dom_fronts.size()) front_id,
+                                                         vector_double::size_type idx) {
+        const auto &front = non_dom_fronts[front_id];
+        for (auto it = front.rbegin(); it != front.rend(); ++it) {
+            if (pareto_dominance(points[*it], points[idx])) {
+                return true;
+            }
+        }
+        return false;
+    };
+    for (auto idx : indexes) {
+        // Binary search for the first front not dominating the point. If the point is dominated by a member
+        // of the front k, it is also dominated by a member of all the fronts preceding k (by transitivity),
+        // hence the predicate is monotonic over the fronts.
+        decltype(non_dom_fronts.size()) lo = 0u, hi = non_dom_fronts.size();
+        while (lo < hi) {
+            const auto mid = lo + (hi - lo) / 2u;
+            if (dominated_by_front(mid, idx)) {
+                lo = mid + 1u;
+            } else {
+                hi = mid;
+            }
+        }
+        if (lo == non_dom_fronts.size()) {
+            non_dom_fronts.emplace_back();
+        }
+        non_dom_fronts[lo].push_back(idx);
+        non_dom_rank[idx] = lo;
+    }
+    // Sort the fronts so that the output does not depend on the lexicographic order.
+    for (auto &front : non_dom_fronts) {
+        std::sort(front.begin(), front.end());
+    }
+    return std::make_tuple(std::move(non_dom_fronts), std::move(non_dom_rank));
+}
+
 /// Crowding distance
 /**
  * An implementation of the crowding distance. Complexity is \f$ O(MNlog(N))\f$ where \f$M\f$ is the number of
@@ -338,7 +443,8 @@ inline vector_double crowding_distance(const std::vector<vector_double> &non_dom
  * - \f$f_1 \prec f_2\f$ if the non domination ranks are such that \f$i_1 < i_2\f$. In case
  * \f$i_1 = i_2\f$, then \f$f_1 \prec f_2\f$ if the crowding distances are such that \f$d_1 > d_2\f$.
  *
- * Complexity is \f$ O(MN^2)\f$ where \f$M\f$ is the number of objectives and \f$N\f$ is the number of individuals.
+ * Complexity is at most \f$ O(MN^2)\f$ (see pagmo::non_dominated_sorting()), where \f$M\f$ is the number of
+ * objectives and \f$N\f$ is the number of individuals.
  *
  * This function will also work for single objective optimization, i.e. with 1 objective
  * in which case, though, it is more efficient to sort using directly on of the following forms:
@@ -356,7 +462,7 @@ inline vector_double crowding_distance(const std::vector<vector_double> &non_dom
  *
  * @returns an <tt>std::vector</tt> containing the indexes of the sorted objectives vectors. Example {1,2,0}
  *
- * @throws unspecified all exceptions thrown by pagmo::fast_non_dominated_sorting and pagmo::crowding_distance
+ * @throws unspecified all exceptions thrown by pagmo::non_dominated_sorting and pagmo::crowding_distance
  */
 inline std::vector<vector_double::size_type> sort_population_mo(const std::vector<vector_double> &input_f)
 {
@@ -371,8 +477,8 @@ inline std::vector<vector_double::size_type> sort_population_mo(const std::vecto
     // Create the indexes 0....N-1
     std::vector<vector_double::size_type> retval(input_f.size());
     std::iota(retval.begin(), retval.end(), vector_double::size_type(0u));
-    // Run fast-non-dominated sorting and compute the crowding distance for all input objectives vectors
-    auto tuple = fast_non_dominated_sorting(input_f);
+    // Run non-dominated sorting and compute the crowding distance for all input objectives vectors
+    auto tuple = non_dominated_sorting(input_f);
     vector_double crowding(input_f.size());
     for (const auto &front : std::get<0>(tuple)) {
         if (front.size() == 1u) {
@@ -392,10 +498,10 @@ inline std::vector<vector_double::size_type> sort_population_mo(const std::vecto
     // Sort the indexes
     std::sort(retval.begin(), retval.end(),
               [&tuple, &crowding](vector_double::size_type idx1, vector_double::size_type idx2) {
-                  if (std::get<3>(tuple)[idx1] == std::get<3>(tuple)[idx2]) {        // same non domination rank
+                  if (std::get<1>(tuple)[idx1] == std::get<1>(tuple)[idx2]) {        // same non domination rank
                       return detail::greater_than_f(crowding[idx1], crowding[idx2]); // crowding distance decides
                   } else {                                                           // different non domination ranks
-                      return std::get<3>(tuple)[idx1] < std::get<3>(tuple)[idx2];    // non domination rank decides
+                      return std::get<1>(tuple)[idx1] < std::get<1>(tuple)[idx2];    // non domination rank decides
                   };
               });
     return retval;
@@ -407,7 +513,8 @@ inline std::vector<vector_double::size_type> sort_population_mo(const std::vecto
  * <tt>std::vector<vector_double></tt> containing the  objective vectors). The strict ordering used
  * is the same as that defined in pagmo::sort_population_mo.
  *
- * Complexity is \f$ O(MN^2)\f$ where \f$M\f$ is the number of objectives and \f$N\f$ is the number of individuals.
+ * Complexity is at most \f$ O(MN^2)\f$ (see pagmo::non_dominated_sorting()), where \f$M\f$ is the number of
+ * objectives and \f$N\f$ is the number of individuals.
  *
  * While the complexity is the same as that of pagmo::sort_population_mo, this function returns a permutation
  * of:
@@ -425,7 +532,7 @@ inline std::vector<vector_double::size_type> sort_population_mo(const std::vecto
  *
  * @returns an <tt>std::vector</tt> containing the indexes of the best N objective vectors. Example {2,1}
  *
- * @throws unspecified all exceptions thrown by pagmo::fast_non_dominated_sorting and pagmo::crowding_distance
+ * @throws unspecified all exceptions thrown by pagmo::non_dominated_sorting and pagmo::crowding_distance
  */
 inline std::vector<vector_double::size_type> select_best_N_mo(const std::vector<vector_double> &input_f,
                                                               vector_double::size_type N)
@@ -447,8 +554,8 @@ inline std::vector<vector_double::size_type> select_best_N_mo(const std::vector<
     }
     std::vector<vector_double::size_type> retval;
     std::vector<vector_double::size_type>::size_type front_id(0u);
-    // Run fast-non-dominated sorting
-    auto tuple = fast_non_dominated_sorting(input_f);
+    // Run non-dominated sorting
+    auto tuple = non_dominated_sorting(input_f);
     // Insert all non dominated fronts if not more than N
     for (const auto &front : std::get<0>(tuple)) {
         if (retval.size() + front.size() <= N) {
@@ -527,7 +634,8 @@ inline vector_double ideal(const std::vector<vector_double> &points)
  * Computes the nadir point of an input population, (intended here as an
  * <tt>std::vector<vector_double></tt> containing the  objective vectors).
  *
- * Complexity is \f$ O(MN^2)\f$ where \f$M\f$ is the number of objectives and \f$N\f$ is the number of individuals.
+ * Complexity is at most \f$ O(MN^2)\f$ (see pagmo::non_dominated_sorting()), where \f$M\f$ is the number of
+ * objectives and \f$N\f$ is the number of individuals.
  *
  * @param points Input objective vectors. Example {{0,7},{1,5},{2,3},{4,2},{7,1},{10,0},{6,6},{9,15}}
  *
@@ -543,7 +651,7 @@ inline vector_double nadir(const std::vector<vector_double> &points)
     // Sanity checks
     auto M = points[0].size();
     // We extract all objective vectors belonging to the first non dominated front (the Pareto front)
-    auto pareto_idx = std::get<0>(fast_non_dominated_sorting(points))[0];
+    auto pareto_idx = std::get<0>(non_dominated_sorting(points))[0];
     std::vector<vector_double> nd_points;
     for (auto idx : pareto_idx) {
         nd_points.push_back(points[idx]);
@@ -0,0 +1,210 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#ifndef PAGMO_UTIL_SHARED_BUFFER_H
+#define PAGMO_UTIL_SHARED_BUFFER_H
+
+#include <algorithm>
+#include <memory>
+#include <mutex>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace pagmo
+{
+
+/// Shared immutable buffer
+/**
+ * This class holds an immutable value of type \p T through a reference-counted pointer. Copying a
+ * pagmo::shared_buffer does not copy the value: all the copies refer to the same object, which is destroyed
+ * together with the last copy. It is meant to be used as a data member of UDPs (and of the other user-defined
+ * components) carrying large amounts of constant data (e.g., shift vectors, rotation matrices, lookup tables), so
+ * that copying the UDP (as it happens, e.g., when constructing populations, islands and archipelagos) costs
+ * \f$ O(1) \f$ memory for the data, irrespective of its size.
+ *
+ * A pagmo::shared_buffer is serialized by value. When a pagmo::shared_buffer is deserialized, the loaded
+ * value is compared to the values of the pagmo::shared_buffer objects of the same type currently alive in the
+ * process: if an equal value is found, the deserialized object will share it, and the loaded value is discarded.
+ * In this way, objects sent to another process one at a time (e.g., by pygmo's multiprocessing facilities)
+ * end up sharing their data again in the receiving process.
+ *
+ * \verbatim embed:rst:leading-asterisk
+ * .. note::
+ *
+ *    The lookup performed at deserialization compares the loaded value with all the distinct live values of
+ *    type ``T``, and its cost is thus linear in their total size. Construction and copies do not perform
+ *    any comparison.
+ *
+ * \endverbatim
+ *
+ * The type \p T must be a non-const, non-reference type which is default-constructible, equality-comparable
+ * and serializable.
+ */
+template <typename T>
+class shared_buffer
+{
+    static_assert(std::is_same<T, typename std::remove_cv<typename std::remove_reference<T>::type>::type>::value,
+                  "The type of a shared_buffer must not be a const or reference type.");
+    // The registry of the values held by the live shared_buffer objects of type T,
+    // used to restore the sharing upon deserialization.
+    struct registry {
+        std::mutex m_mutex;
+        std::vector<std::weak_ptr<const T>> m_values;
+    };
+    static registry &get_registry()
+    {
+        static registry r;
+        return r;
+    }
+    // Record ptr in the registry, pruning the values which have been destroyed.
+    static std::shared_ptr<const T> register_value(std::shared_ptr<const T> ptr)
+    {
+        auto &r = get_registry();
+        std::lock_guard<std::mutex> lock(r.m_mutex);
+        r.m_values.erase(std::remove_if(r.m_values.begin(), r.m_values.end(),
+                                        [](const std::weak_ptr<const T> &w) { return w.expired(); }),
+                         r.m_values.end());
+        r.m_values.push_back(ptr);
+        return ptr;
+    }
+    // Return a live value equal to v, or register a new one.
+    static std::shared_ptr<const T> intern(T &&v)
+    {
+        {
+            auto &r = get_registry();
+            std::lock_guard<std::mutex> lock(r.m_mutex);
+            for (const auto &w : r.m_values) {
+                auto sp = w.lock();
+                if (sp && *sp == v) {
+                    return sp;
+                }
+            }
+        }
+        return register_value(std::make_shared<const T>(std::move(v)));
+    }
+
+public:
+    /// Default constructor.
+    /**
+     * The held value is default-constructed.
+     *
+     * @throws unspecified any exception thrown by memory allocation errors or by the default constructor of \p T.
+     */
+    shared_buffer() : shared_buffer(T{})
+    {
+    }
+    /// Constructor from value.
+    /**
+     * @param value the value that will be held by \p this.
+     *
+     * @throws unspecified any exception thrown by memory allocation errors or by the move constructor of \p T.
+     */
+    explicit shared_buffer(T value) : m_ptr(register_value(std::make_shared<const T>(std::move(value))))
+    {
+    }
+    /// Get the held value.
+    /**
+     * @return a const reference to the held value.
+     */
+    const T &get() const
+    {
+        return *m_ptr;
+    }
+    /// Dereference operator.
+    /**
+     * @return a const reference to the held value.
+     */
+    const T &operator*() const
+    {
+        return *m_ptr;
+    }
+    /// Member access operator.
+    /**
+     * @return a const pointer to the held value.
+     */
+    const T *operator->() const
+    {
+        return m_ptr.get();
+    }
+    /// Number of owners.
+    /**
+     * @return the number of pagmo::shared_buffer objects sharing the held value with \p this (including \p this).
+     */
+    long use_count() const
+    {
+        return m_ptr.use_count();
+    }
+    /// Check if two buffers share their value.
+    /**
+     * @param other another pagmo::shared_buffer.
+     *
+     * @return \p true if \p this and \p other refer to the same object, \p false otherwise.
+     */
+    bool shares_with(const shared_buffer &other) const
+    {
+        return m_ptr == other.m_ptr;
+    }
+    /// Save to archive.
+    /**
+     * This method will save the held value into the archive \p ar.
+     *
+     * @param ar target archive.
+     *
+     * @throws unspecified any exception thrown by the serialization of \p T.
+     */
+    template <typename Archive>
+    void save(Archive &ar) const
+    {
+        ar(*m_ptr);
+    }
+    /// Load from archive.
+    /**
+     * This method will load a value from the archive \p ar, and it will make \p this share it with the live
+     * pagmo::shared_buffer objects holding an equal value, if any.
+     *
+     * @param ar source archive.
+     *
+     * @throws unspecified any exception thrown by the deserialization of \p T, by the comparison of values of
+     * type \p T or by memory allocation errors.
+     */
+    template <typename Archive>
+    void load(Archive &ar)
+    {
+        T tmp;
+        ar(tmp);
+        m_ptr = intern(std::move(tmp));
+    }
+
+private:
+    std::shared_ptr<const T> m_ptr;
+};
+} // namespace pagmo
+
+#endif
@@ -38,14 +38,20 @@ from ._version import __version__
 from .core import *
 from .plotting import *
 from ._py_islands import *
+from ._py_bfes import *
 
-# We move into the problems, algorithms and islands namespaces
-# all the pure python UDAs, UDPs and UDIs
+# We move into the problems, algorithms, islands and batch_evaluators namespaces
+# all the pure python UDAs, UDPs, UDIs and UDBFEs
 for item in dir(_py_islands):
     if item[0] != "_":
         setattr(islands, item, getattr(_py_islands, item))
 del _py_islands
 
+for item in dir(_py_bfes):
+    if item[0] != "_":
+        setattr(batch_evaluators, item, getattr(_py_bfes, item))
+del _py_bfes
+
 # And we explicitly import the test submodule
 from . import test
 
@@ -57,6 +63,14 @@ from . import _patch_problem
 from . import _patch_algorithm
 
 
+# Patch the bfe class.
+from . import _patch_bfe
+
+
+# Patch the topology and migration policy classes.
+from . import _patch_migration
+
+
 class thread_safety(object):
     """Thread safety level.
 
@@ -68,6 +82,8 @@ class thread_safety(object):
     none = core._thread_safety.none
     #: Basic thread safety: any concurrent operation on distinct instances is safe
     basic = core._thread_safety.basic
+    #: Constant thread safety: basic thread safety, and concurrent const operations on the same instance are safe
+    constant = core._thread_safety.constant
 
 
 class evolve_status(object):
@@ -234,6 +250,111 @@ def _unconstrain_init(self, prob=None, method="death penalty", weights=[]):
 
 setattr(unconstrain, "__init__", _unconstrain_init)
 
+# Override of the memoize meta-problem constructor.
+__original_memoize_init = memoize.__init__
+
+# NOTE: the idea of having the memoize init here instead of exposed from C++ is to allow the use
+# of the syntax memoize(udp, ... ) for all udps
+
+
+def _memoize_init(self, prob=None, capacity=1000, cache_gradient=False):
+    """
+    Args:
+        prob: a user-defined problem (either Python or C++), or an instance of :class:`~pygmo.problem`
+            (if ``None``, the inner problem will be :class:`~pygmo.null_problem`)
+        capacity (``int``): the maximum number of entries in the cache
+        cache_gradient (``bool``): if ``True``, the gradient will be memoized as well
+
+    Raises:
+        ValueError: if *capacity* is zero
+        OverflowError: if *capacity* is negative or too large
+
+        unspecified: any exception thrown by:
+
+           * the constructor of :class:`pygmo.problem`,
+           * the constructor of the underlying C++ class,
+           * failures at the intersection between C++ and Python (e.g., type conversion errors, mismatched function
+             signatures, etc.)
+    """
+    if prob is None:
+        # Use the null problem for default init.
+        prob = null_problem()
+    if type(prob) == problem:
+        # If prob is a pygmo problem, we will pass it as-is to the
+        # original init.
+        prob_arg = prob
+    else:
+        # Otherwise, we attempt to create a problem from it. This will
+        # work if prob is an exposed C++ problem or a Python UDP.
+        prob_arg = problem(prob)
+    __original_memoize_init(self, prob_arg, capacity, cache_gradient)
+
+
+setattr(memoize, "__init__", _memoize_init)
+
+# Override of the cfunc_problem constructor.
+__original_cfunc_problem_init = cfunc_problem.__init__
+
+# NOTE: the address of the native function is extracted here from the objects
+# produced by the libraries which can create C function pointers.
+
+
+def _cfunc_address(f):
+    # Return the address of the native function f as an int.
+    import ctypes
+    from numbers import Integral
+    if isinstance(f, Integral) and not isinstance(f, bool):
+        return int(f)
+    if isinstance(f, ctypes._CFuncPtr):
+        return ctypes.cast(f, ctypes.c_void_p).value or 0
+    if type(f).__module__ == '_cffi_backend':
+        import cffi
+        return int(cffi.FFI().cast("uintptr_t", f))
+    # Numba cfunc objects expose the address of the compiled function.
+    address = getattr(f, "address", None)
+    if isinstance(address, Integral):
+        return int(address)
+    raise TypeError("cannot extract a function pointer from an object of type '{}': "
+                    "an int, a Numba cfunc, a cffi function pointer or a ctypes function pointer "
+                    "are needed".format(type(f)))
+
+
+def _cfunc_problem_init(self, fitness=None, lb=[0.], ub=[1.], nobj=1, nec=0, nic=0, nix=0, name=""):
+    """
+    Args:
+        fitness: the fitness function, either as an ``int`` (the address of the function), a Numba ``cfunc``,
+            a cffi function pointer or a :mod:`ctypes` function pointer (if ``None``, the fitness
+            will be a vector of zeroes)
+        lb (array-like object): the lower bounds of the problem
+        ub (array-like object): the upper bounds of the problem
+        nobj (``int``): the number of objectives
+        nec (``int``): the number of equality constraints
+        nic (``int``): the number of inequality constraints
+        nix (``int``): the integer dimension of the problem
+        name (``str``): the name of the problem (if empty, a default name is used)
+
+    Raises:
+        ValueError: if *fitness* is a null function pointer
+        TypeError: if *fitness* is not one of the supported types
+
+        unspecified: any exception thrown by:
+
+           * the constructor of the underlying C++ class,
+           * failures at the intersection between C++ and Python (e.g., type conversion errors, mismatched function
+             signatures, etc.)
+    """
+    if fitness is None:
+        __original_cfunc_problem_init(self)
+        return
+    # NOTE: if fitness is an address, there is no object to keep alive.
+    from numbers import Integral
+    owner = None if isinstance(fitness, Integral) else fitness
+    __original_cfunc_problem_init(self, _cfunc_address(
+        fitness), lb, ub, nobj, nec, nic, nix, name, owner)
+
+
+setattr(cfunc_problem, "__init__", _cfunc_problem_init)
+
 # Override of the mbh meta-algorithm constructor.
 __original_mbh_init = mbh.__init__
 # NOTE: the idea of having the mbh init here instead of exposed from C++ is to allow the use
@@ -325,7 +446,7 @@ setattr(cstrs_self_adaptive, "__init__", _cstrs_self_adaptive_init)
 __original_population_init = population.__init__
 
 
-def _population_init(self, prob=None, size=0, seed=None):
+def _population_init(self, prob=None, size=0, seed=None, b=None):
     # NOTE: the idea of having the pop init here instead of exposed from C++ is that like this we don't need
     # to expose a new pop ctor each time we expose a new problem: in this method we will use the problem ctor
     # from a C++ problem, and on the C++ exposition side we need only to
@@ -336,6 +457,10 @@ def _population_init(self, prob=None, size=0, seed=None):
             (if ``None``, the population problem will be :class:`~pygmo.null_problem`)
         size (``int``): the number of individuals
         seed (``int``): the random seed (if ``None``, it will be randomly-generated)
+        b: a :class:`~pygmo.bfe` or a user-defined batch fitness evaluator, which, if not ``None``, will be used
+            to compute the fitnesses of the initial individuals in a single batch (e.g., in parallel via
+            :class:`~pygmo.thread_bfe` or :class:`~pygmo.mp_bfe`); the resulting population is the same as if
+            *b* were ``None``
 
     Raises:
         TypeError: if *size* is not an ``int`` or *seed* is not ``None`` and not an ``int``
@@ -363,10 +488,18 @@ def _population_init(self, prob=None, size=0, seed=None):
         # Otherwise, we attempt to create a problem from it. This will
         # work if prob is an exposed C++ problem or a Python UDP.
         prob_arg = problem(prob)
-    if seed is None:
-        __original_population_init(self, prob_arg, size)
+    if b is None:
+        if seed is None:
+            __original_population_init(self, prob_arg, size)
+        else:
+            __original_population_init(self, prob_arg, size, seed)
     else:
-        __original_population_init(self, prob_arg, size, seed)
+        # Construct a pygmo bfe from b, if needed.
+        b_arg = b if type(b) == bfe else bfe(b)
+        if seed is None:
+            __original_population_init(self, prob_arg, b_arg, size)
+        else:
+            __original_population_init(self, prob_arg, b_arg, size, seed)
 
 
 setattr(population, "__init__", _population_init)
@@ -612,6 +745,7 @@ from .core import _cleanup as _cpp_cleanup
 
 def _cleanup():
     mp_island._shutdown_pool()
+    mp_bfe._shutdown_pool()
     _cpp_cleanup()
 
 
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 PaGMO development team
+#
+# This file is part of the PaGMO library.
+#
+# The PaGMO library is free software; you can redistribute it and/or modify
+# it under the terms of either:
+#
+#   * the GNU Lesser General Public License as published by the Free
+#     Software Foundation; either version 3 of the License, or (at your
+#     option) any later version.
+#
+# or
+#
+#   * the GNU General Public License as published by the Free Software
+#     Foundation; either version 3 of the License, or (at your option) any
+#     later version.
+#
+# or both in parallel, as here.
+#
+# The PaGMO library is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+# for more details.
+#
+# You should have received copies of the GNU General Public License and the
+# GNU Lesser General Public License along with the PaGMO library.  If not,
+# see https://www.gnu.org/licenses/.
+
+from __future__ import absolute_import as _ai
+
+import unittest as _ut
+
+
+class _udbfe_01(object):
+
+    def __call__(self, prob, dvs):
+        return [prob.fitness(x) for x in dvs]
+
+    def get_name(self):
+        return "udbfe_01"
+
+    def get_extra_info(self):
+        return "extra bits"
+
+
+class _udbfe_02(object):
+    pass
+
+
+class _udbfe_03(object):
+
+    def __call__(self, prob, dvs):
+        # Return the wrong number of fitness vectors.
+        return [prob.fitness(dvs[0])]
+
+
+class _prob(object):
+
+    def __init__(self, data):
+        self.data = data
+
+    def fitness(self, x):
+        return [sum(x)]
+
+    def get_bounds(self):
+        return ([0., 0.], [1., 1.])
+
+
+class bfe_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.bfe` class.
+
+    """
+
+    def runTest(self):
+        self.run_basic_tests()
+        self.run_call_tests()
+        self.run_extract_tests()
+        self.run_pickle_tests()
+        self.run_nsga2_tests()
+
+    def run_basic_tests(self):
+        from .core import bfe, default_bfe, thread_bfe
+        from . import thread_safety
+        b = bfe()
+        self.assertTrue(b.is_(default_bfe))
+        self.assertEqual(b.get_name(), "Default batch fitness evaluator")
+        self.assertEqual(b.get_thread_safety(), thread_safety.basic)
+        b = bfe(udbfe=thread_bfe())
+        self.assertTrue(b.is_(thread_bfe))
+        b = bfe(_udbfe_01())
+        self.assertTrue(b.is_(_udbfe_01))
+        self.assertEqual(b.get_name(), "udbfe_01")
+        self.assertEqual(b.get_extra_info(), "extra bits")
+        self.assertEqual(b.get_thread_safety(), thread_safety.none)
+        self.assertTrue("udbfe_01" in repr(b))
+        self.assertRaises(NotImplementedError, lambda: bfe(_udbfe_02()))
+        self.assertRaises(TypeError, lambda: bfe(_udbfe_01))
+
+    def run_call_tests(self):
+        from .core import bfe, problem, rosenbrock
+        import numpy as np
+        prob = problem(rosenbrock(3))
+        dvs = np.random.uniform(0., 1., (10, 3))
+        ref = np.array([prob.fitness(x) for x in dvs])
+        self.assertEqual(prob.get_fevals(), 10)
+        for b in [bfe(), bfe(_udbfe_01())]:
+            fvs = b(prob, dvs)
+            self.assertEqual(fvs.shape, (10, 1))
+            self.assertTrue(np.all(fvs == ref))
+        # The fitness evaluation counter must have been updated.
+        self.assertEqual(prob.get_fevals(), 30)
+        # Empty batch.
+        self.assertEqual(bfe()(prob, np.zeros((0, 3))).shape, (0, 1))
+        # Wrong number of columns.
+        self.assertRaises(ValueError, lambda: bfe()(prob, np.zeros((2, 2))))
+        self.assertRaises(ValueError, lambda: bfe()(prob, [1., 2., 3.]))
+        # Wrong number of fitness vectors.
+        self.assertRaises(ValueError, lambda: bfe(_udbfe_03())(prob, dvs))
+        self.assertEqual(prob.get_fevals(), 30)
+
+    def run_extract_tests(self):
+        from .core import bfe, thread_bfe, member_bfe
+        b = bfe(_udbfe_01())
+        self.assertTrue(b.extract(thread_bfe) is None)
+        self.assertFalse(b.is_(thread_bfe))
+        self.assertTrue(isinstance(b.extract(_udbfe_01), _udbfe_01))
+        b = bfe(member_bfe())
+        self.assertTrue(isinstance(b.extract(member_bfe), member_bfe))
+        self.assertTrue(b.extract(_udbfe_01) is None)
+        self.assertRaises(TypeError, lambda: b.extract(1))
+
+    def run_pickle_tests(self):
+        from .core import bfe, thread_bfe
+        from pickle import dumps, loads
+        from copy import copy, deepcopy
+        for b in [bfe(), bfe(thread_bfe()), bfe(_udbfe_01())]:
+            for b2 in [loads(dumps(b)), copy(b), deepcopy(b)]:
+                self.assertEqual(repr(b), repr(b2))
+                self.assertEqual(b.get_name(), b2.get_name())
+
+    def run_nsga2_tests(self):
+        from .core import algorithm, bfe, nsga2, population, zdt, thread_bfe
+        pop = population(zdt(1), 20, seed=123)
+        uda = nsga2(gen=10, seed=42)
+        ref = algorithm(uda).evolve(pop)
+        for b in [bfe(thread_bfe()), bfe(_udbfe_01())]:
+            uda = nsga2(gen=10, seed=42)
+            uda.set_bfe(b)
+            algo = algorithm(uda)
+            self.assertEqual(algo.get_thread_safety(), b.get_thread_safety())
+            self.assertTrue(b.get_name() in algo.get_extra_info())
+            new_pop = algo.evolve(pop)
+            self.assertTrue((new_pop.get_f() == ref.get_f()).all())
+            self.assertTrue((new_pop.get_x() == ref.get_x()).all())
+            self.assertEqual(new_pop.problem.get_fevals(),
+                             ref.problem.get_fevals())
+
+
+class thread_bfe_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.thread_bfe` class.
+
+    """
+
+    def runTest(self):
+        from .core import bfe, thread_bfe, problem, rosenbrock
+        import numpy as np
+        b = bfe(thread_bfe())
+        self.assertEqual(b.get_name(), "Multi-threaded batch fitness evaluator")
+        prob = problem(rosenbrock(3))
+        dvs = np.random.uniform(0., 1., (100, 3))
+        ref = np.array([prob.fitness(x) for x in dvs])
+        self.assertTrue(np.all(b(prob, dvs) == ref))
+        self.assertEqual(prob.get_fevals(), 200)
+        # Python problems are not thread-safe.
+        self.assertRaises(ValueError, lambda: b(problem(_prob(0)), dvs[:, :2]))
+
+
+class member_bfe_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.member_bfe` class.
+
+    """
+
+    def runTest(self):
+        from .core import bfe, member_bfe, problem
+        import numpy as np
+        b = bfe(member_bfe())
+        self.assertEqual(b.get_name(), "Member function batch fitness evaluator")
+        prob = problem(_prob(0))
+        dvs = np.random.uniform(0., 1., (10, 2))
+        fvs = b(prob, dvs)
+        self.assertTrue(np.all(fvs == np.sum(dvs, axis=1).reshape((10, 1))))
+        self.assertEqual(prob.get_fevals(), 10)
+
+
+class default_bfe_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.default_bfe` class.
+
+    """
+
+    def runTest(self):
+        from .core import bfe, default_bfe, problem, rosenbrock
+        import numpy as np
+        b = bfe(default_bfe())
+        # Thread-safe C++ problem.
+        prob = problem(rosenbrock(3))
+        dvs = np.random.uniform(0., 1., (10, 3))
+        ref = np.array([prob.fitness(x) for x in dvs])
+        self.assertTrue(np.all(b(prob, dvs) == ref))
+        self.assertEqual(prob.get_fevals(), 20)
+        # Python problem, will use mp_bfe.
+        prob = problem(_prob(0))
+        dvs = np.random.uniform(0., 1., (10, 2))
+        self.assertTrue(
+            np.all(b(prob, dvs) == np.sum(dvs, axis=1).reshape((10, 1))))
+        self.assertEqual(prob.get_fevals(), 10)
+
+
+class mp_bfe_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.mp_bfe` class.
+
+    """
+
+    def runTest(self):
+        import sys
+        import os
+        # The mp bfe requires either Windows or at least Python 3.4.
+        if os.name != 'nt' and (sys.version_info[0] < 3 or (sys.version_info[0] == 3 and sys.version_info[1] < 4)):
+            return
+
+        self.run_basic_tests()
+
+    def run_basic_tests(self):
+        from .core import bfe, problem, rosenbrock
+        from . import mp_bfe
+        from pickle import dumps, loads
+        import numpy as np
+        b = bfe(mp_bfe())
+        self.assertEqual(b.get_name(), "Multiprocessing batch fitness evaluator")
+        self.assertTrue(b.get_extra_info() != "")
+        self.assertTrue(mp_bfe.get_pool_size() > 0)
+        mp_bfe.init_pool()
+        self.assertRaises(TypeError, lambda: mp_bfe.init_pool("dasda"))
+        self.assertRaises(ValueError, lambda: mp_bfe.init_pool(0))
+        self.assertRaises(ValueError, lambda: mp_bfe.init_pool(-1))
+        self.assertRaises(TypeError, lambda: mp_bfe("dasda"))
+        self.assertRaises(ValueError, lambda: mp_bfe(0))
+        mp_bfe.resize_pool(3)
+        self.assertEqual(mp_bfe.get_pool_size(), 3)
+        for udbfe in [mp_bfe(), mp_bfe(chunksize=4)]:
+            b = bfe(udbfe)
+            prob = problem(rosenbrock(3))
+            dvs = np.random.uniform(0., 1., (10, 3))
+            ref = np.array([prob.fitness(x) for x in dvs])
+            self.assertTrue(np.all(b(prob, dvs) == ref))
+            self.assertEqual(prob.get_fevals(), 20)
+            # Check a problem storing a lambda.
+            prob = problem(_prob(lambda x, y: x + y))
+            dvs = np.random.uniform(0., 1., (10, 2))
+            self.assertTrue(
+                np.all(b(prob, dvs) == np.sum(dvs, axis=1).reshape((10, 1))))
+            self.assertEqual(prob.get_fevals(), 10)
+            # Pickling.
+            self.assertEqual(repr(b), repr(loads(dumps(b))))
+        mp_bfe.resize_pool(2)
+        self.assertRaises(ValueError, lambda: mp_bfe.resize_pool(-1))
+        self.assertRaises(TypeError, lambda: mp_bfe.resize_pool("dasda"))
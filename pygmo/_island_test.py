@@ -49,6 +49,17 @@ class _udi_02(object):
     pass
 
 
+class _udi_03(object):
+    # A UDI evolving the population in a nested island.
+
+    def run_evolve(self, algo, pop):
+        from .core import island
+        isl = island(algo=algo, pop=pop)
+        isl.evolve()
+        isl.wait_check()
+        return isl.get_population()
+
+
 class _prob(object):
 
     def __init__(self, data):
@@ -61,6 +72,24 @@ class _prob(object):
         return ([0.], [1.])
 
 
+class _data_prob(object):
+
+    def __init__(self, n=1000):
+        self.data = list(range(n))
+
+    def fitness(self, x):
+        return [sum(x * x)]
+
+    def get_bounds(self):
+        return ([-1.] * 2, [1.] * 2)
+
+
+class _token_data_prob(_data_prob):
+
+    def get_cache_token(self):
+        return len(self.data)
+
+
 class island_test_case(_ut.TestCase):
     """Test case for the :class:`~pygmo.island` class.
 
@@ -74,6 +103,7 @@ class island_test_case(_ut.TestCase):
         self.run_thread_safety_tests()
         self.run_io_tests()
         self.run_status_tests()
+        self.run_pool_tests()
 
     def run_basic_tests(self):
         from .core import island, thread_island, null_algorithm, null_problem, de, rosenbrock
@@ -153,6 +183,33 @@ class island_test_case(_ut.TestCase):
         isl.evolve(20)
         isl.wait()
 
+    def run_pool_tests(self):
+        from .core import island, de, rosenbrock, get_island_pool_size, set_island_pool_size
+        from os import cpu_count
+        old_size = get_island_pool_size()
+        self.assertEqual(old_size, cpu_count())
+        self.assertRaises(ValueError, lambda: set_island_pool_size(0))
+        self.assertRaises(OverflowError, lambda: set_island_pool_size(-1))
+        self.assertEqual(get_island_pool_size(), old_size)
+        try:
+            for size in (1, 2):
+                set_island_pool_size(size)
+                self.assertEqual(get_island_pool_size(), size)
+                isls = [island(algo=de(), prob=rosenbrock(), size=10)
+                        for _ in range(50)]
+                for isl in isls:
+                    isl.evolve(3)
+                for isl in isls:
+                    isl.wait_check()
+                # Nested islands must not deadlock.
+                isl = island(algo=de(), prob=rosenbrock(),
+                             size=10, udi=_udi_03())
+                isl.evolve(3)
+                isl.wait_check()
+        finally:
+            set_island_pool_size(old_size)
+        self.assertEqual(get_island_pool_size(), old_size)
+
     def run_thread_safety_tests(self):
         from .core import island, de, rosenbrock
         from . import thread_safety as ts
@@ -221,8 +278,10 @@ class mp_island_test_case(_ut.TestCase):
         self.run_basic_tests()
 
     def run_basic_tests(self):
-        from .core import island, de, rosenbrock
+        import sys
+        from .core import island, de, rosenbrock, population, algorithm
         from . import mp_island
+        from ._py_islands import _udp_hash_attr, _SharedMemory
         from copy import copy, deepcopy
         from pickle import dumps, loads
         isl = island(algo=de(), prob=rosenbrock(), size=25, udi=mp_island())
@@ -259,6 +318,66 @@ class mp_island_test_case(_ut.TestCase):
         # Pickle.
         self.assertEqual(str(loads(dumps(isl))), str(isl))
 
+        # Caching of the algorithm and problem.
+        self.assertRaises(TypeError, lambda: mp_island(use_cache=1))
+        self.assertTrue("disabled" in mp_island().get_extra_info())
+        isl = island(algo=de(gen=10, ftol=0., tol=0.), prob=_data_prob(),
+                     size=20, udi=mp_island(use_cache=True))
+        self.assertTrue("enabled" in isl.get_extra_info())
+        pop = isl.get_population()
+        ids, cf = pop.get_ID(copy=True), pop.champion_f
+        isl.evolve(4)
+        isl.wait_check()
+        pop = isl.get_population()
+        self.assertEqual(pop.problem.get_fevals(), 20 + 4 * 10 * 20)
+        self.assertTrue(all(pop.get_ID() == ids))
+        self.assertTrue(pop.champion_f[0] <= cf[0])
+        # The hash of the problem is computed once and stored in the problem.
+        self.assertTrue(_udp_hash_attr in vars(pop.problem.extract(_data_prob)))
+        # A problem identified by a cache token.
+        isl = island(algo=de(gen=10, ftol=0., tol=0.), prob=_token_data_prob(),
+                     size=20, udi=mp_island(use_cache=True))
+        isl.evolve(4)
+        isl.wait_check()
+        self.assertEqual(isl.get_population().problem.get_fevals(), 20 + 4 * 10 * 20)
+        self.assertFalse(_udp_hash_attr in vars(
+            isl.get_population().problem.extract(_token_data_prob)))
+        # On Python >= 3.8, the population is exchanged via
+        # a shared memory block re-used across evolutions.
+        udi = mp_island(use_cache=True)
+        pop = population(_data_prob(), size=20)
+        algo = algorithm(de(gen=10, ftol=0., tol=0.))
+        pop = udi.run_evolve(algo, pop)
+        if sys.version_info[0] > 3 or (sys.version_info[0] == 3 and sys.version_info[1] >= 8):
+            name = udi._shm.name
+            pop = udi.run_evolve(algo, pop)
+            self.assertEqual(udi._shm.name, name)
+            self.assertTrue(deepcopy(udi)._shm is None)
+            self.assertTrue(loads(dumps(udi))._shm is None)
+            # A larger population needs a new block.
+            pop.push_back([0., 0.])
+            pop = udi.run_evolve(algo, pop)
+            self.assertTrue(udi._shm.name != name)
+            # The old block has been destroyed, and the processes
+            # of the pool do not keep it alive.
+            self.assertRaises(FileNotFoundError,
+                              lambda: _SharedMemory(name=name))
+        else:
+            self.assertTrue(udi._shm is None)
+            pop = udi.run_evolve(algo, pop)
+            pop.push_back([0., 0.])
+            pop = udi.run_evolve(algo, pop)
+        self.assertEqual(len(pop), 21)
+        self.assertEqual(pop.problem.get_fevals(), 20 + 2 * 10 * 20 + 1 + 10 * 21)
+        # C++ problems are evolved without the cache.
+        isl = island(algo=de(), prob=rosenbrock(),
+                     size=25, udi=mp_island(use_cache=True))
+        isl.evolve(2)
+        isl.wait_check()
+        self.assertEqual(isl.get_population().problem.get_fevals(), 25 + 2 * 25)
+        self.assertTrue("enabled" in deepcopy(isl).get_extra_info())
+        self.assertTrue("enabled" in loads(dumps(isl)).get_extra_info())
+
         if self._level == 0:
             return
 
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 PaGMO development team
+#
+# This file is part of the PaGMO library.
+#
+# The PaGMO library is free software; you can redistribute it and/or modify
+# it under the terms of either:
+#
+#   * the GNU Lesser General Public License as published by the Free
+#     Software Foundation; either version 3 of the License, or (at your
+#     option) any later version.
+#
+# or
+#
+#   * the GNU General Public License as published by the Free Software
+#     Foundation; either version 3 of the License, or (at your option) any
+#     later version.
+#
+# or both in parallel, as here.
+#
+# The PaGMO library is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+# for more details.
+#
+# You should have received copies of the GNU General Public License and the
+# GNU Lesser General Public License along with the PaGMO library.  If not,
+# see https://www.gnu.org/licenses/.
+
+from __future__ import absolute_import as _ai
+
+import unittest as _ut
+
+
+class topology_test_case(_ut.TestCase):
+    """Test case for the :class:`~pygmo.topology` class and the UDTs.
+
+    """
+
+    def runTest(self):
+        self.run_basic_tests()
+        self.run_udt_tests()
+        self.run_pickle_tests()
+
+    def run_basic_tests(self):
+        from .core import topology, unconnected, ring
+        t = topology()
+        self.assertTrue(t.is_(unconnected))
+        self.assertFalse(t.is_(ring))
+        self.assertTrue(t.extract(ring) is None)
+        self.assertRaises(TypeError, lambda: t.extract(1))
+        self.assertEqual(t.get_name(), "Unconnected")
+        self.assertEqual(t.get_extra_info(), "")
+        t.push_back(3)
+        ids, w = t.get_connections(2)
+        self.assertEqual(len(ids), 0)
+        self.assertEqual(len(w), 0)
+        self.assertTrue("Topology name: Unconnected" in repr(t))
+        # Construction from a non-UDT.
+        self.assertRaises(TypeError, lambda: topology(1))
+
+    def run_udt_tests(self):
+        from .core import topology, ring, fully_connected, random_k_regular, free_form
+        t = topology(ring(4, .5))
+        self.assertTrue(t.is_(ring))
+        self.assertEqual(t.extract(ring).num_vertices(), 4)
+        self.assertEqual(t.extract(ring).get_weight(), .5)
+        ids, w = t.get_connections(0)
+        self.assertEqual(sorted(list(ids)), [1, 3])
+        self.assertEqual(list(w), [.5, .5])
+        t.push_back()
+        self.assertEqual(t.extract(ring).num_vertices(), 5)
+        self.assertRaises(ValueError, lambda: ring(2, 2.))
+        t = topology(fully_connected(n=3))
+        ids, w = t.get_connections(1)
+        self.assertEqual(sorted(list(ids)), [0, 2])
+        self.assertEqual(list(w), [1., 1.])
+        t = topology(random_k_regular(2, 10, 1., 42))
+        self.assertEqual(t.extract(random_k_regular).get_seed(), 42)
+        for i in range(10):
+            ids, w = t.get_connections(i)
+            self.assertEqual(len(ids), 2)
+            self.assertFalse(i in ids)
+        ff = free_form(3)
+        ff.add_edge(0, 1)
+        ff.add_edge(2, 1, .25)
+        self.assertRaises(ValueError, lambda: ff.add_edge(1, 1))
+        self.assertRaises(ValueError, lambda: ff.add_edge(0, 3))
+        t = topology(ff)
+        ids, w = t.get_connections(1)
+        self.assertEqual(list(ids), [0, 2])
+        self.assertEqual(list(w), [1., .25])
+        self.assertEqual(len(t.get_connections(0)[0]), 0)
+
+    def run_pickle_tests(self):
+        from .core import topology, ring
+        from pickle import dumps, loads
+        from copy import copy, deepcopy
+        t = topology(ring(3, .75))
+        for t2 in [loads(dumps(t)), copy(t), deepcopy(t)]:
+            self.assertTrue(t2.is_(ring))
+            self.assertEqual(repr(t2), repr(t))
+
+
+class policies_test_case(_ut.TestCase):
+    """Test case for the migration policies.
+
+    """
+
+    def runTest(self):
+        from .core import s_policy, r_policy, select_best, fair_replace
+        from pickle import dumps, loads
+        s = s_policy()
+        self.assertTrue(s.is_(select_best))
+        self.assertFalse(s.is_(fair_replace))
+        self.assertEqual(s.get_name(), "Select best")
+        self.assertEqual(s.extract(select_best).get_rate(), 1.)
+        self.assertFalse(s.extract(select_best).is_fractional())
+        s = s_policy(select_best(.5))
+        self.assertTrue(s.extract(select_best).is_fractional())
+        self.assertEqual(s.extract(select_best).get_rate(), .5)
+        self.assertTrue("Fractional migration rate" in s.get_extra_info())
+        s = s_policy(select_best(rate=3))
+        self.assertFalse(s.extract(select_best).is_fractional())
+        self.assertEqual(s.extract(select_best).get_rate(), 3.)
+        self.assertTrue("Selection policy name: Select best" in repr(s))
+        self.assertEqual(repr(loads(dumps(s))), repr(s))
+        self.assertRaises(ValueError, lambda: select_best(-1))
+        self.assertRaises(ValueError, lambda: select_best(1.5))
+        self.assertRaises(TypeError, lambda: select_best("1"))
+
+        r = r_policy()
+        self.assertTrue(r.is_(fair_replace))
+        self.assertEqual(r.get_name(), "Fair replace")
+        r = r_policy(fair_replace(.25))
+        self.assertTrue(r.extract(fair_replace).is_fractional())
+        self.assertTrue("Replacement policy name: Fair replace" in repr(r))
+        self.assertEqual(repr(loads(dumps(r))), repr(r))
+        self.assertRaises(ValueError, lambda: fair_replace(-2))
+        self.assertRaises(ValueError, lambda: fair_replace(float("nan")))
+        self.assertRaises(TypeError, lambda: fair_replace([]))
+
+
+class archipelago_migration_test_case(_ut.TestCase):
+    """Test case for the migration in :class:`~pygmo.archipelago`.
+
+    """
+
+    def runTest(self):
+        self.run_setters_tests()
+        self.run_migration_tests()
+
+    def run_setters_tests(self):
+        from .core import archipelago, topology, unconnected, ring, select_best, fair_replace, s_policy, r_policy
+        a = archipelago()
+        self.assertTrue(a.get_topology().is_(unconnected))
+        self.assertTrue(a.get_s_policy().is_(select_best))
+        self.assertTrue(a.get_r_policy().is_(fair_replace))
+        self.assertEqual(a.get_migrants_db(), [])
+        a.set_topology(ring())
+        self.assertTrue(a.get_topology().is_(ring))
+        a.set_topology(topology(unconnected()))
+        self.assertTrue(a.get_topology().is_(unconnected))
+        a.set_s_policy(select_best(.5))
+        self.assertTrue(a.get_s_policy().extract(select_best).is_fractional())
+        a.set_s_policy(s_policy(select_best(2)))
+        self.assertEqual(a.get_s_policy().extract(select_best).get_rate(), 2.)
+        a.set_r_policy(fair_replace(.5))
+        self.assertTrue(a.get_r_policy().extract(fair_replace).is_fractional())
+        a.set_r_policy(r_policy(fair_replace(2)))
+        self.assertEqual(a.get_r_policy().extract(fair_replace).get_rate(), 2.)
+        self.assertRaises(TypeError, lambda: a.set_topology(select_best()))
+        self.assertRaises(TypeError, lambda: a.set_s_policy(1))
+        self.assertRaises(TypeError, lambda: a.set_r_policy(ring()))
+
+    def run_migration_tests(self):
+        from .core import archipelago, ring, de, rosenbrock, thread_island
+        from pickle import dumps, loads
+        a = archipelago()
+        a.set_topology(ring())
+        for _ in range(4):
+            a.push_back(algo=de(2), prob=rosenbrock(), size=10,
+                        udi=thread_island())
+        self.assertEqual(a.get_topology().extract(ring).num_vertices(), 4)
+        a.evolve(5)
+        a.wait_check()
+        db = a.get_migrants_db()
+        self.assertEqual(len(db), 4)
+        for i, (ids, xs, fs) in enumerate(db):
+            self.assertEqual(ids.shape, (1,))
+            self.assertEqual(xs.shape, (1, 2))
+            self.assertEqual(fs.shape, (1, 1))
+            # The emigrant is the best individual of the island's population
+            # at the time of emigration, so it cannot be worse than the current champion.
+            self.assertTrue(a[i].get_population().champion_f[0] <= fs[0][0])
+        a2 = loads(dumps(a))
+        self.assertTrue(a2.get_topology().is_(ring))
+        self.assertEqual(len(a2.get_migrants_db()), 4)
+        self.assertEqual(repr(a2), repr(a))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 PaGMO development team
+#
+# This file is part of the PaGMO library.
+#
+# The PaGMO library is free software; you can redistribute it and/or modify
+# it under the terms of either:
+#
+#   * the GNU Lesser General Public License as published by the Free
+#     Software Foundation; either version 3 of the License, or (at your
+#     option) any later version.
+#
+# or
+#
+#   * the GNU General Public License as published by the Free Software
+#     Foundation; either version 3 of the License, or (at your option) any
+#     later version.
+#
+# or both in parallel, as here.
+#
+# The PaGMO library is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+# for more details.
+#
+# You should have received copies of the GNU General Public License and the
+# GNU Lesser General Public License along with the PaGMO library.  If not,
+# see https://www.gnu.org/licenses/.
+
+# for python 2.0 compatibility
+from __future__ import absolute_import as _ai
+
+from .core import topology, s_policy, r_policy
+
+
+def _make_extract(descr, attr):
+    def _extract(self, t):
+        if not isinstance(t, type):
+            raise TypeError("the 't' parameter must be a type")
+        if hasattr(t, attr):
+            return self._cpp_extract(t())
+        # Only the C++ user-defined objects are supported.
+        return None
+
+    _extract.__doc__ = """Extract user-defined {0} instance.
+
+    If *t* is the same type of the user-defined {0} used to construct this {0}, then a reference to
+    the internal user-defined {0} will be returned. Otherwise, ``None`` will be returned.
+
+    Args:
+        t (``type``): the type of the user-defined {0} to extract
+
+    Returns:
+        a reference to the internal user-defined {0} if it is of type *t*, or ``None`` otherwise
+
+    Raises:
+        TypeError: if *t* is not a type
+
+    """.format(descr)
+    return _extract
+
+
+def _make_is(descr):
+    def _is(self, t):
+        return not self.extract(t) is None
+
+    _is.__doc__ = """Check the type of the user-defined {0} instance.
+
+    If *t* is the same type of the user-defined {0} used to construct this {0}, then ``True`` will be
+    returned. Otherwise, ``False`` will be returned.
+
+    Args:
+        t (``type``): the type of the user-defined {0} to extract
+
+    Returns:
+        ``bool``: whether the user-defined {0} is of type *t* or not
+
+    Raises:
+        TypeError: if *t* is not a type
+
+    """.format(descr)
+    return _is
+
+
+setattr(topology, "extract", _make_extract("topology", "_pygmo_cpp_topology"))
+setattr(topology, "is_", _make_is("topology"))
+setattr(s_policy, "extract", _make_extract(
+    "selection policy", "_pygmo_cpp_s_policy"))
+setattr(s_policy, "is_", _make_is("selection policy"))
+setattr(r_policy, "extract", _make_extract(
+    "replacement policy", "_pygmo_cpp_r_policy"))
+setattr(r_policy, "is_", _make_is("replacement policy"))
@@ -57,6 +57,7 @@ class problem_test_case(_ut.TestCase):
         self.run_nf_tests()
         self.run_ctol_tests()
         self.run_evals_tests()
+        self.run_batch_fitness_tests()
         self.run_has_gradient_tests()
         self.run_gradient_tests()
         self.run_has_gradient_sparsity_tests()
@@ -783,6 +784,95 @@ class problem_test_case(_ut.TestCase):
         prob = problem(p())
         self.assertEqual(prob.get_nc(), 0)
 
+    def run_batch_fitness_tests(self):
+        from .core import problem
+        from numpy import array, ndarray
+
+        class p(object):
+
+            def get_nobj(self):
+                return 2
+
+            def get_bounds(self):
+                return ([0, 0], [1, 1])
+
+            def fitness(self, a):
+                return [a[0] + a[1], a[0] - a[1]]
+
+        # Fallback on fitness().
+        prob = problem(p())
+        self.assert_(not prob.has_batch_fitness())
+        res = prob.batch_fitness([[1, 2], [3, 4], [5, 7]])
+        self.assertTrue(isinstance(res, ndarray))
+        self.assertEqual(res.shape, (3, 2))
+        self.assert_((res == array([[3, -1], [7, -1], [12, -2]])).all())
+        self.assertEqual(prob.get_fevals(), 3)
+        self.assertEqual(prob.batch_fitness(
+            array([[1., 2.]])).shape, (1, 2))
+        self.assertEqual(prob.get_fevals(), 4)
+        self.assertRaises(ValueError, lambda: prob.batch_fitness(
+            [[1, 2, 3], [3, 4, 5]]))
+        self.assertRaises(ValueError, lambda: prob.batch_fitness([1, 2]))
+
+        class p(object):
+
+            def get_nobj(self):
+                return 2
+
+            def get_bounds(self):
+                return ([0, 0], [1, 1])
+
+            def fitness(self, a):
+                return [a[0] + a[1], a[0] - a[1]]
+
+            def batch_fitness(self, dvs):
+                assert(isinstance(dvs, ndarray))
+                assert(dvs.ndim == 2)
+                return array([dvs[:, 0] + dvs[:, 1], dvs[:, 0] - dvs[:, 1]]).T
+
+        prob = problem(p())
+        self.assert_(prob.has_batch_fitness())
+        res = prob.batch_fitness(array([[1, 2], [3, 4], [5, 7]]))
+        self.assert_((res == array([[3, -1], [7, -1], [12, -2]])).all())
+        self.assertEqual(prob.get_fevals(), 3)
+        self.assert_((prob.batch_fitness([[1, 2]])[0] ==
+                      prob.fitness([1, 2])).all())
+        self.assertEqual(prob.get_fevals(), 5)
+
+        class p(object):
+
+            def get_bounds(self):
+                return ([0, 0], [1, 1])
+
+            def fitness(self, a):
+                return [42]
+
+            def batch_fitness(self, dvs):
+                return [[42]]
+
+        # Wrong number of returned fitness vectors.
+        self.assert_(problem(p()).has_batch_fitness())
+        self.assertRaises(ValueError, lambda: problem(
+            p()).batch_fitness([[1, 2], [3, 4]]))
+
+        class p(object):
+
+            def get_bounds(self):
+                return ([0, 0], [1, 1])
+
+            def fitness(self, a):
+                return [42]
+
+            def batch_fitness(self, dvs):
+                return [[42]]
+
+            def has_batch_fitness(self):
+                return False
+
+        self.assert_(not problem(p()).has_batch_fitness())
+        self.assert_((problem(p()).batch_fitness(
+            [[1, 2], [3, 4]]) == array([[42], [42]])).all())
+
     def run_has_gradient_tests(self):
         from .core import problem
 
@@ -1945,6 +2035,78 @@ class problem_test_case(_ut.TestCase):
         self.assertTrue(
             problem(translate(rosenbrock(), [0, 1])).get_thread_safety() == ts.basic)
 
+        # Python UDPs declaring themselves thread-safe.
+        from .core import island, de, population, bfe, thread_bfe, algorithm, archipelago
+        from pickle import dumps, loads
+        import numpy as np
+
+        class ts_p(object):
+
+            def get_bounds(self):
+                return ([-1] * 3, [1] * 3)
+
+            def fitness(self, a):
+                return [np.dot(a, a)]
+
+            def get_thread_safety(self):
+                return ts.basic
+
+        class ts_throw(ts_p):
+
+            def __init__(self, n=0):
+                self.n = n
+
+            def fitness(self, a):
+                # Fail after n evaluations.
+                if self.n == 0:
+                    raise ValueError("fitness failure")
+                self.n -= 1
+                return ts_p.fitness(self, a)
+
+        class ts_wrong(p):
+
+            def get_thread_safety(self):
+                return 1
+
+        self.assertTrue(problem(ts_p()).get_thread_safety() == ts.basic)
+        self.assertTrue(
+            problem(translate(ts_p(), [0] * 3)).get_thread_safety() == ts.basic)
+        self.assertTrue(
+            loads(dumps(problem(ts_p()))).get_thread_safety() == ts.basic)
+        self.assertRaises(TypeError, lambda: problem(ts_wrong()))
+        # Evolution in thread islands.
+        isl = island(algo=de(gen=10), prob=ts_p(), size=20)
+        self.assertTrue("Thread island" in str(isl))
+        isl.evolve(3)
+        isl.wait_check()
+        self.assertEqual(
+            isl.get_population().problem.get_fevals(), 20 + 3 * 10 * 20)
+        archi = archipelago(n=4, algo=de(gen=10), prob=ts_p(), pop_size=20)
+        archi.evolve(2)
+        archi.wait_check()
+        # Errors raised in separate threads.
+        isl = island(algo=de(gen=10), prob=ts_throw(20), size=20)
+        isl.evolve()
+        with self.assertRaises(RuntimeError) as cm:
+            isl.wait_check()
+        self.assertTrue("fitness failure" in str(cm.exception))
+        # Threaded evaluations invoked from the main thread.
+        pop = population(ts_p(), size=50, b=bfe())
+        self.assertTrue(np.allclose(
+            pop.get_f()[:, 0], np.sum(pop.get_x()**2, axis=1)))
+        pop = population(ts_p(), size=50, b=thread_bfe())
+        prob = problem(ts_p())
+        fvs = bfe(thread_bfe())(prob, pop.get_x())
+        self.assertTrue(np.allclose(fvs, pop.get_f()))
+        self.assertEqual(prob.get_fevals(), 50)
+        pop.batch_push_back(pop.get_x(), thread_bfe())
+        self.assertEqual(len(pop), 100)
+        pop = algorithm(de(gen=10)).evolve(population(ts_p(), size=20))
+        self.assertEqual(pop.problem.get_fevals(), 20 + 10 * 20)
+        with self.assertRaises(RuntimeError) as cm:
+            population(ts_throw(), size=50, b=thread_bfe())
+        self.assertTrue("fitness failure" in str(cm.exception))
+
     def run_pickle_test(self):
         from .core import problem, rosenbrock, translate
         from pickle import dumps, loads
@@ -1969,6 +2131,9 @@ class problem_test_case(_ut.TestCase):
         self.assertEqual(p.get_nobj(), 1)
         self.assertEqual(p.get_nx(), 2)
         self.assertTrue(p.is_(_prob))
+        # The methods of the UDP must be usable after deserialisation.
+        self.assertEqual(list(p.fitness([.5, .5])), [42.])
+        self.assertEqual(p.batch_fitness([[.5, .5], [.1, .1]]).tolist(), [[42.], [42.]])
         p = problem(translate(_prob(), [.1] * 2))
         p = loads(dumps(p))
         self.assertEqual(repr(p), repr(problem(translate(_prob(), [.1] * 2))))
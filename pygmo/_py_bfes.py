@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 PaGMO development team
+#
+# This file is part of the PaGMO library.
+#
+# The PaGMO library is free software; you can redistribute it and/or modify
+# it under the terms of either:
+#
+#   * the GNU Lesser General Public License as published by the Free
+#     Software Foundation; either version 3 of the License, or (at your
+#     option) any later version.
+#
+# or
+#
+#   * the GNU General Public License as published by the Free Software
+#     Foundation; either version 3 of the License, or (at your option) any
+#     later version.
+#
+# or both in parallel, as here.
+#
+# The PaGMO library is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+# for more details.
+#
+# You should have received copies of the GNU General Public License and the
+# GNU Lesser General Public License along with the PaGMO library.  If not,
+# see https://www.gnu.org/licenses/.
+
+# for python 2.0 compatibility
+from __future__ import absolute_import as _ai
+
+from threading import Lock as _Lock
+
+from ._py_islands import mp_island as _mp_island
+
+
+def _mp_bfe_func(prob, dvs):
+    # The function that is actually run from the separate processes
+    # in mp_bfe.
+    return prob.batch_fitness(dvs)
+
+
+class mp_bfe(object):
+    """Multiprocessing batch fitness evaluator.
+
+    This user-defined batch fitness evaluator (UDBFE) will dispatch the fitness evaluation in batch mode
+    of a set of decision vectors to a pool of processes created via the standard Python multiprocessing module.
+    The input batch of decision vectors is split into chunks, each of which is evaluated in a separate process
+    via the :func:`~pygmo.problem.batch_fitness()` method of the input problem.
+
+    Like the pool of :class:`~pygmo.mp_island`, the pool is shared between different instances of
+    :class:`~pygmo.mp_bfe`, and it is created either implicitly by the construction of the first
+    :class:`~pygmo.mp_bfe` object or explicitly via the :func:`~pygmo.mp_bfe.init_pool()` static method.
+    The default number of processes in the pool is equal to the number of logical CPUs on the
+    current machine. The pool's size can be queried via :func:`~pygmo.mp_bfe.get_pool_size()`,
+    and changed via :func:`~pygmo.mp_bfe.resize_pool()`.
+
+    .. note::
+
+       The same limitations of :class:`~pygmo.mp_island` regarding the initialisation of the pool from a thread
+       different from the main one, and regarding the supported platforms and Python versions, apply to
+       :class:`~pygmo.mp_bfe`. Additionally, :class:`~pygmo.mp_bfe` cannot be used from within the processes
+       of the pool of :class:`~pygmo.mp_island` (as daemonic processes are not allowed to have children).
+
+    """
+    _pool_lock = _Lock()
+    _pool = None
+    _pool_size = None
+
+    def __init__(self, chunksize=None):
+        """
+        Args:
+
+           chunksize(``None`` or an ``int``): if not ``None``, the number of decision vectors that will be sent to
+             each process of the pool in a single task (if ``None``, the input batch will be split evenly
+             between the processes of the pool)
+
+        Raises:
+
+           TypeError: if *chunksize* is not ``None`` and not an ``int``
+           ValueError: if *chunksize* is not ``None`` and not strictly positive
+           unspecified: any exception thrown by :func:`~pygmo.mp_bfe.init_pool()`
+
+        """
+        if chunksize is not None and not isinstance(chunksize, int):
+            raise TypeError(
+                "The 'chunksize' argument must be None or an int")
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError(
+                "The 'chunksize' argument, if not None, must be strictly positive")
+        self._chunksize = chunksize
+        # Init the process pool, if necessary.
+        mp_bfe.init_pool()
+
+    def __call__(self, prob, dvs):
+        """Call operator.
+
+        This method will evaluate in batch mode the fitnesses of the input decision vectors
+        *dvs* using the fitness function from the optimisation problem *prob*. The fitness evaluations
+        are delegated to the processes of the pool backing :class:`~pygmo.mp_bfe`.
+
+        Args:
+
+            prob(:class:`~pygmo.problem`): the input problem
+            dvs(2D array-like object): the input decision vectors, one per row
+
+        Returns:
+            2D NumPy float array: the fitness vectors of *dvs*, one per row
+
+        Raises:
+            ValueError: if *dvs* is not a 2D array
+            unspecified: any exception thrown by the evaluations, by the (de)serialization
+              of the input arguments or of the return value, or by the public interface of the
+              process pool
+
+
+        """
+        import numpy as np
+        dvs = np.asarray(dvs, dtype=float)
+        if dvs.ndim != 2:
+            raise ValueError(
+                "The decision vectors passed to mp_bfe must be provided as a 2D array, but an array with {} "
+                "dimensions was passed instead".format(dvs.ndim))
+        n_dvs = dvs.shape[0]
+        if n_dvs == 0:
+            return np.zeros((0, prob.get_nf()))
+        with mp_bfe._pool_lock:
+            # NOTE: run this while the pool is locked. We have
+            # functions to modify the pool (e.g., resize()) and
+            # we need to make sure we are not trying to touch
+            # the pool while we are sending tasks to it.
+            if self._chunksize is None:
+                n_chunks = min(n_dvs, mp_bfe._pool_size)
+            else:
+                n_chunks = -(-n_dvs // self._chunksize)
+            res = [mp_bfe._pool.apply_async(_mp_bfe_func, (prob, c))
+                   for c in np.array_split(dvs, n_chunks)]
+        # NOTE: the fitness evaluation counter of prob is not updated by the
+        # evaluations in the pool's processes (prob is copied into them). The
+        # counter is updated by pygmo.bfe after this method returns.
+        return np.concatenate([r.get() for r in res])
+
+    def get_name(self):
+        """Name of the evaluator.
+
+        Returns:
+            ``str``: ``"Multiprocessing batch fitness evaluator"``
+
+        """
+        return "Multiprocessing batch fitness evaluator"
+
+    def get_extra_info(self):
+        """Extra info for this evaluator.
+
+        Returns:
+            ``str``: a string specifying the current number of processes in the pool and the chunk size
+
+        """
+        return "\tNumber of processes in the pool: {}\n\tChunk size: {}".format(
+            mp_bfe.get_pool_size(), "auto" if self._chunksize is None else self._chunksize)
+
+    @staticmethod
+    def init_pool(processes=None):
+        """Initialise the process pool.
+
+        This method will initialise the process pool backing :class:`~pygmo.mp_bfe`, if the pool
+        has not been initialised yet. Otherwise, this method will have no effects.
+
+        Args:
+            processes(``None`` or an ``int``): the size of the pool (if ``None``, the size of the pool will be
+              equal to the number of logical CPUs on the system)
+
+        Raises:
+
+            ValueError: if the pool does not exist yet and the function is being called from a thread different
+              from the main one, or if *processes* is a non-positive value
+            RuntimeError: if the current platform or Python version is not supported
+            TypeError: if *processes* is not ``None`` and not an ``int``
+
+        """
+        import sys
+        import os
+        # The mp bfe requires either Windows or at least Python 3.4.
+        if os.name != 'nt' and (sys.version_info[0] < 3 or (sys.version_info[0] == 3 and sys.version_info[1] < 4)):
+            raise RuntimeError(
+                "The multiprocessing batch fitness evaluator is supported only on Windows or on Python >= 3.4.")
+        if processes is not None and not isinstance(processes, int):
+            raise TypeError("The 'processes' argument must be None or an int")
+        if processes is not None and processes <= 0:
+            raise ValueError(
+                "The 'processes' argument, if not None, must be strictly positive")
+        with mp_bfe._pool_lock:
+            if mp_bfe._pool is None:
+                mp_bfe._pool, mp_bfe._pool_size = _mp_island._make_pool(
+                    processes)
+
+    @staticmethod
+    def get_pool_size():
+        """Get the size of the process pool.
+
+        Returns:
+
+            ``int``: the current size of the pool
+
+        """
+        mp_bfe.init_pool()
+        with mp_bfe._pool_lock:
+            return mp_bfe._pool_size
+
+    @staticmethod
+    def resize_pool(processes):
+        """Resize pool.
+
+        This method will resize the process pool backing :class:`~pygmo.mp_bfe`.
+
+        Args:
+
+            processes(``int``): the desired number of processes in the pool
+
+        Raises:
+
+            TypeError: if the *processes* argument is not an ``int``
+            ValueError: if the *processes* argument is not strictly positive
+            unspecified: any exception thrown by :func:`~pygmo.mp_bfe.init_pool()`
+
+        """
+        if not isinstance(processes, int):
+            raise TypeError("The 'processes' argument must be an int")
+        if processes <= 0:
+            raise ValueError(
+                "The 'processes' argument must be strictly positive")
+        mp_bfe.init_pool()
+        with mp_bfe._pool_lock:
+            if processes == mp_bfe._pool_size:
+                # Don't do anything if we are not changing
+                # the size of the pool.
+                return
+            # Create new pool.
+            new_pool, new_size = _mp_island._make_pool(processes)
+            # Stop the current pool.
+            mp_bfe._pool.close()
+            mp_bfe._pool.join()
+            # Assign the new pool.
+            mp_bfe._pool = new_pool
+            mp_bfe._pool_size = new_size
+
+    @staticmethod
+    def _shutdown_pool():
+        # This is used only during the shutdown phase of the pygmo module.
+        with mp_bfe._pool_lock:
+            if mp_bfe._pool is not None:
+                mp_bfe._pool.close()
+                mp_bfe._pool.join()
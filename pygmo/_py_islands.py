@@ -33,6 +33,12 @@ from __future__ import absolute_import as _ai
 
 from threading import Lock as _Lock
 
+try:
+    # NOTE: shared memory is available since Python 3.8.
+    from multiprocessing.shared_memory import SharedMemory as _SharedMemory
+except ImportError:
+    _SharedMemory = None
+
 
 def _evolve_func(algo, pop):
     # The evolve function that is actually run from the separate processes
@@ -40,6 +46,125 @@ def _evolve_func(algo, pop):
     return algo.evolve(pop)
 
 
+# The maximum number of algorithm/problem pairs cached
+# in each process of the pool of mp_island.
+_evolve_cache_size = 8
+# The cache of deserialised algorithm/problem pairs, indexed by the
+# hash of their content. NOTE: this is used only from the processes
+# of the pool of mp_island, one evolution at a time.
+_evolve_cache = None
+# The name of the attribute in which mp_island stores
+# the content hash of a user-defined problem.
+_udp_hash_attr = "_pygmo_mp_island_hash"
+
+
+def _udp_hash(udp):
+    # The content hash of the user-defined problem udp. The hash is computed
+    # upon the first cached evolution of udp in a mp_island and it is then
+    # stored as an attribute of udp, so that the copies of udp made by the island
+    # for the following evolutions re-use it rather than serialising udp again.
+    import hashlib
+    import cloudpickle
+    udp_dict = getattr(udp, "__dict__", None)
+    if udp_dict is not None and _udp_hash_attr in udp_dict:
+        return udp_dict[_udp_hash_attr]
+    retval = hashlib.sha1(cloudpickle.dumps(udp)).hexdigest()
+    if udp_dict is not None:
+        udp_dict[_udp_hash_attr] = retval
+    return retval
+
+
+def _shm_arrays(buf, n, nx, nf):
+    # Views on the decision vectors and on the fitness vectors of a population
+    # of size n stored in the buffer buf of a shared memory block.
+    import numpy as np
+    return np.ndarray((n, nx), buffer=buf), np.ndarray((n, nf), buffer=buf, offset=n * nx * 8)
+
+
+def _attach_shm(name):
+    # Attach to the shared memory block with the given name from
+    # a process of the pool of mp_island.
+    # NOTE: the block is owned by the island which created it, and which
+    # is in charge of unlinking it. The attachment must not be registered
+    # with the resource tracker, otherwise the block would be unlinked (with
+    # a warning about leaked resources) also when the process of the pool exits.
+    try:
+        # NOTE: the track argument is available since Python 3.13.
+        return _SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return _SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _evolve_func_cached(key, state, x, f, seed, shm=None):
+    # The evolve function that is actually run from the separate processes
+    # in mp_island when the caching of the algorithm/problem is enabled.
+    # If state is None, the algorithm and the problem are looked up in the cache
+    # via key. If they are not found, None is returned, and the caller will have
+    # to re-submit the task with the serialised algorithm and problem in state.
+    # If shm is not None, it is a tuple (name, n, nx, nf) describing a shared memory
+    # block from which the population is read (x and f are then ignored), and to which
+    # the evolved population is written back if its size did not change.
+    global _evolve_cache
+    import pickle
+    from collections import OrderedDict
+    from copy import deepcopy
+    from .core import population
+    if _evolve_cache is None:
+        _evolve_cache = OrderedDict()
+    if state is None:
+        if key not in _evolve_cache:
+            return None
+        algo, prob = _evolve_cache.pop(key)
+    else:
+        algo, prob = pickle.loads(state)
+    # (Re)insert the pair as the most recently used one, and
+    # evict the least recently used ones if needed.
+    _evolve_cache[key] = (algo, prob)
+    while len(_evolve_cache) > _evolve_cache_size:
+        _evolve_cache.popitem(last=False)
+    # NOTE: the population stores a copy of the cached problem, and we evolve
+    # with a copy of the cached algorithm: the evolution must not alter the cached
+    # objects, as the original algorithm and problem are never modified by an
+    # evolution in the other islands.
+    pop = population(prob, seed=seed)
+    if shm is None:
+        for xi, fi in zip(x, f):
+            pop.push_back(xi, fi)
+        new_pop = deepcopy(algo).evolve(pop)
+        fevals = new_pop.problem.get_fevals() - prob.get_fevals()
+        return new_pop.get_x(copy=True), new_pop.get_f(copy=True), fevals
+    # NOTE: the block is attached only for the duration of the evolution,
+    # so that its memory is released as soon as the island unlinks it.
+    block = _attach_shm(shm[0])
+    try:
+        x, f = _shm_arrays(block.buf, *shm[1:])
+        for xi, fi in zip(x, f):
+            pop.push_back(xi, fi)
+        new_pop = deepcopy(algo).evolve(pop)
+        fevals = new_pop.problem.get_fevals() - prob.get_fevals()
+        if len(new_pop) == shm[1]:
+            x[:], f[:] = new_pop.get_x(), new_pop.get_f()
+            return None, None, fevals
+        return new_pop.get_x(copy=True), new_pop.get_f(copy=True), fevals
+    finally:
+        # NOTE: the views must be destroyed before closing the block.
+        x = f = xi = fi = None
+        try:
+            block.close()
+        except BufferError:
+            # NOTE: this can happen only if views on the block are still
+            # alive (e.g., in the traceback of an exception). The memory
+            # will be released when they are garbage collected.
+            pass
+
+
 class _temp_disable_sigint(object):
     # A small helper context class to disable CTRL+C temporarily.
 
@@ -80,21 +205,97 @@ class mp_island(object):
        This island type is supported only on Windows or if the Python version is at least 3.4. Attempting to use
        this class on non-Windows platforms with a Python version earlier than 3.4 will raise an error.
 
+    By default, the algorithm and the population (including the problem) are serialised and sent to the pool
+    at every evolution. If the island is constructed with *use_cache* set to ``True`` and the problem is a pythonic
+    one, the processes of the pool will instead keep a cache of the deserialised algorithms and problems, indexed by
+    a hash of their content, and later evolutions will send to the pool only the hash, the decision vectors and
+    the fitness vectors of the population. The algorithm and the problem are then serialised and sent
+    to a process only when they are not already in its cache. This avoids the cost of repeatedly transferring
+    and deserialising problems which store large amounts of data. Additionally, on Python 3.8 and later versions,
+    the decision and fitness vectors are exchanged with the pool through a shared memory block, which is allocated
+    by the island upon the first evolution and re-used by the following ones (it is re-allocated only if the
+    population grows, and it is destroyed together with the island). The processes of the pool read the population
+    from the block and write the evolved population back into it, without pickling the vectors.
+
+    The hash of the problem is computed by serialising the problem upon its first evolution in the island, and it
+    is then stored in the user-defined problem (and in its copies), so that the following evolutions do not
+    serialise the problem again. As a consequence, a user-defined problem modified after having been evolved in
+    a :class:`~pygmo.mp_island` will keep on being identified by its old hash. Problems whose state changes, and
+    problems storing large amounts of data, can instead implement a ``get_cache_token()`` method, returning a small
+    picklable object (e.g., a string or an integer) which identifies their content: the hash is then computed
+    at every evolution from the type of the problem and from the token, and the problem is
+    serialised only upon cache misses. Two problems of the same type returning equal tokens are considered
+    interchangeable, thus a problem whose state changes must return a different token after the change, otherwise
+    the evolutions will keep on using the previous state cached in the pool.
+
+    .. note::
+
+       When the cache is used, the evolved population is obtained by updating the decision and fitness vectors of
+       the original population, whose problem is not replaced by the problem used during the evolution. As a
+       consequence, the individuals keep their IDs, the counter of fitness evaluations of the problem is increased
+       by the number of evaluations performed during the evolution, while the counters of gradient and hessians
+       evaluations and the state of the user-defined problem are not updated.
+
     """
     _pool_lock = _Lock()
     _pool = None
     _pool_size = None
 
-    def __init__(self):
+    def __init__(self, use_cache=False):
         """
+        Args:
+
+           use_cache(``bool``): whether the processes of the pool should cache the algorithm and the problem
+             across evolutions
+
         Raises:
 
+           TypeError: if *use_cache* is not a ``bool``
            unspecified: any exception thrown by :func:`~pygmo.mp_island.init_pool()`
 
         """
+        if not isinstance(use_cache, bool):
+            raise TypeError("The 'use_cache' argument must be a bool")
+        self._use_cache = use_cache
+        # The shared memory block used to exchange the populations
+        # with the pool (allocated upon the first cached evolution).
+        self._shm = None
         # Init the process pool, if necessary.
         mp_island.init_pool()
 
+    def __del__(self):
+        self._release_shm()
+
+    def __getstate__(self):
+        # NOTE: the shared memory block is never copied or pickled,
+        # each copy of the island allocates its own.
+        return {"_use_cache": self._use_cache}
+
+    def __setstate__(self, state):
+        self._use_cache = state["_use_cache"]
+        self._shm = None
+
+    def _release_shm(self):
+        # Close and destroy the shared memory block, if any.
+        shm, self._shm = getattr(self, "_shm", None), None
+        if shm is not None:
+            try:
+                shm.close()
+            except BufferError:
+                # NOTE: this can happen only if views on the block are still
+                # alive (e.g., in the traceback of an exception). The memory
+                # will be released when they are garbage collected.
+                pass
+            shm.unlink()
+
+    def _get_shm(self, size):
+        # Get a shared memory block of at least size bytes,
+        # (re-)allocating it if necessary.
+        if self._shm is None or self._shm.size < size:
+            self._release_shm()
+            self._shm = _SharedMemory(create=True, size=size)
+        return self._shm
+
     def run_evolve(self, algo, pop):
         """Evolve population.
 
@@ -116,16 +317,80 @@ class mp_island(object):
 
 
         """
-        with mp_island._pool_lock:
-            # NOTE: run this while the pool is locked. We have
-            # functions to modify the pool (e.g., resize()) and
-            # we need to make sure we are not trying to touch
-            # the pool while we are sending tasks to it.
-            res = mp_island._pool.apply_async(_evolve_func, (algo, pop))
+        if self._use_cache:
+            udp = pop.problem._py_udp()
+            # NOTE: the cache is used only for pythonic problems. C++ problems
+            # are cheap to serialise, and C++ meta-problems store the evaluation
+            # counters of the inner problems, which would spoil the content hash.
+            if udp is not None:
+                return self._run_evolve_cached(algo, pop, udp)
         # NOTE: there might be a bug in need of a workaround lurking in here:
         # http://stackoverflow.com/questions/11312525/catch-ctrlc-sigint-and-exit-multiprocesses-gracefully-in-python
         # Just keep it in mind.
-        return res.get()
+        return mp_island._submit(_evolve_func, (algo, pop)).get()
+
+    def _run_evolve_cached(self, algo, pop, udp):
+        # Evolve pop with algo while caching algo and the problem
+        # of pop in the processes of the pool.
+        import hashlib
+        import pickle
+        import cloudpickle
+        prob = pop.problem
+        # NOTE: the hash is computed from the user-defined problem rather than from
+        # prob, because the evaluation counters stored in prob change at every evolution.
+        # The constraints tolerance is the only other state of prob not determined by the UDP.
+        # NOTE: the UDP received here is always a fresh deep copy of the UDP stored
+        # in the island, hence its identity cannot be used to avoid serialising it.
+        # Its content hash is thus stored in the UDP itself, and it travels with
+        # its copies. If the UDP provides a cache token, the token identifies its
+        # content instead.
+        get_token = getattr(udp, "get_cache_token", None)
+        if get_token is None:
+            udp_key = _udp_hash(udp)
+        else:
+            udp_t = type(udp)
+            udp_key = (udp_t.__module__, getattr(
+                udp_t, "__qualname__", udp_t.__name__), get_token())
+        key = hashlib.sha1(cloudpickle.dumps(
+            (algo, udp_key, prob.c_tol.tolist()))).hexdigest()
+        n, nx, nf = len(pop), prob.get_nx(), prob.get_nf()
+        if _SharedMemory is not None and n * (nx + nf) > 0:
+            shm = self._get_shm(n * (nx + nf) * 8)
+            x, f = _shm_arrays(shm.buf, n, nx, nf)
+            x[:], f[:] = pop.get_x(), pop.get_f()
+            # NOTE: the views must not outlive this function, otherwise
+            # the block could not be closed.
+            del x, f
+            args = [key, None, None, None, pop.get_seed(), (shm.name, n, nx, nf)]
+        else:
+            shm = None
+            args = [key, None, pop.get_x(), pop.get_f(), pop.get_seed()]
+        res = mp_island._submit(_evolve_func_cached, tuple(args)).get()
+        if res is None:
+            # Cache miss in the process which received the task: re-submit it,
+            # this time with the serialised algorithm and problem.
+            args[1] = pickle.dumps((algo, prob))
+            res = mp_island._submit(_evolve_func_cached, tuple(args)).get()
+        x, f, fevals = res
+        prob.increment_fevals(fevals)
+        if x is None:
+            # The evolved population was written into the shared memory block.
+            x, f = _shm_arrays(shm.buf, n, nx, nf)
+            for i in range(n):
+                pop.set_xf(i, x[i], f[i])
+            del x, f
+            return pop
+        if len(x) == len(pop):
+            for i, (xi, fi) in enumerate(zip(x, f)):
+                pop.set_xf(i, xi, fi)
+            return pop
+        # NOTE: if the algorithm changed the size of the population, we
+        # need to assemble a new one.
+        from .core import population
+        new_pop = population(prob, seed=pop.get_seed())
+        for xi, fi in zip(x, f):
+            new_pop.push_back(xi, fi)
+        return new_pop
 
     def get_name(self):
         """Island's name.
@@ -140,10 +405,22 @@ class mp_island(object):
         """Island's extra info.
 
         Returns:
-            ``str``: a string specifying the current number of processes in the pool
+            ``str``: a string specifying the current number of processes in the pool, and whether the
+            caching of the algorithm and problem is enabled
 
         """
-        return "\tNumber of processes in the pool: {}".format(mp_island.get_pool_size())
+        return "\tNumber of processes in the pool: {}\n\tCaching of the algorithm and problem: {}".format(
+            mp_island.get_pool_size(), "enabled" if self._use_cache else "disabled")
+
+    @staticmethod
+    def _submit(func, args):
+        # Submit an asynchronous task to the pool.
+        with mp_island._pool_lock:
+            # NOTE: run this while the pool is locked. We have
+            # functions to modify the pool (e.g., resize()) and
+            # we need to make sure we are not trying to touch
+            # the pool while we are sending tasks to it.
+            return mp_island._pool.apply_async(func, args)
 
     @staticmethod
     def _make_pool(processes):
@@ -45,6 +45,7 @@ see https://www.gnu.org/licenses/. */
 #include <boost/python/module.hpp>
 #include <boost/python/object.hpp>
 #include <boost/python/stl_iterator.hpp>
+#include <boost/python/str.hpp>
 #include <boost/python/tuple.hpp>
 #include <cassert>
 #include <cstddef>
@@ -223,6 +224,76 @@ inline bp::object vv_to_a(const std::vector<std::vector<T>> &v)
     return retval;
 }
 
+// Convert a vector of arithmetic types, representing a row-major matrix with ncols columns,
+// into a 2D numpy array.
+template <typename T>
+using v_to_2d_a_enabler = pagmo::enable_if_t<std::is_arithmetic<T>::value, int>;
+
+template <typename T, v_to_2d_a_enabler<T> = 0>
+inline bp::object v_to_2d_a(const std::vector<T> &v, typename std::vector<T>::size_type ncols)
+{
+    if (!ncols || v.size() % ncols) {
+        pygmo_throw(PyExc_ValueError, ("cannot convert a vector of size " + std::to_string(v.size())
+                                       + " to a NumPy 2D array with " + std::to_string(ncols) + " columns")
+                                          .c_str());
+    }
+    // The dimensions of the array to be created.
+    npy_intp dims[] = {boost::numeric_cast<npy_intp>(v.size() / ncols), boost::numeric_cast<npy_intp>(ncols)};
+    // Attempt creating the array.
+    PyObject *ret = PyArray_SimpleNew(2, dims, cpp_npy<T>::value);
+    if (!ret) {
+        pygmo_throw(PyExc_RuntimeError, "couldn't create a NumPy array: the 'PyArray_SimpleNew()' function failed");
+    }
+    // Hand over to BP for exception-safe behaviour.
+    bp::object retval{bp::handle<>(ret)};
+    if (v.size()) {
+        // The data is already in row-major order, copy it over in one go.
+        std::copy(v.begin(), v.end(), static_cast<T *>(PyArray_DATA((PyArrayObject *)(ret))));
+    }
+    return retval;
+}
+
+// Create a read-only NumPy array viewing the contiguous storage of v without copying it.
+// ncols == 0 results in a 1D array, otherwise a 2D array with ncols columns is created.
+// The array will keep base alive, and base must in turn keep v alive and unmodified
+// for as long as it lives.
+template <typename T, v_to_a_enabler<T> = 0>
+inline bp::object v_to_view(const std::vector<T> &v, const bp::object &base,
+                            typename std::vector<T>::size_type ncols = 0u)
+{
+    if (ncols && v.size() % ncols) {
+        pygmo_throw(PyExc_ValueError, ("cannot create a view of a vector of size " + std::to_string(v.size())
+                                       + " as a NumPy 2D array with " + std::to_string(ncols) + " columns")
+                                          .c_str());
+    }
+    const int ndim = ncols ? 2 : 1;
+    npy_intp dims[]
+        = {boost::numeric_cast<npy_intp>(ncols ? v.size() / ncols : v.size()), boost::numeric_cast<npy_intp>(ncols)};
+    if (v.empty()) {
+        // Nothing to share, just return an empty read-only array.
+        PyObject *ret = PyArray_SimpleNew(ndim, dims, cpp_npy<T>::value);
+        if (!ret) {
+            pygmo_throw(PyExc_RuntimeError, "couldn't create a NumPy array: the 'PyArray_SimpleNew()' function failed");
+        }
+        PyArray_CLEARFLAGS((PyArrayObject *)(ret), NPY_ARRAY_WRITEABLE);
+        return bp::object(bp::handle<>(ret));
+    }
+    // NOTE: the data is not flagged as writeable, thus the array is read-only.
+    PyObject *ret = PyArray_New(&PyArray_Type, ndim, dims, cpp_npy<T>::value, nullptr, const_cast<T *>(v.data()), 0,
+                                NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_ALIGNED, nullptr);
+    if (!ret) {
+        pygmo_throw(PyExc_RuntimeError, "couldn't create a NumPy array: the 'PyArray_New()' function failed");
+    }
+    // Hand over to BP for exception-safe behaviour.
+    bp::object retval{bp::handle<>(ret)};
+    // NOTE: PyArray_SetBaseObject() steals a reference to base, also on failure.
+    Py_INCREF(base.ptr());
+    if (PyArray_SetBaseObject((PyArrayObject *)(ret), base.ptr())) {
+        bp::throw_error_already_set();
+    }
+    return retval;
+}
+
 // isinstance wrapper.
 inline bool isinstance(const bp::object &o, const bp::object &t)
 {
@@ -245,7 +316,9 @@ inline pagmo::vector_double ad_to_vd(PyArrayObject *o)
                      + std::to_string(PyArray_NDIM(o)) + " instead")
                         .c_str());
     }
-    if (PyArray_STRIDES(o)[0] != sizeof(double)) {
+    // NOTE: the stride of arrays with less than 2 elements is irrelevant,
+    // and NumPy does not guarantee any particular value for it.
+    if (PyArray_SHAPE(o)[0] > 1 && PyArray_STRIDES(o)[0] != sizeof(double)) {
         pygmo_throw(PyExc_RuntimeError,
                     ("cannot convert NumPy array to a vector of doubles: "
                      "the stride value must be "
@@ -271,26 +344,65 @@ inline pagmo::vector_double ad_to_vd(PyArrayObject *o)
 }
 
 // Convert an arbitrary python object to a vector_double.
+// NOTE: this function sits in the hot path of the fitness evaluation of Python UDPs,
+// thus the type of o is checked directly via the Python and NumPy C APIs.
 inline pagmo::vector_double to_vd(const bp::object &o)
 {
-    bp::object a = bp::import("numpy").attr("ndarray");
-    if (isinstance(o, a)) {
+    PyObject *ptr = o.ptr();
+    if (PyArray_Check(ptr)) {
+        auto arr = (PyArrayObject *)ptr;
+        if (PyArray_TYPE(arr) == NPY_DOUBLE && PyArray_ISCARRAY_RO(arr)) {
+            // Already a well-behaved array of doubles, read it directly.
+            return ad_to_vd(arr);
+        }
         // NOTE: the idea here is that we want to be able to convert
         // from a NumPy array of types other than double. This is useful
         // because one can then create arrays of ints and have them converted
-        // on the fly (e.g., for the bounds). If the array is already a
-        // double-precision array, this function should not do any copy.
-        auto n = PyArray_FROM_OTF(o.ptr(), NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+        // on the fly (e.g., for the bounds).
+        auto n = PyArray_FROM_OTF(ptr, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
         if (!n) {
             bp::throw_error_already_set();
         }
         return ad_to_vd((PyArrayObject *)(bp::object(bp::handle<>(n)).ptr()));
     }
-    // If o is not a numpy array, just try to iterate over it and extract doubles.
+    if (PyList_Check(ptr) || PyTuple_Check(ptr)) {
+        // Lists and tuples: read the items directly, with a shortcut for Python floats.
+        // NOTE: PyFloat_AsDouble() converts anything implementing __float__() or __index__()
+        // (e.g., Python ints and NumPy scalars), and it raises TypeError otherwise.
+        const auto size = PySequence_Fast_GET_SIZE(ptr);
+        PyObject **items = PySequence_Fast_ITEMS(ptr);
+        pagmo::vector_double retval;
+        retval.reserve(boost::numeric_cast<pagmo::vector_double::size_type>(size));
+        for (Py_ssize_t i = 0; i < size; ++i) {
+            if (PyFloat_CheckExact(items[i])) {
+                retval.push_back(PyFloat_AS_DOUBLE(items[i]));
+            } else {
+                const double value = PyFloat_AsDouble(items[i]);
+                if (value == -1. && PyErr_Occurred()) {
+                    bp::throw_error_already_set();
+                }
+                retval.push_back(value);
+            }
+        }
+        return retval;
+    }
+    // Otherwise, just try to iterate over o and extract doubles.
     bp::stl_input_iterator<double> begin(o), end;
     return pagmo::vector_double(begin, end);
 }
 
+// Call the Python callable f with the single argument arg.
+// NOTE: this bypasses the argument conversion machinery of Boost.Python,
+// and it is meant to be used in the hot paths.
+inline bp::object call1(const bp::object &f, const bp::object &arg)
+{
+    PyObject *ret = PyObject_CallFunctionObjArgs(f.ptr(), arg.ptr(), nullptr);
+    if (!ret) {
+        bp::throw_error_already_set();
+    }
+    return bp::object(bp::handle<>(ret));
+}
+
 // Convert a numpy array to a vector of vector_double.
 inline std::vector<pagmo::vector_double> a_to_vvd(PyArrayObject *o)
 {
@@ -329,16 +441,14 @@ inline std::vector<pagmo::vector_double> a_to_vvd(PyArrayObject *o)
 // Convert an arbitrary Python object to a vector of vector_double.
 inline std::vector<pagmo::vector_double> to_vvd(const bp::object &o)
 {
-    bp::object l = builtin().attr("list");
-    bp::object a = bp::import("numpy").attr("ndarray");
-    if (isinstance(o, l)) {
+    if (PyList_Check(o.ptr())) {
         bp::stl_input_iterator<bp::object> begin(o), end;
         std::vector<pagmo::vector_double> retval;
         for (; begin != end; ++begin) {
             retval.push_back(to_vd(*begin));
         }
         return retval;
-    } else if (isinstance(o, a)) {
+    } else if (PyArray_Check(o.ptr())) {
         auto n = PyArray_FROM_OTF(o.ptr(), NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
         if (!n) {
             bp::throw_error_already_set();
@@ -353,6 +463,53 @@ inline std::vector<pagmo::vector_double> to_vvd(const bp::object &o)
                     .c_str());
 }
 
+// Convert a 2D numpy array of double to a vector_double containing the rows of the array
+// one after the other.
+inline pagmo::vector_double a_to_flat_vd(PyArrayObject *o)
+{
+    assert(PyArray_TYPE(o) == NPY_DOUBLE);
+    using size_type = pagmo::vector_double::size_type;
+    if (!PyArray_ISCARRAY_RO(o)) {
+        pygmo_throw(PyExc_RuntimeError, "cannot convert NumPy array to a flat vector of doubles: "
+                                        "data must be C-style contiguous, aligned, and in machine byte-order");
+    }
+    if (PyArray_NDIM(o) != 2) {
+        pygmo_throw(PyExc_ValueError, ("cannot convert NumPy array to a flat vector of doubles: "
+                                       "the array must be 2-dimensional, but the dimension is "
+                                       + std::to_string(PyArray_NDIM(o)) + " instead")
+                                          .c_str());
+    }
+    if (PyArray_ITEMSIZE(o) != sizeof(double)) {
+        pygmo_throw(PyExc_RuntimeError, ("cannot convert NumPy array to a flat vector of doubles: "
+                                         "the size of the scalar type must be "
+                                         + std::to_string(sizeof(double)))
+                                            .c_str());
+    }
+    const auto size = boost::numeric_cast<size_type>(PyArray_SIZE(o));
+    if (size) {
+        auto data = static_cast<double *>(PyArray_DATA(o));
+        return pagmo::vector_double(data, data + size);
+    }
+    return pagmo::vector_double{};
+}
+
+// Convert an arbitrary Python object representing a 2D array-like
+// object to a vector_double containing its rows one after the other.
+// The number of rows is written into nrows.
+inline pagmo::vector_double to_flat_vd(const bp::object &o, pagmo::vector_double::size_type &nrows)
+{
+    // NOTE: we let NumPy handle the conversion from any array-like object (e.g., lists of lists).
+    // As in to_vd(), no copy is made here if the input is already a C-contiguous array of doubles.
+    auto n = PyArray_FROM_OTF(o.ptr(), NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    if (!n) {
+        bp::throw_error_already_set();
+    }
+    bp::object bp_n{bp::handle<>(n)};
+    auto retval = a_to_flat_vd((PyArrayObject *)(bp_n.ptr()));
+    nrows = boost::numeric_cast<pagmo::vector_double::size_type>(PyArray_SHAPE((PyArrayObject *)(bp_n.ptr()))[0]);
+    return retval;
+}
+
 // Convert a numpy array to an std::vector<unsigned>.
 inline std::vector<unsigned> a_to_vu(PyArrayObject *o)
 {
@@ -706,6 +863,87 @@ struct gil_thread_ensurer {
     ::PyGILState_STATE m_state;
 };
 
+// Check whether the current thread holds the GIL.
+inline bool gil_held()
+{
+#if PY_MAJOR_VERSION > 3 || (PY_MAJOR_VERSION == 3 && PY_MINOR_VERSION >= 4)
+    return ::PyGILState_Check() != 0;
+#else
+    auto ts = ::PyGILState_GetThisThreadState();
+    return ts && ts == _PyThreadState_Current;
+#endif
+}
+
+// If Python raises any exception in a separate thread (as signalled by a bp::error_already_set exception),
+// the following will
+// happen: the Python error indicator has been set for the *current* thread, but the bp::error_already_set
+// exception will actually *escape* this thread due to the internal exception transport mechanism of
+// std::future. In other words, bp::error_already_set will be re-thrown in a thread which, from the
+// Python side, has no knowledge/information about the Python exception that originated all this, resulting
+// in an unhelpful error message by Boost Python.
+//
+// What we do then is the following: we get the Python exception via PyErr_Fetch(), store its error message in an
+// ad-hoc C++ exception, which will be thrown and then transferred by std::future to the thread that calls
+// wait() on the future.
+// https://docs.python.org/3/c-api/exceptions.html
+//
+// NOTE: we used to have here a more sophisticated system that attempted to transport the exception
+// information for Python into a C++ exception, that would then be translated back to a Python exception via
+// a translator registered in core.cpp. However, managing the lifetime of the exception data turned out to
+// be difficult, with either segfaults in certain situations or memory leaks (if the pointers are never
+// freed). Maybe we can revisit this at one point in the future. The relevant code can be found at the git
+// revision 13a2d254a62dee5d82858595f95babd145e91e94.
+[[noreturn]] inline void handle_thread_py_exception(const std::string &err)
+{
+    // NOTE: my understanding is that this assert should never fail, if we are handling a bp::error_already_set
+    // exception it means a Python exception was generated. However, I have seen snippets of code on the
+    // internet where people do check this flag. Keep this in mind, it should be easy to transform this assert()
+    // in an if/else.
+    assert(::PyErr_Occurred());
+
+    // Small helper to build a bp::object from a raw PyObject ptr.
+    // It assumes that ptr is a new reference, or null. If null, we
+    // return None.
+    auto new_ptr_to_obj = [](::PyObject *ptr) -> bp::object {
+        if (ptr) {
+            return bp::object(bp::handle<>(ptr));
+        }
+        return bp::object();
+    };
+
+    // Fetch the error data that was set by Python: exception type, value and the traceback.
+    ::PyObject *type, *value, *traceback;
+    // PyErr_Fetch() creates new references, and it also clears the error indicator.
+    ::PyErr_Fetch(&type, &value, &traceback);
+    assert(!::PyErr_Occurred());
+    // This normalisation step is apparently needed because sometimes, for some Python-internal reasons,
+    // the values returned by PyErr_Fetch() are “unnormalized” (see the Python documentation for this function).
+    ::PyErr_NormalizeException(&type, &value, &traceback);
+    // Move them into bp::object, so that they are cleaned up at the end of the scope. These are all new
+    // objects.
+    auto tp = new_ptr_to_obj(type);
+    auto v = new_ptr_to_obj(value);
+    auto tb = new_ptr_to_obj(traceback);
+
+    // Try to extract a string description of the exception using the "traceback" module.
+    std::string tmp(err);
+    try {
+        // NOTE: we are about to go back into the Python interpreter. Here Python could throw an exception
+        // and set again the error indicator, which was reset above by PyErr_Fetch(). In case of any issue,
+        // we will give up any attempt of producing a meaningful error message, reset the error indicator,
+        // and throw a pure C++ exception with a generic error message.
+        tmp += bp::extract<std::string>(
+            bp::str("").attr("join")(bp::import("traceback").attr("format_exception")(tp, v, tb)));
+    } catch (const bp::error_already_set &) {
+        // The block above threw from Python. There's not much we can do.
+        ::PyErr_Clear();
+        throw std::runtime_error("While trying to analyze the error message of a Python exception raised in a "
+                                 "separate thread, another Python exception was raised. Giving up now.");
+    }
+    // Throw the C++ exception.
+    throw std::runtime_error(tmp);
+}
+
 #if defined(_MSC_VER)
 
 template <typename T, std::size_t... I>
@@ -71,17 +71,26 @@ see https://www.gnu.org/licenses/. */
 #include <sstream>
 #include <string>
 #include <tuple>
+#include <unordered_map>
 #include <unordered_set>
+#include <utility>
 
 #include <pagmo/algorithm.hpp>
 #include <pagmo/archipelago.hpp>
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
 #include <pagmo/detail/make_unique.hpp>
 #include <pagmo/island.hpp>
 #include <pagmo/population.hpp>
 #include <pagmo/problem.hpp>
+#include <pagmo/r_policy.hpp>
 #include <pagmo/rng.hpp>
+#include <pagmo/s_policy.hpp>
 #include <pagmo/serialization.hpp>
 #include <pagmo/threading.hpp>
+#include <pagmo/topology.hpp>
 #include <pagmo/type_traits.hpp>
 #include <pagmo/utils/gradients_and_hessians.hpp>
 #include <pagmo/utils/hv_algos/hv_algorithm.hpp>
@@ -89,16 +98,22 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/utils/hv_algos/hv_bf_fpras.hpp>
 #include <pagmo/utils/hv_algos/hv_hv2d.hpp>
 #include <pagmo/utils/hv_algos/hv_hv3d.hpp>
+#include <pagmo/utils/hv_algos/hv_hv4d.hpp>
 #include <pagmo/utils/hv_algos/hv_hvwfg.hpp>
+#include <pagmo/utils/hv_archive.hpp>
 #include <pagmo/utils/hypervolume.hpp>
 #include <pagmo/utils/multi_objective.hpp>
 
 #include <pygmo/algorithm.hpp>
+#include <pygmo/bfe.hpp>
 #include <pygmo/common_utils.hpp>
 #include <pygmo/docstrings.hpp>
 #include <pygmo/expose_algorithms.hpp>
+#include <pygmo/expose_bfes.hpp>
 #include <pygmo/expose_islands.hpp>
+#include <pygmo/expose_policies.hpp>
 #include <pygmo/expose_problems.hpp>
+#include <pygmo/expose_topologies.hpp>
 #include <pygmo/island.hpp>
 #include <pygmo/object_serialization.hpp>
 #include <pygmo/problem.hpp>
@@ -139,6 +154,95 @@ std::unique_ptr<bp::class_<pagmo::algorithm>> algorithm_ptr;
 
 // Exposed pagmo::island.
 std::unique_ptr<bp::class_<pagmo::island>> island_ptr;
+
+// Exposed pagmo::bfe.
+std::unique_ptr<bp::class_<pagmo::bfe>> bfe_ptr;
+
+// Exposed pagmo::topology.
+std::unique_ptr<bp::class_<pagmo::topology>> topology_ptr;
+
+// Exposed pagmo::s_policy.
+std::unique_ptr<bp::class_<pagmo::s_policy>> s_policy_ptr;
+
+// Exposed pagmo::r_policy.
+std::unique_ptr<bp::class_<pagmo::r_policy>> r_policy_ptr;
+}
+
+// Owner of the population storage viewed by the NumPy arrays returned by population.get_x(),
+// population.get_f() and population.get_ID(). An owner references the Python population object
+// the views were created from, and it is the base object of the views. If the population is about to be
+// modified while the views are alive, the current storage is moved into the owner and the population
+// continues with a copy (see detach_population_views()). This way the views never dangle, and they
+// always show the data at the time of their creation.
+struct population_view_owner {
+    population_view_owner() = default;
+    population_view_owner(const population_view_owner &) = delete;
+    population_view_owner &operator=(const population_view_owner &) = delete;
+    ~population_view_owner();
+    // The Python population object and the population inside it.
+    bp::object m_pop;
+    population *m_pop_ptr = nullptr;
+    // The storage detached from the population.
+    std::unique_ptr<population> m_storage;
+};
+
+// The registry of the populations with live views, mapped to the Python objects of their owners.
+// NOTE: this is accessed only with the GIL held. It is never destroyed, as owners
+// might still be around when the C++ static objects are destroyed.
+static std::unordered_map<const population *, PyObject *> &population_view_registry()
+{
+    static auto ptr = new std::unordered_map<const population *, PyObject *>;
+    return *ptr;
+}
+
+population_view_owner::~population_view_owner()
+{
+    if (m_pop_ptr) {
+        population_view_registry().erase(m_pop_ptr);
+    }
+}
+
+// The exposed owner class.
+static std::unique_ptr<bp::class_<population_view_owner, boost::noncopyable>> population_view_owner_ptr;
+
+// Get the view owner for the population self, creating it if needed.
+static inline bp::object get_population_view_owner(const bp::object &self)
+{
+    auto &pop = bp::extract<population &>(self)();
+    auto &reg = population_view_registry();
+    const auto it = reg.find(&pop);
+    if (it != reg.end()) {
+        return bp::object(bp::handle<>(bp::borrowed(it->second)));
+    }
+    assert(population_view_owner_ptr);
+    bp::object retval = (*population_view_owner_ptr)();
+    auto &owner = bp::extract<population_view_owner &>(retval)();
+    reg.emplace(&pop, retval.ptr());
+    owner.m_pop = self;
+    owner.m_pop_ptr = &pop;
+    return retval;
+}
+
+// Detach the live views of pop (if any) from its storage. This must be called before
+// any modification of the storage of a population exposed to Python.
+static inline void detach_population_views(population &pop)
+{
+    auto &reg = population_view_registry();
+    const auto it = reg.find(&pop);
+    if (it == reg.end()) {
+        return;
+    }
+    auto &owner = bp::extract<population_view_owner &>(bp::object(bp::handle<>(bp::borrowed(it->second))))();
+    // NOTE: copy first, so that pop is left untouched if the copy fails. The moves
+    // do not throw, and they preserve the storage the views are pointing to.
+    population tmp(pop);
+    owner.m_storage = detail::make_unique<population>(std::move(pop));
+    pop = std::move(tmp);
+    // Give the original problem back to pop.
+    std::swap(pop.get_problem(), owner.m_storage->get_problem());
+    reg.erase(it);
+    owner.m_pop_ptr = nullptr;
+    owner.m_pop = bp::object();
 }
 
 // The cleanup function.
@@ -155,6 +259,16 @@ static inline void cleanup()
     pygmo::algorithm_ptr.reset();
 
     pygmo::island_ptr.reset();
+
+    pygmo::bfe_ptr.reset();
+
+    pygmo::topology_ptr.reset();
+
+    pygmo::s_policy_ptr.reset();
+
+    pygmo::r_policy_ptr.reset();
+
+    population_view_owner_ptr.reset();
 }
 
 // Serialization support for the population class.
@@ -191,6 +305,7 @@ struct population_pickle_suite : bp::pickle_suite {
         std::string s(ptr, ptr + size);
         std::istringstream iss;
         iss.str(s);
+        detach_population_views(pop);
         {
             cereal::PortableBinaryInputArchive iarchive(iss);
             iarchive(pop);
@@ -239,6 +354,65 @@ struct archipelago_pickle_suite : bp::pickle_suite {
     }
 };
 
+// Serialization support for the topology and the migration policies.
+template <typename T>
+struct migration_pickle_suite : bp::pickle_suite {
+    static bp::tuple getstate(const T &x)
+    {
+        std::ostringstream oss;
+        {
+            cereal::PortableBinaryOutputArchive oarchive(oss);
+            oarchive(x);
+        }
+        auto s = oss.str();
+        return bp::make_tuple(pygmo::make_bytes(s.data(), boost::numeric_cast<Py_ssize_t>(s.size())),
+                              pygmo::get_ap_list());
+    }
+    static void setstate(T &x, bp::tuple state)
+    {
+        if (len(state) != 2) {
+            pygmo_throw(PyExc_ValueError, ("the state tuple passed for deserialization "
+                                           "must have 2 elements, but instead it has "
+                                           + std::to_string(len(state)) + " elements")
+                                              .c_str());
+        }
+
+        // Make sure we import all the aps specified in the archive.
+        pygmo::import_aps(bp::list(state[1]));
+
+        auto ptr = PyBytes_AsString(bp::object(state[0]).ptr());
+        if (!ptr) {
+            pygmo_throw(PyExc_TypeError, "a bytes object is needed for deserialization");
+        }
+        const auto size = len(state[0]);
+        std::string s(ptr, ptr + size);
+        std::istringstream iss;
+        iss.str(s);
+        {
+            cereal::PortableBinaryInputArchive iarchive(iss);
+            iarchive(x);
+        }
+    }
+};
+
+// Convert a Python object into a topology or a migration policy. If o is not already an instance
+// of the type-erased class c, o will be passed to the constructor of c.
+template <typename T>
+static inline T to_migration_object(bp::class_<T> &c, const bp::object &o)
+{
+    if (pygmo::isinstance(o, c)) {
+        return bp::extract<T>(o);
+    }
+    return bp::extract<T>(c(o));
+}
+
+// Convert a group of individuals into a tuple of NumPy arrays (IDs, decision vectors, fitness vectors).
+static inline bp::tuple inds_to_tuple(const individuals_group_t &inds)
+{
+    return bp::make_tuple(pygmo::v_to_a(std::get<0>(inds)), pygmo::vv_to_a(std::get<1>(inds)),
+                          pygmo::vv_to_a(std::get<2>(inds)));
+}
+
 // Helper function to test the to_vd functionality.
 static inline bool test_to_vd(const bp::object &o, unsigned n)
 {
@@ -286,6 +460,24 @@ struct py_wait_locks {
     pygmo::gil_releaser gr;
 };
 
+// Release the GIL, if held by the current thread, while running C++ code which might invoke the methods of a
+// thread-safe problem from separate threads (e.g., via a thread_bfe). If the problem is pythonic, its methods
+// acquire the GIL from these threads, which would otherwise wait forever for the GIL held by the current thread.
+// NOTE: this is safe only if thread_safe is true for all the objects involved, because the pythonic objects which
+// are not thread-safe assume that the GIL is held by whoever invokes their methods.
+static inline std::unique_ptr<pygmo::gil_releaser> release_gil_if(bool thread_safe)
+{
+    if (thread_safe && pygmo::gil_held()) {
+        return detail::make_unique<pygmo::gil_releaser>();
+    }
+    return nullptr;
+}
+
+static inline bool is_thread_safe(thread_safety ts)
+{
+    return static_cast<int>(ts) >= static_cast<int>(thread_safety::basic);
+}
+
 // Small helper function to get the max value of unsigned.
 static inline constexpr unsigned max_unsigned()
 {
@@ -330,9 +522,9 @@ BOOST_PYTHON_MODULE(core)
     // Override the default implementation of the island factory.
     detail::island_factory<>::s_func = [](const algorithm &algo, const population &pop,
                                           std::unique_ptr<detail::isl_inner_base> &ptr) {
-        if (static_cast<int>(algo.get_thread_safety()) >= static_cast<int>(thread_safety::basic)
-            && static_cast<int>(pop.get_problem().get_thread_safety()) >= static_cast<int>(thread_safety::basic)) {
-            // Both algo and prob have at least the basic thread safety guarantee. Use the thread island.
+        if (is_thread_safe(algo.get_thread_safety()) && is_thread_safe(pop.get_problem().get_thread_safety())) {
+            // Both algo and prob have at least the basic thread safety guarantee (this includes pythonic
+            // UDPs declaring it via get_thread_safety()). Use the thread island.
             ptr = detail::make_unique<detail::isl_inner<thread_island>>();
         } else {
             // NOTE: here we are re-implementing a piece of code that normally
@@ -353,6 +545,27 @@ BOOST_PYTHON_MODULE(core)
         }
     };
 
+    // Override the default implementation of the default bfe.
+    detail::default_bfe_impl<>::s_func = [](problem &p, const vector_double &dvs) -> vector_double {
+        if (p.has_batch_fitness()) {
+            // The problem provides a batch fitness member function, use it.
+            return member_bfe{}(p, dvs);
+        }
+        if (is_thread_safe(p.get_thread_safety())) {
+            // The problem is thread-safe, use the threaded evaluator.
+            const auto gr = release_gil_if(true);
+            return thread_bfe{}(p, dvs);
+        }
+        // Otherwise (e.g., for pythonic problems), use the multiprocessing evaluator. As in the island factory
+        // above, we construct a GIL ensurer as we might be invoking this code from a separate C++ thread.
+        pygmo::gil_thread_ensurer gte;
+        return bfe{bp::object(bp::import("pygmo").attr("mp_bfe")())}(p, dvs);
+    };
+
+    // Override the default RAII object used during migration. Immigration and emigration might need to
+    // copy and destroy pythonic problems from separate C++ threads, thus we need to make sure we are holding the GIL.
+    detail::migration_raii<>::getter = []() { return std::make_shared<pygmo::gil_thread_ensurer>(); };
+
     // Override the default RAII waiter. We need to use shared_ptr because we don't want to move/copy/destroy
     // the locks when invoking this from island::wait(), we need to instaniate exactly 1 py_wait_lock and have it
     // destroyed at the end of island::wait().
@@ -365,7 +578,10 @@ BOOST_PYTHON_MODULE(core)
     doc_options.disable_py_signatures();
 
     // The thread_safety enum.
-    bp::enum_<thread_safety>("_thread_safety").value("none", thread_safety::none).value("basic", thread_safety::basic);
+    bp::enum_<thread_safety>("_thread_safety")
+        .value("none", thread_safety::none)
+        .value("basic", thread_safety::basic)
+        .value("constant", thread_safety::constant);
 
     // The evolve_status enum.
     bp::enum_<evolve_status>("_evolve_status")
@@ -418,6 +634,15 @@ BOOST_PYTHON_MODULE(core)
     auto islands_module = bp::object(bp::handle<>(bp::borrowed(islands_module_ptr)));
     bp::scope().attr("islands") = islands_module;
 
+    // Create the batch_evaluators submodule.
+    std::string bfes_module_name = bp::extract<std::string>(bp::scope().attr("__name__") + ".batch_evaluators");
+    PyObject *bfes_module_ptr = PyImport_AddModule(bfes_module_name.c_str());
+    if (!bfes_module_ptr) {
+        pygmo_throw(PyExc_RuntimeError, "error while creating the 'batch_evaluators' submodule");
+    }
+    auto bfes_module = bp::object(bp::handle<>(bp::borrowed(bfes_module_ptr)));
+    bp::scope().attr("batch_evaluators") = bfes_module;
+
     // Store the pointers to the classes that can be extended by APs.
     bp::scope().attr("_problem_address") = reinterpret_cast<std::uintptr_t>(&pygmo::problem_ptr);
     bp::scope().attr("_algorithm_address") = reinterpret_cast<std::uintptr_t>(&pygmo::algorithm_ptr);
@@ -442,6 +667,10 @@ BOOST_PYTHON_MODULE(core)
     // Store the address to the list of registered APs.
     bp::scope().attr("_ap_set_address") = reinterpret_cast<std::uintptr_t>(&ap_set);
 
+    // The owner of the population views.
+    population_view_owner_ptr = detail::make_unique<bp::class_<population_view_owner, boost::noncopyable>>(
+        "_population_view_owner", bp::init<>());
+
     // Population class.
     bp::class_<population> pop_class("population", pygmo::population_docstring().c_str(), bp::no_init);
     // Ctors from problem.
@@ -450,6 +679,19 @@ BOOST_PYTHON_MODULE(core)
     // This way we avoid having to expose a different ctor for every exposed C++ prob.
     pop_class.def(bp::init<const problem &, population::size_type>())
         .def(bp::init<const problem &, population::size_type, unsigned>())
+        // Ctors from problem and bfe.
+        .def("__init__", bp::make_constructor(lcast([](const problem &p, const bfe &b, population::size_type size) {
+                                                  const auto gr = release_gil_if(is_thread_safe(p.get_thread_safety()));
+                                                  return ::new population(p, b, size);
+                                              }),
+                                              bp::default_call_policies()))
+        .def("__init__",
+             bp::make_constructor(
+                 lcast([](const problem &p, const bfe &b, population::size_type size, unsigned seed) {
+                     const auto gr = release_gil_if(is_thread_safe(p.get_thread_safety()));
+                     return ::new population(p, b, size, seed);
+                 }),
+                 bp::default_call_policies()))
         // Repr.
         .def(repr(bp::self))
         // Copy and deepcopy.
@@ -457,6 +699,7 @@ BOOST_PYTHON_MODULE(core)
         .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<population>)
         .def_pickle(population_pickle_suite())
         .def("push_back", lcast([](population &pop, const bp::object &x, const bp::object &f) {
+                 detach_population_views(pop);
                  if (f.is_none()) {
                      pop.push_back(pygmo::to_vd(x));
                  } else {
@@ -464,6 +707,30 @@ BOOST_PYTHON_MODULE(core)
                  }
              }),
              pygmo::population_push_back_docstring().c_str(), (bp::arg("x"), bp::arg("f") = bp::object()))
+        .def("batch_push_back", lcast([](population &pop, const bp::object &dvs, const bp::object &b) {
+                 vector_double::size_type nrows;
+                 auto flat_dvs = pygmo::to_flat_vd(dvs, nrows);
+                 const auto nx = pop.get_problem().get_nx();
+                 if (flat_dvs.size() != nrows * nx) {
+                     pygmo_throw(PyExc_ValueError, ("the decision vectors passed to batch_push_back() must be "
+                                                    "provided as a 2D array-like object with "
+                                                    + std::to_string(nx) + " columns")
+                                                       .c_str());
+                 }
+                 detach_population_views(pop);
+                 if (b.is_none()) {
+                     pop.batch_push_back(flat_dvs);
+                 } else {
+                     // Accept both pygmo.bfe objects and user-defined batch fitness evaluators (either
+                     // exposed C++ ones or pythonic ones), which are converted via the pygmo.bfe constructor.
+                     bp::extract<const bfe &> b_ext(b);
+                     bp::object b_obj = b_ext.check() ? b : pygmo::get_bfe_class()(b);
+                     const bfe &b_cpp = bp::extract<const bfe &>(b_obj);
+                     const auto gr = release_gil_if(is_thread_safe(pop.get_problem().get_thread_safety()));
+                     pop.batch_push_back(flat_dvs, b_cpp);
+                 }
+             }),
+             pygmo::population_batch_push_back_docstring().c_str(), (bp::arg("dvs"), bp::arg("b") = bp::object()))
         .def("random_decision_vector",
              lcast([](const population &pop) { return pygmo::v_to_a(pop.random_decision_vector()); }),
              pygmo::population_random_decision_vector_docstring().c_str())
@@ -481,19 +748,35 @@ BOOST_PYTHON_MODULE(core)
              pygmo::population_worst_idx_docstring().c_str())
         .def("__len__", &population::size)
         .def("set_xf", lcast([](population &pop, population::size_type i, const bp::object &x, const bp::object &f) {
+                 detach_population_views(pop);
                  pop.set_xf(i, pygmo::to_vd(x), pygmo::to_vd(f));
              }),
              pygmo::population_set_xf_docstring().c_str())
         .def("set_x", lcast([](population &pop, population::size_type i, const bp::object &x) {
+                 detach_population_views(pop);
                  pop.set_x(i, pygmo::to_vd(x));
              }),
              pygmo::population_set_x_docstring().c_str())
-        .def("get_f", lcast([](const population &pop) { return pygmo::vv_to_a(pop.get_f()); }),
-             pygmo::population_get_f_docstring().c_str())
-        .def("get_x", lcast([](const population &pop) { return pygmo::vv_to_a(pop.get_x()); }),
-             pygmo::population_get_x_docstring().c_str())
-        .def("get_ID", lcast([](const population &pop) { return pygmo::v_to_a(pop.get_ID()); }),
-             pygmo::population_get_ID_docstring().c_str())
+        .def("get_f", lcast([](const bp::object &self, bool copy) {
+                 const auto &pop = bp::extract<const population &>(self)();
+                 const auto nf = pop.get_problem().get_nf();
+                 return copy ? pygmo::v_to_2d_a(pop.get_f_data(), nf)
+                             : pygmo::v_to_view(pop.get_f_data(), get_population_view_owner(self), nf);
+             }),
+             pygmo::population_get_f_docstring().c_str(), (bp::arg("copy") = false))
+        .def("get_x", lcast([](const bp::object &self, bool copy) {
+                 const auto &pop = bp::extract<const population &>(self)();
+                 const auto nx = pop.get_problem().get_nx();
+                 return copy ? pygmo::v_to_2d_a(pop.get_x_data(), nx)
+                             : pygmo::v_to_view(pop.get_x_data(), get_population_view_owner(self), nx);
+             }),
+             pygmo::population_get_x_docstring().c_str(), (bp::arg("copy") = false))
+        .def("get_ID", lcast([](const bp::object &self, bool copy) {
+                 const auto &pop = bp::extract<const population &>(self)();
+                 return copy ? pygmo::v_to_a(pop.get_ID())
+                             : pygmo::v_to_view(pop.get_ID(), get_population_view_owner(self));
+             }),
+             pygmo::population_get_ID_docstring().c_str(), (bp::arg("copy") = false))
         .def("get_seed", &population::get_seed, pygmo::population_get_seed_docstring().c_str());
     pygmo::add_property(pop_class, "champion_x",
                         lcast([](const population &pop) { return pygmo::v_to_a(pop.champion_x()); }),
@@ -518,11 +801,29 @@ BOOST_PYTHON_MODULE(core)
         .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<problem>)
         // Problem extraction.
         .def("_py_extract", &pygmo::generic_py_extract<problem>)
+        // Fetch the pythonic UDP, whatever its type (None if the UDP is a C++ one).
+        .def("_py_udp", lcast([](problem &p) {
+                 auto ptr = p.extract<bp::object>();
+                 return ptr ? *ptr : bp::object{};
+             }))
         // Problem methods.
         .def("fitness", lcast([](const pagmo::problem &p, const bp::object &dv) {
                  return pygmo::v_to_a(p.fitness(pygmo::to_vd(dv)));
              }),
              pygmo::problem_fitness_docstring().c_str(), (bp::arg("dv")))
+        .def("batch_fitness", lcast([](const pagmo::problem &p, const bp::object &dvs) {
+                 vector_double::size_type nrows;
+                 auto flat_dvs = pygmo::to_flat_vd(dvs, nrows);
+                 if (flat_dvs.size() != nrows * p.get_nx()) {
+                     pygmo_throw(PyExc_ValueError, ("the decision vectors passed to batch_fitness() must be "
+                                                    "provided as a 2D array-like object with "
+                                                    + std::to_string(p.get_nx()) + " columns")
+                                                       .c_str());
+                 }
+                 return pygmo::v_to_2d_a(p.batch_fitness(flat_dvs), p.get_nf());
+             }),
+             pygmo::problem_batch_fitness_docstring().c_str(), (bp::arg("dvs")))
+        .def("has_batch_fitness", &problem::has_batch_fitness, pygmo::problem_has_batch_fitness_docstring().c_str())
         .def("get_bounds", lcast([](const pagmo::problem &p) -> bp::tuple {
                  auto retval = p.get_bounds();
                  return bp::make_tuple(pygmo::v_to_a(retval.first), pygmo::v_to_a(retval.second));
@@ -567,6 +868,8 @@ BOOST_PYTHON_MODULE(core)
         .def("get_nic", &problem::get_nic, pygmo::problem_get_nic_docstring().c_str())
         .def("get_nc", &problem::get_nc, pygmo::problem_get_nc_docstring().c_str())
         .def("get_fevals", &problem::get_fevals, pygmo::problem_get_fevals_docstring().c_str())
+        .def("increment_fevals", &problem::increment_fevals, pygmo::problem_increment_fevals_docstring().c_str(),
+             (bp::arg("n")))
         .def("get_gevals", &problem::get_gevals, pygmo::problem_get_gevals_docstring().c_str())
         .def("get_hevals", &problem::get_hevals, pygmo::problem_get_hevals_docstring().c_str())
         .def("set_seed", &problem::set_seed, pygmo::problem_set_seed_docstring().c_str(), (bp::arg("seed")))
@@ -600,7 +903,12 @@ BOOST_PYTHON_MODULE(core)
         // Algorithm extraction.
         .def("_py_extract", &pygmo::generic_py_extract<algorithm>)
         // Algorithm methods.
-        .def("evolve", &algorithm::evolve, pygmo::algorithm_evolve_docstring().c_str(), (bp::arg("pop")))
+        .def("evolve", lcast([](const algorithm &algo, const population &pop) {
+                 const auto gr = release_gil_if(is_thread_safe(algo.get_thread_safety())
+                                                && is_thread_safe(pop.get_problem().get_thread_safety()));
+                 return algo.evolve(pop);
+             }),
+             pygmo::algorithm_evolve_docstring().c_str(), (bp::arg("pop")))
         .def("set_seed", &algorithm::set_seed, pygmo::algorithm_set_seed_docstring().c_str(), (bp::arg("seed")))
         .def("has_set_seed", &algorithm::has_set_seed, pygmo::algorithm_has_set_seed_docstring().c_str())
         .def("set_verbosity", &algorithm::set_verbosity, pygmo::algorithm_set_verbosity_docstring().c_str(),
@@ -679,10 +987,34 @@ BOOST_PYTHON_MODULE(core)
              pygmo::hv_refpoint_docstring().c_str(), (bp::arg("offset") = 0));
     pygmo::add_property(hv_class, "copy_points", &hypervolume::get_copy_points, &hypervolume::set_copy_points);
 
+    // Incremental hypervolume archive.
+    bp::class_<hv_archive>("hv_archive", pygmo::hv_archive_docstring().c_str(), bp::no_init)
+        .def("__init__", bp::make_constructor(lcast([](const bp::object &r_point) {
+                                                  return ::new hv_archive(pygmo::to_vd(r_point));
+                                              }),
+                                              bp::default_call_policies(), (bp::arg("ref_point"))))
+        .def("__len__", &hv_archive::size)
+        .def("insert", lcast([](hv_archive &a, const bp::object &p) { return a.insert(pygmo::to_vd(p)); }),
+             pygmo::hv_archive_insert_docstring().c_str(), (bp::arg("point")))
+        .def("erase", lcast([](hv_archive &a, const bp::object &p) { return a.erase(pygmo::to_vd(p)); }),
+             pygmo::hv_archive_erase_docstring().c_str(), (bp::arg("point")))
+        .def("get_hv", &hv_archive::get_hv, "get_hv()\n\nGet the hypervolume of the archive.\n")
+        .def("get_ref_point", lcast([](const hv_archive &a) { return pygmo::v_to_a(a.get_r_point()); }),
+             "get_ref_point()\n\nGet the reference point of the archive.\n")
+        .def("get_points", lcast([](const hv_archive &a) { return pygmo::vv_to_a(a.get_points()); }),
+             "get_points()\n\nGet the points of the archive, as a 2D NumPy float array.\n")
+        .def("contributions", lcast([](const hv_archive &a) { return pygmo::v_to_a(a.contributions()); }),
+             pygmo::hv_archive_contributions_docstring().c_str())
+        .def("exclusive", lcast([](const hv_archive &a, const bp::object &p) { return a.exclusive(pygmo::to_vd(p)); }),
+             pygmo::hv_archive_exclusive_docstring().c_str(), (bp::arg("point")))
+        .def("least_contributor", lcast([](const hv_archive &a) { return pygmo::v_to_a(a.least_contributor()); }),
+             pygmo::hv_archive_least_contributor_docstring().c_str());
+
     // Hypervolume algorithms
     bp::class_<hv_algorithm, boost::noncopyable>("_hv_algorithm", bp::no_init).def("get_name", &hv_algorithm::get_name);
     bp::class_<hvwfg, bp::bases<hv_algorithm>>("hvwfg", pygmo::hvwfg_docstring().c_str())
-        .def(bp::init<unsigned>((bp::arg("stop_dimension") = 2)));
+        .def(bp::init<unsigned, unsigned>((bp::arg("stop_dimension") = 2, bp::arg("n_threads") = 1)))
+        .def("get_n_threads", &hvwfg::get_n_threads);
     bp::class_<bf_approx, bp::bases<hv_algorithm>>("bf_approx", pygmo::bf_approx_docstring().c_str())
         .def(bp::init<bool, unsigned, double, double, double, double, double, double>(
             (bp::arg("use_exact") = true, bp::arg("trivial_subcase_size") = 1u, bp::arg("eps") = 1e-2,
@@ -691,12 +1023,19 @@ BOOST_PYTHON_MODULE(core)
         .def(bp::init<bool, unsigned, double, double, double, double, double, double, unsigned>(
             (bp::arg("use_exact") = true, bp::arg("trivial_subcase_size") = 1u, bp::arg("eps") = 1e-2,
              bp::arg("delta") = 1e-6, bp::arg("delta_multiplier") = 0.775, bp::arg("alpha") = 0.2,
-             bp::arg("initial_delta_coeff") = 0.1, bp::arg("gamma") = 0.25, bp::arg("seed"))));
+             bp::arg("initial_delta_coeff") = 0.1, bp::arg("gamma") = 0.25, bp::arg("seed"))))
+        .def("set_n_threads", &bf_approx::set_n_threads, pygmo::bf_set_n_threads_docstring("bf_approx").c_str(),
+             (bp::arg("n_threads")))
+        .def("get_n_threads", &bf_approx::get_n_threads, pygmo::bf_get_n_threads_docstring().c_str());
     bp::class_<bf_fpras, bp::bases<hv_algorithm>>("bf_fpras", pygmo::bf_fpras_docstring().c_str())
         .def(bp::init<double, double>((bp::arg("eps") = 1e-2, bp::arg("delta") = 1e-2)))
-        .def(bp::init<double, double, unsigned>((bp::arg("eps") = 1e-2, bp::arg("delta") = 1e-2, bp::arg("seed"))));
+        .def(bp::init<double, double, unsigned>((bp::arg("eps") = 1e-2, bp::arg("delta") = 1e-2, bp::arg("seed"))))
+        .def("set_n_threads", &bf_fpras::set_n_threads, pygmo::bf_set_n_threads_docstring("bf_fpras").c_str(),
+             (bp::arg("n_threads")))
+        .def("get_n_threads", &bf_fpras::get_n_threads, pygmo::bf_get_n_threads_docstring().c_str());
     bp::class_<hv2d, bp::bases<hv_algorithm>>("hv2d", pygmo::hv2d_docstring().c_str(), bp::init<>());
     bp::class_<hv3d, bp::bases<hv_algorithm>>("hv3d", pygmo::hv3d_docstring().c_str(), bp::init<>());
+    bp::class_<hv4d, bp::bases<hv_algorithm>>("hv4d", pygmo::hv4d_docstring().c_str(), bp::init<>());
 
     // Exposition of stand alone functions
     // Multi-objective utilities
@@ -718,6 +1057,17 @@ BOOST_PYTHON_MODULE(core)
                                       pygmo::v_to_a(std::get<3>(fnds)));
             }),
             pygmo::fast_non_dominated_sorting_docstring().c_str(), boost::python::arg("points"));
+    bp::def("non_dominated_sorting", lcast([](const bp::object &x) -> bp::object {
+                auto nds = non_dominated_sorting(pygmo::to_vvd(x));
+                // the non-dominated fronts
+                auto ndf = std::get<0>(nds);
+                bp::list ndf_py;
+                for (const std::vector<vector_double::size_type> &front : ndf) {
+                    ndf_py.append(pygmo::v_to_a(front));
+                }
+                return bp::make_tuple(ndf_py, pygmo::v_to_a(std::get<1>(nds)));
+            }),
+            pygmo::non_dominated_sorting_docstring().c_str(), boost::python::arg("points"));
     bp::def("pareto_dominance", lcast([](const bp::object &obj1, const bp::object &obj2) {
                 return pareto_dominance(pygmo::to_vd(obj1), pygmo::to_vd(obj2));
             }),
@@ -800,6 +1150,10 @@ BOOST_PYTHON_MODULE(core)
     // Global random number generator
     bp::def("set_global_rng_seed", lcast([](unsigned seed) { random_device::set_seed(seed); }),
             pygmo::set_global_rng_seed_docstring().c_str(), bp::arg("seed"));
+    // Island thread pool.
+    bp::def("get_island_pool_size", &get_island_pool_size, pygmo::get_island_pool_size_docstring().c_str());
+    bp::def("set_island_pool_size", &set_island_pool_size, pygmo::set_island_pool_size_docstring().c_str(),
+            bp::arg("n"));
     // Island.
     pygmo::island_ptr
         = detail::make_unique<bp::class_<island>>("island", pygmo::island_docstring().c_str(), bp::init<>());
@@ -832,6 +1186,98 @@ BOOST_PYTHON_MODULE(core)
     // Expose islands.
     pygmo::expose_islands();
 
+    // Bfe.
+    pygmo::bfe_ptr = detail::make_unique<bp::class_<bfe>>("bfe", pygmo::bfe_docstring().c_str(), bp::init<>());
+    auto &bfe_class = pygmo::get_bfe_class();
+    bfe_class.def(bp::init<const bp::object &>((bp::arg("udbfe"))))
+        .def(repr(bp::self))
+        .def_pickle(pygmo::bfe_pickle_suite())
+        // Copy and deepcopy.
+        .def("__copy__", &pygmo::generic_copy_wrapper<bfe>)
+        .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<bfe>)
+        // Bfe extraction.
+        .def("_py_extract", &pygmo::generic_py_extract<bfe>)
+        // Bfe methods.
+        .def("__call__", lcast([](const bfe &b, problem &p, const bp::object &dvs) {
+                 vector_double::size_type nrows;
+                 auto flat_dvs = pygmo::to_flat_vd(dvs, nrows);
+                 if (flat_dvs.size() != nrows * p.get_nx()) {
+                     pygmo_throw(PyExc_ValueError, ("the decision vectors passed to a bfe must be "
+                                                    "provided as a 2D array-like object with "
+                                                    + std::to_string(p.get_nx()) + " columns")
+                                                       .c_str());
+                 }
+                 vector_double fvs;
+                 {
+                     const auto gr = release_gil_if(is_thread_safe(p.get_thread_safety()));
+                     fvs = b(p, flat_dvs);
+                 }
+                 return pygmo::v_to_2d_a(fvs, p.get_nf());
+             }),
+             pygmo::bfe_call_docstring().c_str(), (bp::arg("prob"), bp::arg("dvs")))
+        .def("get_name", &bfe::get_name, pygmo::bfe_get_name_docstring().c_str())
+        .def("get_extra_info", &bfe::get_extra_info, pygmo::bfe_get_extra_info_docstring().c_str())
+        .def("get_thread_safety", &bfe::get_thread_safety, pygmo::bfe_get_thread_safety_docstring().c_str());
+
+    // Expose bfes.
+    pygmo::expose_bfes();
+
+    // Topology.
+    pygmo::topology_ptr
+        = detail::make_unique<bp::class_<topology>>("topology", pygmo::topology_docstring().c_str(), bp::init<>());
+    auto &topology_class = pygmo::get_topology_class();
+    topology_class.def(repr(bp::self))
+        .def_pickle(migration_pickle_suite<topology>())
+        // Copy and deepcopy.
+        .def("__copy__", &pygmo::generic_copy_wrapper<topology>)
+        .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<topology>)
+        // Topology methods.
+        .def("get_connections", lcast([](const topology &t, std::size_t i) {
+                 const auto c = t.get_connections(i);
+                 return bp::make_tuple(pygmo::v_to_a(c.first), pygmo::v_to_a(c.second));
+             }),
+             pygmo::topology_get_connections_docstring().c_str(), bp::arg("i"))
+        .def("push_back", lcast([](topology &t, unsigned n) {
+                 for (unsigned i = 0; i < n; ++i) {
+                     t.push_back();
+                 }
+             }),
+             pygmo::topology_push_back_docstring().c_str(), bp::arg("n") = 1u)
+        .def("get_name", &topology::get_name, pygmo::topology_get_name_docstring().c_str())
+        .def("get_extra_info", &topology::get_extra_info, pygmo::topology_get_extra_info_docstring().c_str());
+
+    // Expose topologies.
+    pygmo::expose_topologies();
+
+    // Selection policy.
+    pygmo::s_policy_ptr
+        = detail::make_unique<bp::class_<s_policy>>("s_policy", pygmo::s_policy_docstring().c_str(), bp::init<>());
+    auto &s_policy_class = pygmo::get_s_policy_class();
+    s_policy_class.def(repr(bp::self))
+        .def_pickle(migration_pickle_suite<s_policy>())
+        // Copy and deepcopy.
+        .def("__copy__", &pygmo::generic_copy_wrapper<s_policy>)
+        .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<s_policy>)
+        // Selection policy methods.
+        .def("get_name", &s_policy::get_name, pygmo::s_policy_get_name_docstring().c_str())
+        .def("get_extra_info", &s_policy::get_extra_info, pygmo::s_policy_get_extra_info_docstring().c_str());
+
+    // Replacement policy.
+    pygmo::r_policy_ptr
+        = detail::make_unique<bp::class_<r_policy>>("r_policy", pygmo::r_policy_docstring().c_str(), bp::init<>());
+    auto &r_policy_class = pygmo::get_r_policy_class();
+    r_policy_class.def(repr(bp::self))
+        .def_pickle(migration_pickle_suite<r_policy>())
+        // Copy and deepcopy.
+        .def("__copy__", &pygmo::generic_copy_wrapper<r_policy>)
+        .def("__deepcopy__", &pygmo::generic_deepcopy_wrapper<r_policy>)
+        // Replacement policy methods.
+        .def("get_name", &r_policy::get_name, pygmo::r_policy_get_name_docstring().c_str())
+        .def("get_extra_info", &r_policy::get_extra_info, pygmo::r_policy_get_extra_info_docstring().c_str());
+
+    // Expose selection and replacement policies.
+    pygmo::expose_policies();
+
     // Archi.
     bp::class_<archipelago> archi_class("archipelago", pygmo::archipelago_docstring().c_str(), bp::init<>());
     archi_class.def(repr(bp::self))
@@ -867,6 +1313,29 @@ BOOST_PYTHON_MODULE(core)
                  }
                  return retval;
              }),
-             pygmo::archipelago_get_champions_x_docstring().c_str());
+             pygmo::archipelago_get_champions_x_docstring().c_str())
+        .def("get_topology", &archipelago::get_topology, pygmo::archipelago_get_topology_docstring().c_str())
+        .def("set_topology", lcast([](archipelago &archi, const bp::object &t) {
+                 archi.set_topology(to_migration_object(pygmo::get_topology_class(), t));
+             }),
+             pygmo::archipelago_set_topology_docstring().c_str(), bp::arg("t"))
+        .def("get_s_policy", &archipelago::get_s_policy, pygmo::archipelago_get_s_policy_docstring().c_str())
+        .def("set_s_policy", lcast([](archipelago &archi, const bp::object &s) {
+                 archi.set_s_policy(to_migration_object(pygmo::get_s_policy_class(), s));
+             }),
+             pygmo::archipelago_set_s_policy_docstring().c_str(), bp::arg("s"))
+        .def("get_r_policy", &archipelago::get_r_policy, pygmo::archipelago_get_r_policy_docstring().c_str())
+        .def("set_r_policy", lcast([](archipelago &archi, const bp::object &r) {
+                 archi.set_r_policy(to_migration_object(pygmo::get_r_policy_class(), r));
+             }),
+             pygmo::archipelago_set_r_policy_docstring().c_str(), bp::arg("r"))
+        .def("get_migrants_db", lcast([](const archipelago &archi) -> bp::list {
+                 bp::list retval;
+                 for (const auto &inds : archi.get_migrants_db()) {
+                     retval.append(inds_to_tuple(inds));
+                 }
+                 return retval;
+             }),
+             pygmo::archipelago_get_migrants_db_docstring().c_str());
     pygmo::add_property(archi_class, "status", &archipelago::status, pygmo::archipelago_status_docstring().c_str());
 }
@@ -78,6 +78,42 @@ Raises:
 )";
 }
 
+std::string population_batch_push_back_docstring()
+{
+    return R"(batch_push_back(dvs, b = None)
+
+Adds many decision vectors (chromosomes) to the population.
+
+This method will append the decision vectors in *dvs* (one per row) to the population, creating new unique identifiers
+for the newly born individuals. The fitnesses of the decision vectors are computed in a single batch, either via
+:func:`pygmo.problem.batch_fitness()` or, if *b* is provided, via the batch fitness evaluator *b*. The latter allows to
+evaluate the decision vectors in parallel, e.g., with a thread pool (:class:`~pygmo.thread_bfe`) or a process pool
+(:class:`~pygmo.mp_bfe`). The outcome is the same as calling :func:`~pygmo.population.push_back()` on each row
+of *dvs* in order.
+
+In case of exceptions, the population will not be altered.
+
+Args:
+    dvs (2D array-like object): the decision vectors to be added to the population
+    b (:class:`~pygmo.bfe` or a user-defined batch fitness evaluator): the batch fitness evaluator that will be
+      used to compute the fitnesses of *dvs* (if ``None``, :func:`pygmo.problem.batch_fitness()` will be used)
+
+Raises:
+    ValueError: if *dvs* is not a 2D array-like object with a number of columns equal to the problem's dimension
+    unspecified: any exception thrown by :func:`pygmo.problem.batch_fitness()`, by the batch fitness evaluator or by
+      failures at the intersection between C++ and Python (e.g., type conversion errors, mismatched function
+      signatures, etc.)
+
+Examples:
+    >>> import pygmo as pg
+    >>> pop = pg.population(pg.rosenbrock(2))
+    >>> pop.batch_push_back([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]], b = pg.thread_bfe())
+    >>> len(pop)
+    3
+
+)";
+}
+
 std::string population_random_decision_vector_docstring()
 {
     return R"(random_decision_vector()
@@ -255,15 +291,24 @@ Returns:
 
 std::string population_get_f_docstring()
 {
-    return R"(get_f()
+    return R"(get_f(copy = False)
 
 This method will return the fitness vectors of the individuals as a 2D NumPy array.
 
 Each row of the returned array represents the fitness vector of the individual at the corresponding position in the
 population.
 
+By default, the returned array is a read-only view sharing the memory of the population, and no data is copied.
+The view keeps the population alive, and it always shows the fitness vectors at the time of its creation: if the population
+is later modified (e.g., via :func:`~pygmo.population.set_xf()` or :func:`~pygmo.population.push_back()`), the
+population will switch to a new copy of its data, leaving the existing views untouched. If *copy* is ``True``,
+a new writeable array will be returned instead.
+
+Args:
+    copy (``bool``): if ``True``, return a deep copy of the fitness vectors rather than a read-only view
+
 Returns:
-    2D NumPy float array: a deep copy of the fitness vectors of the individuals
+    2D NumPy float array: the fitness vectors of the individuals
 
 Raises:
     unspecified: any exception thrown by failures at the intersection between C++ and
@@ -274,15 +319,24 @@ Raises:
 
 std::string population_get_x_docstring()
 {
-    return R"(get_x()
+    return R"(get_x(copy = False)
 
 This method will return the chromosomes of the individuals as a 2D NumPy array.
 
 Each row of the returned array represents the chromosome of the individual at the corresponding position in the
 population.
 
+By default, the returned array is a read-only view sharing the memory of the population, and no data is copied.
+The view keeps the population alive, and it always shows the chromosomes at the time of its creation: if the population
+is later modified (e.g., via :func:`~pygmo.population.set_xf()` or :func:`~pygmo.population.push_back()`), the
+population will switch to a new copy of its data, leaving the existing views untouched. If *copy* is ``True``,
+a new writeable array will be returned instead.
+
+Args:
+    copy (``bool``): if ``True``, return a deep copy of the chromosomes rather than a read-only view
+
 Returns:
-    2D NumPy float array: a deep copy of the chromosomes of the individuals
+    2D NumPy float array: the chromosomes of the individuals
 
 Raises:
     unspecified: any exception thrown by failures at the intersection between C++ and
@@ -293,15 +347,24 @@ Raises:
 
 std::string population_get_ID_docstring()
 {
-    return R"(get_ID()
+    return R"(get_ID(copy = False)
 
 This method will return the IDs of the individuals as a 1D NumPy array.
 
 Each element of the returned array represents the ID of the individual at the corresponding position in the
 population.
 
+By default, the returned array is a read-only view sharing the memory of the population, and no data is copied.
+The view keeps the population alive, and it always shows the IDs at the time of its creation: if the population
+is later modified (e.g., via :func:`~pygmo.population.set_xf()` or :func:`~pygmo.population.push_back()`), the
+population will switch to a new copy of its data, leaving the existing views untouched. If *copy* is ``True``,
+a new writeable array will be returned instead.
+
+Args:
+    copy (``bool``): if ``True``, return a deep copy of the IDs rather than a read-only view
+
 Returns:
-    1D NumPy int array: a deep copy of the IDs of the individuals
+    1D NumPy int array: the IDs of the individuals
 
 Raises:
     unspecified: any exception thrown by failures at the intersection between C++ and
@@ -387,6 +450,10 @@ methods:
      ...
    def get_nic(self):
      ...
+   def batch_fitness(self, dvs):
+     ...
+   def has_batch_fitness(self):
+     ...
    def has_gradient(self):
      ...
    def gradient(self, dv):
@@ -411,6 +478,8 @@ methods:
      ...
    def get_extra_info(self):
      ...
+   def get_thread_safety(self):
+     ...
 
 See the documentation of the corresponding methods in this class for details on how the optional
 methods in the UDP should be implemented and on how they are used by :class:`~pygmo.problem`.
@@ -480,6 +549,68 @@ Raises:
 )";
 }
 
+std::string problem_batch_fitness_docstring()
+{
+    return R"(batch_fitness(dvs)
+
+Batch fitness.
+
+This method will compute the fitness of a batch of decision vectors in a single call. The decision vectors
+must be passed as the rows of the 2D array-like object *dvs*, and the fitness vectors will be returned
+as the rows of a 2D NumPy array.
+
+If :func:`~pygmo.problem.has_batch_fitness()` returns ``True``, the ``batch_fitness()`` method of the UDP will be
+invoked once with the whole batch. Otherwise, the ``fitness()`` method of the UDP will be invoked on each
+decision vector in turn. A successful call of this method will increase the internal fitness evaluation
+counter (see :func:`~pygmo.problem.get_fevals()`) by the number of decision vectors in *dvs*.
+
+The ``batch_fitness()`` method of the UDP must be able to take as input the decision vectors as a 2D NumPy array
+of shape :math:`(N, n_x)`, and it must return the fitness vectors as a 2D array-like object of shape
+:math:`(N, n_f)` (e.g., a 2D NumPy array, or a list of 1D NumPy arrays). This allows UDPs implemented
+with vectorised NumPy operations to evaluate a whole population crossing the C++/Python boundary only once.
+
+Args:
+    dvs (2D array-like object): the decision vectors to be evaluated
+
+Returns:
+    2D NumPy float array: the fitness vectors of *dvs*
+
+Raises:
+    ValueError: if either the rows of *dvs* do not have a length equal to the value returned by
+      :func:`~pygmo.problem.get_nx()`, or the shape of the value returned by the ``batch_fitness()`` method of the
+      UDP is not consistent with the number of decision vectors and the value returned by
+      :func:`~pygmo.problem.get_nf()`
+    unspecified: any exception thrown by the ``batch_fitness()`` or ``fitness()`` methods of the UDP, or by failures
+      at the intersection between C++ and Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string problem_has_batch_fitness_docstring()
+{
+    return R"(has_batch_fitness()
+
+Check if the UDP provides a batch fitness function.
+
+This method will return ``True`` if the UDP provides a ``batch_fitness()`` method, ``False`` otherwise.
+
+The availability of the batch fitness function is determined as follows:
+
+* if the UDP does not provide a ``batch_fitness()`` method, then this method will always return ``False``;
+* if the UDP provides a ``batch_fitness()`` method but it does not provide a ``has_batch_fitness()`` method,
+  then this method will always return ``True``;
+* if the UDP provides both a ``batch_fitness()`` and a ``has_batch_fitness()`` method, then this method will return
+  the output of the ``has_batch_fitness()`` method of the UDP.
+
+The optional ``has_batch_fitness()`` method of the UDP must return a ``bool``. For information on how to
+implement the ``batch_fitness()`` method of the UDP, see :func:`~pygmo.problem.batch_fitness()`.
+
+Returns:
+    ``bool``: a flag signalling the availability of the batch fitness function in the UDP
+
+)";
+}
+
 std::string problem_get_bounds_docstring()
 {
     return R"(get_bounds()
@@ -670,6 +801,27 @@ Returns:
 )";
 }
 
+std::string problem_increment_fevals_docstring()
+{
+    return R"(increment_fevals(n)
+
+Increment the number of fitness evaluations.
+
+This method will increase the internal counter of fitness evaluations by *n*. It is meant to be used
+by components which compute fitnesses on copies of the problem (e.g., in separate processes), so that
+the evaluations can be accounted for in the original problem.
+
+Args:
+    n (``int``): the amount by which the fitness evaluation counter will be increased
+
+Raises:
+    OverflowError: if *n* is negative or too large
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g.,
+      type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
 std::string problem_get_gevals_docstring()
 {
     return R"(get_gevals()
@@ -1125,9 +1277,22 @@ std::string problem_get_thread_safety_docstring()
 Problem's thread safety level.
 
 This method will return a value of the enum :class:`pygmo.thread_safety` which indicates the thread safety level
-of the UDP. Unlike in C++, in Python it is not possible to re-implement this method in the UDP. That is, for C++
-UDPs, the returned value will be the value returned by the ``get_thread_safety()`` method of the UDP. For Python
-UDPs, the returned value will be unconditionally :attr:`pygmo.thread_safety.none`.
+of the UDP. If the UDP provides a ``get_thread_safety()`` method, then this method will return the output of
+``get_thread_safety()`` (queried once, upon the construction of the problem), otherwise
+:attr:`pygmo.thread_safety.none` will be returned for Python UDPs (and :attr:`pygmo.thread_safety.basic` for C++ UDPs).
+
+A Python UDP should declare the :attr:`pygmo.thread_safety.basic` level only if distinct copies of the UDP
+can be evaluated concurrently, and the :attr:`pygmo.thread_safety.constant` level only if the same instance
+can be evaluated concurrently (in which case the UDP might not be copied before a parallel evaluation). The methods of such a UDP might then be invoked from separate threads (e.g.,
+when evolving the problem in a :class:`~pygmo.thread_island`, or evaluating it via a :class:`~pygmo.thread_bfe`),
+in which case pygmo acquires the global interpreter lock (GIL) before calling into the UDP. Parallel speedups are
+thus possible only if the UDP spends most of its time in code which releases the GIL (e.g., NumPy routines or
+C extensions), but the process spawning and pickling overhead of the multiprocessing counterparts is avoided.
+
+.. note::
+
+   Errors raised by the methods of a thread-safe UDP invoked from a separate thread are
+   re-raised as :exc:`RuntimeError` (which contains the original traceback).
 
 Returns:
     a value of :class:`pygmo.thread_safety`: the thread safety level of the UDP
@@ -1927,6 +2092,59 @@ Returns:
 )";
 }
 
+std::string generic_uda_set_dedup_docstring(const std::string &algo)
+{
+    return R"(set_dedup(flag)
+
+Activate or deactivate the fitness deduplication.
+
+When the deduplication is active, the newly generated decision vectors which are exact copies of an individual
+of the current population, or of another decision vector generated in the same generation, are not evaluated:
+their fitness is copied over instead. The evolution is otherwise unchanged. The number of fitness evaluations
+saved during the last call to ``evolve()`` is returned by :func:`~pygmo.)"
+           + algo + R"(.get_saved_fevals()`, and it is shown in the
+``Saved:`` column of the screen output (the ``Fevals:`` column counts only the evaluations actually performed).
+It is not part of the log returned by ``get_log()``. Stochastic problems are never deduplicated. By default the
+deduplication is not active.
+
+Args:
+    flag (``bool``): ``True`` to activate the fitness deduplication, ``False`` to deactivate it
+
+Examples:
+    >>> import pygmo as pg
+    >>> uda = pg.)"
+           + algo + R"(()
+    >>> uda.set_dedup(True)
+    >>> uda.get_dedup()
+    True
+
+)";
+}
+
+std::string generic_uda_get_dedup_docstring()
+{
+    return R"(get_dedup()
+
+Get the fitness deduplication flag.
+
+Returns:
+    ``bool``: ``True`` if the fitness deduplication is active, ``False`` otherwise
+
+)";
+}
+
+std::string generic_uda_get_saved_fevals_docstring()
+{
+    return R"(get_saved_fevals()
+
+Get the number of saved fitness evaluations.
+
+Returns:
+    ``int``: the number of fitness evaluations saved by the deduplication during the last call to ``evolve()``
+
+)";
+}
+
 std::string bee_colony_docstring()
 {
     return R"(__init__(gen = 1, limit = 1, seed = random)
@@ -2280,6 +2498,10 @@ Returns:
     * ``Fevals`` (``int``), number of functions evaluation made
     * ``ideal_point`` (1D numpy array), the ideal point of the current population (cropped to max 5 dimensions only in the screen output)
 
+If the fitness deduplication is active (see :func:`~pygmo.nsga2.set_dedup()`), the screen output also shows, after ``Fevals:``,
+a ``Saved:`` column with the number of fitness evaluations saved so far. This number is not part of the log, and the total
+for the last call to ``evolve()`` is returned by :func:`~pygmo.nsga2.get_saved_fevals()`.
+
 Examples:
     >>> from pygmo import *
     >>> algo = algorithm(nsga2(gen=100))
@@ -2301,6 +2523,26 @@ See also the docs of the relevant C++ method :cpp:func:`pagmo::nsga2::get_log`.
 )";
 }
 
+std::string nsga2_set_bfe_docstring()
+{
+    return R"(set_bfe(b)
+
+Set the batch fitness evaluator.
+
+After a call to this method, the fitness evaluations of the offspring generated at each
+generation will be performed via the batch fitness evaluator *b*, rather than via the
+:func:`~pygmo.problem.batch_fitness()` method of the problem.
+
+Args:
+    b (:class:`~pygmo.bfe`): the batch fitness evaluator that will be used in the evolution
+
+Raises:
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g.,
+      type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
 std::string moead_docstring()
 {
     return R"(__init__(gen = 1, weight_generation = "grid", decomposition = "tchebycheff", neighbours = 20, CR = 1, F = 0.5, eta_m = 20, realb = 0.9, limit = 2, preserve_diversity = true, seed = random)
@@ -2350,6 +2592,10 @@ Returns:
     * ``ADF`` (``float``), Average Decomposed Fitness, that is the average across all decomposed problem of the single objective decomposed fitness along the corresponding direction
     * ``ideal_point`` (``array``), the ideal point of the current population (cropped to max 5 dimensions only in the screen output)
 
+If the fitness deduplication is active (see :func:`~pygmo.moead.set_dedup()`), the screen output also shows, after ``Fevals:``,
+a ``Saved:`` column with the number of fitness evaluations saved so far. This number is not part of the log, and the total
+for the last call to ``evolve()`` is returned by :func:`~pygmo.moead.get_saved_fevals()`.
+
 Examples:
     >>> from pygmo import *
     >>> algo = algorithm(moead(gen=500))
@@ -2882,6 +3128,185 @@ Proceedings 6th European Congress on Intelligent Techniques & Soft Computing, EU
 )";
 }
 
+std::string memoize_docstring()
+{
+    return R"(__init__(prob = null_problem(), capacity = 1000, cache_gradient = False)
+
+The memoize meta-problem.
+
+This meta-problem wraps an input problem and memoizes the results of its fitness function (and, optionally,
+of its gradient) in a bounded least-recently-used (LRU) cache keyed on the decision vector. When the fitness of
+a decision vector which is already in the cache is requested, the cached value is returned and the inner problem
+is not invoked. When the cache is full, the least recently used entry is discarded to make room for a new one.
+
+This meta-problem is useful for expensive problems which are repeatedly evaluated on the same decision
+vectors (e.g., integer and mixed-integer problems, where the search space is discrete).
+
+The number of cache hits and misses is recorded, and it can be retrieved via :func:`~pygmo.memoize.get_hits()`,
+:func:`~pygmo.memoize.get_misses()` (and the corresponding methods for the gradient), or via the
+extra info of the problem. Note that the fitness evaluation counter of the inner problem will record only the
+cache misses.
+
+.. note::
+
+   The cache is stored inside the :class:`~pygmo.memoize` object, and it is thus copied together
+   with it. Distinct copies of a :class:`~pygmo.memoize` object hence have independent caches.
+
+.. warning::
+
+   The inner problem is assumed to be deterministic, or to change its behaviour only when its seed
+   is changed via :func:`pygmo.problem.set_seed()` (which clears the cache).
+
+See also the docs of the C++ class :cpp:class:`pagmo::memoize`.
+
+)";
+}
+
+std::string memoize_get_capacity_docstring()
+{
+    return R"(get_capacity()
+
+Get the capacity of the cache.
+
+Returns:
+    ``int``: the maximum number of entries in the fitness (and gradient) cache
+
+)";
+}
+
+std::string memoize_get_hits_docstring()
+{
+    return R"(get_hits()
+
+Number of fitness cache hits.
+
+Returns:
+    ``int``: the number of fitness evaluations which were served from the cache
+
+)";
+}
+
+std::string memoize_get_misses_docstring()
+{
+    return R"(get_misses()
+
+Number of fitness cache misses.
+
+Returns:
+    ``int``: the number of fitness evaluations which were forwarded to the inner problem
+
+)";
+}
+
+std::string memoize_get_gradient_hits_docstring()
+{
+    return R"(get_gradient_hits()
+
+Number of gradient cache hits.
+
+Returns:
+    ``int``: the number of gradient evaluations which were served from the cache
+
+)";
+}
+
+std::string memoize_get_gradient_misses_docstring()
+{
+    return R"(get_gradient_misses()
+
+Number of gradient cache misses.
+
+Returns:
+    ``int``: the number of gradient evaluations which were forwarded to the inner problem while
+    gradient memoization was active
+
+)";
+}
+
+std::string memoize_clear_cache_docstring()
+{
+    return R"(clear_cache()
+
+Clear the caches.
+
+This method will remove all the entries from the fitness and gradient caches. The hit/miss
+counters are not reset.
+
+)";
+}
+
+std::string cfunc_problem_docstring()
+{
+    return R"(__init__(fitness, lb, ub, nobj = 1, nec = 0, nic = 0, nix = 0, name = "")
+
+A problem defined by a native fitness function.
+
+This problem computes its fitness by invoking a native (i.e., compiled) function via a raw function
+pointer. The function must have the C signature
+
+.. code-block:: c
+
+   void f(const double *x, size_t nx, double *f, size_t nf)
+
+where *x* is the decision vector, *nx* its size, *f* the output fitness vector and *nf* its size
+(i.e., *nobj* + *nec* + *nic*). Such functions can be created, e.g., with `Numba <https://numba.pydata.org/>`__
+(``numba.cfunc``), `cffi <https://cffi.readthedocs.io/>`__ or :mod:`ctypes`.
+
+The function is called directly from C++, without going through the Python interpreter. Consequently,
+the problem provides the :attr:`~pygmo.thread_safety.basic` thread safety guarantee, and it can thus be used
+in a :class:`~pygmo.thread_island` and with a :class:`~pygmo.thread_bfe` (which are selected automatically by
+:class:`~pygmo.island` and :class:`~pygmo.bfe`), rather than with their multiprocessing counterparts.
+
+Args:
+    fitness: the fitness function, either as an ``int`` (the address of the function), a Numba ``cfunc``,
+      a cffi function pointer or a :mod:`ctypes` function pointer
+    lb (array-like object): the lower bounds of the problem
+    ub (array-like object): the upper bounds of the problem
+    nobj (``int``): the number of objectives
+    nec (``int``): the number of equality constraints
+    nic (``int``): the number of inequality constraints
+    nix (``int``): the integer dimension of the problem
+    name (``str``): the name of the problem (if empty, a default name is used)
+
+Raises:
+    ValueError: if *fitness* is a null function pointer
+    TypeError: if *fitness* is not one of the supported types
+    OverflowError: if *nobj*, *nec*, *nic* or *nix* are negative or too large
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g.,
+      type conversion errors, mismatched function signatures, etc.)
+
+.. warning::
+
+   The function will be called concurrently from multiple threads, and thus it must be thread-safe. It should also
+   not call into the Python interpreter (as it is the case, e.g., for :mod:`ctypes` callbacks wrapping a Python
+   function): the function might be invoked from C++ while the current thread is holding the global interpreter lock,
+   leading to a deadlock.
+
+.. note::
+
+   The problem keeps a reference to the object passed as *fitness*, so that the function is not
+   destroyed while the problem is alive. If *fitness* is an address, it is the user's responsibility to ensure
+   that the function remains valid.
+
+   As function pointers are valid only in the process in which they were created, the problem cannot be serialized
+   (and thus it cannot be used, e.g., in a :class:`~pygmo.mp_island`).
+
+Examples:
+    >>> import pygmo as pg
+    >>> from numba import cfunc, types, carray # doctest: +SKIP
+    >>> @cfunc(types.void(types.CPointer(types.double), types.size_t, # doctest: +SKIP
+    ...                   types.CPointer(types.double), types.size_t))
+    ... def sphere(x, nx, f, nf):
+    ...     x = carray(x, (nx,))
+    ...     f[0] = (x * x).sum()
+    >>> isl = pg.island(algo = pg.de(gen = 100), prob = pg.cfunc_problem(sphere, [-1] * 10, [1] * 10),
+    ...                 size = 20) # doctest: +SKIP
+    >>> isl.get_name() # doctest: +SKIP
+    'Thread island'
+
+)";
+}
+
 std::string fast_non_dominated_sorting_docstring()
 {
     return R"(fast_non_dominated_sorting(points)
@@ -2909,6 +3334,38 @@ Examples:
 )";
 }
 
+std::string non_dominated_sorting_docstring()
+{
+    return R"(non_dominated_sorting(points)
+
+Runs the efficient non dominated sorting algorithm with binary search (ENS-BS) on the input *points*
+
+The non dominated fronts and ranks are the same as those returned by :func:`~pygmo.fast_non_dominated_sorting()`,
+but the domination list and the domination count are not computed. This makes the algorithm considerably
+faster and less memory hungry on large sets of points.
+
+See: Zhang, Xingyi, et al. "An efficient approach to nondominated sorting for evolutionary multiobjective
+optimization." IEEE Transactions on Evolutionary Computation 19.2 (2015): 201-213.
+
+Args:
+    points (2d-array-like object): the input points
+
+Raises:
+    ValueError: if *points* is malformed
+    TypeError: if *points* cannot be converted to a vector of vector floats
+
+Returns:
+    ``tuple``: (*ndf*, *ndr*), where:
+
+    * *ndf* (``list`` of 1D NumPy int array): the non dominated fronts, each sorted in ascending order
+    * *ndr* (1D NumPy int array): the non domination ranks
+
+Examples:
+    >>> import pygmo as pg
+    >>> ndf, ndr = pg.non_dominated_sorting(points = [[0,1],[-1,3],[2.3,-0.2],[1.1,-0.12],[1.1, 2.12],[-1.1,-1.1]])
+)";
+}
+
 std::string pareto_dominance_docstring()
 {
     return R"(pareto_dominance(obj1, obj2)
@@ -3401,6 +3858,55 @@ Examples:
 )";
 }
 
+std::string get_island_pool_size_docstring()
+{
+    return R"(get_island_pool_size()
+
+Get the size of the island thread pool.
+
+The evolutions of all the :class:`~pygmo.island` objects are run by a shared pool of threads, and the number
+of evolutions running concurrently is capped at the size of the pool. Each island still runs its own evolutions
+one at a time, in the order in which they were enqueued. By default, the size of the pool is the number of cores.
+
+Returns:
+    ``int``: the size of the island thread pool
+
+Raises:
+    unspecified: any exception thrown by threading primitives
+
+)";
+}
+
+std::string set_island_pool_size_docstring()
+{
+    return R"(set_island_pool_size(n)
+
+Set the size of the island thread pool.
+
+This function will set the maximum number of island evolutions that can run concurrently
+(see :func:`~pygmo.get_island_pool_size()`). Raising the size of the pool can be useful with UDIs whose
+evolutions do not occupy a local core, such as :class:`~pygmo.ipyparallel_island`. The new size affects
+also the evolutions which are already enqueued.
+
+Args:
+    n (``int``): the new size of the island thread pool
+
+Raises:
+    ValueError: if *n* is zero
+    OverflowError: if *n* is negative or too large
+    unspecified: any exception thrown by threading primitives
+
+Examples:
+    >>> import pygmo as pg
+    >>> old_size = pg.get_island_pool_size()
+    >>> pg.set_island_pool_size(2)
+    >>> pg.get_island_pool_size()
+    2
+    >>> pg.set_island_pool_size(old_size)
+
+)";
+}
+
 std::string set_global_rng_seed_docstring()
 {
     return R"(set_global_rng_seed(seed)
@@ -3430,7 +3936,7 @@ Examples:
 
 std::string hvwfg_docstring()
 {
-    return R"(__init__(stop_dimension = 2)
+    return R"(__init__(stop_dimension = 2, n_threads = 1)
 
 The hypervolume algorithm from the Walking Fish Group (2011 version).
 
@@ -3438,15 +3944,21 @@ This object can be passed as parameter to the various methods of the
 class :class:`~pygmo.hypervolume` as it derives from the hidden base
 class :class:`~pygmo._hv_algorithm`
 
+The exclusive contributions of the points (and thus the least and greatest contributors) are
+computed by *n_threads* threads. The results do not depend on the number of threads.
+
 Args:
     stop_dimension (``int``): the input population
+    n_threads (``int``): the number of threads used in the computation of the exclusive contributions
+      (if zero, the number of cores will be used)
 
 Raises:
-    OverflowError: if *stop_dimension* is negative or greater than an implementation-defined value
+    OverflowError: if *stop_dimension* or *n_threads* are negative or greater than an implementation-defined value
 
 Examples:
     >>> import pygmo as pg
     >>> hv_algo = pg.hvwfg(stop_dimension = 2)
+    >>> hv_algo_mt = pg.hvwfg(n_threads = 4)
 
 See also the docs of the C++ class :cpp:class:`pagmo::hvwfg`.
 
@@ -3491,7 +4003,26 @@ See also the docs of the C++ class :cpp:class:`pagmo::hv3d`.
 )";
 }
 
-std::string bf_approx_docstring()
+std::string hv4d_docstring()
+{
+    return R"(__init__()
+
+Exact hypervolume algorithm for four dimensional points.
+
+This object can be passed as parameter to the various methods of the 
+class :class:`~pygmo.hypervolume` as it derives from the hidden base
+class :class:`~pygmo._hv_algorithm`
+
+Examples:
+    >>> import pygmo as pg
+    >>> hv_algo = pg.hv4d()
+
+See also the docs of the C++ class :cpp:class:`pagmo::hv4d`.
+
+)";
+}
+
+std::string bf_approx_docstring()
 {
     return R"(__init__()
 
@@ -3531,6 +4062,44 @@ See also the docs of the C++ class :cpp:class:`pagmo::bf_fpras`.
 )";
 }
 
+std::string bf_set_n_threads_docstring(const std::string &algo)
+{
+    return R"(set_n_threads(n_threads)
+
+Set the number of threads used for the sampling.
+
+The samples are drawn in blocks, distributed among the threads. Each block uses its own stream of pseudo-random
+numbers derived from the seed of the algorithm, so that the results do not depend on the number of threads.
+
+Args:
+    n_threads (``int``): the number of threads (if zero, the number of cores will be used)
+
+Raises:
+    OverflowError: if *n_threads* is negative or greater than an implementation-defined value
+
+Examples:
+    >>> import pygmo as pg
+    >>> hv_algo = pg.)"
+           + algo + R"(()
+    >>> hv_algo.set_n_threads(4)
+    >>> hv_algo.get_n_threads()
+    4
+
+)";
+}
+
+std::string bf_get_n_threads_docstring()
+{
+    return R"(get_n_threads()
+
+Get the number of threads used for the sampling.
+
+Returns:
+    ``int``: the number of threads used for the sampling (1 by default)
+
+)";
+}
+
 std::string hv_init1_docstring()
 {
     return R"(__init__(pop)
@@ -3704,6 +4273,136 @@ See also the docs of the C++ class :cpp:func:`pagmo::hypervolume::refpoint`.
 )";
 }
 
+std::string hv_archive_docstring()
+{
+    return R"(__init__(ref_point)
+
+Incremental hypervolume archive.
+
+This class maintains a set of mutually non-dominated points in two or three dimensions, together with
+the hypervolume they dominate with respect to the fixed reference point *ref_point* and the exclusive contribution
+of each point. Rather than recomputing everything from scratch as :class:`~pygmo.hypervolume` does, the hypervolume
+and the contributions are updated incrementally as points are inserted into and removed from the archive.
+In two dimensions, insertions and removals cost :math:`\mathcal{O}(\log N)`. In three dimensions, they cost
+:math:`\mathcal{O}(N \log N)`, and the contributions are computed on demand.
+
+Args:
+    ref_point (array-like object): the reference point
+
+Raises:
+    ValueError: if the dimension of *ref_point* is not 2 or 3, or if *ref_point* contains NaNs
+    TypeError: if *ref_point* cannot be converted to a vector of floats
+
+Examples:
+    >>> import pygmo as pg
+    >>> a = pg.hv_archive(ref_point = [10, 10])
+    >>> a.insert([5, 5])
+    True
+    >>> a.insert([2, 8])
+    True
+    >>> a.get_hv()
+    31.0
+    >>> a.least_contributor() # doctest: +NORMALIZE_WHITESPACE
+    array([2., 8.])
+
+See also the docs of the C++ class :cpp:class:`pagmo::hv_archive`.
+
+)";
+}
+
+std::string hv_archive_insert_docstring()
+{
+    return R"(insert(point)
+
+Insert a point.
+
+The point is inserted into the archive if it is not weakly dominated by any point already in the archive.
+All the points of the archive dominated by *point* are removed from the archive.
+
+Args:
+    point (array-like object): the point to be inserted
+
+Returns:
+    ``bool``: ``True`` if *point* was inserted, ``False`` if it was weakly dominated by an archived point
+
+Raises:
+    ValueError: if the dimension of *point* differs from the dimension of the reference point, or if *point*
+      contains NaNs or is not dominated by the reference point
+    TypeError: if *point* cannot be converted to a vector of floats
+
+)";
+}
+
+std::string hv_archive_erase_docstring()
+{
+    return R"(erase(point)
+
+Remove a point.
+
+Args:
+    point (array-like object): the point to be removed
+
+Returns:
+    ``bool``: ``True`` if *point* was found in the archive and removed, ``False`` otherwise
+
+Raises:
+    ValueError: if the dimension of *point* differs from the dimension of the reference point, or if *point*
+      contains NaNs or is not dominated by the reference point
+    TypeError: if *point* cannot be converted to a vector of floats
+
+)";
+}
+
+std::string hv_archive_contributions_docstring()
+{
+    return R"(contributions()
+
+Get the exclusive contributions.
+
+Returns:
+    1D NumPy float array: the exclusive contributions to the hypervolume of the points of the archive, in the same order
+    as :func:`~pygmo.hv_archive.get_points()`
+
+)";
+}
+
+std::string hv_archive_exclusive_docstring()
+{
+    return R"(exclusive(point)
+
+Get the exclusive contribution of a point of the archive.
+
+Args:
+    point (array-like object): a point of the archive
+
+Returns:
+    ``float``: the exclusive contribution of *point* to the hypervolume
+
+Raises:
+    ValueError: if *point* is not in the archive
+    TypeError: if *point* cannot be converted to a vector of floats
+
+)";
+}
+
+std::string hv_archive_least_contributor_docstring()
+{
+    return R"(least_contributor()
+
+Get the least contributor.
+
+If several points share the least contribution, the first one in the order of
+:func:`~pygmo.hv_archive.get_points()` is returned.
+
+Returns:
+    1D NumPy float array: the point of the archive contributing the least to the hypervolume
+
+Raises:
+    ValueError: if the archive is empty
+
+)";
+}
+
 std::string island_docstring()
 {
     return R"(Island class.
@@ -3774,386 +4473,1160 @@ An island can be initialised in a variety of ways using keyword arguments:
   above (i.e., *algo* and the newly-created population are used to initialise the island's algorithm and population,
   and the UDI, if not specified, will be chosen according to the heuristic detailed above).
 
-If the keyword arguments list is invalid, a :exc:`KeyError` exception will be raised.
+If the keyword arguments list is invalid, a :exc:`KeyError` exception will be raised.
+
+This class is the Python counterpart of the C++ class :cpp:class:`pagmo::island`.
+
+)";
+}
+
+std::string island_evolve_docstring()
+{
+    return R"(evolve(n = 1)
+
+Launch evolution.
+
+This method will evolve the island’s :class:`~pygmo.population` using the island’s :class:`~pygmo.algorithm`.
+The evolution happens asynchronously: a call to :func:`~pygmo.island.evolve()` will create an evolution task that
+will be pushed to a queue, and then return immediately. The tasks in the queue are consumed, one at a time, by a thread pool
+shared by all the :class:`~pygmo.island` objects (see :func:`~pygmo.set_island_pool_size()`). Each task will invoke the ``run_evolve()`` method of the UDI *n*
+times consecutively to perform the actual evolution. The island's population will be updated at the end of each ``run_evolve()``
+invocation. Exceptions raised inside the tasks are stored within the island object, and can be re-raised by calling
+:func:`~pygmo.island.wait_check()`.
+
+It is possible to call this method multiple times to enqueue multiple evolution tasks, which will be consumed in a FIFO (first-in
+first-out) fashion. The user may call :func:`~pygmo.island.wait()` or :func:`~pygmo.island.wait_check()` to block until all
+tasks have been completed, and to fetch exceptions raised during the execution of the tasks. The :attr:`~pygmo.island.status`
+attribute can be used to query the status of the asynchronous operations in the island.
+
+Args:
+     n (``int``): the number of times the ``run_evolve()`` method of the UDI will be called within the evolution task
+
+Raises:
+    OverflowError: if *n* is negative or larger than an implementation-defined value
+    unspecified: any exception thrown by the underlying C++ method, or by failures at the intersection between C++ and
+      Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string island_wait_check_docstring()
+{
+    return R"(wait_check()
+
+Block until evolution ends and re-raise the first stored exception.
+
+If one task enqueued after the last call to :func:`~pygmo.island.wait_check()` threw an exception, the exception will be re-thrown
+by this method. If more than one task enqueued after the last call to :func:`~pygmo.island.wait_check()` threw an exception,
+this method will re-throw the exception raised by the first enqueued task that threw, and the exceptions
+from all the other tasks that threw will be ignored.
+
+Note that :func:`~pygmo.island.wait_check()` resets the status of the island: after a call to :func:`~pygmo.island.wait_check()`,
+:attr:`~pygmo.island.status` will always return :attr:`pygmo.evolve_status.idle`.
+
+Raises:
+    unspecified: any exception thrown by evolution tasks or by the underlying C++ method
+
+)";
+}
+
+std::string island_wait_docstring()
+{
+    return R"(wait()
+
+This method will block until all the evolution tasks enqueued via :func:`~pygmo.island.evolve()` have been completed.
+Exceptions thrown by the enqueued tasks can be re-raised via :func:`~pygmo.island.wait_check()`: they will **not** be
+re-thrown by this method. Also, contrary to :func:`~pygmo.island.wait_check()`, this method will **not** reset the
+status of the island: after a call to :func:`~pygmo.island.wait()`, :attr:`~pygmo.island.status` will always return
+either :attr:`pygmo.evolve_status.idle` or :attr:`pygmo.evolve_status.idle_error`.
+
+)";
+}
+
+std::string island_status_docstring()
+{
+    return R"(Status of the island.
+
+This read-only property will return an :class:`~pygmo.evolve_status` flag indicating the current status of
+asynchronous operations in the island. The flag will be:
+
+* :attr:`~pygmo.evolve_status.idle` if the island is currently not evolving and no exceptions
+  were thrown by evolution tasks since the last call to :func:`~pygmo.island.wait_check()`;
+* :attr:`~pygmo.evolve_status.busy` if the island is evolving and no exceptions
+  have (yet) been thrown by evolution tasks since the last call to :func:`~pygmo.island.wait_check()`;
+* :attr:`~pygmo.evolve_status.idle_error` if the island is currently not evolving and at least one
+  evolution task threw an exception since the last call to :func:`~pygmo.island.wait_check()`;
+* :attr:`~pygmo.evolve_status.busy_error` if the island is currently evolving and at least one
+  evolution task has already thrown an exception since the last call to :func:`~pygmo.island.wait_check()`.
+
+Note that after a call to :func:`~pygmo.island.wait_check()`, :attr:`~pygmo.island.status` will always return
+:attr:`~pygmo.evolve_status.idle`, and after a call to :func:`~pygmo.island.wait()`, :attr:`~pygmo.island.status`
+will always return either :attr:`~pygmo.evolve_status.idle` or :attr:`~pygmo.evolve_status.idle_error`.
+
+Returns:
+    :class:`~pygmo.evolve_status`: a flag indicating the current status of asynchronous operations in the island
+
+)";
+}
+
+std::string island_get_algorithm_docstring()
+{
+    return R"(get_algorithm()
+
+Get the algorithm.
+
+It is safe to call this method while the island is evolving.
+
+Returns:
+    :class:`~pygmo.algorithm`: a copy of the island's algorithm
+
+Raises:
+    unspecified: any exception thrown by the underlying C++ method
+
+)";
+}
+
+std::string island_set_algorithm_docstring()
+{
+    return R"(set_algorithm(algo)
+
+Set the algorithm.
+
+It is safe to call this method while the island is evolving.
+
+Args:
+    algo (:class:`~pygmo.algorithm`): the algorithm that will be copied into the island
+
+Raises:
+    unspecified: any exception thrown by the underlying C++ method
+
+)";
+}
+
+std::string island_get_population_docstring()
+{
+    return R"(get_population()
+
+Get the population.
+
+It is safe to call this method while the island is evolving.
+
+Returns:
+    :class:`~pygmo.population`: a copy of the island's population
+
+Raises:
+    unspecified: any exception thrown by the underlying C++ method
+
+)";
+}
+
+std::string island_set_population_docstring()
+{
+    return R"(set_population(pop)
+
+Set the population.
+
+It is safe to call this method while the island is evolving.
+
+Args:
+    pop (:class:`~pygmo.population`): the population that will be copied into the island
+
+Raises:
+    unspecified: any exception thrown by the underlying C++ method
+
+)";
+}
+
+std::string island_get_thread_safety_docstring()
+{
+    return R"(get_thread_safety()
+
+It is safe to call this method while the island is evolving.
+
+Returns:
+    ``tuple``: a tuple containing the :class:`~pygmo.thread_safety` levels of the island's algorithm and problem
+
+Raises:
+    unspecified: any exception thrown by the underlying C++ method
+
+)";
+}
+
+std::string island_get_name_docstring()
+{
+    return R"(get_name()
+
+Island's name.
+
+If the UDI provides a ``get_name()`` method, then this method will return the output of its ``get_name()`` method.
+Otherwise, an implementation-defined name based on the type of the UDI will be returned.
+
+It is safe to call this method while the island is evolving.
+
+The ``get_name()`` method of the UDI must return a ``str``.
+
+Returns:
+    ``str``: the name of the UDI
+
+Raises:
+    unspecified: any exception thrown by the ``get_name()`` method of the UDI
+
+)";
+}
+
+std::string island_get_extra_info_docstring()
+{
+    return R"(get_extra_info()
+
+Island's extra info.
+
+If the UDI provides a ``get_extra_info()`` method, then this method will return the output of its ``get_extra_info()``
+method. Otherwise, an empty string will be returned.
+
+It is safe to call this method while the island is evolving.
+
+The ``get_extra_info()`` method of the UDI must return a ``str``.
+
+Returns:
+    ``str``: extra info about the UDI
+
+Raises:
+    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDI
+
+)";
+}
+
+std::string thread_island_docstring()
+{
+    return R"(__init__()
+
+Thread island.
+
+This class is a user-defined island (UDI) that will run evolutions directly inside
+the thread of execution within :class:`pygmo.island` (that is, in one of the threads of the island thread pool,
+see :func:`~pygmo.set_island_pool_size()`). Evolution tasks running on this
+UDI must involve :class:`~pygmo.algorithm` and :class:`~pygmo.problem` instances
+that provide at least the :attr:`~pygmo.thread_safety.basic` thread safety guarantee, otherwise
+errors will be raised during the evolution.
+
+See also the documentation of the corresponding C++ class :cpp:class:`pagmo::thread_island`.
+
+)";
+}
+
+std::string bfe_docstring()
+{
+    return R"(__init__(udbfe = default_bfe())
+
+Batch fitness evaluator.
+
+This class implements the evaluation of decision vectors in batch mode. That is,
+whereas a :class:`pygmo.problem` provides the means to evaluate a single decision
+vector via the :func:`pygmo.problem.fitness()` method, a
+:class:`~pygmo.bfe` (short for *batch fitness evaluator*) enables a :class:`~pygmo.problem`
+to evaluate the fitnesses of a group (or a *batch*) of decision vectors, possibly
+in a parallel/vectorised fashion.
+
+Together with the :func:`pygmo.problem.batch_fitness()` method,
+:class:`~pygmo.bfe` is one of the mechanisms provided
+by pygmo to enable a form of parallelism on a finer level than the
+:class:`~pygmo.archipelago` and :class:`~pygmo.island` classes.
+However, while the :func:`pygmo.problem.batch_fitness()` method must be
+implemented on a UDP-by-UDP basis, a :class:`~pygmo.bfe`
+provides generic batch fitness evaluation capabilities for any :class:`~pygmo.problem`,
+and it can thus be used also with UDPs which do not implement the
+:func:`pygmo.problem.batch_fitness()` method.
+
+Like :class:`~pygmo.problem`, :class:`~pygmo.algorithm`, and many other
+pygmo classes, :class:`~pygmo.bfe` is a generic container
+which stores internally
+a user-defined batch fitness evaluator (UDBFE for short) which actually
+implements the fitness evaluation in batch mode. Users are free to either
+use one of the evaluators provided in the :mod:`pygmo.batch_evaluators` submodule
+(e.g., :class:`~pygmo.thread_bfe` or :class:`~pygmo.mp_bfe`), or to write their own UDBFE.
+
+Every UDBFE must be a callable with a signature equivalent to
+
+.. code-block:: python
+
+   def __call__(self, prob, dvs):
+     ...
+
+UDBFEs receive as input a :class:`~pygmo.problem` and a batch of decision vectors
+in the form of a 2D array-like object (one decision vector per row), and return
+a 2D array-like object containing the fitness vectors corresponding to the input
+batch of decision vectors (one fitness vector per row), as evaluated by the input problem.
+
+UDBFEs can also implement the following (optional) methods:
+
+.. code-block:: python
+
+   def get_name(self):
+     ...
+   def get_extra_info(self):
+     ...
+
+See the documentation of the corresponding methods in this class for details on how the optional
+methods in the UDBFE are used by :class:`~pygmo.bfe`.
+
+This class is the Python counterpart of the C++ class :cpp:class:`pagmo::bfe`.
+
+Args:
+    udbfe: a user-defined batch fitness evaluator, either C++ or Python (note that *udbfe* will be deep-copied
+      and stored inside the :class:`~pygmo.bfe` instance)
+
+Raises:
+    NotImplementedError: if *udbfe* is not callable
+    unspecified: any exception thrown by:
+
+      * methods of the UDBFE invoked during construction,
+      * the deep copy of the UDBFE,
+      * the constructor of the underlying C++ class,
+      * failures at the intersection between C++ and Python (e.g., type conversion errors, mismatched function
+        signatures, etc.)
+
+)";
+}
+
+std::string bfe_call_docstring()
+{
+    return R"(__call__(prob, dvs)
+
+Call operator.
+
+The call operator will invoke the internal UDBFE instance to perform the evaluation in batch mode
+of the decision vectors stored in *dvs* using the input problem *prob*, and it will return the corresponding
+fitness vectors.
+
+The input decision vectors must be provided as a 2D array-like object in which each row represents a decision
+vector, and the returned fitness vectors are stored in a 2D NumPy array in which each row represents a fitness vector.
+The fitness evaluation counter of *prob* will be incremented by the number of evaluated decision vectors.
+
+Args:
+    prob (:class:`~pygmo.problem`): the input problem
+    dvs (2D array-like object): the input decision vectors that will be evaluated in batch mode
+
+Returns:
+    2D NumPy float array: the fitness vectors corresponding to the input decision vectors in *dvs*
+
+Raises:
+    ValueError: if *dvs* is not a 2D array-like object whose number of columns matches the dimension of *prob*,
+      or if the number of fitness vectors returned by the UDBFE is not consistent with *dvs* and *prob*
+    unspecified: any exception raised by the invocation of the UDBFE, or by failures at the intersection
+      between C++ and Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string bfe_get_name_docstring()
+{
+    return R"(get_name()
+
+Bfe's name.
+
+If the UDBFE provides a ``get_name()`` method, then this method will return the output of its ``get_name()`` method.
+Otherwise, an implementation-defined name based on the type of the UDBFE will be returned.
+
+The ``get_name()`` method of the UDBFE must return a ``str``.
+
+Returns:
+    ``str``: the name of the UDBFE
+
+Raises:
+    unspecified: any exception thrown by the ``get_name()`` method of the UDBFE
+
+)";
+}
+
+std::string bfe_get_extra_info_docstring()
+{
+    return R"(get_extra_info()
+
+Bfe's extra info.
+
+If the UDBFE provides a ``get_extra_info()`` method, then this method will return the output of its ``get_extra_info()``
+method. Otherwise, an empty string will be returned.
+
+The ``get_extra_info()`` method of the UDBFE must return a ``str``.
+
+Returns:
+    ``str``: extra info about the UDBFE
+
+Raises:
+    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDBFE
+
+)";
+}
+
+std::string bfe_get_thread_safety_docstring()
+{
+    return R"(get_thread_safety()
+
+Bfe's thread safety level.
+
+This method will return a value of the enum :class:`pygmo.thread_safety` which indicates the thread safety level
+of the UDBFE. Unlike in C++, in Python it is not possible to re-implement this method in the UDBFE. That is, for C++
+UDBFEs, the returned value will be the value returned by the ``get_thread_safety()`` method of the UDBFE. For Python
+UDBFEs, the returned value will be unconditionally :attr:`pygmo.thread_safety.none`.
+
+Returns:
+    a value of :class:`pygmo.thread_safety`: the thread safety level of the UDBFE
+
+)";
+}
+
+std::string default_bfe_docstring()
+{
+    return R"(__init__()
+
+Default batch fitness evaluator.
+
+This class is a user-defined batch fitness evaluator (UDBFE) that can be used to
+construct a :class:`~pygmo.bfe`. It will select, depending on the properties of the
+input :class:`~pygmo.problem`, the most appropriate strategy for the evaluation
+of the fitnesses in batch mode:
+
+* if the UDP provides a ``batch_fitness()`` method, then :class:`~pygmo.member_bfe` will be used;
+* otherwise, if the problem provides at least the :attr:`~pygmo.thread_safety.basic` thread safety
+  guarantee, then :class:`~pygmo.thread_bfe` will be used;
+* otherwise, :class:`~pygmo.mp_bfe` will be used.
+
+See also the documentation of the corresponding C++ class :cpp:class:`pagmo::default_bfe`.
+
+)";
+}
+
+std::string thread_bfe_docstring()
+{
+    return R"(__init__()
+
+Threaded batch fitness evaluator.
+
+This class is a user-defined batch fitness evaluator (UDBFE) that can be used to
+construct a :class:`~pygmo.bfe`. It will use multiple threads of execution to parallelise
+the evaluation of the fitnesses of a batch of input decision vectors. The input problem
+must provide at least the :attr:`~pygmo.thread_safety.basic` thread safety guarantee,
+otherwise errors will be raised during the evaluation (this implies that :class:`~pygmo.thread_bfe`
+cannot be used with pythonic problems).
+
+See also the documentation of the corresponding C++ class :cpp:class:`pagmo::thread_bfe`.
+
+)";
+}
+
+std::string member_bfe_docstring()
+{
+    return R"(__init__()
+
+Member function batch fitness evaluator.
+
+This class is a user-defined batch fitness evaluator (UDBFE) that can be used to
+construct a :class:`~pygmo.bfe`. It will invoke the :func:`~pygmo.problem.batch_fitness()`
+method of the input problem to evaluate the fitnesses of a batch of input decision vectors.
+
+See also the documentation of the corresponding C++ class :cpp:class:`pagmo::member_bfe`.
+
+)";
+}
+
+std::string archipelago_docstring()
+{
+    return R"(Archipelago.
+
+An archipelago is a collection of :class:`~pygmo.island` objects which provides a convenient way to perform
+multiple optimisations in parallel.
+
+The interface of :class:`~pygmo.archipelago` mirrors partially the interface of :class:`~pygmo.island`: the
+evolution is initiated by a call to :func:`~pygmo.archipelago.evolve()`, and at any time the user can query the
+state of the archipelago and access its island members. The user can explicitly wait for pending evolutions
+to conclude by calling the :func:`~pygmo.archipelago.wait()` and :func:`~pygmo.archipelago.wait_check()` methods.
+The status of ongoing evolutions in the archipelago can be queried via the :attr:`~pygmo.archipelago.status` attribute.
+
+)";
+}
+
+std::string archipelago_evolve_docstring()
+{
+    return R"(evolve(n = 1)
+
+Evolve archipelago.
+
+This method will call :func:`pygmo.island.evolve()` on all the islands of the archipelago.
+The input parameter *n* will be passed to the invocations of :func:`pygmo.island.evolve()` for each island.
+The :attr:`~pygmo.archipelago.status` attribute can be used to query the status of the asynchronous operations in the
+archipelago.
+
+Args:
+     n (``int``): the parameter that will be passed to :func:`pygmo.island.evolve()`
+
+Raises:
+    unspecified: any exception thrown by :func:`pygmo.island.evolve()`
+
+)";
+}
+
+std::string archipelago_status_docstring()
+{
+    return R"(Status of the archipelago.
+
+This read-only property will return an :class:`~pygmo.evolve_status` flag indicating the current status of
+asynchronous operations in the archipelago. The flag will be:
+
+* :attr:`~pygmo.evolve_status.idle` if, for all the islands in the archipelago, :attr:`pygmo.island.status`
+  returns :attr:`~pygmo.evolve_status.idle`;
+* :attr:`~pygmo.evolve_status.busy` if, for at least one island in the archipelago, :attr:`pygmo.island.status`
+  returns :attr:`~pygmo.evolve_status.busy`, and for no island :attr:`pygmo.island.status` returns an error status;
+* :attr:`~pygmo.evolve_status.idle_error` if no island in the archipelago is busy and for at least one island
+  :attr:`pygmo.island.status` returns :attr:`~pygmo.evolve_status.idle_error`;
+* :attr:`~pygmo.evolve_status.busy_error` if, for at least one island in the archipelago, :attr:`pygmo.island.status`
+  returns an error status and at least one island is busy.
+
+Note that after a call to :func:`~pygmo.archipelago.wait_check()`, :attr:`pygmo.archipelago.status` will always return
+:attr:`~pygmo.evolve_status.idle`, and after a call to :func:`~pygmo.archipelago.wait()`, :attr:`pygmo.archipelago.status`
+will always return either :attr:`~pygmo.evolve_status.idle` or :attr:`~pygmo.evolve_status.idle_error`.
+
+Returns:
+    :class:`~pygmo.evolve_status`:  a flag indicating the current status of asynchronous operations in the archipelago
+
+)";
+}
+
+std::string archipelago_wait_docstring()
+{
+    return R"(wait()
+
+Block until all evolutions have finished.
+
+This method will call :func:`pygmo.island.wait()` on all the islands of the archipelago. Exceptions thrown by island
+evolutions can be re-raised via :func:`~pygmo.archipelago.wait_check()`: they will **not** be re-thrown by this method.
+Also, contrary to :func:`~pygmo.archipelago.wait_check()`, this method will **not** reset the status of the archipelago:
+after a call to :func:`~pygmo.archipelago.wait()`, the :attr:`~pygmo.archipelago.status` attribute will
+always return either :attr:`pygmo.evolve_status.idle` or :attr:`pygmo.evolve_status.idle_error`.
+
+)";
+}
+
+std::string archipelago_wait_check_docstring()
+{
+    return R"(wait_check()
+
+Block until all evolutions have finished and raise the first exception that was encountered.
+
+This method will call :func:`pygmo.island.wait_check()` on all the islands of the archipelago (following
+the order in which the islands were inserted into the archipelago).
+The first exception raised by :func:`pygmo.island.wait_check()` will be re-raised by this method,
+and all the exceptions thrown by the other calls to :func:`pygmo.island.wait_check()` will be ignored.
+
+Note that :func:`~pygmo.archipelago.wait_check()` resets the status of the archipelago: after a call to
+:func:`~pygmo.archipelago.wait_check()`, the :attr:`~pygmo.archipelago.status` attribute will
+always return :attr:`pygmo.evolve_status.idle`.
+
+Raises:
+    unspecified: any exception thrown by any evolution task queued in the archipelago's
+      islands
+
+)";
+}
+
+std::string archipelago_getitem_docstring()
+{
+    return R"(__getitem__(i)
+
+This subscript operator can be used to access the *i*-th island of the archipelago (that is, the *i*-th island that was
+inserted via :func:`~pygmo.archipelago.push_back()`).
+
+Raises:
+    IndexError: if *i* is greater than the size of the archipelago
+
+)";
+}
+
+std::string archipelago_get_champions_f_docstring()
+{
+    return R"(get_champions_f()
+
+Get the fitness vectors of the islands' champions.
+
+Returns:
+    ``list`` of 1D NumPy float arrays: the fitness vectors of the islands' champions
+
+Raises:
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g., type conversion errors,
+      mismatched function signatures, etc.)
+
+)";
+}
+
+std::string archipelago_get_champions_x_docstring()
+{
+    return R"(get_champions_x()
+
+Get the decision vectors of the islands' champions.
+
+Returns:
+    ``list`` of 1D NumPy float arrays: the decision vectors of the islands' champions
+
+Raises:
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g., type conversion errors,
+      mismatched function signatures, etc.)
+
+)";
+}
+
+std::string archipelago_get_topology_docstring()
+{
+    return R"(get_topology()
+
+Get the topology.
+
+The topology determines the direction and the probability of the migration paths between
+the islands of the archipelago. The :class:`~pygmo.topology` vertex with index ``i``
+corresponds to the island with index ``i`` in the archipelago.
+
+Returns:
+    :class:`~pygmo.topology`: a copy of the archipelago's topology
+
+Raises:
+    unspecified: any exception thrown by copying the topology
+
+)";
+}
+
+std::string archipelago_set_topology_docstring()
+{
+    return R"(set_topology(t)
+
+Set the topology.
+
+The vertices of *t* are not adjusted to the number of islands in the archipelago:
+it is the user's responsibility to provide a topology whose number of vertices
+matches the size of the archipelago. Islands subsequently added via
+:func:`~pygmo.archipelago.push_back()` will trigger a call to :func:`~pygmo.topology.push_back()`
+on the archipelago's topology.
+
+Args:
+    t (:class:`~pygmo.topology` or a supported topology): the new topology
+
+Raises:
+    unspecified: any exception thrown by copying the topology, or by failures at the intersection
+      between C++ and Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string archipelago_get_s_policy_docstring()
+{
+    return R"(get_s_policy()
+
+Get the selection policy.
+
+The selection policy determines which individuals of an island are offered for emigration
+at the end of each evolution.
+
+Returns:
+    :class:`~pygmo.s_policy`: a copy of the archipelago's selection policy
+
+Raises:
+    unspecified: any exception thrown by copying the selection policy
+
+)";
+}
+
+std::string archipelago_set_s_policy_docstring()
+{
+    return R"(set_s_policy(s)
+
+Set the selection policy.
+
+Args:
+    s (:class:`~pygmo.s_policy` or a supported selection policy): the new selection policy
+
+Raises:
+    unspecified: any exception thrown by copying the selection policy, or by failures at the intersection
+      between C++ and Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string archipelago_get_r_policy_docstring()
+{
+    return R"(get_r_policy()
+
+Get the replacement policy.
+
+The replacement policy determines how the immigrants received by an island replace
+the individuals of the island's population at the beginning of each evolution.
+
+Returns:
+    :class:`~pygmo.r_policy`: a copy of the archipelago's replacement policy
+
+Raises:
+    unspecified: any exception thrown by copying the replacement policy
+
+)";
+}
+
+std::string archipelago_set_r_policy_docstring()
+{
+    return R"(set_r_policy(r)
+
+Set the replacement policy.
+
+Args:
+    r (:class:`~pygmo.r_policy` or a supported replacement policy): the new replacement policy
+
+Raises:
+    unspecified: any exception thrown by copying the replacement policy, or by failures at the intersection
+      between C++ and Python (e.g., type conversion errors, mismatched function signatures, etc.)
+
+)";
+}
+
+std::string archipelago_get_migrants_db_docstring()
+{
+    return R"(get_migrants_db()
+
+Get the database of migrants.
+
+The database contains, for each island in the archipelago, the group of individuals
+most recently selected for emigration from that island. Each group is returned as a tuple of
+three NumPy arrays containing, respectively, the IDs (1D array), the decision vectors (2D array)
+and the fitness vectors (2D array) of the individuals.
+
+Returns:
+    ``list`` of ``tuple``: a copy of the database of migrants
+
+Raises:
+    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g., type conversion errors,
+      mismatched function signatures, etc.)
+
+)";
+}
+
+std::string topology_docstring()
+{
+    return R"(__init__(udt = unconnected())
+
+Topology.
+
+In the jargon of pygmo, a topology is an object that represents connections among
+:class:`islands <pygmo.island>` in an :class:`~pygmo.archipelago`. In essence,
+a topology is a weighted directed graph in which
+
+* the vertices (or nodes) are islands,
+* the edges (or arcs) are directed connections between islands across which information flows during the
+  optimisation process (via the migration of individuals),
+* the weights of the edges (whose numerical values are the :math:`[0.,1.]` range) represent the migration
+  probability.
 
-This class is the Python counterpart of the C++ class :cpp:class:`pagmo::island`.
+Following the same schema adopted for :class:`~pygmo.problem`, :class:`~pygmo.algorithm`, etc.,
+:class:`~pygmo.topology` exposes a generic interface to *user-defined topologies* (or UDT for short).
+In pygmo, a :class:`~pygmo.topology` can be constructed only from one of the UDTs implemented in C++
+(:class:`~pygmo.unconnected`, :class:`~pygmo.ring`, :class:`~pygmo.fully_connected`,
+:class:`~pygmo.random_k_regular` and :class:`~pygmo.free_form`). Arbitrary graphs can be
+described via :class:`~pygmo.free_form`.
+
+See also the docs of the C++ class :cpp:class:`pagmo::topology`.
+
+Args:
+    udt: a user-defined topology
+
+Raises:
+    unspecified: any exception thrown by the constructor of the UDT
 
 )";
 }
 
-std::string island_evolve_docstring()
+std::string topology_get_connections_docstring()
 {
-    return R"(evolve(n = 1)
-
-Launch evolution.
+    return R"(get_connections(i)
 
-This method will evolve the island’s :class:`~pygmo.population` using the island’s :class:`~pygmo.algorithm`.
-The evolution happens asynchronously: a call to :func:`~pygmo.island.evolve()` will create an evolution task that
-will be pushed to a queue, and then return immediately. The tasks in the queue are consumed by a separate thread of execution
-managed by the :class:`~pygmo.island` object. Each task will invoke the ``run_evolve()`` method of the UDI *n*
-times consecutively to perform the actual evolution. The island's population will be updated at the end of each ``run_evolve()``
-invocation. Exceptions raised inside the tasks are stored within the island object, and can be re-raised by calling
-:func:`~pygmo.island.wait_check()`.
+Get the connections to a vertex.
 
-It is possible to call this method multiple times to enqueue multiple evolution tasks, which will be consumed in a FIFO (first-in
-first-out) fashion. The user may call :func:`~pygmo.island.wait()` or :func:`~pygmo.island.wait_check()` to block until all
-tasks have been completed, and to fetch exceptions raised during the execution of the tasks. The :attr:`~pygmo.island.status`
-attribute can be used to query the status of the asynchronous operations in the island.
+This method will return a tuple of two 1D NumPy arrays describing the list of vertices connected
+to the vertex at index *i* (that is, the vertices from which individuals can migrate to the vertex
+at index *i*). The first array contains the indices of the connecting vertices, the second array
+contains the weights of the corresponding edges (i.e., the migration probabilities).
 
 Args:
-     n (``int``): the number of times the ``run_evolve()`` method of the UDI will be called within the evolution task
+    i (``int``): the index of the vertex whose connections will be returned
+
+Returns:
+    ``tuple``: the indices of the connecting vertices and the weights of the edges
 
 Raises:
-    OverflowError: if *n* is negative or larger than an implementation-defined value
-    unspecified: any exception thrown by the underlying C++ method, or by failures at the intersection between C++ and
-      Python (e.g., type conversion errors, mismatched function signatures, etc.)
+    OverflowError: if *i* is negative or too large
+    ValueError: if the arrays returned by the UDT have different sizes, or if the weights are not finite
+      numbers in the :math:`[0.,1.]` range
+    unspecified: any exception thrown by the ``get_connections()`` method of the UDT
 
 )";
 }
 
-std::string island_wait_check_docstring()
+std::string topology_push_back_docstring()
 {
-    return R"(wait_check()
+    return R"(push_back(n = 1)
 
-Block until evolution ends and re-raise the first stored exception.
+Add vertices.
 
-If one task enqueued after the last call to :func:`~pygmo.island.wait_check()` threw an exception, the exception will be re-thrown
-by this method. If more than one task enqueued after the last call to :func:`~pygmo.island.wait_check()` threw an exception,
-this method will re-throw the exception raised by the first enqueued task that threw, and the exceptions
-from all the other tasks that threw will be ignored.
+This method will add *n* vertices to the topology.
 
-Note that :func:`~pygmo.island.wait_check()` resets the status of the island: after a call to :func:`~pygmo.island.wait_check()`,
-:attr:`~pygmo.island.status` will always return :attr:`pygmo.evolve_status.idle`.
+Args:
+    n (``int``): the number of vertices to add
 
 Raises:
-    unspecified: any exception thrown by evolution tasks or by the underlying C++ method
+    OverflowError: if *n* is negative or too large
+    unspecified: any exception thrown by the ``push_back()`` method of the UDT
 
 )";
 }
 
-std::string island_wait_docstring()
+std::string topology_get_name_docstring()
 {
-    return R"(wait()
+    return R"(get_name()
 
-This method will block until all the evolution tasks enqueued via :func:`~pygmo.island.evolve()` have been completed.
-Exceptions thrown by the enqueued tasks can be re-raised via :func:`~pygmo.island.wait_check()`: they will **not** be
-re-thrown by this method. Also, contrary to :func:`~pygmo.island.wait_check()`, this method will **not** reset the
-status of the island: after a call to :func:`~pygmo.island.wait()`, :attr:`~pygmo.island.status` will always return
-either :attr:`pygmo.evolve_status.idle` or :attr:`pygmo.evolve_status.idle_error`.
+Topology's name.
+
+Returns:
+    ``str``: the name of the UDT
 
 )";
 }
 
-std::string island_status_docstring()
+std::string topology_get_extra_info_docstring()
 {
-    return R"(Status of the island.
+    return R"(get_extra_info()
 
-This read-only property will return an :class:`~pygmo.evolve_status` flag indicating the current status of
-asynchronous operations in the island. The flag will be:
+Topology's extra info.
 
-* :attr:`~pygmo.evolve_status.idle` if the island is currently not evolving and no exceptions
-  were thrown by evolution tasks since the last call to :func:`~pygmo.island.wait_check()`;
-* :attr:`~pygmo.evolve_status.busy` if the island is evolving and no exceptions
-  have (yet) been thrown by evolution tasks since the last call to :func:`~pygmo.island.wait_check()`;
-* :attr:`~pygmo.evolve_status.idle_error` if the island is currently not evolving and at least one
-  evolution task threw an exception since the last call to :func:`~pygmo.island.wait_check()`;
-* :attr:`~pygmo.evolve_status.busy_error` if the island is currently evolving and at least one
-  evolution task has already thrown an exception since the last call to :func:`~pygmo.island.wait_check()`.
+Returns:
+    ``str``: extra info about the UDT
 
-Note that after a call to :func:`~pygmo.island.wait_check()`, :attr:`~pygmo.island.status` will always return
-:attr:`~pygmo.evolve_status.idle`, and after a call to :func:`~pygmo.island.wait()`, :attr:`~pygmo.island.status`
-will always return either :attr:`~pygmo.evolve_status.idle` or :attr:`~pygmo.evolve_status.idle_error`.
+Raises:
+    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDT
 
-Returns:
-    :class:`~pygmo.evolve_status`: a flag indicating the current status of asynchronous operations in the island
+)";
+}
+
+std::string unconnected_docstring()
+{
+    return R"(__init__()
+
+Unconnected topology.
+
+This user-defined topology (UDT) represents an unconnected graph: no migration
+will take place when using this UDT.
+
+See also the docs of the C++ class :cpp:class:`pagmo::unconnected`.
 
 )";
 }
 
-std::string island_get_algorithm_docstring()
+std::string ring_docstring()
 {
-    return R"(get_algorithm()
+    return R"(__init__(n = 0, w = 1.)
 
-Get the algorithm.
+Ring topology.
 
-It is safe to call this method while the island is evolving.
+This user-defined topology (UDT) represents a bidirectional ring: each vertex is connected
+to the previous and to the next vertex, and all edges have the same weight *w*.
 
-Returns:
-    :class:`~pygmo.algorithm`: a copy of the island's algorithm
+See also the docs of the C++ class :cpp:class:`pagmo::ring`.
+
+Args:
+    n (``int``): the desired number of vertices
+    w (``float``): the weight of the edges
 
 Raises:
-    unspecified: any exception thrown by the underlying C++ method
+    OverflowError: if *n* is negative or too large
+    ValueError: if *w* is not in the :math:`[0.,1.]` range
 
 )";
 }
 
-std::string island_set_algorithm_docstring()
+std::string fully_connected_docstring()
 {
-    return R"(set_algorithm(algo)
+    return R"(__init__(n = 0, w = 1.)
 
-Set the algorithm.
+Fully connected topology.
 
-It is safe to call this method while the island is evolving.
+This user-defined topology (UDT) represents a complete graph: each vertex is connected
+to all the other vertices, and all edges have the same weight *w*.
+
+See also the docs of the C++ class :cpp:class:`pagmo::fully_connected`.
 
 Args:
-    algo (:class:`~pygmo.algorithm`): the algorithm that will be copied into the island
+    n (``int``): the desired number of vertices
+    w (``float``): the weight of the edges
 
 Raises:
-    unspecified: any exception thrown by the underlying C++ method
+    OverflowError: if *n* is negative or too large
+    ValueError: if *w* is not in the :math:`[0.,1.]` range
 
 )";
 }
 
-std::string island_get_population_docstring()
+std::string random_k_regular_docstring()
 {
-    return R"(get_population()
+    return R"(__init__(k = 1, n = 0, w = 1., seed = random)
 
-Get the population.
+Random k-regular topology.
 
-It is safe to call this method while the island is evolving.
+This user-defined topology (UDT) represents a randomly-generated directed graph in which each
+vertex has (whenever possible) exactly *k* incoming edges, all with the same weight *w*. The
+connections of each new vertex are drawn randomly when the vertex is added to the topology.
 
-Returns:
-    :class:`~pygmo.population`: a copy of the island's population
+See also the docs of the C++ class :cpp:class:`pagmo::random_k_regular`.
+
+Args:
+    k (``int``): the number of incoming edges of each vertex
+    n (``int``): the desired number of vertices
+    w (``float``): the weight of the edges
+    seed (``int``): the seed of the random number generator
 
 Raises:
-    unspecified: any exception thrown by the underlying C++ method
+    OverflowError: if *k*, *n* or *seed* are negative or too large
+    ValueError: if *w* is not in the :math:`[0.,1.]` range
 
 )";
 }
 
-std::string island_set_population_docstring()
+std::string free_form_docstring()
 {
-    return R"(set_population(pop)
+    return R"(__init__(n = 0)
 
-Set the population.
+Free-form topology.
 
-It is safe to call this method while the island is evolving.
+This user-defined topology (UDT) represents a graph whose edges are set explicitly by the user
+via the :func:`~pygmo.free_form.add_edge()` method. The *n* initial vertices, and the vertices
+added via :func:`~pygmo.topology.push_back()`, are created without connections.
+
+See also the docs of the C++ class :cpp:class:`pagmo::free_form`.
 
 Args:
-    pop (:class:`~pygmo.population`): the population that will be copied into the island
+    n (``int``): the initial number of vertices
 
 Raises:
-    unspecified: any exception thrown by the underlying C++ method
+    OverflowError: if *n* is negative or too large
 
 )";
 }
 
-std::string island_get_thread_safety_docstring()
+std::string free_form_add_edge_docstring()
 {
-    return R"(get_thread_safety()
+    return R"(add_edge(i, j, w = 1.)
 
-It is safe to call this method while the island is evolving.
+Add an edge.
 
-Returns:
-    ``tuple``: a tuple containing the :class:`~pygmo.thread_safety` levels of the island's algorithm and problem
+This method will add a directed edge from the vertex at index *i* to the vertex at index *j*,
+with weight *w*. If the edge already exists, its weight will be set to *w*.
+
+Args:
+    i (``int``): the index of the source vertex
+    j (``int``): the index of the destination vertex
+    w (``float``): the weight of the edge
 
 Raises:
-    unspecified: any exception thrown by the underlying C++ method
+    OverflowError: if *i* or *j* are negative or too large
+    ValueError: if *i* or *j* are not valid vertex indices, if *i* and *j* are equal, or if *w* is not in
+      the :math:`[0.,1.]` range
 
 )";
 }
 
-std::string island_get_name_docstring()
+std::string generic_udt_num_vertices_docstring()
 {
-    return R"(get_name()
-
-Island's name.
+    return R"(num_vertices()
 
-If the UDI provides a ``get_name()`` method, then this method will return the output of its ``get_name()`` method.
-Otherwise, an implementation-defined name based on the type of the UDI will be returned.
+Returns:
+    ``int``: the number of vertices in the topology
 
-It is safe to call this method while the island is evolving.
+)";
+}
 
-The ``get_name()`` method of the UDI must return a ``str``.
+std::string generic_udt_get_weight_docstring()
+{
+    return R"(get_weight()
 
 Returns:
-    ``str``: the name of the UDI
-
-Raises:
-    unspecified: any exception thrown by the ``get_name()`` method of the UDI
+    ``float``: the weight of the edges in the topology
 
 )";
 }
 
-std::string island_get_extra_info_docstring()
+std::string random_k_regular_get_seed_docstring()
 {
-    return R"(get_extra_info()
+    return R"(get_seed()
 
-Island's extra info.
+Returns:
+    ``int``: the seed used to initialise the random number generator of the topology
 
-If the UDI provides a ``get_extra_info()`` method, then this method will return the output of its ``get_extra_info()``
-method. Otherwise, an empty string will be returned.
+)";
+}
 
-It is safe to call this method while the island is evolving.
+std::string s_policy_docstring()
+{
+    return R"(__init__(udsp = select_best())
 
-The ``get_extra_info()`` method of the UDI must return a ``str``.
+Selection policy.
 
-Returns:
-    ``str``: extra info about the UDI
+A selection policy determines which individuals of an island's population are selected for
+emigration at the end of an evolution. :class:`~pygmo.s_policy` exposes a generic interface to
+*user-defined selection policies* (or UDSP for short). In pygmo, a :class:`~pygmo.s_policy` can be
+constructed only from one of the UDSPs implemented in C++ (e.g., :class:`~pygmo.select_best`).
+
+See also the docs of the C++ class :cpp:class:`pagmo::s_policy`.
+
+Args:
+    udsp: a user-defined selection policy
 
 Raises:
-    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDI
+    unspecified: any exception thrown by the constructor of the UDSP
 
 )";
 }
 
-std::string thread_island_docstring()
+std::string s_policy_get_name_docstring()
 {
-    return R"(__init__()
-
-Thread island.
+    return R"(get_name()
 
-This class is a user-defined island (UDI) that will run evolutions directly inside
-the separate thread of execution within :class:`pygmo.island`. Evolution tasks running on this
-UDI must involve :class:`~pygmo.algorithm` and :class:`~pygmo.problem` instances
-that provide at least the :attr:`~pygmo.thread_safety.basic` thread safety guarantee, otherwise
-errors will be raised during the evolution.
+Selection policy's name.
 
-See also the documentation of the corresponding C++ class :cpp:class:`pagmo::thread_island`.
+Returns:
+    ``str``: the name of the UDSP
 
 )";
 }
 
-std::string archipelago_docstring()
+std::string s_policy_get_extra_info_docstring()
 {
-    return R"(Archipelago.
+    return R"(get_extra_info()
 
-An archipelago is a collection of :class:`~pygmo.island` objects which provides a convenient way to perform
-multiple optimisations in parallel.
+Selection policy's extra info.
 
-The interface of :class:`~pygmo.archipelago` mirrors partially the interface of :class:`~pygmo.island`: the
-evolution is initiated by a call to :func:`~pygmo.archipelago.evolve()`, and at any time the user can query the
-state of the archipelago and access its island members. The user can explicitly wait for pending evolutions
-to conclude by calling the :func:`~pygmo.archipelago.wait()` and :func:`~pygmo.archipelago.wait_check()` methods.
-The status of ongoing evolutions in the archipelago can be queried via the :attr:`~pygmo.archipelago.status` attribute.
+Returns:
+    ``str``: extra info about the UDSP
+
+Raises:
+    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDSP
 
 )";
 }
 
-std::string archipelago_evolve_docstring()
+std::string r_policy_docstring()
 {
-    return R"(evolve(n = 1)
+    return R"(__init__(udrp = fair_replace())
 
-Evolve archipelago.
+Replacement policy.
 
-This method will call :func:`pygmo.island.evolve()` on all the islands of the archipelago.
-The input parameter *n* will be passed to the invocations of :func:`pygmo.island.evolve()` for each island.
-The :attr:`~pygmo.archipelago.status` attribute can be used to query the status of the asynchronous operations in the
-archipelago.
+A replacement policy determines how the individuals of an island's population are replaced
+by the immigrants received from the connected islands at the beginning of an evolution.
+:class:`~pygmo.r_policy` exposes a generic interface to *user-defined replacement policies*
+(or UDRP for short). In pygmo, a :class:`~pygmo.r_policy` can be constructed only from one of the UDRPs
+implemented in C++ (e.g., :class:`~pygmo.fair_replace`).
+
+See also the docs of the C++ class :cpp:class:`pagmo::r_policy`.
 
 Args:
-     n (``int``): the parameter that will be passed to :func:`pygmo.island.evolve()`
+    udrp: a user-defined replacement policy
 
 Raises:
-    unspecified: any exception thrown by :func:`pygmo.island.evolve()`
+    unspecified: any exception thrown by the constructor of the UDRP
 
 )";
 }
 
-std::string archipelago_status_docstring()
+std::string r_policy_get_name_docstring()
 {
-    return R"(Status of the archipelago.
-
-This read-only property will return an :class:`~pygmo.evolve_status` flag indicating the current status of
-asynchronous operations in the archipelago. The flag will be:
-
-* :attr:`~pygmo.evolve_status.idle` if, for all the islands in the archipelago, :attr:`pygmo.island.status`
-  returns :attr:`~pygmo.evolve_status.idle`;
-* :attr:`~pygmo.evolve_status.busy` if, for at least one island in the archipelago, :attr:`pygmo.island.status`
-  returns :attr:`~pygmo.evolve_status.busy`, and for no island :attr:`pygmo.island.status` returns an error status;
-* :attr:`~pygmo.evolve_status.idle_error` if no island in the archipelago is busy and for at least one island
-  :attr:`pygmo.island.status` returns :attr:`~pygmo.evolve_status.idle_error`;
-* :attr:`~pygmo.evolve_status.busy_error` if, for at least one island in the archipelago, :attr:`pygmo.island.status`
-  returns an error status and at least one island is busy.
+    return R"(get_name()
 
-Note that after a call to :func:`~pygmo.archipelago.wait_check()`, :attr:`pygmo.archipelago.status` will always return
-:attr:`~pygmo.evolve_status.idle`, and after a call to :func:`~pygmo.archipelago.wait()`, :attr:`pygmo.archipelago.status`
-will always return either :attr:`~pygmo.evolve_status.idle` or :attr:`~pygmo.evolve_status.idle_error`.
+Replacement policy's name.
 
 Returns:
-    :class:`~pygmo.evolve_status`:  a flag indicating the current status of asynchronous operations in the archipelago
+    ``str``: the name of the UDRP
 
 )";
 }
 
-std::string archipelago_wait_docstring()
+std::string r_policy_get_extra_info_docstring()
 {
-    return R"(wait()
+    return R"(get_extra_info()
 
-Block until all evolutions have finished.
+Replacement policy's extra info.
 
-This method will call :func:`pygmo.island.wait()` on all the islands of the archipelago. Exceptions thrown by island
-evolutions can be re-raised via :func:`~pygmo.archipelago.wait_check()`: they will **not** be re-thrown by this method.
-Also, contrary to :func:`~pygmo.archipelago.wait_check()`, this method will **not** reset the status of the archipelago:
-after a call to :func:`~pygmo.archipelago.wait()`, the :attr:`~pygmo.archipelago.status` attribute will
-always return either :attr:`pygmo.evolve_status.idle` or :attr:`pygmo.evolve_status.idle_error`.
+Returns:
+    ``str``: extra info about the UDRP
+
+Raises:
+    unspecified: any exception thrown by the ``get_extra_info()`` method of the UDRP
 
 )";
 }
 
-std::string archipelago_wait_check_docstring()
+std::string select_best_docstring()
 {
-    return R"(wait_check()
+    return R"(__init__(rate = 1)
 
-Block until all evolutions have finished and raise the first exception that was encountered.
+Select best selection policy.
 
-This method will call :func:`pygmo.island.wait_check()` on all the islands of the archipelago (following
-the order in which the islands were inserted into the archipelago).
-The first exception raised by :func:`pygmo.island.wait_check()` will be re-raised by this method,
-and all the exceptions thrown by the other calls to :func:`pygmo.island.wait_check()` will be ignored.
+This user-defined selection policy (UDSP) will select the *rate* best individuals of a population
+for emigration. If *rate* is an ``int``, it is interpreted as an absolute number of individuals,
+otherwise it is interpreted as a fraction of the population size. In multi-objective problems,
+the individuals are ranked via non-dominated sorting and crowding distance.
 
-Note that :func:`~pygmo.archipelago.wait_check()` resets the status of the archipelago: after a call to
-:func:`~pygmo.archipelago.wait_check()`, the :attr:`~pygmo.archipelago.status` attribute will
-always return :attr:`pygmo.evolve_status.idle`.
+See also the docs of the C++ class :cpp:class:`pagmo::select_best`.
+
+Args:
+    rate (``int`` or ``float``): the desired migration rate
 
 Raises:
-    unspecified: any exception thrown by any evolution task queued in the archipelago's
-      islands
+    ValueError: if *rate* is negative, or if it is a ``float`` not in the :math:`[0.,1.]` range
+    OverflowError: if *rate* is an ``int`` too large to be represented
+    TypeError: if *rate* is neither an ``int`` nor a ``float``
 
 )";
 }
 
-std::string archipelago_getitem_docstring()
+std::string fair_replace_docstring()
 {
-    return R"(__getitem__(i)
+    return R"(__init__(rate = 1)
 
-This subscript operator can be used to access the *i*-th island of the archipelago (that is, the *i*-th island that was
-inserted via :func:`~pygmo.archipelago.push_back()`).
+Fair replacement policy.
+
+This user-defined replacement policy (UDRP) will first select the *rate* best individuals from the
+incoming migrants, and then keep the best individuals among the union of the selected migrants and of the
+original population. The population size is preserved. If *rate* is an ``int``, it is interpreted as an
+absolute number of individuals, otherwise it is interpreted as a fraction of the population size.
+
+See also the docs of the C++ class :cpp:class:`pagmo::fair_replace`.
+
+Args:
+    rate (``int`` or ``float``): the desired migration rate
 
 Raises:
-    IndexError: if *i* is greater than the size of the archipelago
+    ValueError: if *rate* is negative, or if it is a ``float`` not in the :math:`[0.,1.]` range
+    OverflowError: if *rate* is an ``int`` too large to be represented
+    TypeError: if *rate* is neither an ``int`` nor a ``float``
 
 )";
 }
 
-std::string archipelago_get_champions_f_docstring()
+std::string generic_policy_get_rate_docstring()
 {
-    return R"(get_champions_f()
-
-Get the fitness vectors of the islands' champions.
+    return R"(get_rate()
 
 Returns:
-    ``list`` of 1D NumPy float arrays: the fitness vectors of the islands' champions
-
-Raises:
-    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g., type conversion errors,
-      mismatched function signatures, etc.)
+    ``float``: the migration rate, either absolute or fractional (see :func:`is_fractional()`)
 
 )";
 }
 
-std::string archipelago_get_champions_x_docstring()
+std::string generic_policy_is_fractional_docstring()
 {
-    return R"(get_champions_x()
-
-Get the decision vectors of the islands' champions.
+    return R"(is_fractional()
 
 Returns:
-    ``list`` of 1D NumPy float arrays: the decision vectors of the islands' champions
-
-Raises:
-    unspecified: any exception thrown by failures at the intersection between C++ and Python (e.g., type conversion errors,
-      mismatched function signatures, etc.)
+    ``bool``: ``True`` if the migration rate is fractional, ``False`` if it is absolute
 
 )";
 }
@@ -4783,6 +6256,10 @@ Returns:
     ``Best`` (``float``), the best fitness function found so far.
     ``Improvement`` (``float``), improvement made by the last generation.
 
+If the fitness deduplication is active (see :func:`~pygmo.sga.set_dedup()`), the screen output also shows, after ``Fevals:``,
+a ``Saved:`` column with the number of fitness evaluations saved so far. This number is not part of the log, and the total
+for the last call to ``evolve()`` is returned by :func:`~pygmo.sga.get_saved_fevals()`.
+
 Examples:
     >>> from pygmo import *
     >>> algo = algorithm(sga(gen = 500))
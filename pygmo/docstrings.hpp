@@ -36,6 +36,7 @@ namespace pygmo
 // population
 std::string population_docstring();
 std::string population_push_back_docstring();
+std::string population_batch_push_back_docstring();
 std::string population_random_decision_vector_docstring();
 std::string population_best_idx_docstring();
 std::string population_worst_idx_docstring();
@@ -53,6 +54,8 @@ std::string population_problem_docstring();
 std::string problem_docstring();
 std::string problem_get_best_docstring(const std::string &);
 std::string problem_fitness_docstring();
+std::string problem_batch_fitness_docstring();
+std::string problem_has_batch_fitness_docstring();
 std::string problem_get_bounds_docstring();
 std::string problem_get_nec_docstring();
 std::string problem_get_nic_docstring();
@@ -64,6 +67,7 @@ std::string problem_get_nf_docstring();
 std::string problem_get_nc_docstring();
 std::string problem_c_tol_docstring();
 std::string problem_get_fevals_docstring();
+std::string problem_increment_fevals_docstring();
 std::string problem_get_gevals_docstring();
 std::string problem_get_hevals_docstring();
 std::string problem_has_set_seed_docstring();
@@ -111,6 +115,14 @@ std::string decompose_decompose_fitness_docstring();
 std::string decompose_original_fitness_docstring();
 std::string decompose_z_docstring();
 std::string unconstrain_docstring();
+std::string memoize_docstring();
+std::string memoize_get_capacity_docstring();
+std::string memoize_get_hits_docstring();
+std::string memoize_get_misses_docstring();
+std::string memoize_get_gradient_hits_docstring();
+std::string memoize_get_gradient_misses_docstring();
+std::string memoize_clear_cache_docstring();
+std::string cfunc_problem_docstring();
 std::string get_best_docstring(const std::string &);
 std::string generic_udp_inner_problem_docstring();
 
@@ -130,6 +142,7 @@ std::string moead_docstring();
 std::string moead_get_log_docstring();
 std::string nsga2_docstring();
 std::string nsga2_get_log_docstring();
+std::string nsga2_set_bfe_docstring();
 std::string pso_docstring();
 std::string pso_get_log_docstring();
 std::string sade_docstring();
@@ -184,6 +197,9 @@ std::string bls_set_random_sr_seed_docstring(const std::string &);
 
 // common docstrings reusable by multiple udas, udps
 std::string generic_uda_get_seed_docstring();
+std::string generic_uda_set_dedup_docstring(const std::string &);
+std::string generic_uda_get_dedup_docstring();
+std::string generic_uda_get_saved_fevals_docstring();
 std::string generic_uda_inner_algorithm_docstring();
 
 // utilities
@@ -198,16 +214,26 @@ std::string hv_exclusive_docstring();
 std::string hv_greatest_contributor_docstring();
 std::string hv_least_contributor_docstring();
 std::string hv_refpoint_docstring();
+std::string hv_archive_docstring();
+std::string hv_archive_insert_docstring();
+std::string hv_archive_erase_docstring();
+std::string hv_archive_contributions_docstring();
+std::string hv_archive_exclusive_docstring();
+std::string hv_archive_least_contributor_docstring();
 std::string hvwfg_docstring();
 std::string hv2d_docstring();
 std::string hv3d_docstring();
+std::string hv4d_docstring();
 std::string bf_approx_docstring();
 std::string bf_fpras_docstring();
+std::string bf_set_n_threads_docstring(const std::string &);
+std::string bf_get_n_threads_docstring();
 // multi-objective
 std::string pareto_dominance_docstring();
 std::string non_dominated_front_2d_docstring();
 std::string crowding_distance_docstring();
 std::string fast_non_dominated_sorting_docstring();
+std::string non_dominated_sorting_docstring();
 std::string sort_population_mo_docstring();
 std::string select_best_N_mo_docstring();
 std::string decomposition_weights_docstring();
@@ -222,6 +248,8 @@ std::string estimate_sparsity_docstring();
 std::string estimate_gradient_docstring();
 std::string estimate_gradient_h_docstring();
 // global rng
+std::string get_island_pool_size_docstring();
+std::string set_island_pool_size_docstring();
 std::string set_global_rng_seed_docstring();
 
 // island.
@@ -241,6 +269,18 @@ std::string island_get_thread_safety_docstring();
 // udi.
 std::string thread_island_docstring();
 
+// bfe.
+std::string bfe_docstring();
+std::string bfe_call_docstring();
+std::string bfe_get_name_docstring();
+std::string bfe_get_extra_info_docstring();
+std::string bfe_get_thread_safety_docstring();
+
+// udbfe.
+std::string default_bfe_docstring();
+std::string thread_bfe_docstring();
+std::string member_bfe_docstring();
+
 // archipelago.
 std::string archipelago_docstring();
 std::string archipelago_evolve_docstring();
@@ -250,6 +290,47 @@ std::string archipelago_wait_check_docstring();
 std::string archipelago_getitem_docstring();
 std::string archipelago_get_champions_f_docstring();
 std::string archipelago_get_champions_x_docstring();
+std::string archipelago_get_topology_docstring();
+std::string archipelago_set_topology_docstring();
+std::string archipelago_get_s_policy_docstring();
+std::string archipelago_set_s_policy_docstring();
+std::string archipelago_get_r_policy_docstring();
+std::string archipelago_set_r_policy_docstring();
+std::string archipelago_get_migrants_db_docstring();
+
+// topology.
+std::string topology_docstring();
+std::string topology_get_connections_docstring();
+std::string topology_push_back_docstring();
+std::string topology_get_name_docstring();
+std::string topology_get_extra_info_docstring();
+
+// udt.
+std::string unconnected_docstring();
+std::string ring_docstring();
+std::string fully_connected_docstring();
+std::string random_k_regular_docstring();
+std::string free_form_docstring();
+std::string free_form_add_edge_docstring();
+std::string generic_udt_num_vertices_docstring();
+std::string generic_udt_get_weight_docstring();
+std::string random_k_regular_get_seed_docstring();
+
+// s_policy.
+std::string s_policy_docstring();
+std::string s_policy_get_name_docstring();
+std::string s_policy_get_extra_info_docstring();
+
+// r_policy.
+std::string r_policy_docstring();
+std::string r_policy_get_name_docstring();
+std::string r_policy_get_extra_info_docstring();
+
+// udsp and udrp.
+std::string select_best_docstring();
+std::string fair_replace_docstring();
+std::string generic_policy_get_rate_docstring();
+std::string generic_policy_is_fractional_docstring();
 }
 
 #endif
@@ -331,6 +331,9 @@ void expose_algorithms()
              bp::arg("mutation") = "polynomial", bp::arg("selection") = "tournament", bp::arg("seed"))));
     expose_algo_log(sga_, sga_get_log_docstring().c_str());
     sga_.def("get_seed", &sga::get_seed, generic_uda_get_seed_docstring().c_str());
+    sga_.def("set_dedup", &sga::set_dedup, generic_uda_set_dedup_docstring("sga").c_str(), (bp::arg("flag")));
+    sga_.def("get_dedup", &sga::get_dedup, generic_uda_get_dedup_docstring().c_str());
+    sga_.def("get_saved_fevals", &sga::get_saved_fevals, generic_uda_get_saved_fevals_docstring().c_str());
     // SIMULATED ANNEALING
     auto simulated_annealing_
         = expose_algorithm_pygmo<simulated_annealing>("simulated_annealing", simulated_annealing_docstring().c_str());
@@ -421,6 +424,9 @@ void expose_algorithms()
                moead_get_log_docstring().c_str());
 
     moead_.def("get_seed", &moead::get_seed, generic_uda_get_seed_docstring().c_str());
+    moead_.def("set_dedup", &moead::set_dedup, generic_uda_set_dedup_docstring("moead").c_str(), (bp::arg("flag")));
+    moead_.def("get_dedup", &moead::get_dedup, generic_uda_get_dedup_docstring().c_str());
+    moead_.def("get_saved_fevals", &moead::get_saved_fevals, generic_uda_get_saved_fevals_docstring().c_str());
     // NSGA2
     auto nsga2_ = expose_algorithm_pygmo<nsga2>("nsga2", nsga2_docstring().c_str());
     nsga2_.def(bp::init<unsigned, double, double, double, double>((bp::arg("gen") = 1u, bp::arg("cr") = 0.95,
@@ -440,6 +446,10 @@ void expose_algorithms()
                nsga2_get_log_docstring().c_str());
 
     nsga2_.def("get_seed", &nsga2::get_seed, generic_uda_get_seed_docstring().c_str());
+    nsga2_.def("set_dedup", &nsga2::set_dedup, generic_uda_set_dedup_docstring("nsga2").c_str(), (bp::arg("flag")));
+    nsga2_.def("get_dedup", &nsga2::get_dedup, generic_uda_get_dedup_docstring().c_str());
+    nsga2_.def("get_saved_fevals", &nsga2::get_saved_fevals, generic_uda_get_saved_fevals_docstring().c_str());
+    nsga2_.def("set_bfe", &nsga2::set_bfe, nsga2_set_bfe_docstring().c_str(), (bp::arg("b")));
 
 #if defined(PAGMO_WITH_NLOPT)
     // NLopt.
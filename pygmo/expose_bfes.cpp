@@ -0,0 +1,104 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#if defined(_MSC_VER)
+
+// Disable various warnings from MSVC.
+#pragma warning(disable : 4275)
+#pragma warning(disable : 4996)
+#pragma warning(disable : 4503)
+#pragma warning(disable : 4244)
+
+#endif
+
+#include <pygmo/python_includes.hpp>
+
+// See: https://docs.scipy.org/doc/numpy/reference/c-api.array.html#importing-the-api
+// In every cpp file We need to make sure this is included before everything else,
+// with the correct #defines.
+#define NO_IMPORT_ARRAY
+#define PY_ARRAY_UNIQUE_SYMBOL pygmo_ARRAY_API
+#include <pygmo/numpy.hpp>
+
+#include <boost/python/class.hpp>
+#include <boost/python/init.hpp>
+#include <boost/python/return_internal_reference.hpp>
+#include <boost/python/scope.hpp>
+
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
+
+#include <pygmo/common_utils.hpp>
+#include <pygmo/docstrings.hpp>
+#include <pygmo/pygmo_classes.hpp>
+
+using namespace pagmo;
+namespace bp = boost::python;
+
+namespace pygmo
+{
+
+// Main bfe exposition function - for *internal* use by pygmo.
+template <typename Bfe>
+static inline bp::class_<Bfe> expose_bfe_pygmo(const char *name, const char *descr)
+{
+    // We require all bfes to be def-ctible at the bare minimum.
+    bp::class_<Bfe> c(name, descr, bp::init<>());
+
+    // Mark it as a C++ bfe.
+    c.attr("_pygmo_cpp_bfe") = true;
+
+    // Get reference to the bfe class.
+    auto &b = get_bfe_class();
+
+    // Expose the bfe constructor from Bfe.
+    b.def(bp::init<const Bfe &>((bp::arg("udbfe"))));
+
+    // Expose extract.
+    b.def("_cpp_extract", &generic_cpp_extract<pagmo::bfe, Bfe>, bp::return_internal_reference<>());
+
+    // Add the bfe to the batch_evaluators submodule.
+    bp::scope().attr("batch_evaluators").attr(name) = c;
+
+    return c;
+}
+
+void expose_bfes()
+{
+    // Default bfe.
+    expose_bfe_pygmo<default_bfe>("default_bfe", default_bfe_docstring().c_str());
+
+    // Thread bfe.
+    expose_bfe_pygmo<thread_bfe>("thread_bfe", thread_bfe_docstring().c_str());
+
+    // Member bfe.
+    expose_bfe_pygmo<member_bfe>("member_bfe", member_bfe_docstring().c_str());
+}
+} // namespace pygmo
@@ -0,0 +1,155 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#if defined(_MSC_VER)
+
+// Disable various warnings from MSVC.
+#pragma warning(disable : 4275)
+#pragma warning(disable : 4996)
+#pragma warning(disable : 4503)
+#pragma warning(disable : 4244)
+
+#endif
+
+#include <pygmo/python_includes.hpp>
+
+// See: https://docs.scipy.org/doc/numpy/reference/c-api.array.html#importing-the-api
+// In every cpp file We need to make sure this is included before everything else,
+// with the correct #defines.
+#define NO_IMPORT_ARRAY
+#define PY_ARRAY_UNIQUE_SYMBOL pygmo_ARRAY_API
+#include <pygmo/numpy.hpp>
+
+#include <boost/python/args.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/default_call_policies.hpp>
+#include <boost/python/extract.hpp>
+#include <boost/python/init.hpp>
+#include <boost/python/make_constructor.hpp>
+#include <boost/python/object.hpp>
+#include <boost/python/return_internal_reference.hpp>
+#include <boost/python/scope.hpp>
+#include <string>
+
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/r_policy.hpp>
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/s_policy.hpp>
+
+#include <pygmo/common_utils.hpp>
+#include <pygmo/docstrings.hpp>
+#include <pygmo/pygmo_classes.hpp>
+
+using namespace pagmo;
+namespace bp = boost::python;
+
+namespace pygmo
+{
+
+// Main selection policy exposition function - for *internal* use by pygmo.
+template <typename Pol>
+static inline bp::class_<Pol> expose_s_policy_pygmo(const char *name, const char *descr)
+{
+    // We require all policies to be def-ctible at the bare minimum.
+    bp::class_<Pol> c(name, descr, bp::init<>());
+
+    // Mark it as a C++ selection policy.
+    c.attr("_pygmo_cpp_s_policy") = true;
+
+    // Get reference to the s_policy class.
+    auto &s = get_s_policy_class();
+
+    // Expose the s_policy constructor from Pol.
+    s.def(bp::init<const Pol &>((bp::arg("udsp"))));
+
+    // Expose extract.
+    s.def("_cpp_extract", &generic_cpp_extract<pagmo::s_policy, Pol>, bp::return_internal_reference<>());
+
+    return c;
+}
+
+// Main replacement policy exposition function - for *internal* use by pygmo.
+template <typename Pol>
+static inline bp::class_<Pol> expose_r_policy_pygmo(const char *name, const char *descr)
+{
+    // We require all policies to be def-ctible at the bare minimum.
+    bp::class_<Pol> c(name, descr, bp::init<>());
+
+    // Mark it as a C++ replacement policy.
+    c.attr("_pygmo_cpp_r_policy") = true;
+
+    // Get reference to the r_policy class.
+    auto &r = get_r_policy_class();
+
+    // Expose the r_policy constructor from Pol.
+    r.def(bp::init<const Pol &>((bp::arg("udrp"))));
+
+    // Expose extract.
+    r.def("_cpp_extract", &generic_cpp_extract<pagmo::r_policy, Pol>, bp::return_internal_reference<>());
+
+    return c;
+}
+
+// Construct a policy from a migration rate. Python integers are interpreted
+// as absolute migration rates, Python floats as fractional migration rates.
+template <typename Pol>
+static inline Pol *policy_from_rate(const bp::object &rate)
+{
+    if (isinstance(rate, builtin().attr("int"))) {
+        return ::new Pol(bp::extract<long long>(rate)());
+    }
+    if (isinstance(rate, builtin().attr("float"))) {
+        return ::new Pol(bp::extract<double>(rate)());
+    }
+    pygmo_throw(PyExc_TypeError,
+                ("the migration rate must be an integral or floating-point value, but an object of type '"
+                 + str(type(rate)) + "' was provided instead")
+                    .c_str());
+}
+
+// Expose the methods common to the policies parametrised by a migration rate.
+template <typename Pol>
+static inline void expose_rate_policy(bp::class_<Pol> &c)
+{
+    c.def("__init__", bp::make_constructor(lcast([](const bp::object &rate) { return policy_from_rate<Pol>(rate); }),
+                                           bp::default_call_policies(), (bp::arg("rate"))));
+    c.def("get_rate", &Pol::get_rate, generic_policy_get_rate_docstring().c_str());
+    c.def("is_fractional", &Pol::is_fractional, generic_policy_is_fractional_docstring().c_str());
+}
+
+void expose_policies()
+{
+    // Select best.
+    auto sb_ = expose_s_policy_pygmo<select_best>("select_best", select_best_docstring().c_str());
+    expose_rate_policy(sb_);
+
+    // Fair replace.
+    auto fr_ = expose_r_policy_pygmo<fair_replace>("fair_replace", fair_replace_docstring().c_str());
+    expose_rate_policy(fr_);
+}
+} // namespace pygmo
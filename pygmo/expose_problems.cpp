@@ -44,8 +44,10 @@ see https://www.gnu.org/licenses/. */
 #define PY_ARRAY_UNIQUE_SYMBOL pygmo_ARRAY_API
 #include <pygmo/numpy.hpp>
 
+#include <algorithm>
 #include <boost/python/args.hpp>
 #include <boost/python/class.hpp>
+#include <boost/python/def.hpp>
 #include <boost/python/default_call_policies.hpp>
 #include <boost/python/init.hpp>
 #include <boost/python/make_constructor.hpp>
@@ -53,8 +55,15 @@ see https://www.gnu.org/licenses/. */
 #include <boost/python/object.hpp>
 #include <boost/python/return_internal_reference.hpp>
 #include <boost/python/scope.hpp>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <sstream>
+#include <stdexcept>
+#include <string>
 #include <utility>
 
+#include <pagmo/exceptions.hpp>
 #include <pagmo/problem.hpp>
 #include <pagmo/problems/ackley.hpp>
 #include <pagmo/problems/cec2006.hpp>
@@ -68,6 +77,7 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
 #include <pagmo/problems/inventory.hpp>
 #include <pagmo/problems/luksan_vlcek1.hpp>
+#include <pagmo/problems/memoize.hpp>
 #include <pagmo/problems/minlp_rastrigin.hpp>
 #include <pagmo/problems/rastrigin.hpp>
 #include <pagmo/problems/rosenbrock.hpp>
@@ -135,6 +145,115 @@ struct tu_test_problem {
     }
 };
 
+// A problem whose fitness is computed by a native function, passed in as a raw function pointer
+// (e.g., from ctypes, cffi or Numba). The function is invoked directly from C++, without
+// going through the Python interpreter.
+struct cfunc_problem {
+    // The signature of the fitness function: decision vector and its size, output fitness vector and its size.
+    using fitness_t = void (*)(const double *, std::size_t, double *, std::size_t);
+    cfunc_problem() : m_fitness(&null_fitness), m_lb{0.}, m_ub{1.}, m_nobj(1u), m_nec(0u), m_nic(0u), m_nix(0u) {}
+    // NOTE: owner is the Python object (if any) managing the lifetime of the function. We keep a reference
+    // to it for as long as any copy of the problem exists. As the problem might be copied and destroyed in
+    // threads which do not hold the GIL, the reference is not a bp::object but a shared pointer whose deleter
+    // acquires the GIL.
+    cfunc_problem(std::uintptr_t address, const vector_double &lb, const vector_double &ub,
+                  vector_double::size_type nobj, vector_double::size_type nec, vector_double::size_type nic,
+                  vector_double::size_type nix, const std::string &name, const bp::object &owner)
+        : m_fitness(reinterpret_cast<fitness_t>(address)), m_lb(lb), m_ub(ub), m_nobj(nobj), m_nec(nec), m_nic(nic),
+          m_nix(nix), m_name(name)
+    {
+        if (!address) {
+            pagmo_throw(std::invalid_argument, "cannot construct a cfunc_problem from a null function pointer");
+        }
+        if (!owner.is_none()) {
+            Py_INCREF(owner.ptr());
+            m_owner.reset(owner.ptr(), [](PyObject *o) {
+                if (::Py_IsInitialized()) {
+                    gil_thread_ensurer gte;
+                    Py_DECREF(o);
+                }
+            });
+        }
+    }
+    vector_double fitness(const vector_double &x) const
+    {
+        vector_double f(m_nobj + m_nec + m_nic);
+        m_fitness(x.data(), x.size(), f.data(), f.size());
+        return f;
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {m_lb, m_ub};
+    }
+    vector_double::size_type get_nobj() const
+    {
+        return m_nobj;
+    }
+    vector_double::size_type get_nec() const
+    {
+        return m_nec;
+    }
+    vector_double::size_type get_nic() const
+    {
+        return m_nic;
+    }
+    vector_double::size_type get_nix() const
+    {
+        return m_nix;
+    }
+    std::string get_name() const
+    {
+        return m_name.empty() ? "C function problem" : m_name;
+    }
+    std::string get_extra_info() const
+    {
+        std::ostringstream oss;
+        oss << "\tFunction address: " << reinterpret_cast<const void *>(m_fitness) << '\n';
+        return oss.str();
+    }
+    // NOTE: the function is required to be thread-safe (see the docstring).
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::basic;
+    }
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+        pagmo_throw(std::invalid_argument,
+                    "a cfunc_problem cannot be serialized, as the function pointer it contains is valid only in the "
+                    "process in which it was created (a thread island can be used for parallel evolutions instead "
+                    "of a multiprocessing island)");
+    }
+    static void null_fitness(const double *, std::size_t, double *f, std::size_t nf)
+    {
+        std::fill(f, f + nf, 0.);
+    }
+    fitness_t m_fitness;
+    vector_double m_lb;
+    vector_double m_ub;
+    vector_double::size_type m_nobj;
+    vector_double::size_type m_nec;
+    vector_double::size_type m_nic;
+    vector_double::size_type m_nix;
+    std::string m_name;
+    std::shared_ptr<PyObject> m_owner;
+};
+
+// A native function with the signature of cfunc_problem, used to test cfunc_problem.
+// It computes the sphere function (first fitness component), and it sets the other
+// components to the decision vector size.
+static void test_cfunc(const double *x, std::size_t nx, double *f, std::size_t nf)
+{
+    double retval = 0.;
+    for (std::size_t i = 0; i < nx; ++i) {
+        retval += x[i] * x[i];
+    }
+    std::fill(f, f + nf, static_cast<double>(nx));
+    if (nf) {
+        f[0] = retval;
+    }
+}
+
 // C++ UDP exposition function - for *internal* pygmo use. This needs to be different
 // from the exposition function used for APs.
 template <typename Prob>
@@ -171,6 +290,21 @@ void expose_problems()
     test_p.def("set_n", &test_problem::set_n);
     // Thread unsafe test problem.
     expose_problem_pygmo<tu_test_problem>("_tu_test_problem", "A thread unsafe test problem.");
+    // Address of the test function for the cfunc problem.
+    bp::def("_test_cfunc_address", lcast([]() { return reinterpret_cast<std::uintptr_t>(&test_cfunc); }));
+    // Native function problem.
+    // NOTE: the conversion of the function pointer into an address is performed in the __init__ wrapper
+    // on the Python side.
+    auto cfunc_p = expose_problem_pygmo<cfunc_problem>("cfunc_problem", cfunc_problem_docstring().c_str());
+    cfunc_p.def("__init__", bp::make_constructor(
+                                lcast([](std::uintptr_t address, const bp::object &lb, const bp::object &ub,
+                                         vector_double::size_type nobj, vector_double::size_type nec,
+                                         vector_double::size_type nic, vector_double::size_type nix,
+                                         const std::string &name, const bp::object &owner) {
+                                    return ::new cfunc_problem(address, to_vd(lb), to_vd(ub), nobj, nec, nic, nix,
+                                                               name, owner);
+                                }),
+                                bp::default_call_policies()));
     // Null problem.
     auto np = expose_problem_pygmo<null_problem>("null_problem", null_problem_docstring().c_str());
     np.def(bp::init<vector_double::size_type, vector_double::size_type, vector_double::size_type>(
@@ -278,6 +412,25 @@ void expose_problems()
                  bp::make_function(lcast([](unconstrain &udp) -> problem & { return udp.get_inner_problem(); }),
                                    bp::return_internal_reference<>()),
                  generic_udp_inner_problem_docstring().c_str());
+    // Memoize meta-problem.
+    auto memoize_ = expose_problem_pygmo<memoize>("memoize", memoize_docstring().c_str());
+    // NOTE: An __init__ wrapper on the Python side will take care of cting a pagmo::problem from the input UDP,
+    // and then invoke this ctor. This way we avoid having to expose a different ctor for every exposed C++ prob.
+    memoize_.def("__init__",
+                 bp::make_constructor(lcast([](const problem &p, std::size_t capacity, bool cache_gradient) {
+                                          return ::new pagmo::memoize(p, capacity, cache_gradient);
+                                      }),
+                                      bp::default_call_policies()));
+    memoize_.def("get_capacity", &memoize::get_capacity, memoize_get_capacity_docstring().c_str());
+    memoize_.def("get_hits", &memoize::get_hits, memoize_get_hits_docstring().c_str());
+    memoize_.def("get_misses", &memoize::get_misses, memoize_get_misses_docstring().c_str());
+    memoize_.def("get_gradient_hits", &memoize::get_gradient_hits, memoize_get_gradient_hits_docstring().c_str());
+    memoize_.def("get_gradient_misses", &memoize::get_gradient_misses, memoize_get_gradient_misses_docstring().c_str());
+    memoize_.def("clear_cache", &memoize::clear_cache, memoize_clear_cache_docstring().c_str());
+    add_property(memoize_, "inner_problem",
+                 bp::make_function(lcast([](memoize &udp) -> problem & { return udp.get_inner_problem(); }),
+                                   bp::return_internal_reference<>()),
+                 generic_udp_inner_problem_docstring().c_str());
     // Decompose meta-problem.
     auto decompose_ = expose_problem_pygmo<decompose>("decompose", decompose_docstring().c_str());
     // NOTE: An __init__ wrapper on the Python side will take care of cting a pagmo::problem from the input UDP,
@@ -300,3 +453,7 @@ void expose_problems()
                  generic_udp_inner_problem_docstring().c_str());
 }
 }
+
+// Register the native function problem for serialization (which is not supported, but
+// in this way the user gets a meaningful error message).
+PAGMO_REGISTER_PROBLEM(pygmo::cfunc_problem)
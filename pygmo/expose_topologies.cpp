@@ -0,0 +1,133 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#if defined(_MSC_VER)
+
+// Disable various warnings from MSVC.
+#pragma warning(disable : 4275)
+#pragma warning(disable : 4996)
+#pragma warning(disable : 4503)
+#pragma warning(disable : 4244)
+
+#endif
+
+#include <pygmo/python_includes.hpp>
+
+// See: https://docs.scipy.org/doc/numpy/reference/c-api.array.html#importing-the-api
+// In every cpp file We need to make sure this is included before everything else,
+// with the correct #defines.
+#define NO_IMPORT_ARRAY
+#define PY_ARRAY_UNIQUE_SYMBOL pygmo_ARRAY_API
+#include <pygmo/numpy.hpp>
+
+#include <boost/python/args.hpp>
+#include <boost/python/class.hpp>
+#include <boost/python/init.hpp>
+#include <boost/python/return_internal_reference.hpp>
+#include <boost/python/scope.hpp>
+#include <cstddef>
+
+#include <pagmo/topologies/free_form.hpp>
+#include <pagmo/topologies/fully_connected.hpp>
+#include <pagmo/topologies/random_k_regular.hpp>
+#include <pagmo/topologies/ring.hpp>
+#include <pagmo/topologies/unconnected.hpp>
+#include <pagmo/topology.hpp>
+
+#include <pygmo/common_utils.hpp>
+#include <pygmo/docstrings.hpp>
+#include <pygmo/pygmo_classes.hpp>
+
+using namespace pagmo;
+namespace bp = boost::python;
+
+namespace pygmo
+{
+
+// Main topology exposition function - for *internal* use by pygmo.
+template <typename Topo>
+static inline bp::class_<Topo> expose_topology_pygmo(const char *name, const char *descr)
+{
+    // We require all topologies to be def-ctible at the bare minimum.
+    bp::class_<Topo> c(name, descr, bp::init<>());
+
+    // Mark it as a C++ topology.
+    c.attr("_pygmo_cpp_topology") = true;
+
+    // Get reference to the topology class.
+    auto &t = get_topology_class();
+
+    // Expose the topology constructor from Topo.
+    t.def(bp::init<const Topo &>((bp::arg("udt"))));
+
+    // Expose extract.
+    t.def("_cpp_extract", &generic_cpp_extract<pagmo::topology, Topo>, bp::return_internal_reference<>());
+
+    return c;
+}
+
+// Expose the methods common to the topologies with uniform weights.
+template <typename Topo>
+static inline void expose_uniform_topology(bp::class_<Topo> &c)
+{
+    c.def(bp::init<std::size_t, double>((bp::arg("n") = std::size_t(0), bp::arg("w") = 1.)));
+    c.def("num_vertices", &Topo::num_vertices, generic_udt_num_vertices_docstring().c_str());
+    c.def("get_weight", &Topo::get_weight, generic_udt_get_weight_docstring().c_str());
+}
+
+void expose_topologies()
+{
+    // Unconnected topology.
+    expose_topology_pygmo<unconnected>("unconnected", unconnected_docstring().c_str());
+
+    // Ring.
+    auto ring_ = expose_topology_pygmo<ring>("ring", ring_docstring().c_str());
+    expose_uniform_topology(ring_);
+
+    // Fully connected.
+    auto fc_ = expose_topology_pygmo<fully_connected>("fully_connected", fully_connected_docstring().c_str());
+    expose_uniform_topology(fc_);
+
+    // Random k-regular.
+    auto rkr_ = expose_topology_pygmo<random_k_regular>("random_k_regular", random_k_regular_docstring().c_str());
+    rkr_.def(bp::init<unsigned, std::size_t, double>(
+        (bp::arg("k") = 1u, bp::arg("n") = std::size_t(0), bp::arg("w") = 1.)));
+    rkr_.def(bp::init<unsigned, std::size_t, double, unsigned>(
+        (bp::arg("k"), bp::arg("n"), bp::arg("w"), bp::arg("seed"))));
+    rkr_.def("num_vertices", &random_k_regular::num_vertices, generic_udt_num_vertices_docstring().c_str());
+    rkr_.def("get_weight", &random_k_regular::get_weight, generic_udt_get_weight_docstring().c_str());
+    rkr_.def("get_seed", &random_k_regular::get_seed, random_k_regular_get_seed_docstring().c_str());
+
+    // Free form.
+    auto ff_ = expose_topology_pygmo<free_form>("free_form", free_form_docstring().c_str());
+    ff_.def(bp::init<std::size_t>((bp::arg("n"))));
+    ff_.def("num_vertices", &free_form::num_vertices, generic_udt_num_vertices_docstring().c_str());
+    ff_.def("add_edge", &free_form::add_edge, free_form_add_edge_docstring().c_str(),
+            (bp::arg("i"), bp::arg("j"), bp::arg("w") = 1.));
+}
+} // namespace pygmo
@@ -97,16 +97,30 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
         check_mandatory_method(o, "get_bounds", "problem");
         // The Python UDP looks alright, let's deepcopy it into m_value.
         m_value = pygmo::deepcopy(o);
+        resolve_methods();
+    }
+    virtual ~prob_inner()
+    {
+        // NOTE: a thread-safe UDP might be destroyed from a thread not holding the GIL. In such case, we need
+        // to hold the GIL until the Python objects stored in the data members have been destroyed: m_gte
+        // is declared before them, and it is thus destroyed after them.
+        if (m_ts != thread_safety::none && ::Py_IsInitialized() && !pygmo::gil_held()) {
+            m_gte = make_unique<pygmo::gil_thread_ensurer>();
+        }
     }
     virtual std::unique_ptr<prob_inner_base> clone() const override final
     {
-        // This will make a deep copy using the ctor above.
-        return make_unique<prob_inner>(m_value);
+        return gil_call("clone", [&]() -> std::unique_ptr<prob_inner_base> {
+            // This will make a deep copy using the ctor above.
+            return make_unique<prob_inner>(m_value);
+        });
     }
     // Mandatory methods.
     virtual vector_double fitness(const vector_double &dv) const override final
     {
-        return pygmo::to_vd(m_value.attr("fitness")(pygmo::v_to_a(dv)));
+        return gil_call("fitness", [&]() -> vector_double {
+            return pygmo::to_vd(pygmo::call1(m_fitness, pygmo::v_to_a(dv)));
+        });
     }
     virtual std::pair<vector_double, vector_double> get_bounds() const override final
     {
@@ -145,7 +159,57 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
     }
     virtual std::string get_extra_info() const override final
     {
-        return getter_wrapper<std::string>(m_value, "get_extra_info", std::string{});
+        return gil_call("get_extra_info", [&]() -> std::string {
+            return getter_wrapper<std::string>(m_value, "get_extra_info", std::string{});
+        });
+    }
+    virtual bool has_batch_fitness() const override final
+    {
+        // Same logic as in C++:
+        // - without a batch_fitness() method, return false;
+        // - with a batch_fitness() and no override, return true;
+        // - with a batch_fitness() and override, return the value from the override.
+        auto bf = pygmo::callable_attribute(m_value, "batch_fitness");
+        if (bf.is_none()) {
+            return false;
+        }
+        auto hbf = pygmo::callable_attribute(m_value, "has_batch_fitness");
+        if (hbf.is_none()) {
+            return true;
+        }
+        return bp::extract<bool>(hbf());
+    }
+    virtual vector_double batch_fitness(const vector_double &dvs) const override final
+    {
+        return gil_call("batch_fitness", [&]() -> vector_double {
+            if (m_batch_fitness.is_none()) {
+                // NOTE: this can happen only if has_batch_fitness() and the method resolved
+                // at construction time disagree (e.g., if the UDP was modified in-between).
+                pygmo_throw(PyExc_RuntimeError,
+                            ("batch fitness evaluation has been requested but it is not implemented."
+                             "This indicates a logical error in the implementation of the user-defined Python problem "
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the batch fitness was available at problem construction but it has been removed "
+                               "at a later stage")
+                                .c_str());
+            }
+            // NOTE: the UDP receives the whole batch as a single (N, nx) array, and it is expected
+            // to return an (N, nf) array-like object. The problem dimension is needed to shape the input
+            // array: we fetch it from the bounds the first time it is needed, and we cache it (the bounds
+            // are assumed not to change during the lifetime of a problem).
+            if (!m_nx) {
+                m_nx = get_bounds().first.size();
+            }
+            vector_double::size_type nrows;
+            auto retval = pygmo::to_flat_vd(pygmo::call1(m_batch_fitness, pygmo::v_to_2d_a(dvs, m_nx)), nrows);
+            if (nrows != dvs.size() / m_nx) {
+                pygmo_throw(PyExc_ValueError, ("the batch fitness function of the user-defined Python problem returned "
+                                               + std::to_string(nrows) + " fitness vectors, but "
+                                               + std::to_string(dvs.size() / m_nx) + " were expected")
+                                                  .c_str());
+            }
+            return retval;
+        });
     }
     virtual bool has_gradient() const override final
     {
@@ -165,16 +229,17 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
     }
     virtual vector_double gradient(const vector_double &dv) const override final
     {
-        auto g = pygmo::callable_attribute(m_value, "gradient");
-        if (g.is_none()) {
-            pygmo_throw(PyExc_NotImplementedError,
-                        ("gradients have been requested but they are not implemented "
-                         "in the user-defined Python problem '"
-                         + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
-                         + "': the method is either not present or not callable")
-                            .c_str());
-        }
-        return pygmo::to_vd(g(pygmo::v_to_a(dv)));
+        return gil_call("gradient", [&]() -> vector_double {
+            if (m_gradient.is_none()) {
+                pygmo_throw(PyExc_NotImplementedError,
+                            ("gradients have been requested but they are not implemented "
+                             "in the user-defined Python problem '"
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the method is either not present or not callable")
+                                .c_str());
+            }
+            return pygmo::to_vd(pygmo::call1(m_gradient, pygmo::v_to_a(dv)));
+        });
     }
     virtual bool has_gradient_sparsity() const override final
     {
@@ -194,24 +259,27 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
     }
     virtual sparsity_pattern gradient_sparsity() const override final
     {
-        auto gs = pygmo::callable_attribute(m_value, "gradient_sparsity");
-        if (gs.is_none()) {
-            // NOTE: this is similar to C++: this virtual method gradient_sparsity() we are in, is called
-            // only if the availability of gradient_sparsity() in the UDP was detected upon the construction
-            // of a problem (i.e., m_has_gradient_sparsity is set to true). If the UDP didn't have a gradient_sparsity()
-            // method upon problem construction, the m_has_gradient_sparsity is set to false and we never get here.
-            // However, in Python we could have a situation in which a method is erased at runtime, so it is
-            // still possible to end up in this point (if gradient_sparsity() in the internal UDP was erased
-            // after the problem construction). This is something we need to strongly discourage, hence the message.
-            pygmo_throw(PyExc_RuntimeError,
-                        ("gradient sparsity has been requested but it is not implemented."
-                         "This indicates a logical error in the implementation of the user-defined Python problem "
-                         + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
-                         + "': the gradient sparsity was available at problem construction but it has been removed "
-                           "at a later stage")
-                            .c_str());
-        }
-        return pygmo::to_sp(gs());
+        return gil_call("gradient_sparsity", [&]() -> sparsity_pattern {
+            auto gs = pygmo::callable_attribute(m_value, "gradient_sparsity");
+            if (gs.is_none()) {
+                // NOTE: this is similar to C++: this virtual method gradient_sparsity() we are in, is called
+                // only if the availability of gradient_sparsity() in the UDP was detected upon the construction
+                // of a problem (i.e., m_has_gradient_sparsity is set to true). If the UDP didn't have a
+                // gradient_sparsity() method upon problem construction, the m_has_gradient_sparsity is set to false
+                // and we never get here. However, in Python we could have a situation in which a method is erased at
+                // runtime, so it is still possible to end up in this point (if gradient_sparsity() in the internal UDP
+                // was erased after the problem construction). This is something we need to strongly discourage, hence
+                // the message.
+                pygmo_throw(PyExc_RuntimeError,
+                            ("gradient sparsity has been requested but it is not implemented."
+                             "This indicates a logical error in the implementation of the user-defined Python problem "
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the gradient sparsity was available at problem construction but it has been removed "
+                               "at a later stage")
+                                .c_str());
+            }
+            return pygmo::to_sp(gs());
+        });
     }
     virtual bool has_hessians() const override final
     {
@@ -231,22 +299,24 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
     }
     virtual std::vector<vector_double> hessians(const vector_double &dv) const override final
     {
-        auto h = pygmo::callable_attribute(m_value, "hessians");
-        if (h.is_none()) {
-            pygmo_throw(PyExc_NotImplementedError,
-                        ("hessians have been requested but they are not implemented "
-                         "in the user-defined Python problem '"
-                         + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
-                         + "': the method is either not present or not callable")
-                            .c_str());
-        }
-        // Invoke the method, getting out a generic Python object.
-        bp::object tmp = h(pygmo::v_to_a(dv));
-        // Let's build the return value.
-        std::vector<vector_double> retval;
-        bp::stl_input_iterator<bp::object> begin(tmp), end;
-        std::transform(begin, end, std::back_inserter(retval), [](const bp::object &o) { return pygmo::to_vd(o); });
-        return retval;
+        return gil_call("hessians", [&]() -> std::vector<vector_double> {
+            auto h = pygmo::callable_attribute(m_value, "hessians");
+            if (h.is_none()) {
+                pygmo_throw(PyExc_NotImplementedError,
+                            ("hessians have been requested but they are not implemented "
+                             "in the user-defined Python problem '"
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the method is either not present or not callable")
+                                .c_str());
+            }
+            // Invoke the method, getting out a generic Python object.
+            bp::object tmp = h(pygmo::v_to_a(dv));
+            // Let's build the return value.
+            std::vector<vector_double> retval;
+            bp::stl_input_iterator<bp::object> begin(tmp), end;
+            std::transform(begin, end, std::back_inserter(retval), [](const bp::object &o) { return pygmo::to_vd(o); });
+            return retval;
+        });
     }
     virtual bool has_hessians_sparsity() const override final
     {
@@ -266,34 +336,38 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
     }
     virtual std::vector<sparsity_pattern> hessians_sparsity() const override final
     {
-        auto hs = pygmo::callable_attribute(m_value, "hessians_sparsity");
-        if (hs.is_none()) {
-            pygmo_throw(PyExc_RuntimeError,
-                        ("hessians sparsity has been requested but it is not implemented."
-                         "This indicates a logical error in the implementation of the user-defined Python problem "
-                         + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
-                         + "': the hessians sparsity was available at problem construction but it has been removed "
-                           "at a later stage")
-                            .c_str());
-        }
-        bp::object tmp = hs();
-        std::vector<sparsity_pattern> retval;
-        bp::stl_input_iterator<bp::object> begin(tmp), end;
-        std::transform(begin, end, std::back_inserter(retval), [](const bp::object &o) { return pygmo::to_sp(o); });
-        return retval;
+        return gil_call("hessians_sparsity", [&]() -> std::vector<sparsity_pattern> {
+            auto hs = pygmo::callable_attribute(m_value, "hessians_sparsity");
+            if (hs.is_none()) {
+                pygmo_throw(PyExc_RuntimeError,
+                            ("hessians sparsity has been requested but it is not implemented."
+                             "This indicates a logical error in the implementation of the user-defined Python problem "
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the hessians sparsity was available at problem construction but it has been removed "
+                               "at a later stage")
+                                .c_str());
+            }
+            bp::object tmp = hs();
+            std::vector<sparsity_pattern> retval;
+            bp::stl_input_iterator<bp::object> begin(tmp), end;
+            std::transform(begin, end, std::back_inserter(retval), [](const bp::object &o) { return pygmo::to_sp(o); });
+            return retval;
+        });
     }
     virtual void set_seed(unsigned n) override final
     {
-        auto ss = pygmo::callable_attribute(m_value, "set_seed");
-        if (ss.is_none()) {
-            pygmo_throw(PyExc_NotImplementedError,
-                        ("set_seed() has been invoked but it is not implemented "
-                         "in the user-defined Python problem '"
-                         + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
-                         + "': the method is either not present or not callable")
-                            .c_str());
-        }
-        ss(n);
+        return gil_call("set_seed", [&]() -> void {
+            auto ss = pygmo::callable_attribute(m_value, "set_seed");
+            if (ss.is_none()) {
+                pygmo_throw(PyExc_NotImplementedError,
+                            ("set_seed() has been invoked but it is not implemented "
+                             "in the user-defined Python problem '"
+                             + pygmo::str(m_value) + "' of type '" + pygmo::str(pygmo::type(m_value))
+                             + "': the method is either not present or not callable")
+                                .c_str());
+            }
+            ss(n);
+        });
     }
     virtual bool has_set_seed() const override final
     {
@@ -311,17 +385,64 @@ struct prob_inner<bp::object> final : prob_inner_base, pygmo::common_base {
         }
         return bp::extract<bool>(hss());
     }
-    // Hard code no thread safety for python problems.
+    // NOTE: Python problems are not thread-safe by default. They can declare otherwise
+    // via a get_thread_safety() method (see gil_call() below).
     virtual pagmo::thread_safety get_thread_safety() const override final
     {
-        return pagmo::thread_safety::none;
+        return m_ts;
     }
     template <typename Archive>
     void serialize(Archive &ar)
     {
         ar(cereal::base_class<prob_inner_base>(this), m_value);
+        if (Archive::is_loading::value) {
+            resolve_methods();
+        }
+    }
+    // Look up the methods invoked in the evaluation hot paths. They are resolved once (at construction
+    // and deserialisation) rather than at every call, thus methods added, removed or replaced
+    // in m_value later on are not seen by fitness(), batch_fitness() and gradient().
+    // The thread safety level of the UDP is also fetched here.
+    void resolve_methods()
+    {
+        m_fitness = m_value.attr("fitness");
+        m_batch_fitness = pygmo::callable_attribute(m_value, "batch_fitness");
+        m_gradient = pygmo::callable_attribute(m_value, "gradient");
+        m_ts = getter_wrapper<thread_safety>(m_value, "get_thread_safety", thread_safety::none);
+    }
+    // If the UDP declares itself thread-safe, pagmo might invoke the methods of this class
+    // from threads not holding the GIL (e.g., in a thread island or in a thread_bfe). In such case,
+    // we acquire the GIL before calling into the interpreter and we convert Python exceptions into C++ exceptions,
+    // as the Python error indicator does not follow the exceptions across threads. Otherwise, pagmo guarantees
+    // that the methods are invoked only from threads holding the GIL.
+    // NOTE: only the methods which might be called after the construction of a pagmo::problem are wrapped.
+    template <typename F>
+    auto gil_call(const char *name, const F &f) const -> decltype(f())
+    {
+        if (m_ts == thread_safety::none || pygmo::gil_held()) {
+            return f();
+        }
+        pygmo::gil_thread_ensurer gte;
+        try {
+            return f();
+        } catch (const bp::error_already_set &) {
+            pygmo::handle_thread_py_exception("The method '" + std::string(name)
+                                              + "()' of the user-defined Python problem of type '"
+                                              + pygmo::str(pygmo::type(m_value)) + "' raised an error:\n");
+        }
     }
+    // Holds the GIL during the destruction of the data members, if needed. It must be declared before
+    // the Python objects.
+    std::unique_ptr<pygmo::gil_thread_ensurer> m_gte;
     bp::object m_value;
+    // Bound methods of m_value (None if not available).
+    bp::object m_fitness;
+    bp::object m_batch_fitness;
+    bp::object m_gradient;
+    // Cached problem dimension (used only in batch_fitness()). Zero means
+    // not computed yet.
+    mutable vector_double::size_type m_nx = 0;
+    thread_safety m_ts = thread_safety::none;
 };
 }
 }
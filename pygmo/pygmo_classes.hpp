@@ -37,8 +37,12 @@ see https://www.gnu.org/licenses/. */
 #include <memory>
 
 #include <pagmo/algorithm.hpp>
+#include <pagmo/bfe.hpp>
 #include <pagmo/island.hpp>
 #include <pagmo/problem.hpp>
+#include <pagmo/r_policy.hpp>
+#include <pagmo/s_policy.hpp>
+#include <pagmo/topology.hpp>
 
 namespace pygmo
 {
@@ -54,6 +58,18 @@ extern std::unique_ptr<bp::class_<pagmo::algorithm>> algorithm_ptr;
 // pagmo::island.
 extern std::unique_ptr<bp::class_<pagmo::island>> island_ptr;
 
+// pagmo::bfe.
+extern std::unique_ptr<bp::class_<pagmo::bfe>> bfe_ptr;
+
+// pagmo::topology.
+extern std::unique_ptr<bp::class_<pagmo::topology>> topology_ptr;
+
+// pagmo::s_policy.
+extern std::unique_ptr<bp::class_<pagmo::s_policy>> s_policy_ptr;
+
+// pagmo::r_policy.
+extern std::unique_ptr<bp::class_<pagmo::r_policy>> r_policy_ptr;
+
 // Getters for the objects above.
 inline bp::class_<pagmo::problem> &get_problem_class()
 {
@@ -81,6 +97,42 @@ inline bp::class_<pagmo::island> &get_island_class()
     }
     return *island_ptr;
 }
+
+inline bp::class_<pagmo::bfe> &get_bfe_class()
+{
+    if (!bfe_ptr) {
+        std::cerr << "Null bfe class pointer." << std::endl;
+        std::abort();
+    }
+    return *bfe_ptr;
+}
+
+inline bp::class_<pagmo::topology> &get_topology_class()
+{
+    if (!topology_ptr) {
+        std::cerr << "Null topology class pointer." << std::endl;
+        std::abort();
+    }
+    return *topology_ptr;
+}
+
+inline bp::class_<pagmo::s_policy> &get_s_policy_class()
+{
+    if (!s_policy_ptr) {
+        std::cerr << "Null s_policy class pointer." << std::endl;
+        std::abort();
+    }
+    return *s_policy_ptr;
+}
+
+inline bp::class_<pagmo::r_policy> &get_r_policy_class()
+{
+    if (!r_policy_ptr) {
+        std::cerr << "Null r_policy class pointer." << std::endl;
+        std::abort();
+    }
+    return *r_policy_ptr;
+}
 }
 
 #endif
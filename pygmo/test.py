@@ -87,7 +87,7 @@ class core_test_case(_ut.TestCase):
 
     def runTest(self):
         import sys
-        from numpy import random, all, array
+        from numpy import random, all, array, float64, int64
         from .core import _builtin, _test_to_vd, _type, _str, _callable, _deepcopy, _test_object_serialization as tos
         from . import __version__
         self.assertTrue(__version__ != "")
@@ -111,6 +111,14 @@ class core_test_case(_ut.TestCase):
         self.assert_(_test_to_vd((0., 1), 2))
         self.assert_(_test_to_vd(array([0., 1.]), 2))
         self.assert_(_test_to_vd(array([0, 1]), 2))
+        self.assert_(_test_to_vd(array([0., 1.], dtype='float32'), 2))
+        self.assert_(_test_to_vd(array([0., 5., 1., 5.])[::2], 2))
+        self.assert_(_test_to_vd(array([[0., 1.]])[0], 2))
+        self.assert_(_test_to_vd([float64(0), int64(1)], 2))
+        self.assert_(_test_to_vd(range(3), 3))
+        self.assertRaises(TypeError, lambda: _test_to_vd([0., "a"], 2))
+        self.assertRaises(ValueError, lambda: _test_to_vd(
+            array([[0., 1.]]), 2))
         self.assertEqual(type(int), _type(int))
         self.assertEqual(str(123), _str(123))
         self.assertEqual(callable(1), _callable(1))
@@ -137,9 +145,11 @@ class population_test_case(_ut.TestCase):
         self.run_getters_test()
         self.run_problem_test()
         self.run_push_back_test()
+        self.run_batch_push_back_test()
         self.run_random_dv_test()
         self.run_set_x_xf_test()
         self.run_pickle_test()
+        self.run_views_test()
 
     def run_init_test(self):
         from .core import population, null_problem, rosenbrock, problem
@@ -249,6 +259,41 @@ class population_test_case(_ut.TestCase):
         self.assertRaises(ValueError, lambda: pop.push_back([1] * 5, []))
         self.assertRaises(ValueError, lambda: pop.push_back([1] * 5, [1, 2]))
 
+    def run_batch_push_back_test(self):
+        from .core import population, rosenbrock, bfe, thread_bfe, member_bfe
+        from numpy import array
+        # Construction via a bfe gives the same population as the serial construction.
+        for b in [bfe(), thread_bfe(), bfe(member_bfe())]:
+            pop0 = population(rosenbrock(5), size=20, seed=42)
+            pop1 = population(rosenbrock(5), size=20, seed=42, b=b)
+            self.assertTrue((pop0.get_x() == pop1.get_x()).all())
+            self.assertTrue((pop0.get_f() == pop1.get_f()).all())
+            self.assertTrue((pop0.get_ID() == pop1.get_ID()).all())
+            self.assertEqual(pop1.problem.get_fevals(), 20)
+        # Bulk insertion.
+        dvs = array([[.1, .2], [.3, .4], [.5, .6]])
+        pop0 = population(rosenbrock(), seed=1)
+        for x in dvs:
+            pop0.push_back(x)
+        for b in [None, bfe(), thread_bfe()]:
+            pop1 = population(rosenbrock(), seed=1)
+            pop1.batch_push_back(dvs, b=b)
+            self.assertEqual(len(pop1), 3)
+            self.assertTrue((pop0.get_x() == pop1.get_x()).all())
+            self.assertTrue((pop0.get_f() == pop1.get_f()).all())
+            self.assertTrue((pop0.get_ID() == pop1.get_ID()).all())
+            self.assertTrue((pop0.champion_x == pop1.champion_x).all())
+            self.assertEqual(pop1.problem.get_fevals(), 3)
+        # Lists of lists are accepted too, and empty batches do nothing.
+        pop1.batch_push_back([[.1, .1]])
+        self.assertEqual(len(pop1), 4)
+        pop1.batch_push_back(array([]).reshape((0, 2)))
+        self.assertEqual(len(pop1), 4)
+        # Bogus dimensions.
+        self.assertRaises(ValueError, lambda: pop1.batch_push_back([1., 2., 3.]))
+        self.assertRaises(ValueError, lambda: pop1.batch_push_back([[1., 2., 3.]]))
+        self.assertEqual(len(pop1), 4)
+
     def run_random_dv_test(self):
         from .core import population, rosenbrock
         from numpy import ndarray
@@ -303,6 +348,72 @@ class population_test_case(_ut.TestCase):
         p = loads(dumps(pop))
         self.assertEqual(repr(pop), repr(p))
 
+    def run_views_test(self):
+        from .core import population, rosenbrock, zdt
+        from numpy import array
+        from pickle import dumps, loads
+        import gc
+        pop = population(zdt(param=5), size=10, seed=42)
+        x, f, ID = pop.get_x(), pop.get_f(), pop.get_ID()
+        # The views are read-only and share the same memory as the population.
+        for a in (x, f, ID):
+            self.assertFalse(a.flags.writeable)
+            self.assertFalse(a.flags.owndata)
+            self.assertTrue(a.flags.c_contiguous)
+
+            def setter():
+                a[0] = 0
+            self.assertRaises(ValueError, setter)
+        self.assertEqual(x.shape, (10, 5))
+        self.assertEqual(f.shape, (10, 2))
+        self.assertEqual(ID.shape, (10,))
+        self.assertTrue(x.base is pop.get_x().base)
+        self.assertTrue(x.base is pop.get_f(copy=False).base)
+        self.assertTrue(x.base is ID.base)
+        # The copies are writeable and independent.
+        for a, b in ((pop.get_x(copy=True), x), (pop.get_f(copy=True), f), (pop.get_ID(copy=True), ID)):
+            self.assertTrue(a.flags.writeable)
+            self.assertTrue(a.flags.owndata)
+            self.assertTrue((a == b).all())
+            a[0] = 0
+            self.assertFalse((a == b).all())
+        # The views keep the population alive.
+        x2 = population(zdt(param=5), size=10, seed=42).get_x()
+        gc.collect()
+        self.assertTrue((x2 == x).all())
+        # Modifications of the population do not alter the existing views.
+        x_old, f_old, ID_old = pop.get_x(copy=True), pop.get_f(copy=True), pop.get_ID(copy=True)
+        pop.set_xf(0, [.5] * 5, [1., 2.])
+        pop.set_x(1, [.5] * 5)
+        for _ in range(100):
+            pop.push_back([.5] * 5)
+        self.assertTrue((x == x_old).all())
+        self.assertTrue((f == f_old).all())
+        self.assertTrue((ID == ID_old).all())
+        # New views show the new data.
+        self.assertEqual(len(pop.get_x()), 110)
+        self.assertTrue((pop.get_x()[0] == array([.5] * 5)).all())
+        self.assertTrue((pop.get_f()[0] == array([1., 2.])).all())
+        self.assertTrue((pop.get_x()[1:] == pop.get_x(copy=True)[1:]).all())
+        self.assertTrue(pop.get_x().base is not x.base)
+        # Views and pickling.
+        x = pop.get_x()
+        p = loads(dumps(pop))
+        self.assertEqual(repr(pop), repr(p))
+        self.assertTrue((p.get_x() == x).all())
+        xp = p.get_x()
+        p.__setstate__(population(zdt(param=5), size=3).__getstate__())
+        self.assertEqual(len(p.get_x()), 3)
+        self.assertEqual(len(xp), 110)
+        self.assertTrue((xp == x).all())
+        # Empty populations.
+        pop = population(rosenbrock())
+        self.assertEqual(pop.get_x().shape, (0, 2))
+        self.assertEqual(pop.get_f().shape, (0, 1))
+        self.assertEqual(pop.get_ID().shape, (0,))
+        self.assertFalse(pop.get_x().flags.writeable)
+        self.assertTrue(pop.get_x(copy=True).flags.writeable)
+
 
 class pso_test_case(_ut.TestCase):
     """Test case for the UDA pso
@@ -348,6 +459,10 @@ class moead_test_case(_ut.TestCase):
                     CR=1, F=0.5, eta_m=20, realb=0.9, limit=2, preserve_diversity=True, seed=32)
         self.assertEqual(uda.get_seed(), 32)
         log = uda.get_log()
+        self.assertFalse(uda.get_dedup())
+        uda.set_dedup(True)
+        self.assertTrue(uda.get_dedup())
+        self.assertEqual(uda.get_saved_fevals(), 0)
 
 
 class sa_test_case(_ut.TestCase):
@@ -410,6 +525,10 @@ class sga_test_case(_ut.TestCase):
                   mutation="polynomial", selection="tournament", seed=32)
         self.assertEqual(uda.get_seed(), 32)
         seed = uda.get_seed()
+        self.assertFalse(uda.get_dedup())
+        uda.set_dedup(True)
+        self.assertTrue(uda.get_dedup())
+        self.assertEqual(uda.get_saved_fevals(), 0)
 
 
 class nsga2_test_case(_ut.TestCase):
@@ -425,6 +544,10 @@ class nsga2_test_case(_ut.TestCase):
                     eta_m=10, int_dim=0, seed=32)
         self.assertEqual(uda.get_seed(), 32)
         seed = uda.get_seed()
+        self.assertFalse(uda.get_dedup())
+        uda.set_dedup(True)
+        self.assertTrue(uda.get_dedup())
+        self.assertEqual(uda.get_saved_fevals(), 0)
 
 
 class nlopt_test_case(_ut.TestCase):
@@ -739,9 +862,15 @@ class mo_utils_test_case(_ut.TestCase):
     """
 
     def runTest(self):
-        from .core import fast_non_dominated_sorting, pareto_dominance, non_dominated_front_2d, crowding_distance, sort_population_mo, select_best_N_mo, decompose_objectives, decomposition_weights, nadir, ideal, population, dtlz
+        from .core import fast_non_dominated_sorting, non_dominated_sorting, pareto_dominance, non_dominated_front_2d, crowding_distance, sort_population_mo, select_best_N_mo, decompose_objectives, decomposition_weights, nadir, ideal, population, dtlz
         ndf, dl, dc, ndr = fast_non_dominated_sorting(
             points=[[0, 1], [-1, 3], [2.3, -0.2], [1.1, -0.12], [1.1, 2.12], [-1.1, -1.1]])
+        ndf2, ndr2 = non_dominated_sorting(
+            points=[[0, 1], [-1, 3], [2.3, -0.2], [1.1, -0.12], [1.1, 2.12], [-1.1, -1.1]])
+        self.assertEqual(len(ndf2), len(ndf))
+        self.assertTrue(all(sorted(f1) == sorted(f2)
+                            for f1, f2 in zip(ndf, ndf2)))
+        self.assertEqual(list(ndr2), list(ndr))
         self.assertTrue(pareto_dominance(obj1=[1, 2], obj2=[2, 2]))
         non_dominated_front_2d(
             points=[[0, 5], [1, 4], [2, 3], [3, 2], [4, 1], [2, 2]])
@@ -784,13 +913,48 @@ class global_rng_test_case(_ut.TestCase):
         self.assertTrue(f1 == f2)
 
 
+class hv_archive_test_case(_ut.TestCase):
+    """Test case for the incremental hypervolume archive
+
+    """
+
+    def runTest(self):
+        from .core import hv_archive, hypervolume
+        import numpy as np
+        a = hv_archive(ref_point=[10, 10])
+        self.assertEqual(len(a), 0)
+        self.assertTrue(np.all(a.get_ref_point() == [10, 10]))
+        self.assertTrue(a.insert(point=[5, 5]))
+        self.assertFalse(a.insert([6, 6]))
+        self.assertTrue(a.insert([2, 8]))
+        self.assertTrue(a.insert([8, 2]))
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.get_hv(), 37.)
+        self.assertTrue(np.all(a.get_points() == [[2, 8], [5, 5], [8, 2]]))
+        self.assertTrue(np.all(a.contributions() == [6., 9., 6.]))
+        self.assertEqual(a.exclusive(point=[5, 5]), 9.)
+        self.assertTrue(np.all(a.least_contributor() == [2, 8]))
+        self.assertEqual(a.get_hv(), hypervolume(
+            a.get_points()).compute([10, 10]))
+        self.assertTrue(a.erase(point=[5, 5]))
+        self.assertFalse(a.erase([5, 5]))
+        self.assertEqual(a.get_hv(), 28.)
+        self.assertRaises(ValueError, lambda: a.insert([1, 2, 3]))
+        self.assertRaises(ValueError, lambda: a.exclusive([1, 1]))
+        self.assertRaises(ValueError, lambda: hv_archive([1, 1, 1, 1]))
+        a = hv_archive([10, 10, 10])
+        self.assertTrue(a.insert([5, 5, 5]))
+        self.assertEqual(a.get_hv(), 125.)
+        self.assertRaises(ValueError, lambda: hv_archive([1, 1]).least_contributor())
+
+
 class hypervolume_test_case(_ut.TestCase):
     """Test case for the hypervolume utilities
 
     """
 
     def runTest(self):
-        from .core import hypervolume, hv2d, hv3d, hvwfg, bf_fpras, bf_approx
+        from .core import hypervolume, hv2d, hv3d, hv4d, hvwfg, bf_fpras, bf_approx
         from .core import population, zdt
         import numpy as np
         pop = population(prob=zdt(prob_id=1, param=10), size=20)
@@ -815,7 +979,23 @@ class hypervolume_test_case(_ut.TestCase):
         res = hv2.least_contributor(ref_point=[3, 3], hv_algo=algo2)
         res = hv2.greatest_contributor(ref_point=[3, 3], hv_algo=algo2)
         res = hv2.contributions(ref_point=[3, 3], hv_algo=algo2)
+        algo2_mt = hvwfg(n_threads=3)
+        self.assertEqual(algo2.get_n_threads(), 1)
+        self.assertEqual(algo2_mt.get_n_threads(), 3)
+        self.assertTrue(np.all(hv2.contributions(
+            ref_point=[3, 3], hv_algo=algo2_mt) == res))
+        self.assertEqual(hv2.least_contributor(ref_point=[3, 3], hv_algo=algo2_mt),
+                         hv2.least_contributor(ref_point=[3, 3], hv_algo=algo2))
         res = hv2.compute(ref_point=[3, 3], hv_algo=algo3)
+        self.assertEqual(algo3.get_n_threads(), 1)
+        algo3_mt = bf_fpras(seed=42)
+        algo3_mt.set_n_threads(3)
+        self.assertEqual(algo3_mt.get_n_threads(), 3)
+        algo3_st = bf_fpras(seed=42)
+        self.assertEqual(hv2.compute(ref_point=[3, 3], hv_algo=algo3_mt),
+                         hv2.compute(ref_point=[3, 3], hv_algo=algo3_st))
+        algo4.set_n_threads(0)
+        self.assertEqual(algo4.get_n_threads(), 0)
 
         res = hv2.least_contributor(ref_point=[3, 3], hv_algo=algo4)
         res = hv2.greatest_contributor(ref_point=[3, 3], hv_algo=algo4)
@@ -826,6 +1006,14 @@ class hypervolume_test_case(_ut.TestCase):
         res = hv2.greatest_contributor(ref_point=[3, 3])
         res = hv2.contributions(ref_point=[3, 3])
 
+        hv4 = hypervolume(points=[[2.3, 4.5, 3.2, 1.9], [3.4, 3.4, 3.4, 2.1], [6.0, 1.2, 3.6, 3.0]])
+        self.assertAlmostEqual(hv4.compute(ref_point=[7, 7, 7, 7], hv_algo=hv4d()),
+                               hv4.compute(ref_point=[7, 7, 7, 7], hv_algo=algo2))
+        self.assertAlmostEqual(hv4.compute(ref_point=[7, 7, 7, 7]),
+                               hv4.compute(ref_point=[7, 7, 7, 7], hv_algo=algo2))
+        self.assertRaises(ValueError, lambda: hv2.compute(
+            ref_point=[3, 3], hv_algo=hv4d()))
+
         self.assertTrue((hv2.refpoint(offset=0) ==
                          np.array([0., 2.])).all() == True)
         self.assertTrue((hv2.refpoint(offset=.1) ==
@@ -998,6 +1186,144 @@ class translate_test_case(_ut.TestCase):
             decompose).inner_problem.extract(null_problem) is None)
 
 
+class memoize_test_case(_ut.TestCase):
+    """Test case for the memoize meta-problem
+
+    """
+
+    def runTest(self):
+        from .core import problem, rosenbrock, memoize, null_problem, translate, hock_schittkowsky_71
+        from pickle import dumps, loads
+        import numpy as np
+
+        m = memoize()
+        self.assertFalse(m.inner_problem.extract(null_problem) is None)
+        self.assertEqual(m.get_capacity(), 1000)
+        m = memoize(prob=rosenbrock(), capacity=2)
+        self.assertTrue(m.inner_problem.is_(rosenbrock))
+        self.assertEqual(m.get_capacity(), 2)
+        self.assertRaises(ValueError, lambda: memoize(rosenbrock(), 0))
+        self.assertRaises(OverflowError, lambda: memoize(rosenbrock(), -1))
+
+        class p(object):
+
+            def get_bounds(self):
+                return ([0, 0], [1, 1])
+
+            def fitness(self, a):
+                return [sum(a)]
+
+        prob = problem(memoize(p(), 2))
+        self.assertTrue(prob.is_(memoize))
+        self.assertTrue(prob.extract(memoize).inner_problem.is_(p))
+        self.assertEqual(prob.fitness([.1, .2])[0], .1 + .2)
+        self.assertEqual(prob.fitness([.1, .2])[0], .1 + .2)
+        prob.fitness([.3, .4])
+        prob.fitness([.5, .6])
+        # [.1, .2] has been evicted.
+        prob.fitness([.1, .2])
+        m = prob.extract(memoize)
+        self.assertEqual(m.get_hits(), 1)
+        self.assertEqual(m.get_misses(), 4)
+        self.assertEqual(prob.get_fevals(), 5)
+        self.assertEqual(m.inner_problem.get_fevals(), 4)
+        self.assertTrue("Fitness cache hits: 1" in prob.get_extra_info())
+        m.clear_cache()
+        prob.fitness([.1, .2])
+        self.assertEqual(m.get_misses(), 5)
+        self.assertEqual(m.get_gradient_hits(), 0)
+        self.assertEqual(m.get_gradient_misses(), 0)
+
+        # Batch fitness.
+        fvs = prob.batch_fitness(np.array([[.1, .2], [.1, .2]]))
+        self.assertTrue(np.all(fvs == np.array([[.1 + .2], [.1 + .2]])))
+        self.assertEqual(m.get_hits(), 3)
+
+        # Pickling preserves the cache.
+        prob2 = loads(dumps(prob))
+        prob2.fitness([.1, .2])
+        self.assertEqual(prob2.extract(memoize).get_hits(), 4)
+
+        # Chaining of metas.
+        prob = problem(
+            memoize(translate(hock_schittkowsky_71(), [1, 2, 3, 4]), 10, True))
+        self.assertTrue(prob.extract(
+            memoize).inner_problem.is_(translate))
+        prob.gradient([1, 2, 3, 4])
+        prob.gradient([1, 2, 3, 4])
+        self.assertEqual(prob.extract(memoize).get_gradient_hits(), 1)
+
+
+class cfunc_problem_test_case(_ut.TestCase):
+    """Test case for the cfunc_problem UDP
+
+    """
+
+    def runTest(self):
+        from .core import problem, cfunc_problem, _test_cfunc_address, island, de, population, bfe
+        from . import thread_safety
+        from pickle import dumps
+        import ctypes
+        import numpy as np
+
+        prob = problem(cfunc_problem())
+        self.assertEqual(prob.get_nx(), 1)
+        self.assertEqual(list(prob.fitness([.5])), [0.])
+        self.assertEqual(prob.get_name(), "C function problem")
+
+        # The test function computes the sphere function, and it sets the other fitness
+        # components to the problem dimension.
+        addr = _test_cfunc_address()
+        prob = problem(cfunc_problem(addr, [-1] * 3, [1] * 3, nobj=2, nic=1, nix=1, name="sphere"))
+        self.assertEqual(prob.get_name(), "sphere")
+        self.assertEqual(prob.get_nobj(), 2)
+        self.assertEqual(prob.get_nic(), 1)
+        self.assertEqual(prob.get_nix(), 1)
+        self.assertEqual(prob.get_thread_safety(), thread_safety.basic)
+        self.assertEqual(list(prob.fitness([1, 0, -1])), [2., 3., 3.])
+        self.assertTrue("Function address" in prob.get_extra_info())
+        self.assertTrue(prob.extract(cfunc_problem) is not None)
+
+        # Invalid inputs.
+        self.assertRaises(ValueError, lambda: cfunc_problem(0, [0], [1]))
+        self.assertRaises(TypeError, lambda: cfunc_problem("abc", [0], [1]))
+        self.assertRaises(TypeError, lambda: cfunc_problem(True, [0], [1]))
+        self.assertRaises(OverflowError, lambda: cfunc_problem(addr, [0], [1], nobj=-1))
+        self.assertRaises(ValueError, lambda: problem(cfunc_problem(addr, [0, 0], [1])))
+
+        # Serialization is not supported.
+        self.assertRaises(ValueError, lambda: dumps(prob))
+
+        # ctypes function pointers.
+        proto = ctypes.CFUNCTYPE(None, ctypes.POINTER(ctypes.c_double), ctypes.c_size_t,
+                                 ctypes.POINTER(ctypes.c_double), ctypes.c_size_t)
+        prob = problem(cfunc_problem(ctypes.cast(addr, proto), [-1] * 2, [1] * 2))
+        self.assertEqual(list(prob.fitness([.5, .5])), [.5])
+
+        # A ctypes callback wrapping a Python function. The problem must keep the callback alive.
+        def fit(x, nx, f, nf):
+            f[0] = sum(x[i] for i in range(nx))
+
+        prob = problem(cfunc_problem(proto(fit), [-1] * 2, [1] * 2))
+        import gc
+        gc.collect()
+        self.assertEqual(list(prob.fitness([.25, .5])), [.75])
+        prob2 = problem(prob)
+        del prob
+        gc.collect()
+        self.assertEqual(list(prob2.fitness([.25, .5])), [.75])
+
+        # Thread-based parallelism.
+        udp = cfunc_problem(addr, [-1] * 5, [1] * 5)
+        isl = island(algo=de(gen=20), prob=udp, size=20)
+        self.assertTrue("Thread island" in str(isl))
+        isl.evolve()
+        isl.wait_check()
+        self.assertEqual(isl.get_population().problem.get_fevals(), 20 * 21)
+        pop = population(udp, size=10, b=bfe())
+        self.assertTrue(np.allclose(pop.get_f()[:, 0], np.sum(pop.get_x()**2, axis=1)))
+
+
 class unconstrain_test_case(_ut.TestCase):
     """Test case for the unconstrain meta-problem
 
@@ -1575,7 +1901,7 @@ def run_test_suite(level=0):
         level(``int``): the test level (higher values run longer tests)
 
     """
-    from . import _problem_test, _algorithm_test, _island_test, set_global_rng_seed
+    from . import _problem_test, _algorithm_test, _island_test, _bfe_test, _migration_test, set_global_rng_seed
 
     # Make test runs deterministic.
     # NOTE: we'll need to place the async/migration tests at the end, so that at
@@ -1589,6 +1915,14 @@ def run_test_suite(level=0):
     suite.addTest(_island_test.island_test_case())
     suite.addTest(_island_test.mp_island_test_case(level))
     suite.addTest(_island_test.ipyparallel_island_test_case(level))
+    suite.addTest(_bfe_test.bfe_test_case())
+    suite.addTest(_bfe_test.thread_bfe_test_case())
+    suite.addTest(_bfe_test.member_bfe_test_case())
+    suite.addTest(_bfe_test.default_bfe_test_case())
+    suite.addTest(_bfe_test.mp_bfe_test_case())
+    suite.addTest(_migration_test.topology_test_case())
+    suite.addTest(_migration_test.policies_test_case())
+    suite.addTest(_migration_test.archipelago_migration_test_case())
     suite.addTest(pso_test_case())
     suite.addTest(bee_colony_test_case())
     suite.addTest(compass_search_test_case())
@@ -1599,6 +1933,7 @@ def run_test_suite(level=0):
     suite.addTest(archipelago_test_case(level))
     suite.addTest(null_problem_test_case())
     suite.addTest(hypervolume_test_case())
+    suite.addTest(hv_archive_test_case())
     suite.addTest(mo_utils_test_case())
     suite.addTest(con_utils_test_case())
     suite.addTest(global_rng_test_case())
@@ -1619,6 +1954,8 @@ def run_test_suite(level=0):
     suite.addTest(translate_test_case())
     suite.addTest(decompose_test_case())
     suite.addTest(unconstrain_test_case())
+    suite.addTest(memoize_test_case())
+    suite.addTest(cfunc_problem_test_case())
     suite.addTest(mbh_test_case())
     suite.addTest(cstrs_self_adaptive_test_case())
     try:
@@ -47,6 +47,7 @@ see https://www.gnu.org/licenses/. */
 #include <utility>
 #include <vector>
 
+#include <pagmo/algorithm.hpp>
 #include <pagmo/algorithms/de.hpp>
 #include <pagmo/algorithms/pso.hpp>
 #include <pagmo/archipelago.hpp>
@@ -55,8 +56,17 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/problems/rosenbrock.hpp>
 #include <pagmo/problems/schwefel.hpp>
 #include <pagmo/problems/zdt.hpp>
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/r_policy.hpp>
 #include <pagmo/rng.hpp>
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/s_policy.hpp>
 #include <pagmo/serialization.hpp>
+#include <pagmo/topologies/free_form.hpp>
+#include <pagmo/topologies/fully_connected.hpp>
+#include <pagmo/topologies/ring.hpp>
+#include <pagmo/topologies/unconnected.hpp>
+#include <pagmo/topology.hpp>
 #include <pagmo/types.hpp>
 
 using namespace pagmo;
@@ -475,3 +485,195 @@ BOOST_AUTO_TEST_CASE(archipelago_throw_on_ctor)
 {
     BOOST_CHECK_THROW((archipelago{100u, de{}, pthrower_00{}, 1u}), std::invalid_argument);
 }
+
+BOOST_AUTO_TEST_CASE(archipelago_topology_policies)
+{
+    archipelago archi;
+    BOOST_CHECK(archi.get_topology().is<unconnected>());
+    BOOST_CHECK(archi.get_s_policy().is<select_best>());
+    BOOST_CHECK(archi.get_r_policy().is<fair_replace>());
+    BOOST_CHECK(archi.get_migrants_db().empty());
+    archi.set_topology(topology{ring{}});
+    archi.set_s_policy(s_policy{select_best{2}});
+    archi.set_r_policy(r_policy{fair_replace{.5}});
+    BOOST_CHECK(archi.get_s_policy().extract<select_best>()->get_rate() == 2.);
+    BOOST_CHECK(archi.get_r_policy().extract<fair_replace>()->is_fractional());
+    // push_back() adds vertices to the topology.
+    for (auto i = 0; i < 4; ++i) {
+        archi.push_back(de{}, rosenbrock{}, 10u);
+    }
+    BOOST_CHECK_EQUAL(archi.get_topology().extract<ring>()->num_vertices(), 4u);
+    BOOST_CHECK_EQUAL(archi.get_migrants_db().size(), 4u);
+    // Copy and move semantics.
+    archi.evolve();
+    archi.wait_check();
+    auto archi2(archi);
+    BOOST_CHECK_EQUAL(archi2.get_topology().extract<ring>()->num_vertices(), 4u);
+    BOOST_CHECK(archi2.get_s_policy().extract<select_best>()->get_rate() == 2.);
+    BOOST_CHECK(archi2.get_migrants_db() == archi.get_migrants_db());
+    // The topologies are not shared after a push_back().
+    archi2.push_back(de{}, rosenbrock{}, 10u);
+    BOOST_CHECK_EQUAL(archi2.get_topology().extract<ring>()->num_vertices(), 5u);
+    BOOST_CHECK_EQUAL(archi.get_topology().extract<ring>()->num_vertices(), 4u);
+    auto archi3(std::move(archi2));
+    BOOST_CHECK_EQUAL(archi3.get_topology().extract<ring>()->num_vertices(), 5u);
+    BOOST_CHECK_EQUAL(archi3.get_migrants_db().size(), 5u);
+    // The moved-from archipelago is left with the default topology and policies.
+    BOOST_CHECK(archi2.get_topology().is<unconnected>());
+    BOOST_CHECK(archi2.get_s_policy().is<select_best>());
+    archi2 = std::move(archi3);
+    BOOST_CHECK_EQUAL(archi2.get_topology().extract<ring>()->num_vertices(), 5u);
+    archi2 = archi;
+    BOOST_CHECK_EQUAL(archi2.get_topology().extract<ring>()->num_vertices(), 4u);
+    BOOST_CHECK(archi2.get_migrants_db() == archi.get_migrants_db());
+    // The content of the migrant buffers after an evolution.
+    for (const auto &inds : archi.get_migrants_db()) {
+        BOOST_CHECK_EQUAL(std::get<0>(inds).size(), 2u);
+    }
+    // Stream.
+    const auto str = boost::lexical_cast<std::string>(archi);
+    BOOST_CHECK(str.find("Topology: Ring") != std::string::npos);
+    BOOST_CHECK(str.find("Selection policy: Select best") != std::string::npos);
+    BOOST_CHECK(str.find("Replacement policy: Fair replace") != std::string::npos);
+}
+
+BOOST_AUTO_TEST_CASE(archipelago_migration)
+{
+    // NOTE: use the default algorithm (which does not modify the population),
+    // so that the populations change only via migration.
+    population pop0{rosenbrock{2u}, 5u, 42u}, pop1{rosenbrock{2u}, 5u, 43u};
+    pop0.set_x(0, {1., 1.});
+    archipelago archi;
+    archi.set_topology(topology{ring{}});
+    archi.push_back(algorithm{}, pop0);
+    archi.push_back(algorithm{}, pop1);
+    // The evolution of island 0 fills its migrant buffer with its best individual.
+    archi[0].evolve();
+    archi[0].wait_check();
+    auto db = archi.get_migrants_db();
+    BOOST_CHECK((std::get<1>(db[0]) == std::vector<vector_double>{{1., 1.}}));
+    BOOST_CHECK((std::get<2>(db[0]) == std::vector<vector_double>{{0.}}));
+    BOOST_CHECK(std::get<0>(db[1]).empty());
+    // The evolution of island 1 receives it.
+    const auto worst1 = pop1.worst_idx();
+    archi[1].evolve();
+    archi[1].wait_check();
+    auto new_pop1 = archi[1].get_population();
+    BOOST_CHECK((new_pop1.get_x_row(worst1) == vector_double{1., 1.}));
+    BOOST_CHECK((new_pop1.get_f_row(worst1) == vector_double{0.}));
+    BOOST_CHECK((new_pop1.champion_x() == vector_double{1., 1.}));
+    // The same emigrants are not received twice.
+    archi[1].evolve(3);
+    archi[1].wait_check();
+    const auto f1 = archi[1].get_population().get_f();
+    BOOST_CHECK_EQUAL(std::count(f1.begin(), f1.end(), vector_double{0.}), 1);
+    // Island 0 receives back a copy of its own best individual, which replaces its worst individual.
+    archi[0].evolve();
+    archi[0].wait_check();
+    const auto f0 = archi[0].get_population().get_f();
+    BOOST_CHECK_EQUAL(std::count(f0.begin(), f0.end(), vector_double{0.}), 2);
+
+    // No migration with zero weights or with an unconnected topology.
+    for (const auto &t : {topology{}, topology{ring{2u, 0.}}}) {
+        archipelago archi2;
+        archi2.push_back(algorithm{}, pop0);
+        archi2.push_back(algorithm{}, pop1);
+        archi2.set_topology(t);
+        archi2.evolve(5);
+        archi2.wait_check();
+        BOOST_CHECK(archi2[1].get_population().get_f() == pop1.get_f());
+    }
+    // A user-defined migration route.
+    free_form ff{3u};
+    ff.add_edge(0, 2);
+    archipelago archi3;
+    archi3.push_back(algorithm{}, pop0);
+    archi3.push_back(algorithm{}, pop1);
+    archi3.push_back(algorithm{}, pop1);
+    archi3.set_topology(topology{ff});
+    archi3[0].evolve();
+    archi3[0].wait_check();
+    archi3.evolve();
+    archi3.wait_check();
+    BOOST_CHECK(archi3[1].get_population().get_f() == pop1.get_f());
+    BOOST_CHECK((archi3[2].get_population().champion_x() == vector_double{1., 1.}));
+
+    // A topology referring to non-existing islands.
+    archipelago archi4;
+    archi4.push_back(algorithm{}, pop0);
+    archi4.push_back(algorithm{}, pop1);
+    archi4.set_topology(topology{ring{5u}});
+    archi4[0].evolve();
+    BOOST_CHECK_THROW(archi4[0].wait_check(), std::invalid_argument);
+    // Migrants with mismatching dimensions.
+    archipelago archi5;
+    archi5.push_back(algorithm{}, pop0);
+    archi5.push_back(algorithm{}, population{rosenbrock{3u}, 5u});
+    archi5.set_topology(topology{ring{2u}});
+    archi5[0].evolve();
+    archi5[0].wait_check();
+    archi5[1].evolve();
+    BOOST_CHECK_THROW(archi5[1].wait_check(), std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(archipelago_migration_concurrent)
+{
+    // Many islands evolving and migrating concurrently.
+    archipelago archi{16u, de{5u}, rosenbrock{10u}, 20u};
+    archi.set_topology(topology{fully_connected{16u, .5}});
+    archi.set_s_policy(s_policy{select_best{.1}});
+    archi.set_r_policy(r_policy{fair_replace{2}});
+    archi.evolve(10);
+    // Change topology and policies while evolving.
+    archi.set_topology(topology{ring{16u}});
+    archi.set_s_policy(s_policy{select_best{3}});
+    BOOST_CHECK_NO_THROW(archi.get_migrants_db());
+    archi.wait_check();
+    for (const auto &isl : archi) {
+        BOOST_CHECK_EQUAL(isl.get_population().size(), 20u);
+    }
+    // Migration improves the worst champion: with a ring topology and enough evolutions,
+    // the best individual found so far propagates to all the islands.
+    archipelago archi2{8u, algorithm{}, rosenbrock{2u}, 5u, 42u};
+    auto pop = archi2[3].get_population();
+    pop.set_x(0, {1., 1.});
+    archi2[3].set_population(pop);
+    archi2.set_topology(topology{ring{8u}});
+    for (auto i = 0; i < 8; ++i) {
+        archi2.evolve();
+        archi2.wait_check();
+    }
+    for (const auto &f : archi2.get_champions_f()) {
+        BOOST_CHECK(f == vector_double{0.});
+    }
+}
+
+BOOST_AUTO_TEST_CASE(archipelago_migration_serialization)
+{
+    archipelago archi{4u, de{}, rosenbrock{}, 10u};
+    archi.set_topology(topology{ring{4u, .5}});
+    archi.set_s_policy(s_policy{select_best{3}});
+    archi.set_r_policy(r_policy{fair_replace{.25}});
+    archi.evolve();
+    archi.wait_check();
+    const auto db = archi.get_migrants_db();
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(archi);
+    }
+    archi = archipelago{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(archi);
+    }
+    BOOST_CHECK_EQUAL(archi.size(), 4u);
+    BOOST_CHECK(archi.get_topology().is<ring>());
+    BOOST_CHECK_EQUAL(archi.get_topology().extract<ring>()->get_weight(), .5);
+    BOOST_CHECK_EQUAL(archi.get_s_policy().extract<select_best>()->get_rate(), 3.);
+    BOOST_CHECK(archi.get_r_policy().extract<fair_replace>()->is_fractional());
+    BOOST_CHECK(archi.get_migrants_db() == db);
+    // The deserialized archipelago evolves and migrates.
+    archi.evolve();
+    BOOST_CHECK_NO_THROW(archi.wait_check());
+}
@@ -0,0 +1,222 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#define BOOST_TEST_MODULE bfe_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <boost/lexical_cast.hpp>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/problems/rosenbrock.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A minimal UDBFE.
+struct bfe_00 {
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        return p.batch_fitness(dvs);
+    }
+};
+
+// A UDBFE with all the optional methods.
+struct bfe_01 {
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        return p.batch_fitness(dvs);
+    }
+    std::string get_name() const
+    {
+        return "bfe_01";
+    }
+    std::string get_extra_info() const
+    {
+        return "extra " + std::to_string(m_state);
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::none;
+    }
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_state);
+    }
+    int m_state = 0;
+};
+
+PAGMO_REGISTER_BFE(bfe_01)
+
+// A UDBFE returning a wrong number of fitnesses.
+struct bfe_02 {
+    vector_double operator()(problem &, const vector_double &) const
+    {
+        return {1.};
+    }
+};
+
+// Wrong signatures.
+struct nbfe_00 {
+    vector_double operator()(const problem &, const vector_double &) const;
+};
+
+struct nbfe_01 {
+    vector_double operator()(problem &, const vector_double &);
+};
+
+struct nbfe_02 {
+    double operator()(problem &, const vector_double &) const;
+};
+
+struct nbfe_03 {
+    nbfe_03() = delete;
+    vector_double operator()(problem &, const vector_double &) const;
+};
+
+BOOST_AUTO_TEST_CASE(bfe_type_traits_test)
+{
+    BOOST_CHECK(has_bfe_call_operator<bfe_00>::value);
+    BOOST_CHECK(has_bfe_call_operator<nbfe_00>::value);
+    BOOST_CHECK(!has_bfe_call_operator<nbfe_01>::value);
+    BOOST_CHECK(!has_bfe_call_operator<nbfe_02>::value);
+    BOOST_CHECK(!has_bfe_call_operator<int>::value);
+    BOOST_CHECK(is_udbfe<bfe_00>::value);
+    BOOST_CHECK(is_udbfe<bfe_01>::value);
+    BOOST_CHECK(is_udbfe<thread_bfe>::value);
+    BOOST_CHECK(is_udbfe<member_bfe>::value);
+    BOOST_CHECK(is_udbfe<default_bfe>::value);
+    BOOST_CHECK(!is_udbfe<const bfe_00>::value);
+    BOOST_CHECK(!is_udbfe<bfe_00 &>::value);
+    BOOST_CHECK(!is_udbfe<nbfe_01>::value);
+    BOOST_CHECK(!is_udbfe<nbfe_02>::value);
+    BOOST_CHECK(!is_udbfe<nbfe_03>::value);
+    BOOST_CHECK((std::is_constructible<bfe, bfe_00>::value));
+    BOOST_CHECK((!std::is_constructible<bfe, nbfe_01>::value));
+    BOOST_CHECK((!std::is_constructible<bfe, int>::value));
+}
+
+BOOST_AUTO_TEST_CASE(bfe_construction_test)
+{
+    // Default constructor.
+    bfe b0;
+    BOOST_CHECK(b0.is<default_bfe>());
+    BOOST_CHECK(!b0.is<thread_bfe>());
+    BOOST_CHECK(b0.extract<default_bfe>() != nullptr);
+    BOOST_CHECK(b0.extract<thread_bfe>() == nullptr);
+    BOOST_CHECK(static_cast<const bfe &>(b0).extract<default_bfe>() != nullptr);
+    BOOST_CHECK_EQUAL(b0.get_name(), "Default batch fitness evaluator");
+    BOOST_CHECK(b0.get_extra_info().empty());
+    BOOST_CHECK(b0.get_thread_safety() == thread_safety::basic);
+    // Minimal UDBFE.
+    bfe b1{bfe_00{}};
+    BOOST_CHECK(b1.is<bfe_00>());
+    BOOST_CHECK(!b1.get_name().empty());
+    BOOST_CHECK(b1.get_extra_info().empty());
+    BOOST_CHECK(b1.get_thread_safety() == thread_safety::basic);
+    // Full UDBFE.
+    bfe b2{bfe_01{}};
+    BOOST_CHECK_EQUAL(b2.get_name(), "bfe_01");
+    BOOST_CHECK_EQUAL(b2.get_extra_info(), "extra 0");
+    BOOST_CHECK(b2.get_thread_safety() == thread_safety::none);
+    b2.extract<bfe_01>()->m_state = 42;
+    BOOST_CHECK_EQUAL(b2.get_extra_info(), "extra 42");
+    // Copy and move semantics.
+    auto b3(b2);
+    BOOST_CHECK(b3.is<bfe_01>());
+    BOOST_CHECK_EQUAL(b3.get_extra_info(), "extra 42");
+    BOOST_CHECK(b3.extract<bfe_01>() != b2.extract<bfe_01>());
+    auto b4(std::move(b3));
+    BOOST_CHECK_EQUAL(b4.get_name(), "bfe_01");
+    BOOST_CHECK(b4.get_thread_safety() == thread_safety::none);
+    b3 = b1;
+    BOOST_CHECK(b3.is<bfe_00>());
+    b3 = std::move(b4);
+    BOOST_CHECK(b3.is<bfe_01>());
+    BOOST_CHECK_EQUAL(b3.get_extra_info(), "extra 42");
+}
+
+BOOST_AUTO_TEST_CASE(bfe_call_test)
+{
+    problem p{rosenbrock{2u}};
+    const vector_double dvs = {1., 1., 0., 0., 1., 2.};
+    for (const auto &b : {bfe{}, bfe{bfe_00{}}, bfe{thread_bfe{}}, bfe{member_bfe{}}}) {
+        const auto fevals0 = p.get_fevals();
+        const auto fvs = b(p, dvs);
+        BOOST_CHECK((fvs == vector_double{p.fitness({1., 1.})[0], p.fitness({0., 0.})[0], p.fitness({1., 2.})[0]}));
+        BOOST_CHECK_EQUAL(p.get_fevals(), fevals0 + 6u);
+        // Empty batch.
+        BOOST_CHECK(b(p, vector_double{}).empty());
+    }
+    // Wrong input size.
+    BOOST_CHECK_THROW(bfe{}(p, vector_double{1., 2., 3.}), std::invalid_argument);
+    // Wrong output size.
+    BOOST_CHECK_THROW(bfe{bfe_02{}}(p, dvs), std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(bfe_serialization_test)
+{
+    bfe b{bfe_01{}};
+    b.extract<bfe_01>()->m_state = 42;
+    std::stringstream ss;
+    auto before = boost::lexical_cast<std::string>(b);
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(b);
+    }
+    b = bfe{thread_bfe{}};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(b);
+    }
+    auto after = boost::lexical_cast<std::string>(b);
+    BOOST_CHECK_EQUAL(before, after);
+    BOOST_CHECK(b.is<bfe_01>());
+    BOOST_CHECK_EQUAL(b.extract<bfe_01>()->m_state, 42);
+}
+
+BOOST_AUTO_TEST_CASE(bfe_stream_test)
+{
+    auto str = boost::lexical_cast<std::string>(bfe{bfe_01{}});
+    BOOST_CHECK(str.find("BFE name: bfe_01") != std::string::npos);
+    BOOST_CHECK(str.find("Thread safety: none") != std::string::npos);
+    BOOST_CHECK(str.find("Extra info:\nextra 0") != std::string::npos);
+    str = boost::lexical_cast<std::string>(bfe{});
+    BOOST_CHECK(str.find("Extra info") == std::string::npos);
+}
@@ -53,6 +53,9 @@ BOOST_AUTO_TEST_CASE(cec2013_test)
             auto x = random_decision_vector({vector_double(dim, -100.), vector_double(dim, 100.)},
                                             r_engine); // a random vector
             BOOST_CHECK_NO_THROW(udp.fitness(x));
+            // Copies share the shift and rotation data, and they must evaluate identically.
+            const auto udp_copy(udp);
+            BOOST_CHECK(udp_copy.fitness(x) == udp.fitness(x));
         }
         BOOST_CHECK((cec2013{i, 2u}.get_name().find("CEC2013 - f")) != std::string::npos);
     }
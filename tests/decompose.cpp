@@ -300,10 +300,21 @@ struct ts2 {
     }
 };
 
+struct ts3 : ts2 {
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::constant;
+    }
+};
+
 BOOST_AUTO_TEST_CASE(decompose_thread_safety_test)
 {
     zdt p0{1, 2};
     decompose t{p0, {0.5, 0.5}, {2., 2.}};
     BOOST_CHECK(t.get_thread_safety() == thread_safety::basic);
     BOOST_CHECK((decompose{ts2{}, {0.5, 0.5}, {2., 2.}}.get_thread_safety() == thread_safety::none));
+    BOOST_CHECK((decompose{ts3{}, {0.5, 0.5}, {2., 2.}}.get_thread_safety() == thread_safety::constant));
+    // The adaptation of the reference point modifies the decomposed problem.
+    BOOST_CHECK(
+        (decompose{ts3{}, {0.5, 0.5}, {2., 2.}, "weighted", true}.get_thread_safety() == thread_safety::basic));
 }
\ No newline at end of file
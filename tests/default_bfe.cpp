@@ -0,0 +1,112 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#define BOOST_TEST_MODULE default_bfe_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <stdexcept>
+#include <string>
+#include <utility>
+
+#include <pagmo/batch_evaluators/default_bfe.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/problems/rosenbrock.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A problem which is not thread-safe, without batch fitness.
+struct unsafe_prob {
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0]};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::none;
+    }
+};
+
+// A problem which is not thread-safe, with batch fitness.
+struct unsafe_batch_prob {
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0]};
+    }
+    vector_double batch_fitness(const vector_double &dvs) const
+    {
+        vector_double retval(dvs);
+        for (auto &f : retval) {
+            f = -f;
+        }
+        return retval;
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::none;
+    }
+};
+
+BOOST_AUTO_TEST_CASE(member_bfe_test)
+{
+    member_bfe mb;
+    BOOST_CHECK_EQUAL(mb.get_name(), "Member function batch fitness evaluator");
+    problem p{unsafe_batch_prob{}};
+    BOOST_CHECK((mb(p, {.5, .25}) == vector_double{-.5, -.25}));
+    BOOST_CHECK_EQUAL(p.get_fevals(), 2u);
+    problem p2{rosenbrock{2u}};
+    BOOST_CHECK_THROW(mb(p2, {.5, .25, .1}), std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(default_bfe_test)
+{
+    default_bfe db;
+    BOOST_CHECK_EQUAL(db.get_name(), "Default batch fitness evaluator");
+    // Thread-safe problem: the threaded evaluator is used.
+    problem p0{rosenbrock{2u}};
+    BOOST_CHECK((db(p0, {1., 1., 1., 1.}) == vector_double{0., 0.}));
+    BOOST_CHECK_EQUAL(p0.get_fevals(), 2u);
+    // Batch fitness available: the member evaluator is used.
+    problem p1{unsafe_batch_prob{}};
+    BOOST_CHECK((db(p1, {.5, .25}) == vector_double{-.5, -.25}));
+    BOOST_CHECK_EQUAL(p1.get_fevals(), 2u);
+    // No thread safety and no batch fitness: error.
+    problem p2{unsafe_prob{}};
+    BOOST_CHECK_THROW(db(p2, {.5}), std::invalid_argument);
+    BOOST_CHECK_EQUAL(p2.get_fevals(), 0u);
+}
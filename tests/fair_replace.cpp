@@ -0,0 +1,88 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE fair_replace_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <stdexcept>
+#include <tuple>
+#include <vector>
+
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/r_policy.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+BOOST_AUTO_TEST_CASE(fair_replace_construction_test)
+{
+    BOOST_CHECK_EQUAL(fair_replace{}.get_rate(), 1.);
+    BOOST_CHECK(!fair_replace{}.is_fractional());
+    BOOST_CHECK_EQUAL(fair_replace{3}.get_rate(), 3.);
+    BOOST_CHECK(fair_replace{.1}.is_fractional());
+    BOOST_CHECK_THROW(fair_replace{-2}, std::invalid_argument);
+    BOOST_CHECK_THROW(fair_replace{2.}, std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(fair_replace_replace_test)
+{
+    const individuals_group_t inds{{1, 2, 3, 4}, {{1.}, {2.}, {3.}, {4.}}, {{3.}, {1.}, {4.}, {2.}}};
+    const individuals_group_t mig{{5, 6, 7}, {{5.}, {6.}, {7.}}, {{10.}, {0.}, {3.5}}};
+    // Only the best migrant gets in, replacing the worst individual.
+    r_policy r;
+    BOOST_CHECK(r.replace(inds, 1, 0, 1, 0, 0, {}, mig)
+                == (individuals_group_t{{1, 2, 6, 4}, {{1.}, {2.}, {6.}, {4.}}, {{3.}, {1.}, {0.}, {2.}}}));
+    // Up to three migrants, but only two of them are better than the worst individuals.
+    r = r_policy{fair_replace{3}};
+    BOOST_CHECK(r.replace(inds, 1, 0, 1, 0, 0, {}, mig)
+                == (individuals_group_t{{1, 2, 6, 4}, {{1.}, {2.}, {6.}, {4.}}, {{3.}, {1.}, {0.}, {2.}}}));
+    const individuals_group_t mig2{{5, 6, 7}, {{5.}, {6.}, {7.}}, {{-1.}, {0.}, {2.5}}};
+    BOOST_CHECK(r.replace(inds, 1, 0, 1, 0, 0, {}, mig2)
+                == (individuals_group_t{{5, 2, 6, 4}, {{5.}, {2.}, {6.}, {4.}}, {{-1.}, {1.}, {0.}, {2.}}}));
+    // Fractional rate.
+    r = r_policy{fair_replace{.5}};
+    BOOST_CHECK(std::get<0>(r.replace(inds, 1, 0, 1, 0, 0, {}, mig2)) == (std::vector<unsigned long long>{5, 2, 6, 4}));
+    r = r_policy{fair_replace{.2}};
+    BOOST_CHECK(r.replace(inds, 1, 0, 1, 0, 0, {}, mig2) == inds);
+    // No migrants.
+    BOOST_CHECK(r_policy{}.replace(inds, 1, 0, 1, 0, 0, {}, individuals_group_t{}) == inds);
+    // Worse migrants.
+    const individuals_group_t mig3{{5}, {{5.}}, {{100.}}};
+    BOOST_CHECK(r_policy{fair_replace{4}}.replace(inds, 1, 0, 1, 0, 0, {}, mig3) == inds);
+    // Multi-objective: the dominated individual is replaced.
+    const individuals_group_t mo_inds{{1, 2}, {{1.}, {2.}}, {{1., 1.}, {2., 2.}}};
+    const individuals_group_t mo_mig{{3}, {{3.}}, {{0., 0.}}};
+    BOOST_CHECK(std::get<0>(r_policy{}.replace(mo_inds, 1, 0, 2, 0, 0, {}, mo_mig))
+                == (std::vector<unsigned long long>{1, 3}));
+    // Constrained single-objective: a feasible migrant replaces an infeasible individual.
+    const individuals_group_t c_inds{{1, 2}, {{1.}, {2.}}, {{0., 0.}, {-5., 1.}}};
+    const individuals_group_t c_mig{{3}, {{3.}}, {{10., 0.}}};
+    BOOST_CHECK(std::get<0>(r_policy{}.replace(c_inds, 1, 0, 1, 0, 1, {0.}, c_mig))
+                == (std::vector<unsigned long long>{1, 3}));
+}
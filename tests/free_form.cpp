@@ -0,0 +1,89 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE free_form_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <cstddef>
+#include <sstream>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+#include <pagmo/serialization.hpp>
+#include <pagmo/topologies/free_form.hpp>
+#include <pagmo/topology.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+using conn_t = std::pair<std::vector<std::size_t>, vector_double>;
+
+BOOST_AUTO_TEST_CASE(free_form_test)
+{
+    free_form f0;
+    BOOST_CHECK_EQUAL(f0.num_vertices(), 0u);
+    BOOST_CHECK_THROW(f0.get_connections(0), std::invalid_argument);
+    BOOST_CHECK_THROW(f0.add_edge(0, 1), std::invalid_argument);
+    f0.push_back();
+    f0.push_back();
+    f0.push_back();
+    BOOST_CHECK(f0.get_connections(0) == conn_t{});
+    f0.add_edge(0, 1);
+    f0.add_edge(2, 1, .5);
+    f0.add_edge(1, 0, .1);
+    BOOST_CHECK((f0.get_connections(0) == conn_t{{1u}, {.1}}));
+    BOOST_CHECK((f0.get_connections(1) == conn_t{{0u, 2u}, {1., .5}}));
+    BOOST_CHECK(f0.get_connections(2) == conn_t{});
+    // Overwrite the weight of an existing edge.
+    f0.add_edge(0, 1, .3);
+    BOOST_CHECK((f0.get_connections(1) == conn_t{{0u, 2u}, {.3, .5}}));
+    // Invalid edges.
+    BOOST_CHECK_THROW(f0.add_edge(1, 1), std::invalid_argument);
+    BOOST_CHECK_THROW(f0.add_edge(0, 3), std::invalid_argument);
+    BOOST_CHECK_THROW(f0.add_edge(3, 0), std::invalid_argument);
+    BOOST_CHECK_THROW(f0.add_edge(0, 2, -.1), std::invalid_argument);
+    BOOST_CHECK(free_form{5u}.num_vertices() == 5u);
+    // Type-erased usage and serialization.
+    topology t{f0};
+    BOOST_CHECK_EQUAL(t.get_name(), "Free form");
+    BOOST_CHECK(t.get_extra_info().find("Number of edges: 3") != std::string::npos);
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(t);
+    }
+    t = topology{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(t);
+    }
+    BOOST_CHECK(t.is<free_form>());
+    BOOST_CHECK((t.get_connections(1) == conn_t{{0u, 2u}, {.3, .5}}));
+}
@@ -0,0 +1,87 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE fully_connected_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <cstddef>
+#include <sstream>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+#include <pagmo/serialization.hpp>
+#include <pagmo/topologies/fully_connected.hpp>
+#include <pagmo/topology.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+using conn_t = std::pair<std::vector<std::size_t>, vector_double>;
+
+BOOST_AUTO_TEST_CASE(fully_connected_test)
+{
+    fully_connected f0;
+    BOOST_CHECK_EQUAL(f0.num_vertices(), 0u);
+    BOOST_CHECK_EQUAL(f0.get_weight(), 1.);
+    BOOST_CHECK_THROW(f0.get_connections(0), std::invalid_argument);
+    f0.push_back();
+    BOOST_CHECK(f0.get_connections(0) == conn_t{});
+    f0.push_back();
+    f0.push_back();
+    BOOST_CHECK((f0.get_connections(0) == conn_t{{1u, 2u}, {1., 1.}}));
+    BOOST_CHECK((f0.get_connections(1) == conn_t{{0u, 2u}, {1., 1.}}));
+    BOOST_CHECK((f0.get_connections(2) == conn_t{{0u, 1u}, {1., 1.}}));
+    fully_connected f1{20u, .5};
+    for (std::size_t i = 0; i < 20u; ++i) {
+        const auto c = f1.get_connections(i);
+        BOOST_CHECK_EQUAL(c.first.size(), 19u);
+        BOOST_CHECK(c.second == vector_double(19u, .5));
+        for (auto j : c.first) {
+            BOOST_CHECK(j != i && j < 20u);
+        }
+    }
+    BOOST_CHECK_THROW(fully_connected(3u, 2.), std::invalid_argument);
+    // Type-erased usage and serialization.
+    topology t{f1};
+    BOOST_CHECK_EQUAL(t.get_name(), "Fully connected");
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(t);
+    }
+    t = topology{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(t);
+    }
+    BOOST_CHECK(t.is<fully_connected>());
+    BOOST_CHECK_EQUAL(t.extract<fully_connected>()->num_vertices(), 20u);
+    BOOST_CHECK_EQUAL(t.extract<fully_connected>()->get_weight(), .5);
+}
@@ -29,9 +29,13 @@ see https://www.gnu.org/licenses/. */
 #define BOOST_TEST_MODULE generic_utilities_test
 #include <boost/test/included/unit_test.hpp>
 
+#include <algorithm>
 #include <limits>
+#include <random>
 #include <stdexcept>
 #include <tuple>
+#include <utility>
+#include <vector>
 
 #include <pagmo/io.hpp>
 #include <pagmo/rng.hpp>
@@ -202,4 +206,47 @@ BOOST_AUTO_TEST_CASE(kNN_test)
         std::vector<vector_double> points = {{1, 1}, {2, 2}, {2, 3, 4}};
         BOOST_CHECK_THROW(kNN(points, 3u), std::invalid_argument);
     }
+    // Larger sets (searched with the k-d tree), compared to a naive search sorting all the distances.
+    // The points on a coarse grid produce many ties and duplicates, which are sorted by index.
+    detail::random_engine_type r_engine(32u);
+    std::uniform_real_distribution<double> dist(0., 1.);
+    std::uniform_int_distribution<int> idist(0, 3);
+    for (auto M : {1u, 2u, 3u, 5u}) {
+        for (auto grid : {false, true}) {
+            std::vector<vector_double> points(300u, vector_double(M));
+            for (auto &p : points) {
+                for (auto &x : p) {
+                    x = grid ? idist(r_engine) : dist(r_engine);
+                }
+            }
+            for (auto k : {0u, 1u, 7u, 20u, 299u, 400u}) {
+                auto res = kNN(points, k);
+                BOOST_CHECK_EQUAL(res.size(), points.size());
+                for (decltype(points.size()) i = 0u; i < points.size(); ++i) {
+                    std::vector<std::pair<double, vector_double::size_type>> d;
+                    for (decltype(points.size()) j = 0u; j < points.size(); ++j) {
+                        if (j != i) {
+                            d.emplace_back(detail::squared_distance(points[i], points[j]), j);
+                        }
+                    }
+                    std::sort(d.begin(), d.end());
+                    std::vector<vector_double::size_type> expected;
+                    for (decltype(d.size()) j = 0u; j < std::min(d.size(), decltype(d.size())(k)); ++j) {
+                        expected.push_back(d[j].second);
+                    }
+                    BOOST_CHECK(res[i] == expected);
+                }
+            }
+        }
+    }
+    // Non finite coordinates are sorted last.
+    {
+        std::vector<vector_double> points(40u, vector_double{1., 1.});
+        points[3][1] = std::numeric_limits<double>::quiet_NaN();
+        points[7][0] = std::numeric_limits<double>::infinity();
+        auto res = kNN(points, 39u);
+        BOOST_CHECK_EQUAL(res[0].size(), 39u);
+        BOOST_CHECK_EQUAL(res[0][37], 7u);
+        BOOST_CHECK_EQUAL(res[0][38], 3u);
+    }
 }
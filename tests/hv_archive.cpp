@@ -0,0 +1,186 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#define BOOST_TEST_MODULE hv_archive_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <random>
+#include <stdexcept>
+#include <vector>
+
+#include <pagmo/rng.hpp>
+#include <pagmo/types.hpp>
+#include <pagmo/utils/hv_algos/hv_hv2d.hpp>
+#include <pagmo/utils/hv_algos/hv_hv3d.hpp>
+#include <pagmo/utils/hv_archive.hpp>
+#include <pagmo/utils/hypervolume.hpp>
+#include <pagmo/utils/multi_objective.hpp>
+
+using namespace pagmo;
+
+// Check the state of the archive against a computation from scratch.
+static void check_archive(const hv_archive &archive)
+{
+    const auto points = archive.get_points();
+    BOOST_CHECK_EQUAL(points.size(), archive.size());
+    const auto contribs = archive.contributions();
+    BOOST_CHECK_EQUAL(contribs.size(), points.size());
+    if (points.empty()) {
+        BOOST_CHECK(std::abs(archive.get_hv()) < 1E-12);
+        return;
+    }
+    // The points must be mutually non-dominated.
+    if (points.size() > 1u) {
+        BOOST_CHECK_EQUAL(std::get<0>(non_dominated_sorting(points)).size(), 1u);
+    }
+    hypervolume hv(points);
+    BOOST_CHECK(std::abs(archive.get_hv() - hv.compute(archive.get_r_point())) < 1E-10);
+    const auto ref_contribs = hv.contributions(archive.get_r_point());
+    for (decltype(points.size()) i = 0u; i < points.size(); ++i) {
+        BOOST_CHECK(std::abs(contribs[i] - ref_contribs[i]) < 1E-10);
+        BOOST_CHECK_EQUAL(archive.exclusive(points[i]), contribs[i]);
+    }
+    const auto lc = archive.least_contributor();
+    BOOST_CHECK(lc == points[static_cast<decltype(points.size())>(
+                          std::min_element(contribs.begin(), contribs.end()) - contribs.begin())]);
+}
+
+static void random_test(vector_double::size_type dim, unsigned seed)
+{
+    detail::random_engine_type r_engine(seed);
+    // Integer coordinates, to test ties and duplicates.
+    std::uniform_int_distribution<int> dist(0, 20);
+    hv_archive archive(vector_double(dim, 21.));
+    for (auto i = 0; i < 300; ++i) {
+        vector_double p(dim);
+        for (auto &x : p) {
+            x = dist(r_engine);
+        }
+        const auto archived = archive.get_points();
+        BOOST_CHECK_EQUAL(archive.insert(p),
+                          !std::any_of(archived.begin(), archived.end(), [&p](const vector_double &q) {
+                              return std::equal(q.begin(), q.end(), p.begin(),
+                                                [](double a, double b) { return a <= b; });
+                          }));
+        // Every few insertions, remove the least contributor or a random point.
+        if (i % 3 == 2) {
+            archive.erase(archive.least_contributor());
+        } else if (i % 5 == 4) {
+            const auto points = archive.get_points();
+            BOOST_CHECK(archive.erase(points[points.size() / 2u]));
+            BOOST_CHECK(!archive.erase(points[points.size() / 2u]));
+        }
+        check_archive(archive);
+    }
+    // Empty the archive.
+    while (archive.size()) {
+        BOOST_CHECK(archive.erase(archive.least_contributor()));
+    }
+    check_archive(archive);
+}
+
+BOOST_AUTO_TEST_CASE(hv_archive_2d_test)
+{
+    hv_archive archive({10., 10.});
+    BOOST_CHECK_EQUAL(archive.size(), 0u);
+    BOOST_CHECK_EQUAL(archive.get_hv(), 0.);
+    BOOST_CHECK(archive.contributions().empty());
+    BOOST_CHECK_THROW(archive.least_contributor(), std::invalid_argument);
+    BOOST_CHECK(archive.insert({5., 5.}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 25.);
+    BOOST_CHECK_EQUAL(archive.exclusive({5., 5.}), 25.);
+    // Weakly dominated points are rejected.
+    BOOST_CHECK(!archive.insert({5., 5.}));
+    BOOST_CHECK(!archive.insert({5., 6.}));
+    BOOST_CHECK(!archive.insert({7., 8.}));
+    BOOST_CHECK(archive.insert({2., 8.}));
+    BOOST_CHECK(archive.insert({8., 2.}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 25. + 6. + 6.);
+    BOOST_CHECK((archive.get_points() == std::vector<vector_double>{{2., 8.}, {5., 5.}, {8., 2.}}));
+    BOOST_CHECK((archive.contributions() == std::vector<double>{6., 9., 6.}));
+    BOOST_CHECK((archive.least_contributor() == vector_double{2., 8.}));
+    // A dominating point evicts the dominated ones.
+    BOOST_CHECK(archive.insert({5., 2.}));
+    BOOST_CHECK((archive.get_points() == std::vector<vector_double>{{2., 8.}, {5., 2.}}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 46.);
+    check_archive(archive);
+    BOOST_CHECK(archive.erase({5., 2.}));
+    BOOST_CHECK(!archive.erase({5., 2.}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 16.);
+    check_archive(archive);
+    // Points on the boundary of the reference point.
+    BOOST_CHECK(archive.insert({10., 0.}));
+    check_archive(archive);
+
+    // Random sequences of insertions and removals.
+    random_test(2u, 42u);
+    random_test(2u, 43u);
+}
+
+BOOST_AUTO_TEST_CASE(hv_archive_3d_test)
+{
+    hv_archive archive({10., 10., 10.});
+    BOOST_CHECK(archive.insert({5., 5., 5.}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 125.);
+    BOOST_CHECK((archive.contributions() == std::vector<double>{125.}));
+    BOOST_CHECK(!archive.insert({5., 6., 5.}));
+    BOOST_CHECK(archive.insert({2., 8., 8.}));
+    BOOST_CHECK(archive.insert({1., 1., 9.}));
+    check_archive(archive);
+    BOOST_CHECK(archive.insert({1., 1., 1.}));
+    BOOST_CHECK((archive.get_points() == std::vector<vector_double>{{1., 1., 1.}}));
+    BOOST_CHECK_EQUAL(archive.get_hv(), 729.);
+    check_archive(archive);
+
+    random_test(3u, 42u);
+    random_test(3u, 43u);
+}
+
+BOOST_AUTO_TEST_CASE(hv_archive_errors_test)
+{
+    const auto nan = std::numeric_limits<double>::quiet_NaN();
+    BOOST_CHECK_THROW(hv_archive{vector_double{}}, std::invalid_argument);
+    BOOST_CHECK_THROW(hv_archive{vector_double{1.}}, std::invalid_argument);
+    BOOST_CHECK_THROW((hv_archive{vector_double{1., 1., 1., 1.}}), std::invalid_argument);
+    BOOST_CHECK_THROW((hv_archive{vector_double{1., nan}}), std::invalid_argument);
+    hv_archive archive({10., 10.});
+    BOOST_CHECK_THROW(archive.insert({1., 1., 1.}), std::invalid_argument);
+    BOOST_CHECK_THROW(archive.insert({1., nan}), std::invalid_argument);
+    BOOST_CHECK_THROW(archive.insert({1., 11.}), std::invalid_argument);
+    BOOST_CHECK_THROW(archive.erase({1.}), std::invalid_argument);
+    BOOST_CHECK(archive.insert({1., 1.}));
+    BOOST_CHECK_THROW(archive.exclusive({2., 2.}), std::invalid_argument);
+    hv_archive archive3({10., 10., 10.});
+    BOOST_CHECK(archive3.insert({1., 1., 1.}));
+    BOOST_CHECK_THROW(archive3.exclusive({2., 2., 2.}), std::invalid_argument);
+    BOOST_CHECK(archive3.erase({1., 1., 1.}));
+    BOOST_CHECK_THROW(archive3.least_contributor(), std::invalid_argument);
+}
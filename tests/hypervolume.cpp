@@ -28,6 +28,8 @@ see https://www.gnu.org/licenses/. */
 
 #define BOOST_TEST_MODULE hypervolume_utilities_test
 #include <boost/test/included/unit_test.hpp>
+#include <cmath>
+#include <random>
 #include <stdexcept>
 #include <tuple>
 
@@ -41,12 +43,14 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
 #include <pagmo/problems/rosenbrock.hpp>
 #include <pagmo/problems/zdt.hpp>
+#include <pagmo/rng.hpp>
 #include <pagmo/types.hpp>
 #include <pagmo/utils/hv_algos/hv_algorithm.hpp>
 #include <pagmo/utils/hv_algos/hv_bf_approx.hpp>
 #include <pagmo/utils/hv_algos/hv_bf_fpras.hpp>
 #include <pagmo/utils/hv_algos/hv_hv2d.hpp>
 #include <pagmo/utils/hv_algos/hv_hv3d.hpp>
+#include <pagmo/utils/hv_algos/hv_hv4d.hpp>
 #include <pagmo/utils/hv_algos/hv_hvwfg.hpp>
 #include <pagmo/utils/hypervolume.hpp>
 
@@ -85,6 +89,8 @@ public:
             m_method = hv2d().clone();
         } else if (method_name == "hv3d") {
             m_method = hv3d().clone();
+        } else if (method_name == "hv4d") {
+            m_method = hv4d().clone();
         } else if (method_name == "wfg") {
             m_method = hvwfg().clone();
         } else {
@@ -463,6 +469,115 @@ BOOST_AUTO_TEST_CASE(hypervolume_contributions_test)
     assertContribs(points, ref, answers);
 }
 
+BOOST_AUTO_TEST_CASE(hypervolume_parallel_contributions_test)
+{
+    // Points on the unit sphere in 6 dimensions (all non dominated), plus a few dominated points.
+    detail::random_engine_type r_engine(42u);
+    std::normal_distribution<double> dist(0., 1.);
+    std::vector<vector_double> points;
+    for (auto i = 0; i < 40; ++i) {
+        vector_double p(6);
+        double norm = 0.;
+        for (auto &x : p) {
+            x = std::abs(dist(r_engine));
+            norm += x * x;
+        }
+        for (auto &x : p) {
+            x /= std::sqrt(norm);
+        }
+        points.push_back(p);
+    }
+    for (auto i = 0; i < 5; ++i) {
+        auto p = points[static_cast<decltype(points.size())>(i)];
+        for (auto &x : p) {
+            x += .1;
+        }
+        points.push_back(p);
+    }
+    const vector_double ref(6, 1.5);
+    hypervolume hv(points);
+    hvwfg algo_serial, algo_serial3(3u);
+    const auto c_serial = hv.contributions(ref, algo_serial);
+    BOOST_CHECK_EQUAL(hvwfg().get_n_threads(), 1u);
+    for (auto n_threads : {0u, 2u, 3u, 7u, 100u}) {
+        hvwfg algo(2u, n_threads);
+        BOOST_CHECK_EQUAL(algo.get_n_threads(), n_threads);
+        // The results must be identical, regardless of the number of threads.
+        BOOST_CHECK(hv.contributions(ref, algo) == c_serial);
+        BOOST_CHECK_EQUAL(hv.least_contributor(ref, algo), hv.least_contributor(ref, algo_serial));
+        BOOST_CHECK_EQUAL(hv.greatest_contributor(ref, algo), hv.greatest_contributor(ref, algo_serial));
+        // Stop dimension different from 2.
+        hvwfg algo3(3u, n_threads);
+        BOOST_CHECK(hv.contributions(ref, algo3) == hv.contributions(ref, algo_serial3));
+    }
+    // The dominated points do not contribute.
+    for (auto i = 40u; i < 45u; ++i) {
+        BOOST_CHECK_EQUAL(c_serial[i], 0.);
+    }
+    // Single point.
+    hv = hypervolume({{.5, .5, .5, .5, .5, .5}});
+    hvwfg algo4(2u, 4u);
+    BOOST_CHECK(hv.contributions(ref, algo4) == hv.contributions(ref, algo_serial));
+}
+
+BOOST_AUTO_TEST_CASE(hypervolume_hv4d_test)
+{
+    hv4d algo;
+    hvwfg algo_wfg;
+    hv3d algo_3d;
+    BOOST_CHECK(hypervolume({{1., 1., 1., 1.}}).get_best_compute({2., 2., 2., 2.})->get_name() == algo.get_name());
+    BOOST_CHECK(hypervolume({{1., 1., 1.}}).get_best_compute({2., 2., 2.})->get_name() == algo_3d.get_name());
+    BOOST_CHECK(hypervolume({{1., 1., 1., 1., 1.}}).get_best_compute({2., 2., 2., 2., 2.})->get_name()
+                == algo_wfg.get_name());
+    // Wrong dimensions.
+    hypervolume hv({{2.3, 4.5, 3.2}, {3.4, 3.4, 3.4}, {6.0, 1.2, 3.6}});
+    BOOST_CHECK_THROW(hv.compute({7.0, 7.0, 7.0}, algo), std::invalid_argument);
+    hv = hypervolume({{2.3, 4.5, 3.2, 1.9, 6.0}, {3.4, 3.4, 3.4, 2.1, 5.8}, {6.0, 1.2, 3.6, 3.0, 6.0}});
+    BOOST_CHECK_THROW(hv.compute({7.0, 7.0, 7.0, 7.0, 7.0}, algo), std::invalid_argument);
+    // Single point and simple cases.
+    hv = hypervolume({{1., 2., 3., 4.}});
+    BOOST_CHECK_EQUAL(hv.compute({5., 5., 5., 5.}, algo), 4. * 3. * 2. * 1.);
+    hv = hypervolume({{1., 1., 1., 1.}, {1., 1., 1., 1.}, {2., 2., 2., 2.}});
+    BOOST_CHECK_EQUAL(hv.compute({3., 3., 3., 3.}, algo), 16.);
+    hv = hypervolume({{2.3, 4.5, 3.2, 1.9}, {3.4, 3.4, 3.4, 2.1}, {6.0, 1.2, 3.6, 3.0}});
+    BOOST_CHECK_CLOSE(hv.compute({7.0, 7.0, 7.0, 7.0}, algo), hv.compute({7.0, 7.0, 7.0, 7.0}, algo_wfg), 1e-10);
+    // Random fronts: points on the unit sphere (all non dominated) mixed with uniformly distributed points,
+    // and points sharing some coordinates.
+    detail::random_engine_type r_engine(42u);
+    std::normal_distribution<double> dist(0., 1.);
+    std::uniform_real_distribution<double> udist(0., 1.);
+    std::uniform_int_distribution<int> idist(0, 3);
+    for (auto n : {2, 10, 50, 200}) {
+        std::vector<vector_double> points;
+        for (auto i = 0; i < n; ++i) {
+            vector_double p(4);
+            double norm = 0.;
+            for (auto &x : p) {
+                x = std::abs(dist(r_engine));
+                norm += x * x;
+            }
+            for (auto &x : p) {
+                x /= std::sqrt(norm);
+            }
+            points.push_back(p);
+            for (auto &x : p) {
+                x = udist(r_engine);
+            }
+            points.push_back(p);
+            for (auto &x : p) {
+                x = idist(r_engine) / 4.;
+            }
+            points.push_back(p);
+        }
+        hv = hypervolume(points);
+        const vector_double ref(4, 1.1);
+        BOOST_CHECK_CLOSE(hv.compute(ref, algo), hv.compute(ref, algo_wfg), 1e-8);
+        BOOST_CHECK_CLOSE(hv.compute(ref), hv.compute(ref, algo_wfg), 1e-8);
+        // Exclusive contributions go through the same algorithm.
+        BOOST_CHECK_CLOSE(hv.exclusive(0u, ref, algo), hv.exclusive(0u, ref, algo_wfg), 1e-6);
+    }
+}
+
 BOOST_AUTO_TEST_CASE(hypervolume_least_contribution_test)
 {
     hypervolume hv;
@@ -769,6 +884,8 @@ BOOST_AUTO_TEST_CASE(hypervolume_name_getters_test)
     BOOST_CHECK(al1.get_name().find("hv2d") != std::string::npos);
     hv3d al2;
     BOOST_CHECK(al2.get_name().find("hv3d") != std::string::npos);
+    hv4d al6;
+    BOOST_CHECK(al6.get_name().find("hv4d") != std::string::npos);
     hvwfg al3;
     BOOST_CHECK(al3.get_name().find("WFG") != std::string::npos);
     bf_approx al4;
@@ -777,6 +894,27 @@ BOOST_AUTO_TEST_CASE(hypervolume_name_getters_test)
     BOOST_CHECK(al5.get_name().find("bf_fpras") != std::string::npos);
 }
 
+// Random points on the positive part of the unit sphere (all non dominated).
+static std::vector<vector_double> sphere_points(vector_double::size_type dim, unsigned n, unsigned seed)
+{
+    detail::random_engine_type r_engine(seed);
+    std::normal_distribution<double> dist(0., 1.);
+    std::vector<vector_double> points;
+    for (auto i = 0u; i < n; ++i) {
+        vector_double p(dim);
+        double norm = 0.;
+        for (auto &x : p) {
+            x = std::abs(dist(r_engine));
+            norm += x * x;
+        }
+        for (auto &x : p) {
+            x /= std::sqrt(norm);
+        }
+        points.push_back(p);
+    }
+    return points;
+}
+
 BOOST_AUTO_TEST_CASE(hypervolume_bf_approx_test)
 {
     bf_approx al;
@@ -785,6 +923,27 @@ BOOST_AUTO_TEST_CASE(hypervolume_bf_approx_test)
     BOOST_CHECK_THROW(al.compute(points, ref), std::invalid_argument);
     auto al_clone = al.clone();
     BOOST_CHECK(al_clone->get_name().find("Bringmann-Friedrich") != std::string::npos);
+    BOOST_CHECK_EQUAL(al.get_n_threads(), 1u);
+    al.set_n_threads(4u);
+    BOOST_CHECK_EQUAL(al.get_n_threads(), 4u);
+    // The results depend only on the seed, not on the number of threads.
+    auto points_sphere = sphere_points(8u, 30u, 123u);
+    const vector_double ref_sphere(8u, 1.2);
+    hypervolume hv(points_sphere);
+    hvwfg algo_wfg;
+    const auto lc_exact = hv.least_contributor(ref_sphere, algo_wfg);
+    const auto gc_exact = hv.greatest_contributor(ref_sphere, algo_wfg);
+    bf_approx al1(true, 1u, 1e-2, 1e-6, 0.775, 0.2, 0.1, 0.25, 42u);
+    const auto lc = hv.least_contributor(ref_sphere, al1);
+    const auto gc = hv.greatest_contributor(ref_sphere, al1);
+    BOOST_CHECK_EQUAL(lc, lc_exact);
+    BOOST_CHECK_EQUAL(gc, gc_exact);
+    for (auto n_threads : {0u, 2u, 3u}) {
+        bf_approx al2(true, 1u, 1e-2, 1e-6, 0.775, 0.2, 0.1, 0.25, 42u);
+        al2.set_n_threads(n_threads);
+        BOOST_CHECK_EQUAL(hv.least_contributor(ref_sphere, al2), lc);
+        BOOST_CHECK_EQUAL(hv.greatest_contributor(ref_sphere, al2), gc);
+    }
 }
 
 BOOST_AUTO_TEST_CASE(hypervolume_bf_pras_test)
@@ -798,4 +957,24 @@ BOOST_AUTO_TEST_CASE(hypervolume_bf_pras_test)
     BOOST_CHECK_THROW(al.contributions(points, ref), std::invalid_argument);
     auto al_clone = al.clone();
     BOOST_CHECK(al_clone->get_name().find("bf_fpras") != std::string::npos);
+    BOOST_CHECK_EQUAL(al.get_n_threads(), 1u);
+    al.set_n_threads(0u);
+    BOOST_CHECK_EQUAL(al.get_n_threads(), 0u);
+    // Approximation of a 10-dimensional hypervolume.
+    auto points_sphere = sphere_points(10u, 30u, 321u);
+    const vector_double ref_sphere(10u, 1.1);
+    hypervolume hv(points_sphere);
+    hvwfg algo_wfg;
+    const auto hv_exact = hv.compute(ref_sphere, algo_wfg);
+    bf_fpras al1(5e-2, 1e-2, 42u);
+    const auto hv_approx = hv.compute(ref_sphere, al1);
+    BOOST_CHECK_CLOSE(hv_approx, hv_exact, 5.);
+    // The result depends only on the seed, not on the number of threads.
+    for (auto n_threads : {0u, 2u, 3u}) {
+        bf_fpras al2(5e-2, 1e-2, 42u);
+        al2.set_n_threads(n_threads);
+        BOOST_CHECK_EQUAL(hv.compute(ref_sphere, al2), hv_approx);
+        // The clone keeps the number of threads.
+        BOOST_CHECK_EQUAL(static_cast<bf_fpras &>(*al2.clone()).get_n_threads(), n_threads);
+    }
 }
\ No newline at end of file
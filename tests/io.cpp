@@ -98,6 +98,9 @@ BOOST_AUTO_TEST_CASE(stream_print_test_00)
     ss1.str("");
     stream(ss1, thread_safety::basic);
     BOOST_CHECK_EQUAL(ss1.str(), "basic");
+    ss1.str("");
+    stream(ss1, thread_safety::constant);
+    BOOST_CHECK_EQUAL(ss1.str(), "constant");
 }
 
 BOOST_AUTO_TEST_CASE(stream_print_test_01)
@@ -167,6 +167,44 @@ BOOST_AUTO_TEST_CASE(ipopt_nlp_test)
     BOOST_CHECK(std::abs(h[9] - (0. + lambda[0] * 2)) < 1E-8);
 }
 
+BOOST_AUTO_TEST_CASE(ipopt_nlp_cache)
+{
+    using ipopt_nlp = detail::ipopt_nlp;
+    using Index = ipopt_nlp::Index;
+    problem prob(hock_schittkowsky_71{});
+    ipopt_nlp nlp(prob, {1.1, 1.2, 1.3, 1.4}, 0u);
+
+    const vector_double x{2.1, 2.2, 2.3, 2.4}, x2{2.5, 2.2, 2.3, 2.4};
+    double objval;
+    vector_double grad_f(4), g(2), jac_g(8);
+    std::vector<Index> iRow(8), jCol(8);
+
+    // A new point: the fitness is computed once for eval_f() and eval_g(),
+    // the gradient once for eval_grad_f() and eval_jac_g().
+    nlp.eval_f(4, x.data(), true, objval);
+    nlp.eval_g(4, x.data(), false, 2, g.data());
+    nlp.eval_grad_f(4, x.data(), false, grad_f.data());
+    nlp.eval_jac_g(4, x.data(), false, 2, 8, iRow.data(), jCol.data(), jac_g.data());
+    BOOST_CHECK_EQUAL(prob.get_fevals(), 1u);
+    BOOST_CHECK_EQUAL(prob.get_gevals(), 1u);
+    BOOST_CHECK_EQUAL(nlp.m_fit_hits, 1u);
+    BOOST_CHECK_EQUAL(nlp.m_grad_hits, 1u);
+    BOOST_CHECK_EQUAL(objval, prob.fitness(x)[0]);
+    BOOST_CHECK((g == vector_double{prob.fitness(x)[1], prob.fitness(x)[2]}));
+
+    // The values at the new point must be recomputed, starting from any callback.
+    nlp.eval_g(4, x2.data(), true, 2, g.data());
+    nlp.eval_jac_g(4, x2.data(), false, 2, 8, iRow.data(), jCol.data(), jac_g.data());
+    nlp.eval_f(4, x2.data(), false, objval);
+    nlp.eval_grad_f(4, x2.data(), false, grad_f.data());
+    BOOST_CHECK_EQUAL(prob.get_fevals(), 5u);
+    BOOST_CHECK_EQUAL(prob.get_gevals(), 2u);
+    BOOST_CHECK_EQUAL(objval, prob.fitness(x2)[0]);
+    const auto grad = prob.gradient(x2);
+    BOOST_CHECK((grad_f == vector_double(grad.begin(), grad.begin() + 4)));
+    BOOST_CHECK((jac_g == vector_double(grad.begin() + 4, grad.end())));
+}
+
 BOOST_AUTO_TEST_CASE(ipopt_evolve_test_00)
 {
     ipopt ip;
@@ -186,9 +224,12 @@ BOOST_AUTO_TEST_CASE(ipopt_evolve_test_01)
     problem prob(luksan_vlcek1{4});
     prob.set_c_tol({1E-8, 1E-8});
     population pop(prob, 1);
+    BOOST_CHECK(algo.get_extra_info().find("cache hits: fitness 0, gradient 0") != std::string::npos);
     algo.evolve(pop);
     BOOST_CHECK_EQUAL(Ipopt::Solve_Succeeded, algo.extract<ipopt>()->get_last_opt_result());
     BOOST_CHECK(!algo.get_extra_info().empty());
+    // The constraints are evaluated at the same points as the objective function.
+    BOOST_CHECK(algo.get_extra_info().find("cache hits: fitness 0,") == std::string::npos);
     BOOST_CHECK(!algo.extract<ipopt>()->get_log().empty());
 }
 
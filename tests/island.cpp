@@ -31,6 +31,7 @@ see https://www.gnu.org/licenses/. */
 
 #include <atomic>
 #include <boost/lexical_cast.hpp>
+#include <chrono>
 #include <initializer_list>
 #include <sstream>
 #include <stdexcept>
@@ -401,3 +402,99 @@ BOOST_AUTO_TEST_CASE(island_evolve_status)
     stream(ss, evolve_status::idle_error);
     BOOST_CHECK_EQUAL(ss.str(), "idle - **error occurred**");
 }
+
+BOOST_AUTO_TEST_CASE(island_pool_size)
+{
+    const auto hc = std::thread::hardware_concurrency();
+    BOOST_CHECK_EQUAL(get_island_pool_size(), hc ? hc : 1u);
+    BOOST_CHECK_THROW(set_island_pool_size(0u), std::invalid_argument);
+    BOOST_CHECK_EQUAL(get_island_pool_size(), hc ? hc : 1u);
+    set_island_pool_size(3u);
+    BOOST_CHECK_EQUAL(get_island_pool_size(), 3u);
+    set_island_pool_size(hc ? hc : 1u);
+    BOOST_CHECK_EQUAL(get_island_pool_size(), hc ? hc : 1u);
+}
+
+static std::atomic<unsigned> n_running(0u), max_running(0u);
+
+// An algorithm increasing the first component of the first decision vector,
+// while keeping track of the number of concurrent evolutions.
+struct algo_02 {
+    population evolve(population pop) const
+    {
+        const auto cur = ++n_running;
+        auto old_max = max_running.load();
+        while (cur > old_max && !max_running.compare_exchange_weak(old_max, cur)) {
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(1));
+        vector_double x = pop.get_x_row(0);
+        x[0] += 1.;
+        pop.set_xf(0, x, pop.get_f_row(0));
+        --n_running;
+        return pop;
+    }
+};
+
+BOOST_AUTO_TEST_CASE(island_pool_many_islands)
+{
+    set_island_pool_size(2u);
+    std::vector<island> islands;
+    for (auto i = 0; i < 200; ++i) {
+        islands.emplace_back(algo_02{}, population{rosenbrock{}, 1u});
+    }
+    std::vector<double> x0;
+    for (auto &isl : islands) {
+        x0.push_back(isl.get_population().get_x_row(0)[0]);
+        isl.evolve(2);
+        isl.evolve();
+    }
+    for (auto &isl : islands) {
+        BOOST_CHECK(isl.status() != evolve_status::idle_error && isl.status() != evolve_status::busy_error);
+    }
+    for (auto &isl : islands) {
+        isl.wait_check();
+    }
+    // The evolutions of each island ran one after the other.
+    for (decltype(islands.size()) i = 0; i < islands.size(); ++i) {
+        BOOST_CHECK_EQUAL(islands[i].get_population().get_x_row(0)[0], x0[i] + 3.);
+    }
+    BOOST_CHECK(max_running.load() <= 2u);
+    BOOST_CHECK(max_running.load() >= 1u);
+    const auto hc = std::thread::hardware_concurrency();
+    set_island_pool_size(hc ? hc : 1u);
+}
+
+// An algorithm evolving a population in a nested island.
+struct algo_03 {
+    population evolve(const population &pop) const
+    {
+        island isl{algo_02{}, pop};
+        isl.evolve(2);
+        isl.wait_check();
+        island isl2{algo_02{}, isl.get_population()};
+        isl2.evolve();
+        // NOTE: isl2 is destroyed while evolving.
+        return isl.get_population();
+    }
+};
+
+BOOST_AUTO_TEST_CASE(island_pool_nested)
+{
+    // Nested islands must not deadlock, even with a pool of size 1.
+    set_island_pool_size(1u);
+    island isl{algo_03{}, population{rosenbrock{}, 1u}};
+    const auto x0 = isl.get_population().get_x_row(0)[0];
+    isl.evolve(3);
+    isl.wait_check();
+    BOOST_CHECK_EQUAL(isl.get_population().get_x_row(0)[0], x0 + 6.);
+    std::vector<island> islands;
+    for (auto i = 0; i < 10; ++i) {
+        islands.emplace_back(algo_03{}, population{rosenbrock{}, 1u});
+        islands.back().evolve();
+    }
+    for (auto &i : islands) {
+        i.wait_check();
+    }
+    const auto hc = std::thread::hardware_concurrency();
+    set_island_pool_size(hc ? hc : 1u);
+}
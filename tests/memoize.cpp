@@ -0,0 +1,236 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#define BOOST_TEST_MODULE memoize_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <boost/lexical_cast.hpp>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+
+#include <pagmo/io.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/problems/hock_schittkowsky_71.hpp>
+#include <pagmo/problems/inventory.hpp>
+#include <pagmo/problems/memoize.hpp>
+#include <pagmo/problems/minlp_rastrigin.hpp>
+#include <pagmo/problems/rosenbrock.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+BOOST_AUTO_TEST_CASE(memoize_construction_test)
+{
+    problem p0{memoize{}};
+    problem p1{memoize{null_problem{}, 1000u}};
+    BOOST_CHECK_EQUAL(boost::lexical_cast<std::string>(p0), boost::lexical_cast<std::string>(p1));
+    BOOST_CHECK_EQUAL(p0.extract<memoize>()->get_capacity(), 1000u);
+    BOOST_CHECK(!p0.extract<memoize>()->get_cache_gradient());
+    BOOST_CHECK_THROW((memoize{null_problem{}, 0u}), std::invalid_argument);
+    memoize m{rosenbrock{2u}, 10u, true};
+    BOOST_CHECK_EQUAL(m.get_capacity(), 10u);
+    BOOST_CHECK(m.get_cache_gradient());
+    BOOST_CHECK(m.get_name().find("[memoized]") != std::string::npos);
+    BOOST_CHECK(m.get_extra_info().find("Gradient cache hits") != std::string::npos);
+}
+
+BOOST_AUTO_TEST_CASE(memoize_fitness_test)
+{
+    problem p{memoize{rosenbrock{2u}, 2u}};
+    problem ref{rosenbrock{2u}};
+    const vector_double x1{.1, .2}, x2{.3, .4}, x3{.5, .6};
+    BOOST_CHECK(p.fitness(x1) == ref.fitness(x1));
+    BOOST_CHECK(p.fitness(x1) == ref.fitness(x1));
+    auto m = p.extract<memoize>();
+    BOOST_CHECK_EQUAL(m->get_hits(), 1u);
+    BOOST_CHECK_EQUAL(m->get_misses(), 1u);
+    // The outer problem counts all the evaluations, the inner one only the misses.
+    BOOST_CHECK_EQUAL(p.get_fevals(), 2u);
+    BOOST_CHECK_EQUAL(m->get_inner_problem().get_fevals(), 1u);
+    // Fill the cache, then evict x2 (the least recently used entry).
+    p.fitness(x2);
+    p.fitness(x1);
+    p.fitness(x3);
+    BOOST_CHECK_EQUAL(m->get_hits(), 2u);
+    BOOST_CHECK_EQUAL(m->get_misses(), 3u);
+    BOOST_CHECK(p.fitness(x1) == ref.fitness(x1));
+    BOOST_CHECK_EQUAL(m->get_hits(), 3u);
+    BOOST_CHECK(p.fitness(x2) == ref.fitness(x2));
+    BOOST_CHECK_EQUAL(m->get_misses(), 4u);
+    BOOST_CHECK_EQUAL(m->get_inner_problem().get_fevals(), 4u);
+    BOOST_CHECK(p.get_extra_info().find("Fitness cache hits: 3") != std::string::npos);
+    // Clearing the cache.
+    p.extract<memoize>()->clear_cache();
+    p.fitness(x1);
+    BOOST_CHECK_EQUAL(m->get_hits(), 3u);
+    BOOST_CHECK_EQUAL(m->get_misses(), 5u);
+}
+
+// A UDP with batch fitness, which records the size of the last batch.
+struct batch_udp {
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0] + x[1]};
+    }
+    vector_double batch_fitness(const vector_double &dvs) const
+    {
+        last_batch_size = dvs.size() / 2u;
+        vector_double retval;
+        for (decltype(dvs.size()) i = 0; i < dvs.size(); i += 2u) {
+            retval.push_back(dvs[i] + dvs[i + 1u]);
+        }
+        return retval;
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0., 0.}, {1., 1.}};
+    }
+    static vector_double::size_type last_batch_size;
+};
+
+vector_double::size_type batch_udp::last_batch_size = 0;
+
+BOOST_AUTO_TEST_CASE(memoize_batch_fitness_test)
+{
+    const vector_double dvs{.1, .2, .3, .4, .1, .2};
+    {
+        // The inner problem does not provide batch fitness, the outer problem will fall back to
+        // memoize::fitness().
+        problem p{memoize{rosenbrock{2u}, 10u}};
+        problem ref{rosenbrock{2u}};
+        BOOST_CHECK(!p.has_batch_fitness());
+        p.fitness({.3, .4});
+        BOOST_CHECK(p.batch_fitness(dvs) == ref.batch_fitness(dvs));
+        auto m = p.extract<memoize>();
+        BOOST_CHECK_EQUAL(m->get_hits(), 2u);
+        BOOST_CHECK_EQUAL(m->get_misses(), 2u);
+        BOOST_CHECK(p.batch_fitness(dvs) == ref.batch_fitness(dvs));
+        BOOST_CHECK_EQUAL(m->get_hits(), 5u);
+        BOOST_CHECK_EQUAL(p.get_fevals(), 7u);
+    }
+    {
+        // Only the cache misses are forwarded, in a single batch, to the inner problem.
+        problem p{memoize{batch_udp{}, 10u}};
+        problem ref{batch_udp{}};
+        BOOST_CHECK(p.has_batch_fitness());
+        p.fitness({.3, .4});
+        BOOST_CHECK(p.batch_fitness(dvs) == ref.batch_fitness(dvs));
+        auto m = p.extract<memoize>();
+        BOOST_CHECK_EQUAL(m->get_hits(), 1u);
+        BOOST_CHECK_EQUAL(m->get_misses(), 3u);
+        BOOST_CHECK_EQUAL(m->get_inner_problem().get_fevals(), 3u);
+        BOOST_CHECK(p.batch_fitness({.5, .5, .1, .2}) == (vector_double{1., .1 + .2}));
+        BOOST_CHECK_EQUAL(batch_udp::last_batch_size, 1u);
+        BOOST_CHECK(p.batch_fitness(dvs) == ref.batch_fitness(dvs));
+        BOOST_CHECK_EQUAL(m->get_hits(), 5u);
+        BOOST_CHECK_EQUAL(m->get_misses(), 4u);
+        BOOST_CHECK_EQUAL(p.get_fevals(), 9u);
+    }
+}
+
+BOOST_AUTO_TEST_CASE(memoize_gradient_test)
+{
+    hock_schittkowsky_71 hs;
+    const vector_double x{3., 3., 3., 3.};
+    problem p0{memoize{hs}};
+    p0.gradient(x);
+    p0.gradient(x);
+    BOOST_CHECK_EQUAL(p0.extract<memoize>()->get_gradient_hits(), 0u);
+    BOOST_CHECK_EQUAL(p0.extract<memoize>()->get_inner_problem().get_gevals(), 2u);
+    problem p1{memoize{hs, 10u, true}};
+    BOOST_CHECK(p1.gradient(x) == problem{hs}.gradient(x));
+    BOOST_CHECK(p1.gradient(x) == problem{hs}.gradient(x));
+    BOOST_CHECK_EQUAL(p1.extract<memoize>()->get_gradient_hits(), 1u);
+    BOOST_CHECK_EQUAL(p1.extract<memoize>()->get_gradient_misses(), 1u);
+    BOOST_CHECK_EQUAL(p1.extract<memoize>()->get_inner_problem().get_gevals(), 1u);
+    BOOST_CHECK(p1.hessians(x) == problem{hs}.hessians(x));
+}
+
+BOOST_AUTO_TEST_CASE(memoize_copy_test)
+{
+    memoize m{rosenbrock{2u}, 10u};
+    m.fitness({.1, .2});
+    // The copy has an independent cache with the same content.
+    auto m2(m);
+    m2.fitness({.1, .2});
+    BOOST_CHECK_EQUAL(m2.get_hits(), 1u);
+    m2.fitness({.3, .4});
+    m = m2;
+    m.fitness({.3, .4});
+    BOOST_CHECK_EQUAL(m.get_hits(), 2u);
+    BOOST_CHECK_EQUAL(m2.get_hits(), 1u);
+}
+
+BOOST_AUTO_TEST_CASE(memoize_serialization_test)
+{
+    problem p{memoize{hock_schittkowsky_71{}, 10u, true}};
+    p.fitness({1., 1., 1., 1.});
+    p.fitness({1., 1., 1., 1.});
+    p.gradient({1., 1., 1., 1.});
+    std::stringstream ss;
+    auto before = boost::lexical_cast<std::string>(p);
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(p);
+    }
+    p = problem{null_problem{}};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(p);
+    }
+    auto after = boost::lexical_cast<std::string>(p);
+    BOOST_CHECK_EQUAL(before, after);
+    // The cache content has been restored.
+    p.fitness({1., 1., 1., 1.});
+    BOOST_CHECK_EQUAL(p.extract<memoize>()->get_hits(), 2u);
+    BOOST_CHECK_EQUAL(p.extract<memoize>()->get_misses(), 1u);
+}
+
+BOOST_AUTO_TEST_CASE(memoize_inheritance_test)
+{
+    problem p{memoize{minlp_rastrigin{3u, 2u}}};
+    problem ref{minlp_rastrigin{3u, 2u}};
+    BOOST_CHECK_EQUAL(p.get_nix(), ref.get_nix());
+    BOOST_CHECK(p.get_bounds() == ref.get_bounds());
+    BOOST_CHECK_EQUAL(p.has_gradient(), ref.has_gradient());
+    BOOST_CHECK_EQUAL(p.has_hessians(), ref.has_hessians());
+    BOOST_CHECK(p.get_thread_safety() == thread_safety::basic);
+    // Stochastic problems: set_seed() clears the cache.
+    problem ps{memoize{inventory{10u, 10u, 1234567u}}};
+    BOOST_CHECK(ps.is_stochastic());
+    const vector_double x(10u, 1.);
+    const auto f0 = ps.fitness(x);
+    ps.set_seed(5672543u);
+    ps.fitness(x);
+    BOOST_CHECK_EQUAL(ps.extract<memoize>()->get_misses(), 2u);
+    ps.set_seed(1234567u);
+    BOOST_CHECK(ps.fitness(x) == f0);
+}
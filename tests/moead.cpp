@@ -32,6 +32,7 @@ see https://www.gnu.org/licenses/. */
 #include <boost/lexical_cast.hpp>
 #include <boost/test/floating_point_comparison.hpp>
 #include <iostream>
+#include <sstream>
 #include <string>
 
 #include <pagmo/algorithm.hpp>
@@ -161,6 +162,20 @@ BOOST_AUTO_TEST_CASE(moead_evolve_test)
 
     BOOST_CHECK(user_algo1.get_log() == user_algo2.get_log());
 
+    // The neighbourhoods of the weights are cached across calls to evolve: the results
+    // must be the same as when they are computed from scratch, also after a call with
+    // a different population size.
+    for (auto size : {40u, 50u}) {
+        moead user_algo3{10u, "grid", "tchebycheff", 20u, 1., 0.5, 20., 0.9, 2u, true, 23u};
+        user_algo3.set_verbosity(1u);
+        user_algo3.evolve(population{prob, size, 32u});
+        user_algo3.set_seed(23u);
+        population pop5{prob, 40u, 23u};
+        pop5 = user_algo3.evolve(pop5);
+        BOOST_CHECK(user_algo1.get_log() == user_algo3.get_log());
+        BOOST_CHECK(pop5.get_f() == pop1.get_f());
+    }
+
     // We then check that the method evolve fails when called on unsuitable problems (populations)
     // Empty population.
     BOOST_CHECK_THROW(moead{10u}.evolve(population{problem{rosenbrock{}}, 0u}), std::invalid_argument);
@@ -234,3 +249,33 @@ BOOST_AUTO_TEST_CASE(moead_serialization_test)
         }
     }
 }
+
+BOOST_AUTO_TEST_CASE(moead_dedup_test)
+{
+    // With a null crossover rate many candidates are copies of their parent. The deduplication
+    // must not alter the evolution, only the number of fitness evaluations.
+    population pop0{zdt{1u, 10u}, 20u, 23u};
+    moead user_algo0{20u, "grid", "tchebycheff", 10u, 0., 0.5, 20., 0.9, 2u, true, 23u};
+    BOOST_CHECK(!user_algo0.get_dedup());
+    auto pop_ref = user_algo0.evolve(pop0);
+    BOOST_CHECK_EQUAL(user_algo0.get_saved_fevals(), 0u);
+    moead user_algo1{20u, "grid", "tchebycheff", 10u, 0., 0.5, 20., 0.9, 2u, true, 23u};
+    user_algo1.set_dedup(true);
+    BOOST_CHECK(user_algo1.get_dedup());
+    BOOST_CHECK(user_algo1.get_extra_info().find("Fitness deduplication: true") != std::string::npos);
+    auto pop1 = user_algo1.evolve(pop0);
+    BOOST_CHECK(pop1.get_x() == pop_ref.get_x());
+    BOOST_CHECK(pop1.get_f() == pop_ref.get_f());
+    BOOST_CHECK(user_algo1.get_saved_fevals() > 0u);
+    BOOST_CHECK_EQUAL(pop1.get_problem().get_fevals() + user_algo1.get_saved_fevals(),
+                      pop_ref.get_problem().get_fevals());
+    // The saved evaluations are shown in the screen output.
+    {
+        std::stringstream out;
+        auto old_buf = std::cout.rdbuf(out.rdbuf());
+        user_algo1.set_verbosity(10u);
+        user_algo1.evolve(pop0);
+        std::cout.rdbuf(old_buf);
+        BOOST_CHECK(out.str().find("Saved:") != std::string::npos);
+    }
+}
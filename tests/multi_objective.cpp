@@ -29,11 +29,15 @@ see https://www.gnu.org/licenses/. */
 #define BOOST_TEST_MODULE mo_utilities_test
 
 #include <boost/test/included/unit_test.hpp>
+#include <cmath>
+#include <limits>
 #include <numeric>
 #include <stdexcept>
+#include <random>
 #include <tuple>
 
 #include <pagmo/io.hpp>
+#include <pagmo/rng.hpp>
 #include <pagmo/types.hpp>
 #include <pagmo/utils/multi_objective.hpp>
 
@@ -142,6 +146,54 @@ BOOST_AUTO_TEST_CASE(fast_non_dominated_sorting_test)
     BOOST_CHECK_THROW(fast_non_dominated_sorting(example), std::invalid_argument);
 }
 
+BOOST_AUTO_TEST_CASE(non_dominated_sorting_test)
+{
+    // The examples of fast_non_dominated_sorting_test.
+    auto retval = non_dominated_sorting(
+        {{0, 7}, {1, 5}, {2, 3}, {4, 2}, {7, 1}, {10, 0}, {2, 6}, {4, 4}, {10, 2}, {6, 6}, {9, 5}});
+    BOOST_CHECK((std::get<0>(retval)
+                 == std::vector<std::vector<vector_double::size_type>>{{0, 1, 2, 3, 4, 5}, {6, 7, 8}, {9, 10}}));
+    BOOST_CHECK((std::get<1>(retval) == std::vector<vector_double::size_type>{0, 0, 0, 0, 0, 0, 1, 1, 1, 2, 2}));
+    retval = non_dominated_sorting({{1, 2, 3}, {-2, 3, 7}, {-1, -2, -3}, {0, 0, 0}});
+    BOOST_CHECK((std::get<0>(retval) == std::vector<std::vector<vector_double::size_type>>{{1, 2}, {3}, {0}}));
+    BOOST_CHECK((std::get<1>(retval) == std::vector<vector_double::size_type>{2, 0, 0, 1}));
+    retval = non_dominated_sorting({{}, {}, {}, {}});
+    BOOST_CHECK((std::get<0>(retval) == std::vector<std::vector<vector_double::size_type>>{{0, 1, 2, 3}}));
+    BOOST_CHECK((std::get<1>(retval) == std::vector<vector_double::size_type>{0, 0, 0, 0}));
+    // Duplicates and NaNs.
+    const auto nan = std::numeric_limits<double>::quiet_NaN();
+    retval = non_dominated_sorting({{1, 1}, {0, nan}, {1, 1}, {2, 2}, {nan, 0}, {0, 3}});
+    BOOST_CHECK((std::get<0>(retval) == std::vector<std::vector<vector_double::size_type>>{{0, 1, 2, 4, 5}, {3}}));
+    BOOST_CHECK((std::get<1>(retval) == std::vector<vector_double::size_type>{0, 0, 0, 1, 0, 0}));
+
+    // Compare with fast_non_dominated_sorting on random points, with many ties.
+    detail::random_engine_type r_engine(32u);
+    std::uniform_int_distribution<int> dist(0, 9);
+    for (auto M : {1u, 2u, 3u, 5u}) {
+        for (auto N : {2u, 10u, 100u, 500u}) {
+            std::vector<vector_double> points(N, vector_double(M));
+            for (auto &p : points) {
+                for (auto &x : p) {
+                    x = dist(r_engine);
+                }
+            }
+            auto fnds = fast_non_dominated_sorting(points);
+            auto nds = non_dominated_sorting(points);
+            for (auto &front : std::get<0>(fnds)) {
+                std::sort(front.begin(), front.end());
+            }
+            BOOST_CHECK(std::get<0>(nds) == std::get<0>(fnds));
+            BOOST_CHECK(std::get<1>(nds) == std::get<3>(fnds));
+        }
+    }
+
+    // Error handling.
+    BOOST_CHECK_THROW(non_dominated_sorting({{0, 0, 0}}), std::invalid_argument);
+    BOOST_CHECK_THROW(non_dominated_sorting({}), std::invalid_argument);
+    BOOST_CHECK_THROW(non_dominated_sorting({{1, 3}, {3, 42, 3}, {}}), std::invalid_argument);
+    BOOST_CHECK_THROW(non_dominated_sorting({{3, 4, 5}, {}}), std::invalid_argument);
+}
+
 BOOST_AUTO_TEST_CASE(crowding_distance_test)
 {
     std::vector<vector_double> example;
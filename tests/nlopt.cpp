@@ -245,6 +245,27 @@ BOOST_AUTO_TEST_CASE(nlopt_evolve)
     }
 }
 
+BOOST_AUTO_TEST_CASE(nlopt_cache)
+{
+    // hs71 has one equality and one inequality constraint, which NLopt evaluates at the
+    // same points as the objective function: the fitness and the gradient must be computed
+    // only once per point.
+    algorithm a{nlopt{"slsqp"}};
+    a.set_verbosity(1);
+    BOOST_CHECK(a.get_extra_info().find("cache hits: fitness 0, gradient 0") != std::string::npos);
+    population pop{hs71{}, 1};
+    const auto fevals = pop.get_problem().get_fevals();
+    pop = a.evolve(pop);
+    // NOTE: the log contains one line per objective function evaluation. Without
+    // the cache, there would be 3 fitness evaluations per line (plus the one performed
+    // by evolve() on the optimised individual).
+    const auto n_obj = a.extract<nlopt>()->get_log().size();
+    BOOST_CHECK(n_obj > 0u);
+    BOOST_CHECK(pop.get_problem().get_fevals() - fevals < 2u * n_obj + 1u);
+    BOOST_CHECK(pop.get_problem().get_gevals() < 2u * n_obj);
+    BOOST_CHECK(a.get_extra_info().find("cache hits: fitness 0,") == std::string::npos);
+}
+
 BOOST_AUTO_TEST_CASE(nlopt_set_sc)
 {
     auto a = nlopt{"slsqp"};
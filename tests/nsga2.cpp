@@ -33,10 +33,14 @@ see https://www.gnu.org/licenses/. */
 #include <boost/lexical_cast.hpp>
 #include <boost/test/floating_point_comparison.hpp>
 #include <iostream>
+#include <sstream>
 #include <string>
 
 #include <pagmo/algorithm.hpp>
 #include <pagmo/algorithms/nsga2.hpp>
+#include <pagmo/batch_evaluators/member_bfe.hpp>
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
 #include <pagmo/io.hpp>
 #include <pagmo/problems/dtlz.hpp>
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
@@ -44,6 +48,7 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/problems/rosenbrock.hpp>
 #include <pagmo/problems/zdt.hpp>
 #include <pagmo/serialization.hpp>
+#include <pagmo/threading.hpp>
 #include <pagmo/types.hpp>
 
 using namespace pagmo;
@@ -179,3 +184,94 @@ BOOST_AUTO_TEST_CASE(nsga2_serialization_test)
         }
     }
 }
+
+struct unsafe_bfe {
+    vector_double operator()(problem &p, const vector_double &dvs) const
+    {
+        return p.batch_fitness(dvs);
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::none;
+    }
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+
+PAGMO_REGISTER_BFE(unsafe_bfe)
+
+BOOST_AUTO_TEST_CASE(nsga2_bfe_test)
+{
+    // The evolution with a batch fitness evaluator must give the same results as
+    // the evolution without it.
+    population pop0{zdt{1u, 30u}, 40u, 23u};
+    nsga2 user_algo0{10u, 0.95, 10., 0.01, 50., 32u};
+    auto pop_ref = user_algo0.evolve(pop0);
+    for (const auto &b : {bfe{}, bfe{thread_bfe{}}, bfe{member_bfe{}}}) {
+        nsga2 user_algo1{10u, 0.95, 10., 0.01, 50., 32u};
+        user_algo1.set_bfe(b);
+        BOOST_CHECK(user_algo1.get_extra_info().find("Batch fitness evaluator: " + b.get_name()) != std::string::npos);
+        auto pop1 = user_algo1.evolve(pop0);
+        BOOST_CHECK(pop1.get_x() == pop_ref.get_x());
+        BOOST_CHECK(pop1.get_f() == pop_ref.get_f());
+        BOOST_CHECK(pop1.get_ID() == pop_ref.get_ID());
+        BOOST_CHECK_EQUAL(pop1.get_problem().get_fevals(), pop_ref.get_problem().get_fevals());
+    }
+    // The thread safety of the algorithm depends on the bfe.
+    nsga2 user_algo2;
+    BOOST_CHECK(user_algo2.get_thread_safety() == thread_safety::basic);
+    user_algo2.set_bfe(bfe{unsafe_bfe{}});
+    BOOST_CHECK(user_algo2.get_thread_safety() == thread_safety::none);
+    BOOST_CHECK(algorithm{user_algo2}.get_thread_safety() == thread_safety::none);
+    // Serialization preserves the bfe.
+    algorithm algo{user_algo2};
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(algo);
+    }
+    algo = algorithm{null_algorithm{}};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(algo);
+    }
+    BOOST_CHECK(algo.extract<nsga2>()->get_thread_safety() == thread_safety::none);
+    BOOST_CHECK(algo.extract<nsga2>()->get_extra_info().find("Batch fitness evaluator") != std::string::npos);
+}
+
+BOOST_AUTO_TEST_CASE(nsga2_dedup_test)
+{
+    // The deduplication must not alter the evolution, only the number of fitness evaluations,
+    // with and without a batch fitness evaluator.
+    population pop0{zdt{5u, 10u}, 20u, 23u};
+    nsga2 user_algo0{50u, 0.95, 10., 0.01, 50., 32u};
+    BOOST_CHECK(!user_algo0.get_dedup());
+    auto pop_ref = user_algo0.evolve(pop0);
+    BOOST_CHECK_EQUAL(user_algo0.get_saved_fevals(), 0u);
+    for (const auto &b : {bfe{}, bfe{thread_bfe{}}}) {
+        nsga2 user_algo1{50u, 0.95, 10., 0.01, 50., 32u};
+        user_algo1.set_bfe(b);
+        user_algo1.set_dedup(true);
+        BOOST_CHECK(user_algo1.get_dedup());
+        BOOST_CHECK(user_algo1.get_extra_info().find("Fitness deduplication: true") != std::string::npos);
+        auto pop1 = user_algo1.evolve(pop0);
+        BOOST_CHECK(pop1.get_x() == pop_ref.get_x());
+        BOOST_CHECK(pop1.get_f() == pop_ref.get_f());
+        BOOST_CHECK(pop1.get_ID() == pop_ref.get_ID());
+        BOOST_CHECK(user_algo1.get_saved_fevals() > 0u);
+        BOOST_CHECK_EQUAL(pop1.get_problem().get_fevals() + user_algo1.get_saved_fevals(),
+                          pop_ref.get_problem().get_fevals());
+    }
+    // The saved evaluations are shown in the screen output.
+    {
+        std::stringstream out;
+        auto old_buf = std::cout.rdbuf(out.rdbuf());
+        user_algo0.set_dedup(true);
+        user_algo0.set_verbosity(10u);
+        user_algo0.evolve(pop0);
+        std::cout.rdbuf(old_buf);
+        BOOST_CHECK(out.str().find("Saved:") != std::string::npos);
+    }
+}
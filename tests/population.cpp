@@ -28,14 +28,18 @@ see https://www.gnu.org/licenses/. */
 
 #define BOOST_TEST_MODULE population_test
 
+#include <algorithm>
 #include <boost/lexical_cast.hpp>
 #include <boost/test/included/unit_test.hpp>
+#include <cstddef>
 #include <iostream>
 #include <sstream>
 #include <stdexcept>
 #include <string>
 #include <type_traits>
 
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
 #include <pagmo/population.hpp>
 #include <pagmo/problem.hpp>
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
@@ -178,6 +182,58 @@ BOOST_AUTO_TEST_CASE(population_push_back_test)
     BOOST_CHECK_THROW(pop3.push_back(vector_double(30u, 0.5), {0., 0., 0.}), std::invalid_argument);
 }
 
+BOOST_AUTO_TEST_CASE(population_batch_push_back_test)
+{
+    // The construction via a bfe gives the same population as the serial construction.
+    for (const auto &b : {bfe{}, bfe{thread_bfe{}}}) {
+        for (auto size : {0u, 1u, 13u, 100u}) {
+            population pop0{rosenbrock{5u}, size, 42u}, pop1{rosenbrock{5u}, b, size, 42u};
+            BOOST_CHECK(pop1.get_x() == pop0.get_x());
+            BOOST_CHECK(pop1.get_f() == pop0.get_f());
+            BOOST_CHECK(pop1.get_ID() == pop0.get_ID());
+            BOOST_CHECK(pop1.get_seed() == 42u);
+            BOOST_CHECK_EQUAL(pop1.get_problem().get_fevals(), size);
+            if (size) {
+                BOOST_CHECK(pop1.champion_x() == pop0.champion_x());
+                BOOST_CHECK(pop1.champion_f() == pop0.champion_f());
+            }
+        }
+    }
+    // Bulk insertion is equivalent to a sequence of push_back(), also for constrained problems.
+    for (const auto &prob : {problem{rosenbrock{2u}}, problem{hock_schittkowsky_71{}}, problem{zdt{1u, 3u}}}) {
+        population pop0{prob, 3u, 7u}, pop1{prob, 3u, 7u}, pop2{prob, 3u, 7u}, gen{prob, 0u, 8u};
+        vector_double dvs;
+        for (auto i = 0; i < 20; ++i) {
+            const auto x = gen.random_decision_vector();
+            dvs.insert(dvs.end(), x.begin(), x.end());
+            pop0.push_back(x);
+        }
+        pop1.batch_push_back(dvs);
+        pop2.batch_push_back(dvs, bfe{thread_bfe{}});
+        for (const auto &pop : {pop1, pop2}) {
+            BOOST_CHECK(pop.get_x() == pop0.get_x());
+            BOOST_CHECK(pop.get_f() == pop0.get_f());
+            BOOST_CHECK(pop.get_ID() == pop0.get_ID());
+            BOOST_CHECK_EQUAL(pop.get_problem().get_fevals(), pop0.get_problem().get_fevals());
+            if (prob.get_nobj() == 1u) {
+                BOOST_CHECK(pop.champion_x() == pop0.champion_x());
+                BOOST_CHECK(pop.champion_f() == pop0.champion_f());
+            }
+        }
+    }
+    // An empty batch does nothing, a malformed one throws without altering the population.
+    population pop{rosenbrock{2u}, 5u, 1u};
+    const auto x = pop.get_x_data();
+    pop.batch_push_back(vector_double{});
+    BOOST_CHECK(pop.size() == 5u);
+    BOOST_CHECK_THROW(pop.batch_push_back(vector_double(5u, 0.5)), std::invalid_argument);
+    BOOST_CHECK_THROW(pop.batch_push_back(vector_double(5u, 0.5), bfe{}), std::invalid_argument);
+    population pop2{problem{malformed{}}};
+    BOOST_CHECK_THROW(pop2.batch_push_back({1., 2.}), std::invalid_argument);
+    BOOST_CHECK(pop.get_x_data() == x);
+    BOOST_CHECK(pop2.size() == 0u);
+}
+
 BOOST_AUTO_TEST_CASE(population_random_decision_vector_test)
 {
     // Create an empty population
@@ -252,6 +308,70 @@ BOOST_AUTO_TEST_CASE(population_getters_test)
     BOOST_CHECK(pop_string.find(prob_string) != std::string::npos);
 }
 
+BOOST_AUTO_TEST_CASE(population_contiguous_storage_test)
+{
+    population pop{problem{zdt{1u, 5u}}, 10u, 1234u};
+    const auto &xd = pop.get_x_data();
+    const auto &fd = pop.get_f_data();
+    BOOST_CHECK_EQUAL(xd.size(), 50u);
+    BOOST_CHECK_EQUAL(fd.size(), 20u);
+    const auto xs = pop.get_x();
+    const auto fs = pop.get_f();
+    BOOST_CHECK_EQUAL(xs.size(), 10u);
+    BOOST_CHECK_EQUAL(fs.size(), 10u);
+    for (decltype(pop.size()) i = 0u; i < pop.size(); ++i) {
+        BOOST_CHECK((pop.get_x_row(i) == xs[i]));
+        BOOST_CHECK((pop.get_f_row(i) == fs[i]));
+        BOOST_CHECK((vector_double(xd.begin() + static_cast<std::ptrdiff_t>(i * 5u),
+                                   xd.begin() + static_cast<std::ptrdiff_t>(i * 5u + 5u))
+                     == xs[i]));
+        BOOST_CHECK((vector_double(fd.begin() + static_cast<std::ptrdiff_t>(i * 2u),
+                                   fd.begin() + static_cast<std::ptrdiff_t>(i * 2u + 2u))
+                     == fs[i]));
+    }
+    // Rows are non-owning views on the contiguous storage.
+    const auto xr = pop.get_x_row(3u);
+    const auto fr = pop.get_f_row(3u);
+    BOOST_CHECK_EQUAL(xr.size(), 5u);
+    BOOST_CHECK_EQUAL(fr.size(), 2u);
+    BOOST_CHECK(!xr.empty());
+    BOOST_CHECK_EQUAL(xr.data(), xd.data() + 15);
+    BOOST_CHECK_EQUAL(fr.data(), fd.data() + 6);
+    BOOST_CHECK_EQUAL(xr[4], xd[19]);
+    BOOST_CHECK(std::equal(xr.begin(), xr.end(), xs[3].begin()));
+    BOOST_CHECK((xr == pop.get_x_row(3u)));
+    BOOST_CHECK((xr != pop.get_x_row(4u)));
+    BOOST_CHECK((xs[3] == xr));
+    const vector_double xr_copy = xr;
+    BOOST_CHECK((xr_copy == xs[3]));
+    // Setters write in place.
+    pop.set_xf(3u, {.1, .2, .3, .4, .5}, {1., 2.});
+    BOOST_CHECK((xr == vector_double{.1, .2, .3, .4, .5}));
+    BOOST_CHECK((fr == vector_double{1., 2.}));
+    BOOST_CHECK((xr_copy == xs[3]));
+    BOOST_CHECK((pop.get_x_row(3u) == vector_double{.1, .2, .3, .4, .5}));
+    BOOST_CHECK((pop.get_f_row(3u) == vector_double{1., 2.}));
+    BOOST_CHECK_EQUAL(pop.get_x_data()[15u], .1);
+    BOOST_CHECK_EQUAL(pop.get_f_data()[7u], 2.);
+    // push_back appends a row.
+    pop.push_back({.5, .4, .3, .2, .1}, {3., 4.});
+    BOOST_CHECK_EQUAL(pop.get_x_data().size(), 55u);
+    BOOST_CHECK_EQUAL(pop.get_f_data().size(), 22u);
+    BOOST_CHECK((pop.get_x_row(10u) == vector_double{.5, .4, .3, .2, .1}));
+    BOOST_CHECK((pop.get_f_row(10u) == vector_double{3., 4.}));
+    // Out of range rows.
+    BOOST_CHECK_THROW(pop.get_x_row(11u), std::invalid_argument);
+    BOOST_CHECK_THROW(pop.get_f_row(11u), std::invalid_argument);
+    // Empty population.
+    population pop2{problem{zdt{1u, 5u}}};
+    BOOST_CHECK(pop2.get_x_data().empty());
+    BOOST_CHECK(pop2.get_f_data().empty());
+    BOOST_CHECK(pop2.get_x().empty());
+    BOOST_CHECK(pop2.get_f().empty());
+    BOOST_CHECK_THROW(pop2.get_x_row(0u), std::invalid_argument);
+    BOOST_CHECK_THROW(pop2.get_f_row(0u), std::invalid_argument);
+}
+
 BOOST_AUTO_TEST_CASE(population_champion_test)
 {
     // Unconstrained case
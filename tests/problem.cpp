@@ -36,6 +36,7 @@ see https://www.gnu.org/licenses/. */
 #include <sstream>
 #include <stdexcept>
 #include <string>
+#include <thread>
 #include <type_traits>
 #include <utility>
 #include <vector>
@@ -537,6 +538,78 @@ BOOST_AUTO_TEST_CASE(problem_fitness_test)
     BOOST_CHECK((p1.fitness({3, 3}) == vector_double{12, 13, 14, 15, 16, 17}));
 }
 
+// A problem implementing batch fitness evaluation: the fitness is the sum of
+// the components of the decision vector.
+struct batch_p {
+    vector_double fitness(const vector_double &dv) const
+    {
+        return {dv[0] + dv[1]};
+    }
+    vector_double batch_fitness(const vector_double &dvs) const
+    {
+        vector_double retval;
+        for (decltype(dvs.size()) i = 0u; i < dvs.size(); i += 2u) {
+            retval.push_back(dvs[i] + dvs[i + 1u]);
+        }
+        return retval;
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0, 0}, {1, 1}};
+    }
+};
+
+// Batch fitness returning a wrong number of elements.
+struct batch_p_wrong : batch_p {
+    vector_double batch_fitness(const vector_double &) const
+    {
+        return {1.};
+    }
+};
+
+// Batch fitness implemented, but disabled via override.
+struct batch_p_override : batch_p_wrong {
+    bool has_batch_fitness() const
+    {
+        return false;
+    }
+};
+
+BOOST_AUTO_TEST_CASE(problem_batch_fitness_test)
+{
+    problem p0{base_p{2, 2, 2, {12, 13, 14, 15, 16, 17}, {5, 5}, {10, 10}}};
+    problem p1{batch_p{}};
+    problem p2{batch_p_wrong{}};
+    problem p3{batch_p_override{}};
+    BOOST_CHECK(!p0.has_batch_fitness());
+    BOOST_CHECK(p1.has_batch_fitness());
+    BOOST_CHECK(p2.has_batch_fitness());
+    BOOST_CHECK(!p3.has_batch_fitness());
+    // Fallback on the fitness() method of the UDP.
+    BOOST_CHECK((p0.batch_fitness({3, 3, 4, 4, 5, 5})
+                 == vector_double{12, 13, 14, 15, 16, 17, 12, 13, 14, 15, 16, 17, 12, 13, 14, 15, 16, 17}));
+    BOOST_CHECK_EQUAL(p0.get_fevals(), 3u);
+    BOOST_CHECK(p0.batch_fitness({}).empty());
+    BOOST_CHECK_EQUAL(p0.get_fevals(), 3u);
+    BOOST_CHECK_THROW(p0.batch_fitness({3, 3, 4}), std::invalid_argument);
+    problem p0_wrong_retval{base_p{2, 2, 2, {1, 1, 1}, {5, 5}, {10, 10}}};
+    BOOST_CHECK_THROW(p0_wrong_retval.batch_fitness({3, 3}), std::invalid_argument);
+    BOOST_CHECK_EQUAL(p0.get_fevals(), 3u);
+    // UDP-provided batch fitness.
+    BOOST_CHECK((p1.batch_fitness({.1, .2, .3, .4}) == vector_double{.1 + .2, .3 + .4}));
+    BOOST_CHECK_EQUAL(p1.get_fevals(), 2u);
+    BOOST_CHECK_THROW(p1.batch_fitness({.1, .2, .3}), std::invalid_argument);
+    BOOST_CHECK_THROW(p2.batch_fitness({.1, .2, .3, .4}), std::invalid_argument);
+    BOOST_CHECK_EQUAL(p2.get_fevals(), 0u);
+    // The override disables the UDP's batch_fitness().
+    BOOST_CHECK((p3.batch_fitness({.1, .2, .3, .4}) == vector_double{.1 + .2, .3 + .4}));
+    BOOST_CHECK_EQUAL(p3.get_fevals(), 2u);
+    // Consistency with the fitness() method, and preservation across copies.
+    auto p4(p1);
+    BOOST_CHECK(p4.has_batch_fitness());
+    BOOST_CHECK((p4.batch_fitness({.5, .6}) == p4.fitness({.5, .6})));
+}
+
 BOOST_AUTO_TEST_CASE(problem_gradient_test)
 {
     problem p1{grad_p{1, 0, 0, {12}, {5, 5}, {10, 10}, {12, 13}, {{0, 0}, {0, 1}}}};
@@ -1113,6 +1186,70 @@ BOOST_AUTO_TEST_CASE(thread_safety_test)
     BOOST_CHECK(problem{ts3{}}.get_thread_safety() == thread_safety::basic);
 }
 
+struct ts4 {
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0]};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0}, {1}};
+    }
+    vector_double gradient(const vector_double &) const
+    {
+        return {1};
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::constant;
+    }
+    template <typename Archive>
+    void serialize(Archive &)
+    {
+    }
+};
+
+PAGMO_REGISTER_PROBLEM(ts4)
+
+BOOST_AUTO_TEST_CASE(concurrent_evals_test)
+{
+    problem p{ts4{}};
+    BOOST_CHECK(p.get_thread_safety() == thread_safety::constant);
+    // Evaluate the same problem concurrently: no evaluation must be lost in the counters.
+    std::vector<std::thread> threads;
+    for (auto i = 0; i < 4; ++i) {
+        threads.emplace_back([&p]() {
+            for (auto j = 0; j < 1000; ++j) {
+                p.fitness({.5});
+                p.gradient({.5});
+            }
+        });
+    }
+    for (auto &t : threads) {
+        t.join();
+    }
+    BOOST_CHECK_EQUAL(p.get_fevals(), 4000u);
+    BOOST_CHECK_EQUAL(p.get_gevals(), 4000u);
+    // The counters are preserved by copy, move and serialization.
+    problem p2{p};
+    BOOST_CHECK_EQUAL(p2.get_fevals(), 4000u);
+    problem p3{std::move(p2)};
+    BOOST_CHECK_EQUAL(p3.get_gevals(), 4000u);
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(p3);
+    }
+    problem p4{null_problem{}};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(p4);
+    }
+    BOOST_CHECK_EQUAL(p4.get_fevals(), 4000u);
+    BOOST_CHECK_EQUAL(p4.get_gevals(), 4000u);
+    BOOST_CHECK_EQUAL(p4.get_hevals(), 0u);
+}
+
 struct gs1 {
     vector_double fitness(const vector_double &) const
     {
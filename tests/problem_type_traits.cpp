@@ -267,6 +267,57 @@ BOOST_AUTO_TEST_CASE(has_extra_info_test)
     BOOST_CHECK((!has_extra_info<ei_03>::value));
 }
 
+struct bf_00 {};
+
+// The good one.
+struct bf_01 {
+    vector_double batch_fitness(const vector_double &) const;
+};
+
+struct bf_02 {
+    vector_double batch_fitness(const vector_double &);
+};
+
+struct bf_03 {
+    vector_double batch_fitness(vector_double &) const;
+};
+
+struct bf_04 {
+    void batch_fitness(const vector_double &) const;
+};
+
+BOOST_AUTO_TEST_CASE(has_batch_fitness_test)
+{
+    BOOST_CHECK((!has_batch_fitness<bf_00>::value));
+    BOOST_CHECK((has_batch_fitness<bf_01>::value));
+    BOOST_CHECK((!has_batch_fitness<bf_02>::value));
+    BOOST_CHECK((!has_batch_fitness<bf_03>::value));
+    BOOST_CHECK((!has_batch_fitness<bf_04>::value));
+}
+
+struct ov_bf_00 {};
+
+// The good one.
+struct ov_bf_01 {
+    bool has_batch_fitness() const;
+};
+
+struct ov_bf_02 {
+    bool has_batch_fitness();
+};
+
+struct ov_bf_03 {
+    void has_batch_fitness() const;
+};
+
+BOOST_AUTO_TEST_CASE(override_has_batch_fitness_test)
+{
+    BOOST_CHECK((!override_has_batch_fitness<ov_bf_00>::value));
+    BOOST_CHECK((override_has_batch_fitness<ov_bf_01>::value));
+    BOOST_CHECK((!override_has_batch_fitness<ov_bf_02>::value));
+    BOOST_CHECK((!override_has_batch_fitness<ov_bf_03>::value));
+}
+
 struct grad_00 {
 };
 
@@ -0,0 +1,193 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE r_policy_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <boost/lexical_cast.hpp>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+
+#include <pagmo/r_policies/fair_replace.hpp>
+#include <pagmo/r_policy.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A UDRP replacing the first individual with the first migrant.
+struct udrp_00 {
+    individuals_group_t replace(const individuals_group_t &inds, vector_double::size_type, vector_double::size_type,
+                                vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                const vector_double &, const individuals_group_t &mig) const
+    {
+        auto retval = inds;
+        if (!std::get<0>(inds).empty() && !std::get<0>(mig).empty()) {
+            std::get<0>(retval)[0] = std::get<0>(mig)[0];
+            std::get<1>(retval)[0] = std::get<1>(mig)[0];
+            std::get<2>(retval)[0] = std::get<2>(mig)[0];
+        }
+        return retval;
+    }
+    std::string get_name() const
+    {
+        return "udrp_00";
+    }
+    std::string get_extra_info() const
+    {
+        return "extra " + std::to_string(m_state);
+    }
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_state);
+    }
+    int m_state = 0;
+};
+
+PAGMO_REGISTER_R_POLICY(udrp_00)
+
+// A UDRP appending the migrants.
+struct udrp_01 {
+    individuals_group_t replace(const individuals_group_t &inds, vector_double::size_type, vector_double::size_type,
+                                vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                const vector_double &, const individuals_group_t &mig) const
+    {
+        auto retval = inds;
+        std::get<0>(retval).insert(std::get<0>(retval).end(), std::get<0>(mig).begin(), std::get<0>(mig).end());
+        std::get<1>(retval).insert(std::get<1>(retval).end(), std::get<1>(mig).begin(), std::get<1>(mig).end());
+        std::get<2>(retval).insert(std::get<2>(retval).end(), std::get<2>(mig).begin(), std::get<2>(mig).end());
+        return retval;
+    }
+};
+
+// Wrong signatures.
+struct nudrp_00 {
+    individuals_group_t replace(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+                                vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                const vector_double &, const individuals_group_t &);
+};
+
+struct nudrp_01 {
+    individuals_group_t replace(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+                                vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                                const vector_double &) const;
+};
+
+BOOST_AUTO_TEST_CASE(r_policy_type_traits_test)
+{
+    BOOST_CHECK(has_replace<udrp_00>::value);
+    BOOST_CHECK(!has_replace<nudrp_00>::value);
+    BOOST_CHECK(!has_replace<nudrp_01>::value);
+    BOOST_CHECK(!has_replace<int>::value);
+    BOOST_CHECK(is_udrp<udrp_00>::value);
+    BOOST_CHECK(is_udrp<fair_replace>::value);
+    BOOST_CHECK(!is_udrp<const udrp_00>::value);
+    BOOST_CHECK(!is_udrp<udrp_00 &>::value);
+    BOOST_CHECK(!is_udrp<nudrp_00>::value);
+    BOOST_CHECK((std::is_constructible<r_policy, udrp_00>::value));
+    BOOST_CHECK((!std::is_constructible<r_policy, int>::value));
+}
+
+BOOST_AUTO_TEST_CASE(r_policy_construction_test)
+{
+    r_policy r0;
+    BOOST_CHECK(r0.is<fair_replace>());
+    BOOST_CHECK_EQUAL(r0.extract<fair_replace>()->get_rate(), 1.);
+    BOOST_CHECK(!r0.extract<fair_replace>()->is_fractional());
+    BOOST_CHECK_EQUAL(r0.get_name(), "Fair replace");
+    r_policy r1{udrp_00{}};
+    BOOST_CHECK(r1.is<udrp_00>());
+    BOOST_CHECK(!r1.is<fair_replace>());
+    BOOST_CHECK_EQUAL(r1.get_name(), "udrp_00");
+    BOOST_CHECK_EQUAL(r1.get_extra_info(), "extra 0");
+    r1.extract<udrp_00>()->m_state = 1;
+    auto r2(r1);
+    BOOST_CHECK_EQUAL(r2.extract<udrp_00>()->m_state, 1);
+    auto r3(std::move(r2));
+    BOOST_CHECK_EQUAL(r3.extract<udrp_00>()->m_state, 1);
+    r2 = r0;
+    BOOST_CHECK(r2.is<fair_replace>());
+    r2 = std::move(r3);
+    BOOST_CHECK(r2.is<udrp_00>());
+}
+
+BOOST_AUTO_TEST_CASE(r_policy_replace_test)
+{
+    const individuals_group_t inds{{1, 2, 3}, {{1.}, {2.}, {3.}}, {{3.}, {2.}, {1.}}};
+    const individuals_group_t mig{{4}, {{4.}}, {{0.}}};
+    r_policy r0{udrp_00{}};
+    const auto rep = r0.replace(inds, 1, 0, 1, 0, 0, {}, mig);
+    BOOST_CHECK(rep == (individuals_group_t{{4, 2, 3}, {{4.}, {2.}, {3.}}, {{0.}, {2.}, {1.}}}));
+    // Invalid problem properties.
+    BOOST_CHECK_THROW(r0.replace(inds, 0, 0, 1, 0, 0, {}, mig), std::invalid_argument);
+    BOOST_CHECK_THROW(r0.replace(inds, 1, 0, 1, 1, 0, {}, mig), std::invalid_argument);
+    // Invalid input groups.
+    BOOST_CHECK_THROW(r0.replace(individuals_group_t{{1}, {{1.}, {2.}}, {{1.}}}, 1, 0, 1, 0, 0, {}, mig),
+                      std::invalid_argument);
+    BOOST_CHECK_THROW(r0.replace(inds, 1, 0, 1, 0, 0, {}, individuals_group_t{{4}, {{4., 5.}}, {{0.}}}),
+                      std::invalid_argument);
+    // Invalid output.
+    BOOST_CHECK_THROW(r_policy{udrp_01{}}.replace(inds, 1, 0, 1, 0, 0, {}, mig), std::invalid_argument);
+    BOOST_CHECK_NO_THROW(r_policy{udrp_01{}}.replace(inds, 1, 0, 1, 0, 0, {}, individuals_group_t{}));
+}
+
+BOOST_AUTO_TEST_CASE(r_policy_serialization_test)
+{
+    r_policy r{udrp_00{}};
+    r.extract<udrp_00>()->m_state = 42;
+    std::stringstream ss;
+    auto before = boost::lexical_cast<std::string>(r);
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(r);
+    }
+    r = r_policy{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(r);
+    }
+    auto after = boost::lexical_cast<std::string>(r);
+    BOOST_CHECK_EQUAL(before, after);
+    BOOST_CHECK(r.is<udrp_00>());
+    BOOST_CHECK_EQUAL(r.extract<udrp_00>()->m_state, 42);
+}
+
+BOOST_AUTO_TEST_CASE(r_policy_stream_test)
+{
+    auto str = boost::lexical_cast<std::string>(r_policy{udrp_00{}});
+    BOOST_CHECK(str.find("Replacement policy name: udrp_00") != std::string::npos);
+    BOOST_CHECK(str.find("Extra info:\nextra 0") != std::string::npos);
+    str = boost::lexical_cast<std::string>(r_policy{fair_replace{.5}});
+    BOOST_CHECK(str.find("Fractional migration rate: 0.5") != std::string::npos);
+}
@@ -0,0 +1,108 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE random_k_regular_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <algorithm>
+#include <cstddef>
+#include <set>
+#include <sstream>
+#include <stdexcept>
+#include <vector>
+
+#include <pagmo/serialization.hpp>
+#include <pagmo/topologies/random_k_regular.hpp>
+#include <pagmo/topology.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// Check that each vertex of t has min(k, n - 1) distinct sources, different from itself.
+static void check_k_regular(const random_k_regular &t, unsigned k)
+{
+    const auto n = t.num_vertices();
+    for (std::size_t i = 0; i < n; ++i) {
+        const auto c = t.get_connections(i);
+        BOOST_CHECK_EQUAL(c.first.size(), std::min(static_cast<std::size_t>(k), n - 1u));
+        BOOST_CHECK(c.second == vector_double(c.first.size(), t.get_weight()));
+        const std::set<std::size_t> s(c.first.begin(), c.first.end());
+        BOOST_CHECK_EQUAL(s.size(), c.first.size());
+        BOOST_CHECK(s.count(i) == 0u);
+        BOOST_CHECK(std::all_of(s.begin(), s.end(), [n](std::size_t j) { return j < n; }));
+    }
+}
+
+BOOST_AUTO_TEST_CASE(random_k_regular_test)
+{
+    random_k_regular r0;
+    BOOST_CHECK_EQUAL(r0.num_vertices(), 0u);
+    BOOST_CHECK_THROW(r0.get_connections(0), std::invalid_argument);
+    for (auto i = 0; i < 10; ++i) {
+        r0.push_back();
+        check_k_regular(r0, 1u);
+    }
+    for (auto k : {0u, 1u, 3u, 10u}) {
+        random_k_regular r{k, 20u, .75, 42u};
+        BOOST_CHECK_EQUAL(r.num_vertices(), 20u);
+        BOOST_CHECK_EQUAL(r.get_seed(), 42u);
+        check_k_regular(r, k);
+        // Growing the graph vertex by vertex yields the same graph.
+        random_k_regular r2{k, 0u, .75, 42u};
+        for (auto i = 0; i < 20; ++i) {
+            r2.push_back();
+        }
+        for (std::size_t i = 0; i < 20u; ++i) {
+            BOOST_CHECK(r.get_connections(i) == r2.get_connections(i));
+        }
+    }
+    BOOST_CHECK_THROW(random_k_regular(2u, 3u, 1.1), std::invalid_argument);
+    // Type-erased usage and serialization.
+    topology t{random_k_regular{3u, 15u, 1., 123u}};
+    BOOST_CHECK_EQUAL(t.get_name(), "Random k-regular");
+    BOOST_CHECK(t.get_extra_info().find("Seed: 123") != std::string::npos);
+    const auto before = t.get_connections(7);
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(t);
+    }
+    t = topology{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(t);
+    }
+    BOOST_CHECK(t.is<random_k_regular>());
+    BOOST_CHECK(t.get_connections(7) == before);
+    // The state of the random engine is preserved as well.
+    random_k_regular r3{3u, 15u, 1., 123u};
+    t.push_back();
+    r3.push_back();
+    BOOST_CHECK(t.get_connections(15) == r3.get_connections(15));
+}
@@ -0,0 +1,92 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE ring_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <cstddef>
+#include <sstream>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+#include <pagmo/serialization.hpp>
+#include <pagmo/topologies/ring.hpp>
+#include <pagmo/topology.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+using conn_t = std::pair<std::vector<std::size_t>, vector_double>;
+
+BOOST_AUTO_TEST_CASE(ring_test)
+{
+    ring r0;
+    BOOST_CHECK_EQUAL(r0.num_vertices(), 0u);
+    BOOST_CHECK_EQUAL(r0.get_weight(), 1.);
+    BOOST_CHECK_THROW(r0.get_connections(0), std::invalid_argument);
+    // One vertex.
+    r0.push_back();
+    BOOST_CHECK(r0.get_connections(0) == conn_t{});
+    // Two vertices.
+    r0.push_back();
+    BOOST_CHECK((r0.get_connections(0) == conn_t{{1u}, {1.}}));
+    BOOST_CHECK((r0.get_connections(1) == conn_t{{0u}, {1.}}));
+    // Three or more vertices.
+    r0.push_back();
+    BOOST_CHECK((r0.get_connections(0) == conn_t{{2u, 1u}, {1., 1.}}));
+    BOOST_CHECK((r0.get_connections(1) == conn_t{{0u, 2u}, {1., 1.}}));
+    BOOST_CHECK((r0.get_connections(2) == conn_t{{1u, 0u}, {1., 1.}}));
+    BOOST_CHECK_THROW(r0.get_connections(3), std::invalid_argument);
+    ring r1{10u, .25};
+    BOOST_CHECK_EQUAL(r1.num_vertices(), 10u);
+    BOOST_CHECK_EQUAL(r1.get_weight(), .25);
+    BOOST_CHECK((r1.get_connections(5) == conn_t{{4u, 6u}, {.25, .25}}));
+    BOOST_CHECK((r1.get_connections(9) == conn_t{{8u, 0u}, {.25, .25}}));
+    // Invalid weights.
+    BOOST_CHECK_THROW(ring(3u, -1.), std::invalid_argument);
+    BOOST_CHECK_THROW(ring(3u, 1.5), std::invalid_argument);
+    // Type-erased usage and serialization.
+    topology t{r1};
+    BOOST_CHECK_EQUAL(t.get_name(), "Ring");
+    BOOST_CHECK(t.get_extra_info().find("Number of vertices: 10") != std::string::npos);
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(t);
+    }
+    t = topology{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(t);
+    }
+    BOOST_CHECK(t.is<ring>());
+    BOOST_CHECK_EQUAL(t.extract<ring>()->num_vertices(), 10u);
+    BOOST_CHECK_EQUAL(t.extract<ring>()->get_weight(), .25);
+}
@@ -0,0 +1,201 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE s_policy_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <boost/lexical_cast.hpp>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/s_policy.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A UDSP selecting the first individual.
+struct udsp_00 {
+    individuals_group_t select(const individuals_group_t &inds, vector_double::size_type, vector_double::size_type,
+                               vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                               const vector_double &) const
+    {
+        if (std::get<0>(inds).empty()) {
+            return inds;
+        }
+        return individuals_group_t{{std::get<0>(inds)[0]}, {std::get<1>(inds)[0]}, {std::get<2>(inds)[0]}};
+    }
+    std::string get_name() const
+    {
+        return "udsp_00";
+    }
+    std::string get_extra_info() const
+    {
+        return "extra " + std::to_string(m_state);
+    }
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_state);
+    }
+    int m_state = 0;
+};
+
+PAGMO_REGISTER_S_POLICY(udsp_00)
+
+// A UDSP selecting too many individuals.
+struct udsp_01 {
+    individuals_group_t select(const individuals_group_t &inds, vector_double::size_type, vector_double::size_type,
+                               vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                               const vector_double &) const
+    {
+        auto retval = inds;
+        std::get<0>(retval).push_back(0);
+        std::get<1>(retval).push_back({0.});
+        std::get<2>(retval).push_back({0.});
+        return retval;
+    }
+};
+
+// A UDSP returning an inconsistent group.
+struct udsp_02 {
+    individuals_group_t select(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+                               vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                               const vector_double &) const
+    {
+        return individuals_group_t{{0}, {}, {}};
+    }
+};
+
+// Wrong signatures.
+struct nudsp_00 {
+    individuals_group_t select(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+                               vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                               const vector_double &);
+};
+
+struct nudsp_01 {
+    void select(const individuals_group_t &, vector_double::size_type, vector_double::size_type,
+                vector_double::size_type, vector_double::size_type, vector_double::size_type,
+                const vector_double &) const;
+};
+
+BOOST_AUTO_TEST_CASE(s_policy_type_traits_test)
+{
+    BOOST_CHECK(has_select<udsp_00>::value);
+    BOOST_CHECK(!has_select<nudsp_00>::value);
+    BOOST_CHECK(!has_select<nudsp_01>::value);
+    BOOST_CHECK(!has_select<int>::value);
+    BOOST_CHECK(is_udsp<udsp_00>::value);
+    BOOST_CHECK(is_udsp<select_best>::value);
+    BOOST_CHECK(!is_udsp<const udsp_00>::value);
+    BOOST_CHECK(!is_udsp<udsp_00 &>::value);
+    BOOST_CHECK(!is_udsp<nudsp_00>::value);
+    BOOST_CHECK((std::is_constructible<s_policy, udsp_00>::value));
+    BOOST_CHECK((!std::is_constructible<s_policy, int>::value));
+}
+
+BOOST_AUTO_TEST_CASE(s_policy_construction_test)
+{
+    s_policy s0;
+    BOOST_CHECK(s0.is<select_best>());
+    BOOST_CHECK_EQUAL(s0.extract<select_best>()->get_rate(), 1.);
+    BOOST_CHECK(!s0.extract<select_best>()->is_fractional());
+    BOOST_CHECK_EQUAL(s0.get_name(), "Select best");
+    s_policy s1{udsp_00{}};
+    BOOST_CHECK(s1.is<udsp_00>());
+    BOOST_CHECK(!s1.is<select_best>());
+    BOOST_CHECK_EQUAL(s1.get_name(), "udsp_00");
+    BOOST_CHECK_EQUAL(s1.get_extra_info(), "extra 0");
+    s1.extract<udsp_00>()->m_state = 1;
+    auto s2(s1);
+    BOOST_CHECK_EQUAL(s2.extract<udsp_00>()->m_state, 1);
+    auto s3(std::move(s2));
+    BOOST_CHECK_EQUAL(s3.extract<udsp_00>()->m_state, 1);
+    s2 = s0;
+    BOOST_CHECK(s2.is<select_best>());
+    s2 = std::move(s3);
+    BOOST_CHECK(s2.is<udsp_00>());
+}
+
+BOOST_AUTO_TEST_CASE(s_policy_select_test)
+{
+    const individuals_group_t inds{{1, 2, 3}, {{1.}, {2.}, {3.}}, {{3.}, {2.}, {1.}}};
+    s_policy s0{udsp_00{}};
+    const auto sel = s0.select(inds, 1, 0, 1, 0, 0, {});
+    BOOST_CHECK(sel == (individuals_group_t{{1}, {{1.}}, {{3.}}}));
+    // Invalid problem properties.
+    BOOST_CHECK_THROW(s0.select(inds, 0, 0, 1, 0, 0, {}), std::invalid_argument);
+    BOOST_CHECK_THROW(s0.select(inds, 1, 2, 1, 0, 0, {}), std::invalid_argument);
+    BOOST_CHECK_THROW(s0.select(inds, 1, 0, 0, 0, 0, {}), std::invalid_argument);
+    BOOST_CHECK_THROW(s0.select(inds, 1, 0, 1, 0, 0, {0.}), std::invalid_argument);
+    // Invalid input group.
+    BOOST_CHECK_THROW(s0.select(individuals_group_t{{1, 2}, {{1.}}, {{1.}}}, 1, 0, 1, 0, 0, {}),
+                      std::invalid_argument);
+    BOOST_CHECK_THROW(s0.select(inds, 2, 0, 1, 0, 0, {}), std::invalid_argument);
+    BOOST_CHECK_THROW(s0.select(inds, 1, 0, 2, 0, 0, {}), std::invalid_argument);
+    // Invalid output.
+    BOOST_CHECK_THROW(s_policy{udsp_01{}}.select(inds, 1, 0, 1, 0, 0, {}), std::invalid_argument);
+    BOOST_CHECK_THROW(s_policy{udsp_02{}}.select(inds, 1, 0, 1, 0, 0, {}), std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(s_policy_serialization_test)
+{
+    s_policy s{udsp_00{}};
+    s.extract<udsp_00>()->m_state = 42;
+    std::stringstream ss;
+    auto before = boost::lexical_cast<std::string>(s);
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(s);
+    }
+    s = s_policy{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(s);
+    }
+    auto after = boost::lexical_cast<std::string>(s);
+    BOOST_CHECK_EQUAL(before, after);
+    BOOST_CHECK(s.is<udsp_00>());
+    BOOST_CHECK_EQUAL(s.extract<udsp_00>()->m_state, 42);
+}
+
+BOOST_AUTO_TEST_CASE(s_policy_stream_test)
+{
+    auto str = boost::lexical_cast<std::string>(s_policy{udsp_00{}});
+    BOOST_CHECK(str.find("Selection policy name: udsp_00") != std::string::npos);
+    BOOST_CHECK(str.find("Extra info:\nextra 0") != std::string::npos);
+    str = boost::lexical_cast<std::string>(s_policy{});
+    BOOST_CHECK(str.find("Absolute migration rate: 1") != std::string::npos);
+}
@@ -0,0 +1,86 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE select_best_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <limits>
+#include <stdexcept>
+#include <tuple>
+
+#include <pagmo/s_policies/select_best.hpp>
+#include <pagmo/s_policy.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+BOOST_AUTO_TEST_CASE(select_best_construction_test)
+{
+    BOOST_CHECK_EQUAL(select_best{}.get_rate(), 1.);
+    BOOST_CHECK(!select_best{}.is_fractional());
+    BOOST_CHECK_EQUAL(select_best{5}.get_rate(), 5.);
+    BOOST_CHECK_EQUAL(select_best{5u}.get_rate(), 5.);
+    BOOST_CHECK(!select_best{5ull}.is_fractional());
+    BOOST_CHECK_EQUAL(select_best{.25}.get_rate(), .25);
+    BOOST_CHECK(select_best{.25f}.is_fractional());
+    BOOST_CHECK_NO_THROW(select_best{0});
+    BOOST_CHECK_NO_THROW(select_best{0.});
+    BOOST_CHECK_NO_THROW(select_best{1.});
+    BOOST_CHECK_THROW(select_best{-1}, std::invalid_argument);
+    BOOST_CHECK_THROW(select_best{-.1}, std::invalid_argument);
+    BOOST_CHECK_THROW(select_best{1.1}, std::invalid_argument);
+    BOOST_CHECK_THROW(select_best{std::numeric_limits<double>::quiet_NaN()}, std::invalid_argument);
+}
+
+BOOST_AUTO_TEST_CASE(select_best_select_test)
+{
+    // Unconstrained single-objective.
+    const individuals_group_t inds{{1, 2, 3, 4}, {{1.}, {2.}, {3.}, {4.}}, {{3.}, {1.}, {4.}, {2.}}};
+    s_policy s{select_best{2}};
+    BOOST_CHECK(s.select(inds, 1, 0, 1, 0, 0, {}) == (individuals_group_t{{2, 4}, {{2.}, {4.}}, {{1.}, {2.}}}));
+    s = s_policy{select_best{10}};
+    BOOST_CHECK(std::get<0>(s.select(inds, 1, 0, 1, 0, 0, {})) == (std::vector<unsigned long long>{2, 4, 1, 3}));
+    s = s_policy{select_best{.5}};
+    BOOST_CHECK(std::get<0>(s.select(inds, 1, 0, 1, 0, 0, {})) == (std::vector<unsigned long long>{2, 4}));
+    s = s_policy{select_best{.3}};
+    BOOST_CHECK(std::get<0>(s.select(inds, 1, 0, 1, 0, 0, {})) == (std::vector<unsigned long long>{2}));
+    s = s_policy{select_best{0}};
+    BOOST_CHECK(std::get<0>(s.select(inds, 1, 0, 1, 0, 0, {})).empty());
+    BOOST_CHECK(std::get<0>(s_policy{}.select(individuals_group_t{}, 1, 0, 1, 0, 0, {})).empty());
+    // Constrained single-objective: the feasible individual wins.
+    const individuals_group_t c_inds{{1, 2, 3}, {{1.}, {2.}, {3.}}, {{0., 1.}, {5., 0.}, {1., 2.}}};
+    s = s_policy{select_best{1}};
+    BOOST_CHECK(std::get<0>(s.select(c_inds, 1, 0, 1, 0, 1, {0.})) == (std::vector<unsigned long long>{2}));
+    // Unconstrained multi-objective: the non-dominated individuals win.
+    const individuals_group_t mo_inds{{1, 2, 3}, {{1.}, {2.}, {3.}}, {{1., 1.}, {0., 0.}, {2., 2.}}};
+    BOOST_CHECK(std::get<0>(s.select(mo_inds, 1, 0, 2, 0, 0, {})) == (std::vector<unsigned long long>{2}));
+    // Constrained multi-objective is not supported.
+    BOOST_CHECK_THROW(s.select(individuals_group_t{{1}, {{1.}}, {{1., 1., 1.}}}, 1, 0, 2, 0, 1, {0.}),
+                      std::invalid_argument);
+}
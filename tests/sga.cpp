@@ -30,6 +30,7 @@ see https://www.gnu.org/licenses/. */
 #include <boost/test/included/unit_test.hpp>
 
 #include <iostream>
+#include <sstream>
 #include <stdexcept>
 #include <string>
 
@@ -40,6 +41,7 @@ see https://www.gnu.org/licenses/. */
 #include <pagmo/population.hpp>
 #include <pagmo/problems/hock_schittkowsky_71.hpp>
 #include <pagmo/problems/inventory.hpp>
+#include <pagmo/problems/minlp_rastrigin.hpp>
 #include <pagmo/problems/rosenbrock.hpp>
 #include <pagmo/problems/schwefel.hpp>
 #include <pagmo/problems/zdt.hpp>
@@ -192,3 +194,57 @@ BOOST_AUTO_TEST_CASE(sga_serialization_test)
         BOOST_CHECK_CLOSE(std::get<3>(before_log[i]), std::get<3>(after_log[i]), 1e-8);
     }
 }
+
+BOOST_AUTO_TEST_CASE(sga_dedup_test)
+{
+    // The deduplication must not alter the evolution, only the number of fitness evaluations.
+    population pop0{minlp_rastrigin{1u, 4u}, 20u, 23u};
+    sga user_algo0{50u, .9, 1., .02, 1., 2u, "exponential", "polynomial", "tournament", 32u};
+    BOOST_CHECK(!user_algo0.get_dedup());
+    auto pop_ref = user_algo0.evolve(pop0);
+    BOOST_CHECK_EQUAL(user_algo0.get_saved_fevals(), 0u);
+    sga user_algo1{50u, .9, 1., .02, 1., 2u, "exponential", "polynomial", "tournament", 32u};
+    user_algo1.set_dedup(true);
+    BOOST_CHECK(user_algo1.get_dedup());
+    BOOST_CHECK(user_algo1.get_extra_info().find("Fitness deduplication: true") != std::string::npos);
+    auto pop1 = user_algo1.evolve(pop0);
+    BOOST_CHECK(pop1.get_x() == pop_ref.get_x());
+    BOOST_CHECK(pop1.get_f() == pop_ref.get_f());
+    BOOST_CHECK(user_algo1.get_saved_fevals() > 0u);
+    BOOST_CHECK_EQUAL(pop1.get_problem().get_fevals() + user_algo1.get_saved_fevals(),
+                      pop_ref.get_problem().get_fevals());
+    // Stochastic problems are never deduplicated.
+    population pop2{inventory{4u, 10u, 23u}, 20u, 23u};
+    pop2 = user_algo1.evolve(pop2);
+    BOOST_CHECK_EQUAL(user_algo1.get_saved_fevals(), 0u);
+    // The saved evaluations are shown in the screen output.
+    {
+        std::stringstream out;
+        auto old_buf = std::cout.rdbuf(out.rdbuf());
+        user_algo1.set_verbosity(10u);
+        user_algo1.evolve(pop0);
+        std::cout.rdbuf(old_buf);
+        BOOST_CHECK(out.str().find("Saved:") != std::string::npos);
+        // No column if the deduplication is not performed.
+        out.str("");
+        old_buf = std::cout.rdbuf(out.rdbuf());
+        user_algo1.evolve(pop2);
+        std::cout.rdbuf(old_buf);
+        BOOST_CHECK(out.str().find("Gen:") != std::string::npos);
+        BOOST_CHECK(out.str().find("Saved:") == std::string::npos);
+        user_algo1.set_verbosity(0u);
+    }
+    // The flag is serialized.
+    algorithm algo{user_algo1};
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(algo);
+    }
+    algo = algorithm{null_algorithm{}};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(algo);
+    }
+    BOOST_CHECK(algo.extract<sga>()->get_dedup());
+}
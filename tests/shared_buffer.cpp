@@ -0,0 +1,143 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE shared_buffer_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <sstream>
+#include <utility>
+#include <vector>
+
+#include <pagmo/population.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/serialization.hpp>
+#include <pagmo/types.hpp>
+#include <pagmo/utils/shared_buffer.hpp>
+
+using namespace pagmo;
+
+// A UDP carrying a large table of constant data.
+struct udp_table {
+    udp_table() = default;
+    explicit udp_table(vector_double::size_type n) : m_table(vector_double(n, 1.))
+    {
+    }
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0] * m_table->size()};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_table);
+    }
+    shared_buffer<vector_double> m_table;
+};
+
+BOOST_AUTO_TEST_CASE(shared_buffer_basic_test)
+{
+    shared_buffer<vector_double> def;
+    BOOST_CHECK(def->empty());
+    shared_buffer<vector_double> b1(vector_double{1., 2., 3.});
+    BOOST_CHECK((*b1 == vector_double{1., 2., 3.}));
+    BOOST_CHECK((b1.get() == vector_double{1., 2., 3.}));
+    BOOST_CHECK_EQUAL(b1.use_count(), 1);
+    // Copies share the value.
+    auto b2(b1);
+    BOOST_CHECK(b2.shares_with(b1));
+    BOOST_CHECK_EQUAL(b1.use_count(), 2);
+    BOOST_CHECK_EQUAL(&b1.get(), &b2.get());
+    // Buffers constructed separately do not share, even with equal values.
+    shared_buffer<vector_double> b3(vector_double{1., 2., 3.});
+    BOOST_CHECK(!b3.shares_with(b1));
+    b2 = b3;
+    BOOST_CHECK(b2.shares_with(b3));
+    BOOST_CHECK_EQUAL(b1.use_count(), 1);
+}
+
+BOOST_AUTO_TEST_CASE(shared_buffer_problem_copy_test)
+{
+    problem p{udp_table{1000u}};
+    // Copying the problem (also through a population) does not copy the data.
+    problem p2(p);
+    population pop{p, 10u};
+    const auto &t1 = p.extract<udp_table>()->m_table;
+    BOOST_CHECK(p2.extract<udp_table>()->m_table.shares_with(t1));
+    BOOST_CHECK(pop.get_problem().extract<udp_table>()->m_table.shares_with(t1));
+    BOOST_CHECK_EQUAL(t1.use_count(), 3);
+    BOOST_CHECK((p2.fitness({1.}) == vector_double{1000.}));
+}
+
+BOOST_AUTO_TEST_CASE(shared_buffer_serialization_test)
+{
+    udp_table orig{100u};
+    std::stringstream ss;
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(orig);
+    }
+    std::stringstream ss2(ss.str());
+    // Loading an object whose data is equal to a live buffer restores the sharing.
+    udp_table u1, u2;
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(u1);
+    }
+    {
+        cereal::JSONInputArchive iarchive(ss2);
+        iarchive(u2);
+    }
+    BOOST_CHECK((u1.m_table.get() == vector_double(100u, 1.)));
+    BOOST_CHECK(u1.m_table.shares_with(orig.m_table));
+    BOOST_CHECK(u2.m_table.shares_with(orig.m_table));
+    // Loading data not held by any live buffer creates a new value,
+    // shared by the objects loaded afterwards.
+    std::stringstream ss3;
+    {
+        cereal::BinaryOutputArchive oarchive(ss3);
+        oarchive(udp_table{42u});
+    }
+    std::stringstream ss4(ss3.str());
+    udp_table u3, u4;
+    {
+        cereal::BinaryInputArchive iarchive(ss3);
+        iarchive(u3);
+    }
+    {
+        cereal::BinaryInputArchive iarchive(ss4);
+        iarchive(u4);
+    }
+    BOOST_CHECK_EQUAL(u3.m_table->size(), 42u);
+    BOOST_CHECK(u3.m_table.shares_with(u4.m_table));
+    BOOST_CHECK(!u3.m_table.shares_with(orig.m_table));
+}
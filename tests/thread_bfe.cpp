@@ -0,0 +1,200 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+#define BOOST_TEST_MODULE thread_bfe_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <pagmo/batch_evaluators/thread_bfe.hpp>
+#include <pagmo/bfe.hpp>
+#include <pagmo/detail/parallel_for.hpp>
+#include <pagmo/problem.hpp>
+#include <pagmo/problems/rosenbrock.hpp>
+#include <pagmo/problems/zdt.hpp>
+#include <pagmo/threading.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A problem which is not thread-safe.
+struct unsafe_prob {
+    vector_double fitness(const vector_double &x) const
+    {
+        return {x[0]};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::none;
+    }
+};
+
+// A problem throwing on a specific input.
+struct throwing_prob {
+    vector_double fitness(const vector_double &x) const
+    {
+        if (x[0] == 42.) {
+            throw std::runtime_error("42");
+        }
+        return {x[0]};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+};
+
+// A problem which can be evaluated concurrently, and which counts its copies.
+struct shared_prob {
+    shared_prob() = default;
+    shared_prob(const shared_prob &)
+    {
+        ++n_copies;
+    }
+    vector_double fitness(const vector_double &x) const
+    {
+        if (x[0] == 42.) {
+            throw std::runtime_error("42");
+        }
+        return {x[0]};
+    }
+    std::pair<vector_double, vector_double> get_bounds() const
+    {
+        return {{0.}, {1.}};
+    }
+    thread_safety get_thread_safety() const
+    {
+        return thread_safety::constant;
+    }
+    static std::atomic<unsigned> n_copies;
+};
+
+std::atomic<unsigned> shared_prob::n_copies(0u);
+
+BOOST_AUTO_TEST_CASE(thread_bfe_test)
+{
+    thread_bfe tb;
+    BOOST_CHECK_EQUAL(tb.get_name(), "Multi-threaded batch fitness evaluator");
+    // A batch large enough to be split among multiple threads.
+    problem p{zdt{1u, 30u}};
+    const auto nx = p.get_nx();
+    vector_double dvs;
+    for (auto i = 0u; i < 1000u; ++i) {
+        for (decltype(p.get_nx()) j = 0u; j < nx; ++j) {
+            dvs.push_back(static_cast<double>((i + j) % 7u) / 7.);
+        }
+    }
+    const auto fvs = tb(p, dvs);
+    BOOST_CHECK_EQUAL(fvs.size(), 1000u * p.get_nf());
+    BOOST_CHECK_EQUAL(p.get_fevals(), 1000u);
+    // Compare with the serial evaluation.
+    BOOST_CHECK(fvs == p.batch_fitness(dvs));
+    BOOST_CHECK_EQUAL(p.get_fevals(), 2000u);
+    // Small batches.
+    problem p2{rosenbrock{2u}};
+    BOOST_CHECK(tb(p2, {}).empty());
+    BOOST_CHECK((tb(p2, {1., 1.}) == vector_double{0.}));
+    BOOST_CHECK_EQUAL(p2.get_fevals(), 1u);
+    // Errors.
+    BOOST_CHECK_THROW(tb(p2, {1.}), std::invalid_argument);
+    problem p3{unsafe_prob{}};
+    BOOST_CHECK_THROW(tb(p3, {.5}), std::invalid_argument);
+    BOOST_CHECK_THROW(bfe{tb}(p3, {.5}), std::invalid_argument);
+    problem p4{throwing_prob{}};
+    dvs = vector_double(100u, .5);
+    dvs[57] = 42.;
+    BOOST_CHECK_THROW(tb(p4, dvs), std::runtime_error);
+    // The fevals are not incremented in case of errors.
+    BOOST_CHECK_EQUAL(p4.get_fevals(), 0u);
+}
+
+BOOST_AUTO_TEST_CASE(thread_bfe_constant_test)
+{
+    thread_bfe tb;
+    problem p{shared_prob{}};
+    const auto n_copies = shared_prob::n_copies.load();
+    vector_double dvs(1000u);
+    for (auto i = 0u; i < 1000u; ++i) {
+        dvs[i] = static_cast<double>(i % 7u) / 7.;
+    }
+    const auto fvs = tb(p, dvs);
+    BOOST_CHECK(fvs == dvs);
+    BOOST_CHECK_EQUAL(p.get_fevals(), 1000u);
+    // The problem was shared among the threads, not copied.
+    BOOST_CHECK_EQUAL(shared_prob::n_copies.load(), n_copies);
+    // Errors.
+    dvs[57] = 42.;
+    BOOST_CHECK_THROW(tb(p, dvs), std::runtime_error);
+}
+
+BOOST_AUTO_TEST_CASE(thread_bfe_parallel_for_test)
+{
+    // Each index is visited exactly once, and the iterations of a worker never overlap.
+    const auto n_w = 4u;
+    std::vector<std::atomic<unsigned>> visits(10000u), busy(n_w);
+    std::atomic<bool> overlap(false);
+    for (auto k = 0; k < 10; ++k) {
+        detail::parallel_for(visits.size(), n_w, [&](unsigned w, std::size_t i) {
+            if (busy[w]++) {
+                overlap = true;
+            }
+            ++visits[i];
+            --busy[w];
+        });
+    }
+    BOOST_CHECK(std::all_of(visits.begin(), visits.end(), [](const std::atomic<unsigned> &v) { return v == 10u; }));
+    BOOST_CHECK(!overlap);
+    // Nested loops do not deadlock.
+    std::atomic<unsigned> count(0u);
+    detail::parallel_for(100u, 4u, [&count](unsigned, std::size_t) {
+        detail::parallel_for(100u, 4u, [&count](unsigned, std::size_t) { ++count; });
+    });
+    BOOST_CHECK_EQUAL(count.load(), 10000u);
+    // The first error is re-thrown, and the remaining iterations are skipped.
+    count = 0u;
+    BOOST_CHECK_THROW(detail::parallel_for(1000000u, 4u,
+                                           [&count](unsigned, std::size_t i) {
+                                               ++count;
+                                               if (i == 10u) {
+                                                   throw std::runtime_error("");
+                                               }
+                                           }),
+                      std::runtime_error);
+    BOOST_CHECK(count.load() < 1000000u);
+    // Empty loop.
+    detail::parallel_for(0u, 0u, [](unsigned, std::size_t) { BOOST_CHECK(false); });
+}
@@ -0,0 +1,232 @@
+/* Copyright 2017 PaGMO development team
+
+This file is part of the PaGMO library.
+
+The PaGMO library is free software; you can redistribute it and/or modify
+it under the terms of either:
+
+  * the GNU Lesser General Public License as published by the Free
+    Software Foundation; either version 3 of the License, or (at your
+    option) any later version.
+
+or
+
+  * the GNU General Public License as published by the Free Software
+    Foundation; either version 3 of the License, or (at your option) any
+    later version.
+
+or both in parallel, as here.
+
+The PaGMO library is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License
+for more details.
+
+You should have received copies of the GNU General Public License and the
+GNU Lesser General Public License along with the PaGMO library.  If not,
+see https://www.gnu.org/licenses/. */
+
+
+#define BOOST_TEST_MODULE topology_test
+#include <boost/test/included/unit_test.hpp>
+
+#include <boost/lexical_cast.hpp>
+#include <cstddef>
+#include <limits>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <pagmo/serialization.hpp>
+#include <pagmo/topologies/free_form.hpp>
+#include <pagmo/topologies/fully_connected.hpp>
+#include <pagmo/topologies/random_k_regular.hpp>
+#include <pagmo/topologies/ring.hpp>
+#include <pagmo/topologies/unconnected.hpp>
+#include <pagmo/topology.hpp>
+#include <pagmo/types.hpp>
+
+using namespace pagmo;
+
+// A minimal UDT: a chain in which each vertex receives from the previous one.
+struct udt_00 {
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t i) const
+    {
+        if (i == 0u) {
+            return {};
+        }
+        return {{i - 1u}, {.5}};
+    }
+    void push_back()
+    {
+        ++m_n;
+    }
+    std::string get_name() const
+    {
+        return "udt_00";
+    }
+    std::string get_extra_info() const
+    {
+        return "extra " + std::to_string(m_n);
+    }
+    template <typename Archive>
+    void serialize(Archive &ar)
+    {
+        ar(m_n);
+    }
+    std::size_t m_n = 0;
+};
+
+PAGMO_REGISTER_TOPOLOGY(udt_00)
+
+// A UDT returning vectors of different sizes.
+struct udt_01 {
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t) const
+    {
+        return {{0u, 1u}, {1.}};
+    }
+    void push_back() {}
+};
+
+// A UDT returning invalid weights.
+struct udt_02 {
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t) const
+    {
+        return {{0u}, {m_w}};
+    }
+    void push_back() {}
+    double m_w = 2.;
+};
+
+// Wrong signatures.
+struct nudt_00 {
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t);
+    void push_back();
+};
+
+struct nudt_01 {
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t) const;
+};
+
+struct nudt_02 {
+    std::vector<std::size_t> get_connections(std::size_t) const;
+    void push_back();
+};
+
+struct nudt_03 {
+    nudt_03() = delete;
+    std::pair<std::vector<std::size_t>, vector_double> get_connections(std::size_t) const;
+    void push_back();
+};
+
+BOOST_AUTO_TEST_CASE(topology_type_traits_test)
+{
+    BOOST_CHECK(has_get_connections<udt_00>::value);
+    BOOST_CHECK(!has_get_connections<nudt_00>::value);
+    BOOST_CHECK(!has_get_connections<nudt_02>::value);
+    BOOST_CHECK(!has_get_connections<int>::value);
+    BOOST_CHECK(has_push_back<udt_00>::value);
+    BOOST_CHECK(!has_push_back<nudt_01>::value);
+    BOOST_CHECK(!has_push_back<int>::value);
+    BOOST_CHECK(is_udt<udt_00>::value);
+    BOOST_CHECK(is_udt<unconnected>::value);
+    BOOST_CHECK(is_udt<ring>::value);
+    BOOST_CHECK(is_udt<fully_connected>::value);
+    BOOST_CHECK(is_udt<random_k_regular>::value);
+    BOOST_CHECK(is_udt<free_form>::value);
+    BOOST_CHECK(!is_udt<const udt_00>::value);
+    BOOST_CHECK(!is_udt<udt_00 &>::value);
+    BOOST_CHECK(!is_udt<nudt_00>::value);
+    BOOST_CHECK(!is_udt<nudt_01>::value);
+    BOOST_CHECK(!is_udt<nudt_02>::value);
+    BOOST_CHECK(!is_udt<nudt_03>::value);
+    BOOST_CHECK((std::is_constructible<topology, udt_00>::value));
+    BOOST_CHECK((!std::is_constructible<topology, nudt_01>::value));
+    BOOST_CHECK((!std::is_constructible<topology, int>::value));
+}
+
+BOOST_AUTO_TEST_CASE(topology_construction_test)
+{
+    // Default constructor.
+    topology t0;
+    BOOST_CHECK(t0.is<unconnected>());
+    BOOST_CHECK(!t0.is<ring>());
+    BOOST_CHECK(t0.extract<ring>() == nullptr);
+    BOOST_CHECK_EQUAL(t0.get_name(), "Unconnected");
+    BOOST_CHECK(t0.get_extra_info().empty());
+    t0.push_back();
+    BOOST_CHECK(t0.get_connections(0).first.empty());
+    // Generic constructor.
+    topology t1{udt_00{}};
+    BOOST_CHECK(t1.is<udt_00>());
+    BOOST_CHECK_EQUAL(t1.get_name(), "udt_00");
+    BOOST_CHECK_EQUAL(t1.get_extra_info(), "extra 0");
+    t1.push_back();
+    t1.push_back();
+    BOOST_CHECK_EQUAL(t1.extract<udt_00>()->m_n, 2u);
+    // Copy/move semantics.
+    auto t2(t1);
+    BOOST_CHECK(t2.is<udt_00>());
+    BOOST_CHECK_EQUAL(t2.extract<udt_00>()->m_n, 2u);
+    t2.push_back();
+    BOOST_CHECK_EQUAL(t1.extract<udt_00>()->m_n, 2u);
+    auto t3(std::move(t2));
+    BOOST_CHECK_EQUAL(t3.extract<udt_00>()->m_n, 3u);
+    t2 = t0;
+    BOOST_CHECK(t2.is<unconnected>());
+    t2 = std::move(t3);
+    BOOST_CHECK_EQUAL(t2.extract<udt_00>()->m_n, 3u);
+    // Name of a UDT without get_name().
+    BOOST_CHECK(!topology{udt_01{}}.get_name().empty());
+}
+
+BOOST_AUTO_TEST_CASE(topology_get_connections_test)
+{
+    topology t{udt_00{}};
+    BOOST_CHECK(t.get_connections(0).first.empty());
+    BOOST_CHECK((t.get_connections(3) == std::make_pair(std::vector<std::size_t>{2u}, vector_double{.5})));
+    // Inconsistent sizes.
+    BOOST_CHECK_THROW(topology{udt_01{}}.get_connections(0), std::invalid_argument);
+    // Invalid weights.
+    BOOST_CHECK_THROW(topology{udt_02{}}.get_connections(0), std::invalid_argument);
+    udt_02 u;
+    u.m_w = -1.;
+    BOOST_CHECK_THROW(topology{u}.get_connections(0), std::invalid_argument);
+    u.m_w = std::numeric_limits<double>::quiet_NaN();
+    BOOST_CHECK_THROW(topology{u}.get_connections(0), std::invalid_argument);
+    u.m_w = 0.;
+    BOOST_CHECK_NO_THROW(topology{u}.get_connections(0));
+}
+
+BOOST_AUTO_TEST_CASE(topology_serialization_test)
+{
+    topology t{udt_00{}};
+    t.push_back();
+    std::stringstream ss;
+    auto before = boost::lexical_cast<std::string>(t);
+    {
+        cereal::JSONOutputArchive oarchive(ss);
+        oarchive(t);
+    }
+    t = topology{};
+    {
+        cereal::JSONInputArchive iarchive(ss);
+        iarchive(t);
+    }
+    auto after = boost::lexical_cast<std::string>(t);
+    BOOST_CHECK_EQUAL(before, after);
+    BOOST_CHECK(t.is<udt_00>());
+    BOOST_CHECK_EQUAL(t.extract<udt_00>()->m_n, 1u);
+}
+
+BOOST_AUTO_TEST_CASE(topology_stream_test)
+{
+    auto str = boost::lexical_cast<std::string>(topology{udt_00{}});
+    BOOST_CHECK(str.find("Topology name: udt_00") != std::string::npos);
+    BOOST_CHECK(str.find("Extra info:\nextra 0") != std::string::npos);
+    str = boost::lexical_cast<std::string>(topology{});
+    BOOST_CHECK(str.find("Extra info") == std::string::npos);
+}
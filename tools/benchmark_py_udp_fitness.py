@@ -0,0 +1,62 @@
+import pygmo as pg
+import numpy as np
+import time
+
+
+# Microbenchmark of the overhead of the fitness evaluation of user-defined Python problems.
+# The UDPs below do (almost) nothing, so that the timings measure the cost of the
+# C++ -> Python -> C++ round trip: conversion of the decision vector to a NumPy array,
+# lookup and invocation of the fitness method, conversion of the returned fitness.
+
+class list_udp:
+
+    def __init__(self, dim):
+        self.dim = dim
+
+    def fitness(self, x):
+        return [0.]
+
+    def get_bounds(self):
+        return ([0.] * self.dim, [1.] * self.dim)
+
+
+class array_udp:
+
+    def __init__(self, dim):
+        self.dim = dim
+        self.f = np.zeros(1)
+
+    def fitness(self, x):
+        return self.f
+
+    def get_bounds(self):
+        return ([0.] * self.dim, [1.] * self.dim)
+
+
+def bench(prob, n):
+    # Evaluation of n decision vectors driven from C++ (the problem has no batch fitness
+    # method, so the evaluations are performed one by one).
+    dvs = np.random.rand(n, prob.get_nx())
+    prob.batch_fitness(dvs[:10])
+    start = time.perf_counter()
+    prob.batch_fitness(dvs)
+    cpp_loop = (time.perf_counter() - start) / n
+    # Evaluation of n decision vectors driven from Python.
+    start = time.perf_counter()
+    for x in dvs:
+        prob.fitness(x)
+    py_loop = (time.perf_counter() - start) / n
+    return cpp_loop, py_loop
+
+
+def main(n=200000):
+    print("{:>12}{:>6}{:>20}{:>20}".format("UDP", "dim", "C++ loop (us/eval)", "Py loop (us/eval)"))
+    for udp in [list_udp, array_udp]:
+        for dim in [1, 10, 100]:
+            cpp_loop, py_loop = bench(pg.problem(udp(dim)), n)
+            print("{:>12}{:>6}{:>20.3f}{:>20.3f}".format(
+                udp.__name__, dim, cpp_loop * 1E6, py_loop * 1E6))
+
+
+if __name__ == '__main__':
+    main()